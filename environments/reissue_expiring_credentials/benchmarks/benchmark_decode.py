@@ -0,0 +1,148 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Compares decoding synthetic issuer service pages into full dicts, as `response.json()` does, with the compact
+decoding of `credential_page`, with the `json` module and with `orjson` if it is installed.
+
+For every page size, the benchmark decodes the same pages with each decoder and keeps the decoded credentials of
+`--pages-held` pages alive, like the pages in flight of the listing. It reports the decode time, the number of
+garbage collections, the peak traced memory and the memory still held by the decoded pages at the end.
+
+Usage: python benchmarks/benchmark_decode.py --page-sizes 15 500 5000 --num-credentials 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from collections import deque
+from datetime import date, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import credential_page
+
+CREDENTIAL_TYPES = ("BUSINESS_PARTNER_NUMBER", "MEMBERSHIP", "DATA_EXCHANGE_GOVERNANCE_CREDENTIAL")
+
+
+def make_credential(index: int) -> dict:
+    """A credential as listed by the issuer service, with the details the reissue script does not use"""
+    credential_id = f"00000000-0000-0000-0000-{index:012d}"
+    return {
+        "credentialDetailId": credential_id,
+        "bpnl": f"BPNL{index // 3:012d}",
+        "credentialType": CREDENTIAL_TYPES[index % 3],
+        "useCase": "None",
+        "participationStatus": "ACTIVE",
+        "expiryDate": f"{(date(2025, 1, 1) + timedelta(days=index % 365)).isoformat()}T00:00:00+00:00",
+        "documents": [
+            {
+                "documentId": f"10000000-0000-0000-0000-{index:012d}",
+                "documentName": f"{credential_id}.json",
+                "documentType": "VERIFIED_CREDENTIAL",
+            },
+        ],
+        "externalTypeDetail": None,
+        "processId": f"20000000-0000-0000-0000-{index:012d}",
+        "processSteps": [
+            {"processStepId": f"3000000{step}-0000-0000-0000-{index:012d}", "processStepTypeId": step_type,
+             "processStepStatusId": "DONE", "dateLastChanged": "2024-01-01T00:00:00+00:00"}
+            for step, step_type in enumerate(("CREATE_SIGNED_CREDENTIAL", "SAVE_CREDENTIAL_DOCUMENT",
+                                              "CREATE_CREDENTIAL_FOR_HOLDER", "TRIGGER_CALLBACK"))
+        ],
+    }
+
+
+def make_pages(num_credentials: int, page_size: int) -> list[bytes]:
+    total_pages = (num_credentials + page_size - 1) // page_size
+    pages = []
+    for page in range(total_pages):
+        content = [make_credential(i) for i in range(page * page_size, min(num_credentials, (page + 1) * page_size))]
+        pages.append(json.dumps({
+            "meta": {"numberOfElements": num_credentials, "totalPages": total_pages, "page": page,
+                     "contentSize": len(content)},
+            "content": content,
+        }).encode())
+    return pages
+
+
+def decode_dicts(body: bytes) -> list:
+    return json.loads(body)["content"]
+
+
+def compact_decoder(loads):
+    def decode_compact(body: bytes) -> list:
+        return credential_page.decode_credential_page(body, loads).credentials
+
+    return decode_compact
+
+
+def decode_all(decode, pages: list[bytes], pages_held: int) -> deque:
+    held = deque(maxlen=pages_held)
+    for body in pages:
+        held.append(decode(body))
+    return held
+
+
+def measure(decode, pages: list[bytes], pages_held: int) -> tuple[float, int, float, float]:
+    """Returns the decode time, the number of garbage collections, and the peak and held memory in MiB"""
+    gc.collect()
+    collections_before = sum(stats["collections"] for stats in gc.get_stats())
+    start = perf_counter()
+    decode_all(decode, pages, pages_held)
+    elapsed = perf_counter() - start
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections_before
+
+    # Tracing slows down allocations, so memory is measured in a separate pass
+    gc.collect()
+    tracemalloc.start()
+    held = decode_all(decode, pages, pages_held)
+    held_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return elapsed, collections, peak_memory / (1024 * 1024), held_memory / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark decoding issuer service pages")
+    parser.add_argument("--num-credentials", type=int, default=50000, help="Number of credentials listed")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[15, 500, 5000], help="Page sizes to compare")
+    parser.add_argument("--pages-held", type=int, default=5,
+                        help="Number of decoded pages kept alive, like the pages in flight of the listing")
+    args = parser.parse_args()
+
+    decoders = [("dicts (json)", decode_dicts), ("compact (json)", compact_decoder(json.loads))]
+    if credential_page.orjson is not None:
+        decoders.append(("compact (orjson)", compact_decoder(credential_page.orjson.loads)))
+
+    print(f"{'page size':>9} {'decoder':<18} {'time (s)':>9} {'GCs':>6} {'peak (MiB)':>11} {'held (MiB)':>11}")
+    for page_size in args.page_sizes:
+        pages = make_pages(args.num_credentials, page_size)
+        for name, decode in decoders:
+            elapsed, collections, peak, held = measure(decode, pages, args.pages_held)
+            print(f"{page_size:>9} {name:<18} {elapsed:>9.3f} {collections:>6} {peak:>11.1f} {held:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
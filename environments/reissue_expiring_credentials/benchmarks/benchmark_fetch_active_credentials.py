@@ -0,0 +1,69 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Compares the wall-clock time of the serial and the concurrent page fetching of `fetch_active_credentials`
+against a local stand-in issuer service, including the time until the first credential is available.
+
+Usage: python benchmarks/benchmark_fetch_active_credentials.py --num-credentials 3000 --latency 0.02
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_issuer import FakeIssuer, FakeIssuerConfig
+from reissue_expiring_credentials import fetch_active_credentials
+
+
+def run(issuer_url: str, page_size: int, workers: int) -> tuple[float, float, int]:
+    """Returns the time to the first credential, the total time and the number of fetched credentials"""
+    start = perf_counter()
+    first = None
+    count = 0
+    for _ in fetch_active_credentials(issuer_url, "client-id", "client-secret", issuer_url, page_size, workers):
+        first = first or perf_counter() - start
+        count += 1
+    return first, perf_counter() - start, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fetch_active_credentials")
+    parser.add_argument("--num-credentials", type=int, default=3000, help="Number of ACTIVE credentials served")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated latency per request in seconds")
+    parser.add_argument("--page-size", type=int, default=15, help="Page size requested by the client")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="Worker counts to compare")
+    args = parser.parse_args()
+
+    config = FakeIssuerConfig(num_credentials=args.num_credentials, latency=args.latency)
+    with FakeIssuer(config) as issuer:
+        baseline = None
+        print(f"{'workers':>8} {'first (s)':>10} {'total (s)':>10} {'credentials':>12} {'speedup':>8}")
+        for workers in args.workers:
+            first, elapsed, count = run(issuer.url, args.page_size, workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {first:>10.3f} {elapsed:>10.3f} {count:>12} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
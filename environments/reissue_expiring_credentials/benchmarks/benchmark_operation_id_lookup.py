@@ -0,0 +1,91 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Compares the indexed BPN to operation ID lookup with the previous substring scan over all customer wallets.
+
+The substring scan is quadratic, so it is only timed for a sample of the credentials and extrapolated.
+
+Usage: python benchmarks/benchmark_operation_id_lookup.py --num-wallets 50000 --num-credentials 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reissue_expiring_credentials import (KEY_CUSTOMER_NAME, KEY_OPERATION_ID, build_operation_id_index,
+                                          find_operation_ids)
+
+
+def make_wallets(num_wallets: int) -> list[dict]:
+    wallets = []
+    for i in range(num_wallets):
+        # Every 100th customer name carries no BPNL and has to be matched by the fallback
+        name = f"Company {i}" if i % 100 == 0 else f"Company {i} BPNL{i:012d} int"
+        wallets.append({KEY_CUSTOMER_NAME: name, KEY_OPERATION_ID: f"operation-{i}"})
+    return wallets
+
+
+def substring_scan(operation_data: list[dict], bpn: str) -> list[str]:
+    op_ids = []
+    for operation in operation_data:
+        if bpn in operation[KEY_CUSTOMER_NAME]:
+            op_ids.append(operation[KEY_OPERATION_ID])
+    return op_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the BPN to operation ID lookup")
+    parser.add_argument("--num-wallets", type=int, default=50_000, help="Number of customer wallets")
+    parser.add_argument("--num-credentials", type=int, default=50_000, help="Number of credentials to look up")
+    parser.add_argument("--scan-sample", type=int, default=500, help="Number of credentials timed with the scan")
+    args = parser.parse_args()
+
+    wallets = make_wallets(args.num_wallets)
+    rng = random.Random(42)
+    bpns = [f"BPNL{rng.randrange(args.num_wallets):012d}" for _ in range(args.num_credentials)]
+
+    start = perf_counter()
+    index = build_operation_id_index(wallets)
+    build_seconds = perf_counter() - start
+    start = perf_counter()
+    indexed_results = [find_operation_ids(index, bpn) for bpn in bpns]
+    lookup_seconds = perf_counter() - start
+
+    sample = bpns[:args.scan_sample]
+    start = perf_counter()
+    scan_results = [substring_scan(wallets, bpn) for bpn in sample]
+    scan_seconds = (perf_counter() - start) * len(bpns) / len(sample)
+
+    assert scan_results == indexed_results[:len(sample)], "Indexed lookup differs from substring scan"
+    indexed_seconds = build_seconds + lookup_seconds
+    print(f"wallets: {args.num_wallets}, credentials: {args.num_credentials}")
+    print(f"substring scan (extrapolated from {len(sample)}): {scan_seconds:10.3f} s")
+    print(f"index build:                              {build_seconds:10.3f} s")
+    print(f"indexed lookup:                           {lookup_seconds:10.3f} s")
+    print(f"speedup:                                  {scan_seconds / indexed_seconds:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
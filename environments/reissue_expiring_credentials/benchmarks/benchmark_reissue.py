@@ -0,0 +1,177 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Runs the reissue script end to end against local stand-ins for the issuer service, Keycloak, SAP DIV and DIS,
+and reports the throughput, the per-call latency percentiles and the peak memory usage.
+
+The fake services run in a separate process, so the reported peak RSS only covers the reissue script.
+Arguments not known to the benchmark are passed on to the reissue script, e.g. `--concurrency 8`.
+
+Usage: python benchmarks/benchmark_reissue.py --num-credentials 3000 --latency 0.02 --jitter 0.01 --concurrency 8
+"""
+
+import argparse
+import os
+import resource
+import sys
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import http_client
+import reissue_expiring_credentials
+from fake_issuer import FakeIssuer, FakeIssuerConfig
+
+ISSUANCE_ROUTES = {"POST /api/issuer/bpn", "POST /api/issuer/membership", "POST /api/issuer/framework"}
+BULK_ISSUANCE_ROUTE = "POST /api/issuer/bulk"
+
+
+class CallRecorder:
+    """Records the latency and status code of every call made through `http_client`, grouped by route"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # Number of items issued by successful bulk issuance requests
+        self.bulk_issued = 0
+
+    def wrap(self, method: str, call):
+        def timed(*args, **kwargs):
+            url = kwargs["url"] if "url" in kwargs else args[0]
+            route = http_client.route_of(method, url)
+            start = perf_counter()
+            status = "error"
+            try:
+                response = call(*args, **kwargs)
+                status = str(response.status_code)
+                if route == BULK_ISSUANCE_ROUTE and response.status_code == 200:
+                    issued = sum(1 for items in response.json().values() for item in items or []
+                                 if item.get("error") is None)
+                    with self.lock:
+                        self.bulk_issued += issued
+                return response
+            finally:
+                with self.lock:
+                    self.latencies[route].append(perf_counter() - start)
+                    self.statuses[route][status] += 1
+
+        return timed
+
+    def install(self):
+        http_client.get = self.wrap("GET", http_client.get)
+        http_client.post = self.wrap("POST", http_client.post)
+
+    def count(self, routes: set[str], status: str) -> int:
+        return sum(self.statuses[route][status] for route in routes)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def print_report(recorder: CallRecorder, elapsed: float, exit_code: int):
+    reissued = recorder.count(ISSUANCE_ROUTES, "200") + recorder.bulk_issued
+    print()
+    print(f"exit code:         {exit_code}")
+    print(f"wall time:         {elapsed:.2f} s")
+    print(f"reissued:          {reissued}")
+    print(f"credentials/s:     {reissued / elapsed:.1f}")
+    print(f"peak RSS:          {peak_rss_mib():.1f} MiB")
+    print()
+    print(f"{'route':<45} {'calls':>7} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}  statuses")
+    all_latencies = []
+    for route in sorted(recorder.latencies):
+        latencies = sorted(recorder.latencies[route])
+        all_latencies.extend(latencies)
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(recorder.statuses[route].items()))
+        print(f"{route:<45} {len(latencies):>7} {percentile(latencies, 0.5) * 1000:>9.1f} "
+              f"{percentile(latencies, 0.99) * 1000:>9.1f} {latencies[-1] * 1000:>9.1f}  {statuses}")
+    if all_latencies:
+        all_latencies.sort()
+        print(f"{'all':<45} {len(all_latencies):>7} {percentile(all_latencies, 0.5) * 1000:>9.1f} "
+              f"{percentile(all_latencies, 0.99) * 1000:>9.1f} {all_latencies[-1] * 1000:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the reissue script against local fake services")
+    parser.add_argument("--num-credentials", type=int, default=3000, help="Number of ACTIVE credentials served")
+    parser.add_argument("--credentials-per-bpn", type=int, default=3, help="Number of credentials per BPN, up to 3")
+    parser.add_argument("--wallets-per-bpn", type=int, default=1,
+                        help="Number of customer wallets per BPN, only the last one belongs to the stage")
+    parser.add_argument("--page-size", type=int, default=15, help="Maximum page size of the fake issuer service")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated latency per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Additional random latency of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503, help="Status code of the failed requests")
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Log level of the reissue script")
+    args, script_args = parser.parse_known_args()
+
+    config = FakeIssuerConfig(
+        num_credentials=args.num_credentials,
+        credentials_per_bpn=args.credentials_per_bpn,
+        wallets_per_bpn=args.wallets_per_bpn,
+        max_page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    recorder = CallRecorder()
+    recorder.install()
+    with FakeIssuer(config, separate_process=True) as services:
+        sys.argv = [
+            "reissue_expiring_credentials.py",
+            "--stage", config.stage,
+            "--start_date", config.expiry_start.isoformat(),
+            "--end_date", (config.expiry_start + timedelta(days=364)).isoformat(),
+            "--issuer-service-client-id", "issuer-client",
+            "--issuer-service-client-secret", "issuer-secret",
+            "--sap-url", services.url,
+            "--sap-auth-url", services.url,
+            "--sap-client-id", "sap-client",
+            "--sap-client-secret", "sap-secret",
+            "--issuer-service-base-url", services.url,
+            "--keycloak-base-url", services.url,
+            "--dis-base-url", services.url,
+            "--log-level", args.log_level,
+            *script_args,
+        ]
+        start = perf_counter()
+        exit_code = reissue_expiring_credentials.main()
+        elapsed = perf_counter() - start
+    print_report(recorder, elapsed, exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Local stand-ins for the services used by the reissue script, used by the benchmarks.
+
+A single server answers
+- the Keycloak and SAP token endpoints,
+- the paginated `/api/issuer` listing with synthetic credentials and its keyset paginated `/api/issuer/compact`
+  variant. The first `num_pending` credentials have a PENDING replacement and the next `num_replaced` ones an
+  ACTIVE replacement, both of the same BPN and type and expiring a year later. Every credential was created a year
+  before its expiry date, which only the keyset paginated listing returns,
+- the single and bulk revocation and `bpn`/`membership`/`framework` issuance endpoints of the issuer service and
+  the `status` endpoint. Issued credentials are signed `signing_delay` seconds after their issuance, unless their
+  signing fails with probability `signing_failure_rate`. Framework credentials stay pending as they are not approved,
+- the SAP DIV `customerWallets` and `operations/{id}` endpoints and the DIS `companyIdentities` endpoint.
+  With several wallets per BPN, only the company DID of the last wallet belongs to the stage, the others belong to
+  another stage or have no company identity.
+
+Every request is delayed by `latency` seconds plus up to `jitter` seconds to emulate the round trip to a remote
+host, and fails with `error_status` with probability `error_rate`.
+"""
+
+import bisect
+import json
+import multiprocessing
+import random
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic, sleep
+from urllib.parse import parse_qs, urlparse
+
+CREDENTIAL_TYPES = ["BUSINESS_PARTNER_NUMBER", "MEMBERSHIP", "DATA_EXCHANGE_GOVERNANCE_CREDENTIAL"]
+ISSUANCE_PATHS = {"/api/issuer/bpn", "/api/issuer/membership", "/api/issuer/framework"}
+REVOCATION_PATH_PREFIX = "/api/revocation/issuer/credentials/"
+BULK_REVOCATION_PATH = "/api/revocation/issuer/credentials/bulk"
+BULK_ISSUANCE_PATH = "/api/issuer/bulk"
+BULK_ISSUANCE_FIELDS = ("bpnCredentials", "membershipCredentials", "frameworkCredentials")
+FRAMEWORK_ISSUANCE_PATH = "/api/issuer/framework"
+FRAMEWORK_ISSUANCE_FIELD = "frameworkCredentials"
+STATUS_PATH = "/api/issuer/status"
+OPERATIONS_PATH_PREFIX = "/api/v1.0.0/operations/"
+# Kinds of listed credentials, their number is the first digit of the credential ID
+ORIGINAL = 0
+PENDING_REPLACEMENT = 1
+ACTIVE_REPLACEMENT = 2
+
+
+@dataclass
+class FakeIssuerConfig:
+    num_credentials: int = 3000
+    # Every BPN holds up to one credential of each type
+    credentials_per_bpn: int = 1
+    # Every BPN has this many customer wallets, only the company DID of the last one belongs to `stage`
+    wallets_per_bpn: int = 1
+    max_page_size: int = 15
+    latency: float = 0.02
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    expiry_start: date = date(2025, 1, 1)
+    # Stage contained in the company DIDs returned by `companyIdentities`
+    stage: str = "int"
+    # Older issuer services reject the expiry date sorting and filters with 400
+    supports_expiry_filter: bool = True
+    max_compact_page_size: int = 1000
+    # Older issuer services have no keyset paginated listing and answer it with 404
+    supports_keyset: bool = True
+    # Older issuer services have no bulk routes, they reject bulk revocations with 400 and bulk issuances with 404
+    supports_bulk: bool = True
+    num_pending: int = 0
+    num_replaced: int = 0
+    signing_delay: float = 0.5
+    signing_failure_rate: float = 0.0
+    # Older issuer services have no status route and answer it with 404
+    supports_status: bool = True
+
+    @property
+    def num_wallets(self) -> int:
+        return (self.num_credentials + self.credentials_per_bpn - 1) // self.credentials_per_bpn
+
+
+def expiry_date_of(index: int, config: FakeIssuerConfig) -> date:
+    return config.expiry_start + timedelta(days=index % 365)
+
+
+def date_created_of(expiry_date: str) -> str:
+    return (datetime.fromisoformat(expiry_date) - timedelta(days=365)).isoformat()
+
+
+def bpn_of(wallet: int) -> str:
+    return f"BPNL{wallet:012d}"
+
+
+def listed_entries(config: FakeIssuerConfig, status: str) -> list[tuple[str, int, int]]:
+    """Expiry date, index and kind of the credentials listed with `status`, ordered by expiry date"""
+    if status == "PENDING":
+        entries = [(expiry_date_of(i, config) + timedelta(days=365), i, PENDING_REPLACEMENT)
+                   for i in range(min(config.num_pending, config.num_credentials))]
+    else:
+        entries = [(expiry_date_of(i, config), i, ORIGINAL) for i in range(config.num_credentials)]
+        entries += [(expiry_date_of(i, config) + timedelta(days=365), i, ACTIVE_REPLACEMENT)
+                    for i in range(config.num_pending, min(config.num_pending + config.num_replaced,
+                                                           config.num_credentials))]
+    return sorted((expiry_date.isoformat(), index, kind) for expiry_date, index, kind in entries)
+
+
+def make_credential(index: int, config: FakeIssuerConfig, kind: int = ORIGINAL) -> dict:
+    expiry_date = expiry_date_of(index, config) + timedelta(days=365 if kind != ORIGINAL else 0)
+    return {
+        "credentialDetailId": f"{kind}0000000-0000-0000-0000-{index:012d}",
+        "bpnl": bpn_of(index // config.credentials_per_bpn),
+        "credentialType": CREDENTIAL_TYPES[index % config.credentials_per_bpn % len(CREDENTIAL_TYPES)],
+        "expiryDate": f"{expiry_date.isoformat()}T00:00:00+00:00",
+        "processSteps": [
+            {"processStepTypeId": "CREATE_SIGNED_CREDENTIAL", "processStepStatusId": "DONE"},
+            {"processStepTypeId": "SAVE_CREDENTIAL_DOCUMENT", "processStepStatusId": "DONE"},
+        ],
+    }
+
+
+class FakeIssuerHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, like the real services behind the ingress
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    config: FakeIssuerConfig
+    # Listed entries per status, computed once per server
+    listings: dict
+    # Issuance time, framework flag and signing failure of every issued credential, shared by all handlers
+    issued: dict
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_text(self, status: int, text: str):
+        payload = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def simulate_remote_call(self) -> bool:
+        """Delays the response and returns `False` if the request failed and the error was sent"""
+        sleep(self.config.latency + random.uniform(0, self.config.jitter))
+        if self.config.error_rate > 0 and random.random() < self.config.error_rate:
+            self.send_json(self.config.error_status, {"error": "Simulated failure"})
+            return False
+        return True
+
+    def issue(self, framework: bool) -> str:
+        credential_id = str(uuid.uuid4())
+        failed = self.config.signing_failure_rate > 0 and random.random() < self.config.signing_failure_rate
+        self.issued[credential_id] = (monotonic(), framework, failed)
+        return credential_id
+
+    def credential_status(self, credential_id: str) -> dict:
+        issued_at, framework, failed = self.issued[credential_id]
+        signed = not framework and not failed and monotonic() - issued_at >= self.config.signing_delay
+        return {
+            "credentialDetailId": credential_id,
+            "status": "PENDING" if framework else "ACTIVE",
+            "signed": signed,
+            "failed": failed and monotonic() - issued_at >= self.config.signing_delay,
+        }
+
+    def listed(self, query: dict, by_expiry_date: bool = True) -> list[tuple[str, int, int]]:
+        key = (query.get("companySsiDetailStatusId", ["ACTIVE"])[0], by_expiry_date)
+        if key not in self.listings:
+            entries = listed_entries(self.config, key[0])
+            # Unsorted listings are ordered by BPN
+            self.listings[key] = entries if by_expiry_date else sorted(entries, key=lambda entry: entry[1:])
+        return self.listings[key]
+
+    @property
+    def own_url(self) -> str:
+        return f"http://{self.headers.get('Host')}"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if not self.simulate_remote_call():
+            return
+
+        path = urlparse(self.path).path
+        if path.endswith("/token"):
+            # The token identifies the client, so `companyIdentities` knows the wallet of the caller
+            client_id = parse_qs(body.decode()).get("client_id", ["fake"])[0]
+            self.send_json(200, {"access_token": f"token-{client_id}", "expires_in": 300})
+        elif path == BULK_REVOCATION_PATH and self.config.supports_bulk:
+            self.send_json(200, [{"index": index, "id": credential_id, "error": None}
+                                 for index, credential_id in enumerate(json.loads(body))])
+        elif path == BULK_ISSUANCE_PATH and self.config.supports_bulk:
+            request = json.loads(body)
+            self.send_json(200, {field: [{"index": index, "id": self.issue(field == FRAMEWORK_ISSUANCE_FIELD),
+                                          "error": None}
+                                         for index in range(len(request.get(field) or []))]
+                                 for field in BULK_ISSUANCE_FIELDS})
+        elif path == STATUS_PATH and self.config.supports_status:
+            self.send_json(200, [self.credential_status(credential_id) for credential_id in json.loads(body)
+                                 if credential_id in self.issued])
+        elif path == BULK_REVOCATION_PATH:
+            self.send_json(400, {"errors": {"credentialId": ["The value 'bulk' is not valid."]}})
+        elif path.startswith(REVOCATION_PATH_PREFIX):
+            self.send_text(200, "")
+        elif path in ISSUANCE_PATHS:
+            self.send_json(200, self.issue(path == FRAMEWORK_ISSUANCE_PATH))
+        else:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_GET(self):
+        if not self.simulate_remote_call():
+            return
+
+        url = urlparse(self.path)
+        if url.path == "/api/issuer":
+            self.send_credential_page(parse_qs(url.query))
+        elif url.path == "/api/issuer/compact" and self.config.supports_keyset:
+            self.send_compact_page(parse_qs(url.query))
+        elif url.path == "/api/v1.0.0/customerWallets":
+            self.send_json(200, {"data": [
+                {"customerName": f"Company {wallet} {bpn_of(wallet)} {number}",
+                 "lastOperationId": f"operation-{wallet}-{number}"}
+                for wallet in range(self.config.num_wallets) for number in range(self.config.wallets_per_bpn)
+            ]})
+        elif url.path.startswith(OPERATIONS_PATH_PREFIX):
+            operation_id = url.path.removeprefix(OPERATIONS_PATH_PREFIX)
+            self.send_json(200, {"data": {"serviceKey": {"uaa": {
+                "url": self.own_url,
+                "clientid": f"client-{operation_id}",
+                "clientsecret": "fake-secret",
+            }}}})
+        elif url.path == "/api/v2.0.0/companyIdentities":
+            number = int(self.headers.get("Authorization", "-0").rsplit("-", 1)[1])
+            if number == self.config.wallets_per_bpn - 1:
+                self.send_json(200, {"data": [
+                    {"issuerDID": f"did:web:dis-agent.{self.config.stage}.example.com:{uuid.uuid4()}"}]})
+            elif number % 2 == 0:
+                self.send_json(200, {"data": []})
+            else:
+                self.send_json(200, {"data": [{"issuerDID": f"did:web:dis-agent.other.example.com:{uuid.uuid4()}"}]})
+        else:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def send_credential_page(self, query: dict):
+        page = int(query.get("page", ["0"])[0])
+        size = min(int(query.get("size", ["15"])[0]), self.config.max_page_size)
+        entries = self.listed(query, "sorting" in query)
+        if "sorting" in query:
+            if not self.config.supports_expiry_filter or query["sorting"][0] != "ExpiryDateAsc":
+                self.send_json(400, {"error": f"Unsupported sorting {query['sorting'][0]}"})
+                return
+            expiry_from = query.get("expiryDateFrom", ["0001-01-01"])[0][:10]
+            expiry_to = query.get("expiryDateTo", ["9999-12-31"])[0][:10]
+            entries = [entry for entry in entries if expiry_from <= entry[0] <= expiry_to]
+        total = len(entries)
+        total_pages = (total + size - 1) // size
+        content = [make_credential(i, self.config, kind) for _, i, kind in entries[page * size:(page + 1) * size]]
+        self.send_json(200, {
+            "meta": {"numberOfElements": total, "totalPages": total_pages, "page": page, "contentSize": len(content)},
+            "content": content,
+        })
+
+    def send_compact_page(self, query: dict):
+        size = int(query.get("size", ["500"])[0])
+        if not 1 <= size <= self.config.max_compact_page_size:
+            self.send_json(400, {"error": f"Invalid page size {size}"})
+            return
+        expiry_from = query.get("expiryDateFrom", ["0001-01-01"])[0][:10]
+        expiry_to = query.get("expiryDateTo", ["9999-12-31"])[0][:10]
+        entries = self.listed(query)
+        keys = entries[bisect.bisect_left(entries, (expiry_from,)):bisect.bisect_left(entries, (expiry_to + "~",))]
+        start = 0
+        if "cursor" in query:
+            expiry_date, index, kind = query["cursor"][0].split("_")
+            start = bisect.bisect_right(keys, (expiry_date, int(index), int(kind)))
+        page_keys = keys[start:start + size]
+        has_more = start + size < len(keys)
+        self.send_json(200, {
+            "content": [
+                {
+                    "credentialDetailId": credential["credentialDetailId"],
+                    "bpnl": credential["bpnl"],
+                    "credentialType": credential["credentialType"],
+                    "expiryDate": credential["expiryDate"],
+                    "dateCreated": date_created_of(credential["expiryDate"]),
+                    "signed": True,
+                }
+                for credential in (make_credential(i, self.config, kind) for _, i, kind in page_keys)
+            ],
+            "nextCursor": "_".join(map(str, page_keys[-1])) if has_more else None,
+        })
+
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def create_server(config: FakeIssuerConfig) -> FakeServer:
+    handler = type("ConfiguredFakeIssuerHandler", (FakeIssuerHandler,),
+                   {"config": config, "issued": {}, "listings": {}})
+    return FakeServer(("127.0.0.1", 0), handler)
+
+
+def serve(config: FakeIssuerConfig, addresses: multiprocessing.Queue):
+    server = create_server(config)
+    addresses.put(server.server_address)
+    server.serve_forever()
+
+
+class FakeIssuer:
+    """
+    Runs the fake services on a random local port in a background thread.
+    With `separate_process` the server runs in a child process instead, so it neither competes with the
+    benchmarked code for the GIL nor adds to its memory usage.
+    """
+
+    def __init__(self, config: FakeIssuerConfig, separate_process: bool = False):
+        self.config = config
+        self.separate_process = separate_process
+        self.server: FakeServer | None = None
+        self.process: multiprocessing.Process | None = None
+        self.address: tuple[str, int] | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakeIssuer":
+        if self.separate_process:
+            addresses = multiprocessing.Queue()
+            self.process = multiprocessing.Process(target=serve, args=(self.config, addresses), daemon=True)
+            self.process.start()
+            self.address = addresses.get(timeout=30)
+        else:
+            self.server = create_server(self.config)
+            self.address = self.server.server_address
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+        else:
+            self.server.shutdown()
+            self.server.server_close()
@@ -0,0 +1,162 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Combines the revocations and issuances of concurrent reissue workers into bulk requests of the issuer service.
+
+A worker submits its item to a `MicroBatcher` and waits for its result. The batch is sent once it holds
+`max_size` items, or by the first waiting worker once `max_wait` seconds have passed, so a batch never delays an
+item by more than `max_wait`. The send function returns one result per item, either a value or the exception of the
+failed item, which is raised in the worker that submitted it.
+
+Issuer services without the bulk routes answer the first bulk request with 404 or 405. The send function then
+raises `BulkUnsupported`, the batcher disables itself for the rest of the run and `submit_or_call` falls back to
+the single requests. Any other failed bulk request, a 400 included, fails the items of its batch only.
+
+A bulk request whose response was lost, e.g. by a read timeout or a connection reset after sending, may have been
+processed. The send function then raises `BulkOutcomeUnknown`, and the batcher passes the items to its `resolve`
+function, which finds out the result of every item, e.g. from the status of the credentials or by repeating
+idempotent requests one by one. Without `resolve`, the items fail with `BulkOutcomeUnknown`.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError
+from typing import Callable, Generic, List, TypeVar
+
+DEFAULT_BULK_SIZE = 1
+DEFAULT_BULK_WAIT = 0.1
+# Maximum number of items the issuer service accepts per bulk request
+MAX_BULK_SIZE = 100
+# Status codes of issuer services without the bulk route
+UNSUPPORTED_STATUS_CODES = (404, 405)
+# The single revocation route `credentials/{credentialId}` of older issuer services also matches `credentials/bulk`
+# and rejects `bulk` as credential ID with 400. Only this binding error marks the bulk revocation as unsupported,
+# older services that omit the error details answer with a bare 400 and need `--bulk-size 1`.
+ROUTE_BINDING_ERROR = "'bulk' is not valid"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BulkUnsupported(Exception):
+    """The issuer service does not provide the bulk route"""
+
+
+class BulkOutcomeUnknown(Exception):
+    """The bulk request failed after it was sent, its items may have been processed"""
+
+
+def is_bulk_unsupported(status_code: int, text: str) -> bool:
+    """Whether a bulk request failed because the issuer service has no bulk route"""
+    return status_code in UNSUPPORTED_STATUS_CODES or (status_code == 400 and ROUTE_BINDING_ERROR in text)
+
+
+class MicroBatcher(Generic[T, R]):
+    def __init__(self, name: str, send: Callable[[List[T]], List[R | Exception]], max_size: int,
+                 max_wait: float = DEFAULT_BULK_WAIT,
+                 resolve: Callable[[List[T], Exception], List[R | Exception]] | None = None):
+        self.name = name
+        self.send = send
+        self.resolve = resolve
+        self.max_size = max_size
+        self.max_wait = max_wait
+        # Cleared once the issuer service turns out not to support the bulk route
+        self.enabled = True
+        self.num_batches = 0
+        self.num_items = 0
+        # Batches whose outcome was unknown and had to be resolved
+        self.num_unknown = 0
+        self._pending: List[tuple[T, Future]] = []
+        self._lock = threading.Lock()
+
+    def submit(self, item: T) -> R:
+        """Waits until the batch of `item` was sent, returns its result or raises its exception"""
+        if not self.enabled:
+            raise BulkUnsupported(f"Bulk {self.name} is not supported")
+        entry = (item, Future())
+        with self._lock:
+            self._pending.append(entry)
+            batch = self._take() if len(self._pending) >= self.max_size else None
+        if batch is not None:
+            self._send(batch)
+        else:
+            try:
+                return entry[1].result(timeout=self.max_wait)
+            except TimeoutError:
+                # Nobody filled the batch in time, the entry is sent now unless another worker took it meanwhile
+                with self._lock:
+                    batch = self._take() if entry in self._pending else None
+                if batch is not None:
+                    self._send(batch)
+        return entry[1].result()
+
+    def _take(self) -> List[tuple[T, Future]]:
+        batch, self._pending = self._pending[:self.max_size], self._pending[self.max_size:]
+        return batch
+
+    def _send(self, batch: List[tuple[T, Future]]):
+        try:
+            results = self.send([item for item, _ in batch])
+        except BulkUnsupported as e:
+            if self.num_batches == 0:
+                if self.enabled:
+                    logging.warning("Issuer service does not support bulk %s, falling back to single requests: %s",
+                                    self.name, e)
+                self.enabled = False
+                results = [e] * len(batch)
+            else:
+                # The bulk route worked before, so the issuer service rejected this request
+                results = [RuntimeError(str(e))] * len(batch)
+        except BulkOutcomeUnknown as e:
+            self.num_unknown += 1
+            results = self._resolve([item for item, _ in batch], e)
+        except Exception as e:
+            results = [e] * len(batch)
+        else:
+            self.num_batches += 1
+            self.num_items += len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _resolve(self, items: List[T], error: BulkOutcomeUnknown) -> List[R | Exception]:
+        if self.resolve is None:
+            return [error] * len(items)
+        logging.warning("Outcome of a bulk %s of %d items is unknown, resolving it: %s", self.name, len(items), error)
+        try:
+            return self.resolve(items, error)
+        except Exception as e:
+            logging.warning("Failed to resolve the outcome of a bulk %s: %s", self.name, e)
+            return [error] * len(items)
+
+
+def submit_or_call(batcher: MicroBatcher[T, R] | None, item: T, call: Callable[[], R]) -> R:
+    """Submits `item` to `batcher`, or runs the single request `call` without batcher or bulk route"""
+    if batcher is not None:
+        try:
+            return batcher.submit(item)
+        except BulkUnsupported:
+            pass
+    return call()
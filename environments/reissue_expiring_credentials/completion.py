@@ -0,0 +1,238 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Tracks whether the credentials issued by a run are completed by the process worker of the issuer service.
+
+The issuer service answers an issuance with the ID of the new credential as soon as it is stored, the credential is
+signed and written to the wallet of the holder later. `CompletionTracker` collects the new credential IDs and polls
+their status in a background thread, with one `/api/issuer/status` request per `batch_size` credentials. Every
+credential is polled again after an exponentially growing interval, from `interval` up to `max_interval` seconds.
+Credentials due within the next `interval` seconds are polled along with the due ones, so credentials issued around
+the same time share requests and at most one round of requests is sent per `interval`, however many credentials are
+in progress.
+
+A credential is completed once its CREATE_SIGNED_CREDENTIAL step is done. Credentials with a failed process step need
+the step to be retriggered and framework credentials wait for their approval, neither is polled further. At the end of
+the run `finish` waits up to a timeout for the credentials in progress, the ones still in progress are stuck.
+
+Issuer services without the status route answer it with 404 or 405, tracking stops then.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Dict, List
+
+from credential_page import CredentialStatus
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 60.0
+DEFAULT_TIMEOUT = 600.0
+# Status codes of issuer services without the status route
+UNSUPPORTED_STATUS_ROUTE_CODES = (404, 405)
+LATENCY_PERCENTILES = (0.5, 0.9, 0.99)
+
+STATE_IN_PROGRESS = "in_progress"
+STATE_COMPLETED = "completed"
+STATE_FAILED = "failed"
+STATE_AWAITING_APPROVAL = "awaiting_approval"
+STATES = (STATE_COMPLETED, STATE_FAILED, STATE_AWAITING_APPROVAL, STATE_IN_PROGRESS)
+# Status of framework credentials that were not approved yet
+STATUS_PENDING = "PENDING"
+
+
+class StatusUnsupported(Exception):
+    """The issuer service does not provide the status route"""
+
+
+@dataclass
+class TrackedCredential:
+    credential_id: str
+    # ID of the credential that was reissued
+    previous_credential_id: str | None
+    bpn: str | None
+    credential_type: str | None
+    issued_at: float
+    next_poll: float
+    polls: int = 0
+    state: str = STATE_IN_PROGRESS
+    # Seconds from the issuance to the poll that found the credential signed
+    latency: float | None = None
+
+
+def latency_percentiles(latencies: List[float]) -> Dict[str, float | None]:
+    values = sorted(latencies)
+    result = {f"p{round(fraction * 100)}": values[min(len(values) - 1, int(fraction * len(values)))] if values else None
+              for fraction in LATENCY_PERCENTILES}
+    result["max"] = values[-1] if values else None
+    return result
+
+
+class CompletionTracker:
+    def __init__(self, poll: Callable[[List[str]], List[CredentialStatus]], batch_size: int = DEFAULT_BATCH_SIZE,
+                 interval: float = DEFAULT_INTERVAL, max_interval: float = DEFAULT_MAX_INTERVAL,
+                 clock: Callable[[], float] = monotonic):
+        self.poll = poll
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_interval = max_interval
+        self.clock = clock
+        # Cleared once the issuer service turns out not to support the status route
+        self.supported = True
+        self.num_requests = 0
+        self._credentials: Dict[str, TrackedCredential] = {}
+        self._in_progress: Dict[str, TrackedCredential] = {}
+        self._condition = threading.Condition()
+        # Time the poller waits for, `None` while it polls or has nothing to poll
+        self._next_wake: float | None = None
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def num_in_progress(self) -> int:
+        return len(self._in_progress)
+
+    def track(self, credential_id: str, previous_credential_id: str | None = None, bpn: str | None = None,
+              credential_type: str | None = None):
+        """Adds a newly issued credential, it is polled for the first time after `interval` seconds"""
+        now = self.clock()
+        tracked = TrackedCredential(credential_id, previous_credential_id, bpn, credential_type, now,
+                                    now + self.interval)
+        with self._condition:
+            if not self.supported or self._stopping:
+                return
+            self._credentials[credential_id] = tracked
+            self._in_progress[credential_id] = tracked
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="completion", daemon=True)
+                self._thread.start()
+            elif self._next_wake is None or tracked.next_poll < self._next_wake:
+                self._condition.notify_all()
+
+    def finish(self, timeout: float):
+        """Waits up to `timeout` seconds until no credential is in progress anymore and stops polling"""
+        deadline = self.clock() + timeout
+        with self._condition:
+            while self._in_progress and self.supported:
+                time_left = deadline - self.clock()
+                if time_left <= 0:
+                    break
+                self._condition.wait(time_left)
+            self._stopping = True
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                due = self._wait_for_due()
+            if due is None:
+                return
+            for start in range(0, len(due), self.batch_size):
+                if not self._poll_batch(due[start:start + self.batch_size]):
+                    return
+
+    def _wait_for_due(self) -> List[TrackedCredential] | None:
+        """Waits until credentials are due and returns them, `None` once stopped"""
+        while not self._stopping:
+            now = self.clock()
+            next_poll = min((tracked.next_poll for tracked in self._in_progress.values()), default=None)
+            if next_poll is not None and next_poll <= now:
+                self._next_wake = None
+                return [tracked for tracked in self._in_progress.values() if tracked.next_poll <= now + self.interval]
+            self._next_wake = next_poll
+            self._condition.wait(None if next_poll is None else next_poll - now)
+        return None
+
+    def _poll_batch(self, batch: List[TrackedCredential]) -> bool:
+        """Polls the status of `batch` and updates its credentials, returns `False` if the status route is missing"""
+        try:
+            statuses = self.poll([tracked.credential_id for tracked in batch])
+        except StatusUnsupported as e:
+            if self.num_requests == 0:
+                logging.warning("Issuer service does not support polling the credential status, the completion of "
+                                "issued credentials is not tracked: %s", e)
+                with self._condition:
+                    self.supported = False
+                    self._condition.notify_all()
+                return False
+            logging.warning("Failed to poll the status of %s credentials: %s", len(batch), e)
+            statuses = []
+        except Exception as e:
+            logging.warning("Failed to poll the status of %s credentials: %s", len(batch), e)
+            statuses = []
+
+        now = self.clock()
+        status_by_id = {status.credential_id: status for status in statuses}
+        with self._condition:
+            self.num_requests += 1
+            for tracked in batch:
+                tracked.polls += 1
+                # Credentials that are not listed yet are polled again
+                status = status_by_id.get(tracked.credential_id)
+                if status is not None and status.signed:
+                    tracked.state = STATE_COMPLETED
+                    tracked.latency = now - tracked.issued_at
+                elif status is not None and status.failed:
+                    tracked.state = STATE_FAILED
+                elif status is not None and status.status == STATUS_PENDING:
+                    tracked.state = STATE_AWAITING_APPROVAL
+                if tracked.state == STATE_IN_PROGRESS:
+                    tracked.next_poll = now + min(self.interval * 2 ** min(tracked.polls, 32), self.max_interval)
+                else:
+                    self._in_progress.pop(tracked.credential_id, None)
+            if not self._in_progress:
+                self._condition.notify_all()
+        return True
+
+    def summary(self) -> Dict:
+        """
+        Counts the tracked credentials per state and reports the completion latency percentiles and the stuck
+        credentials, which failed or are still in progress
+        """
+        now = self.clock()
+        with self._condition:
+            credentials = list(self._credentials.values())
+        counts = {state: 0 for state in STATES}
+        for tracked in credentials:
+            counts[tracked.state] += 1
+        latencies = [round(tracked.latency, 3) for tracked in credentials if tracked.latency is not None]
+        return {
+            "tracked": len(credentials),
+            **counts,
+            "status_requests": self.num_requests,
+            "latency_seconds": latency_percentiles(latencies),
+            # Kept to merge the percentiles of several shards
+            "latencies": latencies,
+            "stuck_credentials": [
+                {
+                    "credential_id": tracked.credential_id,
+                    "previous_credential_id": tracked.previous_credential_id,
+                    "bpn": tracked.bpn,
+                    "type": tracked.credential_type,
+                    "state": tracked.state,
+                    "age_seconds": round(now - tracked.issued_at, 3),
+                }
+                for tracked in credentials if tracked.state in (STATE_FAILED, STATE_IN_PROGRESS)
+            ],
+        }
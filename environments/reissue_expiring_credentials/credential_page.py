@@ -0,0 +1,152 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Compact decoding of the credential pages of the issuer service.
+
+A page lists every credential with its documents, process steps and further details, of which the reissue script
+only needs the credential ID, BPN, credential type, expiry date and whether the credential was signed. A page is
+decoded into `ListedCredential` tuples holding just these fields, so the decoded page objects are released right
+away instead of being held while the credentials move through the pipeline. BPNs and credential types repeat
+across credentials and are interned.
+
+The keyset paginated `/api/issuer/compact` listing only returns these fields in the first place, together with the
+creation date of the credential and the cursor of the next page instead of the total number of pages.
+
+`/api/issuer/status` returns the status of the credentials with the given IDs, e.g. of the newly issued ones.
+
+If the optional `orjson` package is installed, it is used to decode the page, which is several times faster than
+the standard library and allocates less. Otherwise `json` is used.
+"""
+
+import json
+import sys
+from typing import Callable, List, NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SIGNED_STEP_TYPE = "CREATE_SIGNED_CREDENTIAL"
+DONE_STEP_STATUS = "DONE"
+
+
+class ListedCredential(NamedTuple):
+    """Fields of a listed credential used by the reissue script, missing fields are `None`"""
+    credential_id: str | None
+    bpn: str | None
+    credential_type: str | None
+    expiry_date: str | None
+    # The CREATE_SIGNED_CREDENTIAL step is DONE
+    signed: bool
+    # Only returned by the keyset paginated listing
+    date_created: str | None = None
+
+
+class CredentialPage(NamedTuple):
+    total_pages: int
+    credentials: List[ListedCredential]
+
+
+class CompactPage(NamedTuple):
+    # `None` on the last page
+    next_cursor: str | None
+    credentials: List[ListedCredential]
+
+
+class CredentialStatus(NamedTuple):
+    credential_id: str | None
+    # PENDING, ACTIVE, REVOKED or INACTIVE
+    status: str | None
+    # The CREATE_SIGNED_CREDENTIAL step is DONE
+    signed: bool
+    # A process step failed and the credential is not signed
+    failed: bool
+
+
+def json_backend() -> str:
+    return "orjson" if orjson is not None else "json"
+
+
+def loads(body: bytes):
+    """Decodes JSON with `orjson` if it is installed, raises a `ValueError` for invalid JSON with either backend"""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def is_signed(process_steps: List[dict] | None) -> bool:
+    for step in process_steps or ():
+        if step["processStepTypeId"] == SIGNED_STEP_TYPE and step["processStepStatusId"] == DONE_STEP_STATUS:
+            return True
+    return False
+
+
+def intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+def decode_credential_page(body: bytes, decode: Callable[[bytes], dict] = loads) -> CredentialPage:
+    """Decodes a page of `/api/issuer`, raises a `KeyError` if the page has no content or total pages"""
+    page = decode(body)
+    return CredentialPage(
+        page["meta"]["totalPages"],
+        [
+            ListedCredential(
+                cred.get("credentialDetailId"),
+                intern(cred.get("bpnl")),
+                intern(cred.get("credentialType")),
+                cred.get("expiryDate"),
+                is_signed(cred.get("processSteps")),
+            )
+            for cred in page["content"]
+        ],
+    )
+
+
+def decode_compact_page(body: bytes, decode: Callable[[bytes], dict] = loads) -> CompactPage:
+    """Decodes a page of `/api/issuer/compact`, raises a `KeyError` if the page has no content"""
+    page = decode(body)
+    return CompactPage(
+        page.get("nextCursor"),
+        [
+            ListedCredential(
+                cred.get("credentialDetailId"),
+                intern(cred.get("bpnl")),
+                intern(cred.get("credentialType")),
+                cred.get("expiryDate"),
+                bool(cred.get("signed")),
+                cred.get("dateCreated"),
+            )
+            for cred in page["content"]
+        ],
+    )
+
+
+def decode_credential_status(body: bytes, decode: Callable[[bytes], list] = loads) -> List[CredentialStatus]:
+    """Decodes the response of `/api/issuer/status`"""
+    return [
+        CredentialStatus(
+            cred.get("credentialDetailId"),
+            intern(cred.get("status")),
+            bool(cred.get("signed")),
+            bool(cred.get("failed")),
+        )
+        for cred in decode(body)
+    ]
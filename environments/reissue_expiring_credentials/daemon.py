@@ -0,0 +1,249 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Daemon mode of the reissue script.
+
+The `serve` command keeps the process running and reissues the credentials expiring within a rolling window, from
+today until `window_days` days ahead, once every `interval` seconds. A credential is thereby reissued within one
+interval of entering the window instead of on the next manual run. Between the cycles the process keeps its HTTP
+connection pools, tokens, cached client info and company DIDs, and the index of the customer wallets.
+
+A cycle that fails, e.g. because an upstream service is down, is logged and retried on the next cycle. SIGTERM and
+SIGINT stop the daemon once the current cycle is done.
+
+`HealthServer` exposes the state of the daemon on a local port:
+- `/healthz` answers 200 while the daemon is starting or its last cycle succeeded, and 503 once the last cycle
+  failed or no cycle succeeded for `2 * interval` seconds.
+- `/metrics` returns the metrics in the OpenMetrics text format, accumulated since the start of the daemon.
+- `/status` returns the state of the daemon and the outcome of the last cycle as JSON.
+"""
+
+import json
+import logging
+import signal
+import threading
+from datetime import date, datetime, timedelta, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic, perf_counter
+from typing import Callable, Dict
+
+from metrics import Metrics
+
+DEFAULT_INTERVAL = 3600.0
+DEFAULT_WINDOW_DAYS = 30
+DEFAULT_HEALTH_HOST = "127.0.0.1"
+DEFAULT_HEALTH_PORT = 9464
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+STATUS_STARTING = "starting"
+STATUS_OK = "ok"
+STATUS_FAILING = "failing"
+STATUS_STALE = "stale"
+
+
+def rolling_window(today: date, window_days: int) -> tuple[date, date]:
+    """The window of a cycle, from today until `window_days` days ahead, both inclusive"""
+    return today, today + timedelta(days=window_days)
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class Daemon:
+    def __init__(self, cycle: Callable[[date, date, float], Dict], metrics: Metrics,
+                 interval: float = DEFAULT_INTERVAL, window_days: int = DEFAULT_WINDOW_DAYS,
+                 today: Callable[[], date] = date.today, clock: Callable[[], float] = monotonic):
+        # Reissues the credentials expiring between the given dates and returns the summary of the run
+        self.cycle = cycle
+        self.metrics = metrics
+        self.interval = interval
+        self.window_days = window_days
+        self.today = today
+        self.clock = clock
+        self.started_at = utc_now()
+        self.num_cycles = 0
+        self.num_failed_cycles = 0
+        self.num_reissued = 0
+        self.num_failed = 0
+        self.last_cycle: Dict | None = None
+        self.next_cycle_at: str | None = None
+        self._start = clock()
+        self._last_success: float | None = None
+        self._last_cycle_failed = False
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self, *_):
+        """Stops the daemon once the current cycle is done, also used as signal handler"""
+        if not self._stop.is_set():
+            logging.info("Stopping the daemon after the current cycle")
+        self._stop.set()
+
+    def run(self, max_cycles: int | None = None) -> int:
+        """
+        Runs a cycle every `interval` seconds, measured from the start of one cycle to the next, until `stop` is
+        called or after `max_cycles` cycles. Returns 1 if the last cycle failed, otherwise 0.
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        logging.info("Starting the daemon, reissuing the credentials expiring within the next %s days every %.0f s",
+                     self.window_days, self.interval)
+        while not self._stop.is_set() and (max_cycles is None or self.num_cycles < max_cycles):
+            cycle_start = self.clock()
+            self.run_cycle()
+            if max_cycles is not None and self.num_cycles >= max_cycles:
+                break
+            wait = max(0.0, self.interval - (self.clock() - cycle_start))
+            with self._lock:
+                self.next_cycle_at = (datetime.now(timezone.utc) + timedelta(seconds=wait)).isoformat()
+            logging.info("Next cycle in %.0f s", wait)
+            self._stop.wait(wait)
+        logging.info("Stopped the daemon after %s cycles", self.num_cycles)
+        return 1 if self._last_cycle_failed else 0
+
+    def run_cycle(self):
+        start_date, end_date = rolling_window(self.today(), self.window_days)
+        run_start = perf_counter()
+        started_at = utc_now()
+        logging.info("Starting cycle %s for the credentials expiring between %s and %s", self.num_cycles + 1,
+                     start_date, end_date)
+        last_cycle = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "started_at": started_at,
+        }
+        try:
+            summary = self.cycle(start_date, end_date, run_start)
+        except Exception as e:
+            logging.exception("Cycle %s failed, retrying on the next cycle", self.num_cycles + 1)
+            last_cycle["error"] = str(e)
+            summary = None
+        duration = perf_counter() - run_start
+        with self._lock:
+            self.num_cycles += 1
+            self._last_cycle_failed = summary is None
+            if summary is None:
+                self.num_failed_cycles += 1
+            else:
+                self._last_success = self.clock()
+                self.num_reissued += summary["reissued"]
+                self.num_failed += summary["failed"]
+                last_cycle.update({
+                    "reissued": summary["reissued"],
+                    "failed": summary["failed"],
+                    "remaining": len(summary["remaining"]),
+                    "skipped": len(summary["skipped"]),
+                    "listing_complete": summary["listing_complete"],
+                })
+            last_cycle["duration_seconds"] = round(duration, 3)
+            self.last_cycle = last_cycle
+            self.next_cycle_at = None
+        self.metrics.set_total("daemon_cycles", self.num_cycles)
+        self.metrics.set_total("daemon_failed_cycles", self.num_failed_cycles)
+        self.metrics.set_total("daemon_credentials_reissued", self.num_reissued)
+        self.metrics.set_total("daemon_credentials_failed", self.num_failed)
+        self.metrics.set_total("daemon_last_cycle_duration_seconds", duration)
+
+    def health(self) -> str:
+        with self._lock:
+            if self._last_cycle_failed:
+                return STATUS_FAILING
+            last_success = self._last_success if self._last_success is not None else self._start
+            if self.clock() - last_success > 2 * self.interval:
+                return STATUS_STALE
+            return STATUS_OK if self._last_success is not None else STATUS_STARTING
+
+    def status(self) -> Dict:
+        health = self.health()
+        with self._lock:
+            return {
+                "status": health,
+                "started_at": self.started_at,
+                "uptime_seconds": round(self.clock() - self._start, 3),
+                "interval_seconds": self.interval,
+                "window_days": self.window_days,
+                "cycles": self.num_cycles,
+                "failed_cycles": self.num_failed_cycles,
+                "credentials_reissued": self.num_reissued,
+                "credentials_failed": self.num_failed,
+                "last_cycle": self.last_cycle,
+                "next_cycle_at": self.next_cycle_at,
+            }
+
+
+class HealthRequestHandler(BaseHTTPRequestHandler):
+    server: "HealthServer"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/healthz":
+            health = self.server.daemon.health()
+            healthy = health in (STATUS_OK, STATUS_STARTING)
+            self._respond(HTTPStatus.OK if healthy else HTTPStatus.SERVICE_UNAVAILABLE, "text/plain; charset=utf-8",
+                          f"{health}\n")
+        elif path == "/metrics":
+            self._respond(HTTPStatus.OK, OPENMETRICS_CONTENT_TYPE, self.server.metrics.to_openmetrics())
+        elif path == "/status":
+            self._respond(HTTPStatus.OK, "application/json",
+                          json.dumps(self.server.daemon.status(), indent=2) + "\n")
+        else:
+            self._respond(HTTPStatus.NOT_FOUND, "text/plain; charset=utf-8", "not found\n")
+
+    def _respond(self, status: HTTPStatus, content_type: str, body: str):
+        content = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args):
+        logging.debug("Health server: " + format, *args)
+
+
+class HealthServer(ThreadingHTTPServer):
+    """Serves `/healthz`, `/metrics` and `/status` of the daemon in a background thread"""
+    daemon_threads = True
+
+    def __init__(self, daemon: Daemon, metrics: Metrics, host: str = DEFAULT_HEALTH_HOST,
+                 port: int = DEFAULT_HEALTH_PORT):
+        super().__init__((host, port), HealthRequestHandler)
+        self.daemon = daemon
+        self.metrics = metrics
+        self._thread = threading.Thread(target=self.serve_forever, name="health-server", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "HealthServer":
+        self._thread.start()
+        logging.info("Serving /healthz, /metrics and /status at %s", self.url)
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
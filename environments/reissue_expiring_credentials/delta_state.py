@@ -0,0 +1,185 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+State of incremental reissue runs, persisted between runs.
+
+The state holds a watermark, the last expiry date whose credentials were all listed by a previous run, and the
+outcome of every credential seen since, keyed by credential ID together with its expiry date. A run then only lists
+the credentials expiring after the watermark, i.e. those that newly entered the expiry window, and retries the
+credentials of earlier runs that were not reissued: credentials without operation ID, failed ones, and ones that
+were revoked but not issued again. The latter are not ACTIVE anymore, so they are only known from the state.
+Listed credentials the state already knows are not evaluated again. Listed credentials that are not signed yet are
+not reissued, the watermark stays before the earliest of them, so the next run lists them again.
+
+Credentials are dropped from the state once they expire before the start of the window. The state is written to a
+temporary file that replaces the state file, so a crash never leaves a partial state. Without a path, e.g. between the
+cycles of the daemon, the state is only kept in memory.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator
+
+from metrics import write_atomically
+
+STATE_VERSION = 1
+
+# Fields of the credential records of the reissue script
+KEY_CREDENTIAL_ID = "credential_id"
+KEY_EXPIRY_DATE = "expiry_date"
+
+STATUS_PENDING = "pending"
+STATUS_REVOKED = "revoked"
+STATUS_FAILED = "failed"
+STATUS_REISSUED = "reissued"
+
+
+def expiry_date_of(record: Dict) -> date:
+    # ISO 8601 timestamps start with the date
+    return date.fromisoformat(record[KEY_EXPIRY_DATE][:10])
+
+
+class DeltaState:
+    def __init__(self, path: str | None, settings: Dict, watermark: date | None = None,
+                 credentials: Dict[str, Dict] | None = None):
+        self.path = path
+        # Settings the state is only valid for, e.g. the stage and the shard
+        self.settings = settings
+        self.watermark = watermark
+        # Credential ID -> {"status": ..., "record": credential record}
+        self.credentials: Dict[str, Dict] = credentials or {}
+        self.listing_complete = False
+        # Earliest expiry date of the listed credentials that are not signed yet
+        self.earliest_unsigned: date | None = None
+        self.num_retried = 0
+        self.num_skipped = 0
+        self._lock = threading.Lock()
+
+    def listing_start(self, start: date) -> date:
+        """First expiry date that has to be listed, the day after the watermark unless the window starts later"""
+        # Called once at the start of every listing, the counters are per run
+        self.num_retried = 0
+        self.num_skipped = 0
+        self.earliest_unsigned = None
+        if self.watermark is None or self.watermark < start:
+            return start
+        return self.watermark + timedelta(days=1)
+
+    def track(self, records: Iterable[Dict], start: date, end: date) -> Iterator[Dict]:
+        """
+        Lazily yields the credentials of earlier runs that were not reissued and expire between `start` and `end`,
+        then the records not seen before. Yielded records are recorded as pending.
+        """
+        for credential_id, entry in list(self.credentials.items()):
+            if entry["status"] != STATUS_REISSUED and start <= expiry_date_of(entry["record"]) <= end:
+                self.num_retried += 1
+                yield dict(entry["record"])
+
+        for record in records:
+            credential_id = record[KEY_CREDENTIAL_ID]
+            with self._lock:
+                if credential_id in self.credentials:
+                    self.num_skipped += 1
+                    continue
+                self.credentials[credential_id] = {"status": STATUS_PENDING, "record": dict(record)}
+            yield record
+        self.listing_complete = True
+
+    def hold(self, expiry_date: date):
+        """Keeps the watermark before `expiry_date`, for listed credentials that cannot be reissued yet"""
+        with self._lock:
+            if self.earliest_unsigned is None or expiry_date < self.earliest_unsigned:
+                self.earliest_unsigned = expiry_date
+
+    def status_of(self, credential_id: str) -> str | None:
+        entry = self.credentials.get(credential_id)
+        return entry["status"] if entry is not None else None
+
+    def mark(self, credential_id: str, status: str):
+        """Records the progress of a tracked credential, unknown credentials are ignored"""
+        with self._lock:
+            entry = self.credentials.get(credential_id)
+            if entry is None:
+                return
+            # A revoked credential is not ACTIVE anymore, so it has to stay marked as revoked until it is issued again
+            if status == STATUS_FAILED and entry["status"] == STATUS_REVOKED:
+                return
+            entry["status"] = status
+
+    def save(self, start: date, end: date):
+        """
+        Writes the state. The watermark only advances to `end` if the listing was processed completely, and at most
+        to the day before the earliest held credential. Credentials expiring before `start` are dropped. The listing
+        of the next run starts over.
+        """
+        if self.listing_complete:
+            watermark = end
+            if self.earliest_unsigned is not None:
+                watermark = min(watermark, self.earliest_unsigned - timedelta(days=1))
+            if self.watermark is None or self.watermark < watermark:
+                self.watermark = watermark
+        self.listing_complete = False
+        self.earliest_unsigned = None
+        with self._lock:
+            self.credentials = {credential_id: entry for credential_id, entry in self.credentials.items()
+                                if expiry_date_of(entry["record"]) >= start}
+            if self.path is None:
+                return
+            state = {
+                "state_version": STATE_VERSION,
+                **self.settings,
+                "watermark": self.watermark.isoformat() if self.watermark is not None else None,
+                "credentials": self.credentials,
+            }
+        write_atomically(self.path, json.dumps(state, separators=(",", ":"), sort_keys=True))
+        logging.info("Wrote state of %s credentials with watermark %s to %s", len(self.credentials), self.watermark,
+                     self.path)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {}
+        for entry in self.credentials.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
+
+
+def load_delta_state(path: str, **settings) -> DeltaState:
+    """
+    Reads the state of previous runs. Without a state file, every credential in the window is listed.
+    Raises a `ValueError` if the state was written with different `settings`, e.g. for another stage.
+    """
+    if not os.path.exists(path):
+        logging.warning("No state found at %s, listing every credential in the window", path)
+        return DeltaState(path, settings)
+
+    with open(path, encoding="utf-8") as state_file:
+        state = json.load(state_file)
+    if state.get("state_version") != STATE_VERSION:
+        raise ValueError(f"Unsupported state {path}: expected state_version {STATE_VERSION}, "
+                         f"got {state.get('state_version')}")
+    mismatches = [f"{name}={state.get(name)}" for name, value in settings.items() if state.get(name) != value]
+    if mismatches:
+        raise ValueError(f"State {path} was written for {', '.join(mismatches)}, it cannot be used for "
+                         f"{', '.join(f'{name}={value}' for name, value in settings.items())}")
+    watermark = date.fromisoformat(state["watermark"]) if state["watermark"] else None
+    return DeltaState(path, settings, watermark, state["credentials"])
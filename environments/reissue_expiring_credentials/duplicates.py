@@ -0,0 +1,148 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Detection of redundant reissues per BPN and credential type.
+
+Reissuing a credential is redundant if its holder already has a replacement of the same type:
+- a PENDING credential, e.g. requested by an earlier run and not signed or approved yet, or
+- an ACTIVE credential expiring after the expiry window and created after the expiring credential, e.g. issued to
+  the holder by an operator in the meantime. An older credential with a longer validity does not replace it.
+  Only the keyset paginated listing returns the creation dates, without them only PENDING credentials are
+  replacements.
+Several expiring credentials of the same BPN and type need a single new credential, so only the first one in the
+order of the run is reissued, the earliest expiring one if the run is ordered by expiry date.
+
+`DuplicateIndex` holds the replacements found by the listing keyed by `(bpn, credential type)` and skips the
+redundant credentials before they are merged, i.e. before any SAP request or mutation of the issuer service. Skipped
+credentials are reported with the reason and the credential they were skipped for.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+
+from credential_page import ListedCredential
+
+REASON_PENDING_REPLACEMENT = "pending_replacement"
+REASON_ACTIVE_REPLACEMENT = "active_replacement"
+REASON_DUPLICATE = "duplicate"
+REASONS = (REASON_PENDING_REPLACEMENT, REASON_ACTIVE_REPLACEMENT, REASON_DUPLICATE)
+
+# Fields of the credential records of the reissue script
+KEY_CREDENTIAL_ID = "credential_id"
+KEY_BPN = "bpn"
+KEY_TYPE = "type"
+KEY_EXPIRY_DATE = "expiry_date"
+KEY_DATE_CREATED = "date_created"
+
+
+class SkippedCredential(NamedTuple):
+    record: Dict
+    reason: str
+    # The replacement, or the credential that is reissued instead
+    other_credential_id: str | None
+
+    def to_dict(self) -> Dict:
+        return {
+            "credential_id": self.record.get(KEY_CREDENTIAL_ID),
+            "bpn": self.record.get(KEY_BPN),
+            "type": self.record.get(KEY_TYPE),
+            "expiry_date": self.record.get(KEY_EXPIRY_DATE),
+            "reason": self.reason,
+            "other_credential_id": self.other_credential_id,
+        }
+
+
+class Replacement(NamedTuple):
+    reason: str
+    credential_id: str
+    # Creation date of an active replacement, `None` for pending ones
+    date_created: datetime | None
+
+    def replaces(self, record: Dict) -> bool:
+        if self.date_created is None:
+            return True
+        date_created = parse_date_created(record.get(KEY_DATE_CREATED))
+        return date_created is not None and self.date_created > date_created
+
+
+def parse_date_created(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    date_created = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # Dates without offset are UTC, like all dates of the issuer service
+    return date_created if date_created.tzinfo is not None else date_created.replace(tzinfo=timezone.utc)
+
+
+class DuplicateIndex:
+    def __init__(self):
+        # Replacement per BPN and credential type, pending replacements take precedence over the latest created
+        # active one
+        self.replacements: Dict[tuple[str, str], Replacement] = {}
+        # ID of the credential that is reissued per BPN and credential type
+        self.reissued: Dict[tuple[str, str], str] = {}
+        self.skipped: List[SkippedCredential] = []
+
+    def add_replacements(self, credentials: Iterable[ListedCredential], reason: str) -> int:
+        """
+        Indexes the listed `credentials` as replacements, returns their number. Active credentials without creation
+        date are ignored, as it is unknown whether they were issued after the expiring ones.
+        """
+        num_replacements = 0
+        for cred in credentials:
+            if cred.bpn is None or cred.credential_type is None:
+                continue
+            key = (cred.bpn, cred.credential_type)
+            current = self.replacements.get(key)
+            if reason == REASON_PENDING_REPLACEMENT:
+                self.replacements[key] = Replacement(reason, cred.credential_id, None)
+            else:
+                date_created = parse_date_created(cred.date_created)
+                if date_created is None:
+                    continue
+                if current is None or (current.date_created is not None and date_created > current.date_created):
+                    self.replacements[key] = Replacement(reason, cred.credential_id, date_created)
+            num_replacements += 1
+        return num_replacements
+
+    def filter(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        """Lazily yields the credential records whose reissue is not redundant, the others are recorded as skipped"""
+        for record in records:
+            key = (record[KEY_BPN], record[KEY_TYPE])
+            replacement = self.replacements.get(key)
+            if replacement is not None and replacement.replaces(record):
+                skipped = SkippedCredential(record, replacement.reason, replacement.credential_id)
+            elif key in self.reissued:
+                skipped = SkippedCredential(record, REASON_DUPLICATE, self.reissued[key])
+            else:
+                self.reissued[key] = record[KEY_CREDENTIAL_ID]
+                yield record
+                continue
+            logging.info("Skipping credential %s (BPN: %s, Type: %s): %s %s", record[KEY_CREDENTIAL_ID],
+                         record[KEY_BPN], record[KEY_TYPE], skipped.reason, skipped.other_credential_id)
+            self.skipped.append(skipped)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {reason: 0 for reason in REASONS}
+        for skipped in self.skipped:
+            counts[skipped.reason] += 1
+        return counts
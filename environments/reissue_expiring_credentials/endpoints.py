@@ -0,0 +1,160 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Base URLs and paths of the services called by the reissue script.
+
+Every endpoint can be overridden per run, so the script can target in-cluster services, other deployments or
+local stand-ins. Settings are applied in the following order, later sources win:
+1. the defaults, pointing at the public `*.catena-x.net` hosts of the stage
+2. the top level keys of the TOML config file
+3. the `[stages.<stage>]` table of the TOML config file
+4. environment variables named `REISSUE_<FIELD>`, e.g. `REISSUE_ISSUER_SERVICE_BASE_URL`
+5. command line arguments, e.g. `--issuer-service-base-url`
+
+Values may contain the `{stage}` placeholder, the DID document URL also requires the `{bpn}` placeholder.
+Example config file:
+
+    sap_auth_url = "https://sap-auth.example.com"
+
+    [stages.int]
+    issuer_service_base_url = "http://ssi-credential-issuer.issuer.svc.cluster.local:8080"
+"""
+
+import os
+import re
+import tomllib
+from dataclasses import dataclass, fields, replace
+from string import Formatter
+from typing import Dict, Mapping
+from urllib.parse import urlsplit
+
+ENV_PREFIX = "REISSUE_"
+
+# Stages are part of host names, so they have to be valid DNS labels
+STAGE_PATTERN = re.compile(r"[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?")
+
+URL_FIELDS = ("issuer_service_base_url", "keycloak_base_url", "sap_url", "sap_auth_url", "dis_base_url",
+              "did_document_url")
+PATH_FIELDS = ("keycloak_token_path", "sap_token_path")
+
+
+@dataclass(frozen=True)
+class Endpoints:
+    issuer_service_base_url: str = "https://ssi-credential-issuer.{stage}.catena-x.net"
+    keycloak_base_url: str = "https://centralidp.{stage}.catena-x.net"
+    keycloak_token_path: str = "/auth/realms/CX-Central/protocol/openid-connect/token"
+    sap_url: str | None = None
+    sap_auth_url: str | None = None
+    sap_token_path: str = "/oauth/token"
+    dis_base_url: str = "https://dis-integration-service-prod.eu10.div.cloud.sap"
+    did_document_url: str = "https://portal-backend.{stage}.catena-x.net/api/administration/staticdata/did/{bpn}/did.json"
+
+    def did_document(self, bpn: str) -> str:
+        return self.did_document_url.format(bpn=bpn)
+
+    def __str__(self) -> str:
+        return "\n".join(f"{field.name}: {getattr(self, field.name)}" for field in fields(self))
+
+
+def env_overrides(environ: Mapping[str, str] = os.environ) -> Dict[str, str]:
+    """Returns the endpoints set by `REISSUE_<FIELD>` environment variables"""
+    overrides = {}
+    for field in fields(Endpoints):
+        value = environ.get(f"{ENV_PREFIX}{field.name.upper()}")
+        if value:
+            overrides[field.name] = value
+    return overrides
+
+
+def read_config_file(path: str, stage: str) -> Dict[str, str]:
+    """Returns the endpoints set by the top level keys and the `[stages.<stage>]` table of a TOML config file"""
+    with open(path, "rb") as config_file:
+        config = tomllib.load(config_file)
+
+    stages = config.pop("stages", {})
+    settings = {**config, **stages.get(stage, {})}
+    known_fields = {field.name for field in fields(Endpoints)}
+    unknown_keys = settings.keys() - known_fields
+    if unknown_keys:
+        raise ValueError(f"Unknown settings in config file {path}: {', '.join(sorted(unknown_keys))}")
+    return settings
+
+
+def placeholders_of(template: str) -> set[str]:
+    return {name for _, name, _, _ in Formatter().parse(template) if name is not None}
+
+
+def validate(endpoints: Endpoints, stage: str):
+    """Raises a `ValueError` listing every invalid setting"""
+    problems = []
+    if not STAGE_PATTERN.fullmatch(stage):
+        problems.append(f"stage must be a lowercase DNS label, got '{stage}'")
+
+    for name in URL_FIELDS + PATH_FIELDS:
+        value = getattr(endpoints, name)
+        if not value:
+            problems.append(f"{name} is required")
+            continue
+        if not isinstance(value, str):
+            problems.append(f"{name} must be a string: {value}")
+            continue
+        try:
+            allowed_placeholders = {"stage", "bpn"} if name == "did_document_url" else {"stage"}
+            unknown_placeholders = placeholders_of(value) - allowed_placeholders
+        except ValueError as valueError:
+            problems.append(f"{name} is not a valid template: {valueError}")
+            continue
+        if unknown_placeholders:
+            problems.append(f"{name} contains unknown placeholders {sorted(unknown_placeholders)}: {value}")
+        elif name in URL_FIELDS:
+            url = urlsplit(value)
+            if url.scheme not in ("http", "https") or not url.netloc:
+                problems.append(f"{name} must be an absolute http(s) URL: {value}")
+        elif not value.startswith("/"):
+            problems.append(f"{name} must start with '/': {value}")
+
+    if isinstance(endpoints.did_document_url, str) and "bpn" not in placeholders_of(endpoints.did_document_url):
+        problems.append(f"did_document_url must contain the {{bpn}} placeholder: {endpoints.did_document_url}")
+
+    if problems:
+        raise ValueError("Invalid endpoint configuration:\n" + "\n".join(f"- {problem}" for problem in problems))
+
+
+def resolve(endpoints: Endpoints, stage: str) -> Endpoints:
+    """Fills in the stage and strips trailing slashes, the `{bpn}` placeholder of the DID document URL is kept"""
+    resolved = {name: getattr(endpoints, name).format(stage=stage, bpn="{bpn}") for name in URL_FIELDS + PATH_FIELDS}
+    for name in URL_FIELDS:
+        if name != "did_document_url":
+            resolved[name] = resolved[name].rstrip("/")
+    return replace(endpoints, **resolved)
+
+
+def load_endpoints(stage: str, config_file: str | None = None, cli_overrides: Mapping[str, str | None] = None,
+                   environ: Mapping[str, str] = os.environ) -> Endpoints:
+    """Merges the defaults, the config file, the environment and the command line, validates and resolves them"""
+    settings = {}
+    if config_file:
+        settings.update(read_config_file(config_file, stage))
+    settings.update(env_overrides(environ))
+    settings.update({name: value for name, value in (cli_overrides or {}).items() if value is not None})
+    endpoints = Endpoints(**settings)
+    validate(endpoints, stage)
+    return resolve(endpoints, stage)
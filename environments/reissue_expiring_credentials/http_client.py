@@ -0,0 +1,267 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Shared HTTP client used for all outbound calls of the reissue script.
+
+All requests go through one `requests.Session`, which keeps a connection pool per host, so connections to the
+issuer service, Keycloak, SAP and the DIS integration service are reused across calls (keep-alive).
+Every request gets explicit connect/read timeouts. Idempotent GET requests are retried with exponential backoff
+on connection errors and on 429/502/503/504, POST requests are only retried when the server did not process them,
+i.e. on connection errors and on 429/503. `Retry-After` headers are respected.
+Unless disabled, the number of requests in flight per host is limited by an `AdaptiveLimiter`, which backs off on
+throttling and rising latency and probes for more throughput otherwise.
+"""
+
+import logging
+import threading
+from time import perf_counter
+from urllib.parse import urlsplit
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from urllib3.util.retry import Retry
+
+from metrics import Metrics
+from rate_limiter import DEFAULT_INITIAL_LIMIT, HostLimiters, parse_retry_after
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+IDEMPOTENT_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Status codes signalling that the request was rejected before it was processed, safe to retry for any method
+UNPROCESSED_RETRY_STATUS_CODES = frozenset({429, 503})
+# Number of leading path segments identifying a route for latency tracking, e.g. POST /api/revocation/issuer
+ROUTE_PATH_SEGMENTS = 3
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def host_key(scheme: str, host: str, port: int | None) -> str:
+    """Key of the limiter of a host, the default port of `scheme` is omitted so every URL of a host shares one key"""
+    host = host.lower()
+    return host if port is None or port == DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+
+
+class ReissueRetry(Retry):
+    """
+    Retries idempotent requests on `IDEMPOTENT_RETRY_STATUS_CODES` and all other requests on
+    `UNPROCESSED_RETRY_STATUS_CODES`. Read errors are only retried for idempotent requests.
+    Throttled attempts are reported to the host's limiter before they are retried.
+    """
+    limiters: HostLimiters | None = None
+    # Set once the throttled response this retry was incremented for was reported, so the adapter does not report it
+    # again if the retries are exhausted and the response is returned
+    throttle_reported = False
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code in UNPROCESSED_RETRY_STATUS_CODES:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def new(self, **kw) -> "ReissueRetry":
+        retry = super().new(**kw)
+        retry.limiters = self.limiters
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None) -> Retry:
+        if self.limiters is not None and _pool is not None and response is not None \
+                and response.status in UNPROCESSED_RETRY_STATUS_CODES:
+            host = host_key(_pool.scheme, _pool.host, _pool.port)
+            self.limiters.get(host).throttle(parse_retry_after(response.headers.get("Retry-After")))
+            self.throttle_reported = True
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def route_of(method: str, url: str) -> str:
+    path = urlsplit(url).path.strip("/").split("/")
+    return f"{method} /{'/'.join(path[:ROUTE_PATH_SEGMENTS])}"
+
+
+class ReissueHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that applies a default (connect, read) timeout to every request without an explicit one,
+    if `limiters` are given, limits the number of requests in flight per host and, if `metrics` are given, records
+    the latency, status code and number of retries of every request.
+    """
+
+    def __init__(self, timeout: tuple[float, float], limiters: HostLimiters | None = None,
+                 metrics: Metrics | None = None, **kwargs):
+        self.timeout = timeout
+        self.limiters = limiters
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs) -> Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        if self.limiters is None and self.metrics is None:
+            return super().send(request, **kwargs)
+
+        route = route_of(request.method, request.url)
+        limiter = None
+        if self.limiters is not None:
+            split_url = urlsplit(request.url)
+            host = host_key(split_url.scheme, split_url.hostname, split_url.port)
+            limiter = self.limiters.get(host)
+            limiter.acquire()
+        start = perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except BaseException as exception:
+            latency = perf_counter() - start
+            if limiter is not None:
+                limiter.release(route, latency, throttled=isinstance(exception, requests.ConnectionError))
+            if self.metrics is not None:
+                self.metrics.observe_request(route, "error", latency)
+            raise
+        latency = perf_counter() - start
+        retries = getattr(response.raw, "retries", None)
+        num_retries = len(retries.history) if retries is not None else 0
+        if limiter is not None:
+            # The latency of retried requests includes the backoff. Their throttled attempts were already reported by
+            # `ReissueRetry.increment`, the returned response as well if the retries were exhausted by it
+            throttled = response.status_code in UNPROCESSED_RETRY_STATUS_CODES \
+                and not getattr(retries, "throttle_reported", False)
+            limiter.release(
+                route,
+                None if num_retries else latency,
+                throttled=throttled,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")) if throttled else None,
+            )
+        if self.metrics is not None:
+            self.metrics.observe_request(route, response.status_code, latency, num_retries)
+        return response
+
+
+def create_session(
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        adaptive_rate_limit: bool = True,
+        initial_rate_limit: float = DEFAULT_INITIAL_LIMIT,
+        metrics: Metrics | None = None,
+) -> requests.Session:
+    """
+    Create a session with pooled keep-alive connections, timeouts and retries.
+    `pool_connections` is the number of hosts for which a pool is kept, `pool_maxsize` the number of connections
+    kept per host. `pool_maxsize` should be at least the number of threads issuing requests concurrently.
+    With `adaptive_rate_limit`, requests per host start at `initial_rate_limit` in flight and adapt up to
+    `pool_maxsize`. If `metrics` are given, every request is recorded in them.
+    """
+    global _limiters
+    _limiters = HostLimiters(initial_limit=initial_rate_limit, max_limit=pool_maxsize) if adaptive_rate_limit else None
+    retry = ReissueRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=IDEMPOTENT_RETRY_STATUS_CODES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    retry.limiters = _limiters
+    adapter = ReissueHTTPAdapter(
+        (connect_timeout, read_timeout),
+        _limiters,
+        metrics,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_limiters: HostLimiters | None = None
+
+
+def log_rate_limits():
+    """Logs the current concurrency limit of every host"""
+    if _limiters is not None:
+        _limiters.log_limits()
+
+
+def configure_session(**kwargs) -> requests.Session:
+    """Replace the shared session with a new one created by `create_session` with the given settings"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(**kwargs)
+        logging.debug("Configured HTTP session with %s", kwargs)
+        return _session
+
+
+def get_session() -> requests.Session:
+    """Returns the shared session, creating one with the default settings on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def close_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def outcome_unknown(error: Exception) -> bool:
+    """
+    Whether a failed request may still have been processed by the server: the connection failed after the request
+    was sent, or the response timed out. Connection errors raised before the request was sent, e.g. refused
+    connections, name resolution failures and connect timeouts, are known not to have reached the server.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    if isinstance(error, requests.ConnectionError):
+        reason = error.args[0] if error.args else None
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        return not isinstance(reason, NewConnectionError)
+    return isinstance(error, (requests.Timeout, requests.exceptions.ChunkedEncodingError))
+
+
+def get(url: str, **kwargs) -> Response:
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> Response:
+    return get_session().post(url, **kwargs)
@@ -0,0 +1,181 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Append-only journal that records the progress of every credential of a reissue run.
+
+Each line is a JSON object with the credential ID and the step it reached: `merged` (with the merged credential
+record), `revoked`, `issued` or `failed`. A `discovery_complete` line marks that every page of the listing has
+been processed. Lines are written by a background thread and flushed and fsync'd in batches, so recording a step
+does not block the reissue workers. A crash can lose at most the last unflushed batch, except for lines recorded
+with `durable=True`: their caller waits until the line is on disk. Concurrent durable records share one fsync.
+If writing or syncing fails, the journal stops writing, and the pending and all later durable records raise the
+error instead of waiting forever.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from time import time
+from typing import Dict, List
+
+STEP_MERGED = "merged"
+STEP_REVOKED = "revoked"
+STEP_ISSUED = "issued"
+STEP_FAILED = "failed"
+STEP_DISCOVERY_COMPLETE = "discovery_complete"
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+_STOP = object()
+
+
+class Journal:
+    def __init__(self, path: str, append: bool = False, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+        self._queue: queue.Queue = queue.Queue()
+        # First write or sync error, set by the writer thread
+        self._error: Exception | None = None
+        self._writer = threading.Thread(target=self._write_loop, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, credential_id: str | None, step: str, durable: bool = False, **data):
+        """
+        Queue a journal line. Returns immediately unless `durable` is set, then it waits until the line is synced and
+        raises an `OSError` if the journal could not be written.
+        """
+        synced = threading.Event() if durable else None
+        self._queue.put(({"credential_id": credential_id, "step": step, "ts": time(), **data}, synced))
+        if synced is not None:
+            synced.wait()
+            if self._error is not None:
+                raise OSError(f"Failed to write journal {self.path}: {self._error}") from self._error
+
+    def _write_loop(self):
+        pending = 0
+        waiting: List[threading.Event] = []
+        last_sync = time()
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stop = True
+            elif item is not None:
+                entry, synced = item
+                if synced is not None:
+                    waiting.append(synced)
+                if self._error is None:
+                    try:
+                        self._file.write(json.dumps(entry) + "\n")
+                    except Exception as e:
+                        self._fail(e)
+                    pending += 1
+            if self._error is not None:
+                # Nothing is written anymore, waiting records are released to raise the error
+                pending = 0
+                for synced in waiting:
+                    synced.set()
+                waiting.clear()
+            # Durable records are synced once no further lines are queued, so concurrent ones share the fsync
+            if pending and (stop or pending >= self.batch_size or time() - last_sync >= self.flush_interval
+                            or (waiting and self._queue.empty())):
+                try:
+                    self._sync()
+                except Exception as e:
+                    self._fail(e)
+                pending = 0
+                last_sync = time()
+                for synced in waiting:
+                    synced.set()
+                waiting.clear()
+
+    def _fail(self, error: Exception):
+        logging.error("Failed to write journal %s, no further progress is recorded: %s", self.path, error)
+        self._error = error
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Write all queued lines to disk and close the journal"""
+        self._queue.put(_STOP)
+        self._writer.join()
+        try:
+            self._file.close()
+        except OSError as e:
+            # The unwritten lines were already reported by the writer thread
+            if self._error is None:
+                raise
+            logging.debug("Failed to close journal %s: %s", self.path, e)
+
+
+@dataclass
+class JournalEntry:
+    step: str
+    record: Dict
+
+
+@dataclass
+class JournalState:
+    entries: Dict[str, JournalEntry] = field(default_factory=dict)
+    discovery_complete: bool = False
+
+    def pending(self, step: str) -> List[Dict]:
+        """Returns the merged records of all credentials whose last confirmed step is `step`"""
+        return [entry.record for entry in self.entries.values() if entry.step == step]
+
+
+def load_journal(path: str) -> JournalState:
+    """Read the last confirmed step of every credential from an existing journal"""
+    state = JournalState()
+    if not os.path.exists(path):
+        logging.warning("No journal found at %s, starting from scratch", path)
+        return state
+
+    with open(path, encoding="utf-8") as journal_file:
+        for line_number, line in enumerate(journal_file, start=1):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash while writing can leave a truncated last line
+                logging.warning("Ignoring invalid journal line %s in %s", line_number, path)
+                continue
+
+            step = entry["step"]
+            credential_id = entry["credential_id"]
+            if step == STEP_DISCOVERY_COMPLETE:
+                state.discovery_complete = True
+            elif step == STEP_MERGED:
+                state.entries[credential_id] = JournalEntry(step, entry["record"])
+            elif step in (STEP_REVOKED, STEP_ISSUED) and credential_id in state.entries:
+                state.entries[credential_id].step = step
+    return state
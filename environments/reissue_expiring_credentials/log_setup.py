@@ -0,0 +1,133 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Logging of the reissue script.
+
+Records are put on a queue by the calling thread and formatted and written by a background thread, so logging adds
+no I/O to the request threads. Messages use lazy %-style arguments, which are only formatted once a record passed
+the level check, on the background thread. Callers must therefore pass values that are not modified afterwards.
+
+Every message is redacted before it is written: client secrets, passwords and tokens in JSON bodies, form bodies and
+Python reprs as well as bearer tokens are replaced with `***`. Messages longer than `max_length` characters, e.g.
+full response bodies, are truncated. `excerpt` applies the same to texts that end up elsewhere, e.g. in exception
+messages reported in the summary file.
+
+Records are written as text lines or, with `json_output`, as one JSON object per line.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import re
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+DEFAULT_MAX_LENGTH = 2000
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+REDACTED = "***"
+
+SECRET_KEYS = r"client_?secret|password|access_token|refresh_token"
+SECRET_PATTERNS = (
+    # JSON bodies and Python reprs, e.g. "clientsecret": "..." or 'client_secret': '...'
+    re.compile(rf"""(?i)((["'])(?:{SECRET_KEYS})\2\s*:\s*(["']))(?:\\.|(?!\3).)*"""),
+    # Form bodies and query strings, e.g. client_secret=...&
+    re.compile(rf"(?i)(\b(?:{SECRET_KEYS})=)[^&\s\"']*"),
+    re.compile(r"(?i)(\bbearer\s+)[\w\-.~+/]+=*"),
+)
+
+
+def redact(text: str) -> str:
+    for pattern in SECRET_PATTERNS:
+        text = pattern.sub(rf"\g<1>{REDACTED}", text)
+    return text
+
+
+def truncate(text: str, max_length: int = DEFAULT_MAX_LENGTH) -> str:
+    if max_length <= 0 or len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}... [{len(text) - max_length} characters truncated]"
+
+
+def excerpt(text: str, max_length: int = DEFAULT_MAX_LENGTH) -> str:
+    """Redacts and truncates e.g. a response body, redacting first so no secret is cut into an unrecognized part"""
+    return truncate(redact(text), max_length)
+
+
+class RedactingFormatter(logging.Formatter):
+    def __init__(self, fmt: str = TEXT_FORMAT, max_length: int = DEFAULT_MAX_LENGTH):
+        super().__init__(fmt)
+        self.max_length = max_length
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.message = excerpt(record.message, self.max_length)
+        return super().formatMessage(record)
+
+    def formatException(self, ei) -> str:
+        # Exception messages may contain response bodies as well
+        return excerpt(super().formatException(ei), self.max_length)
+
+
+class JsonFormatter(RedactingFormatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": excerpt(record.getMessage(), self.max_length),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queues records unformatted, the listener formats them on its thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(level: int, json_output: bool = False, max_length: int = DEFAULT_MAX_LENGTH,
+                      stream: TextIO | None = None) -> QueueListener:
+    """
+    Replaces the handlers of the root logger with a queue that is written to `stream`, by default stderr, by a
+    background thread. The queue is flushed at exit.
+    """
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    handler.setFormatter(JsonFormatter(max_length=max_length) if json_output
+                         else RedactingFormatter(max_length=max_length))
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(DeferredQueueHandler(records))
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,293 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+In-process metrics of a reissue run.
+
+Records latency histograms, status codes and retries per HTTP route (reported by `http_client`), latency
+histograms and outcomes per outbound function of the script, cache hits and misses, and run totals.
+At the end of a run the metrics can be written as JSON and as an OpenMetrics text file, e.g. for the node
+exporter textfile collector. Histograms have fixed buckets, so recording is O(1) and memory does not grow with
+the number of calls.
+"""
+
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterable
+
+# Upper bounds in seconds, an implicit +Inf bucket follows
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_PREFIX = "reissue"
+
+
+class Histogram:
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, fraction: float) -> float:
+        """Estimates a quantile as the upper bound of the bucket containing it, the last bound for +Inf"""
+        rank = fraction * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def cumulative_counts(self) -> list[tuple[str, int]]:
+        cumulative = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), cumulative))
+        return result
+
+    def merge(self, other: "Histogram"):
+        if other.buckets != self.buckets:
+            raise ValueError(f"Cannot merge histograms with buckets {self.buckets} and {other.buckets}")
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> "Histogram":
+        """Restores a histogram written by `to_dict`"""
+        bounds = [bound for bound in values["buckets"] if bound != "+Inf"]
+        histogram = cls(float(bound) for bound in bounds)
+        previous = 0
+        for position, cumulative in enumerate(values["buckets"].values()):
+            histogram.counts[position] = cumulative - previous
+            previous = cumulative
+        histogram.count = values["count"]
+        histogram.sum = values["sum"]
+        return histogram
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5) if self.count else None,
+            "p99": self.quantile(0.99) if self.count else None,
+            "buckets": dict(self.cumulative_counts()),
+        }
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(**labels: str) -> str:
+    return ",".join(f'{name}="{escape_label_value(str(value))}"' for name, value in labels.items())
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.request_latency: Dict[str, Histogram] = {}
+        self.responses: Dict[tuple[str, str], int] = {}
+        self.retries: Dict[str, int] = {}
+        self.operation_latency: Dict[str, Histogram] = {}
+        self.operations: Dict[tuple[str, str], int] = {}
+        self.cache: Dict[tuple[str, str], int] = {}
+        self.totals: Dict[str, float] = {}
+
+    def observe_request(self, route: str, status: int | str, latency: float, retries: int = 0):
+        """Records an HTTP request, `status` is "error" if no response was received"""
+        with self._lock:
+            self.request_latency.setdefault(route, Histogram()).observe(latency)
+            key = (route, str(status))
+            self.responses[key] = self.responses.get(key, 0) + 1
+            if retries:
+                self.retries[route] = self.retries.get(route, 0) + retries
+
+    def observe_operation(self, operation: str, latency: float, outcome: str):
+        with self._lock:
+            self.operation_latency.setdefault(operation, Histogram()).observe(latency)
+            key = (operation, outcome)
+            self.operations[key] = self.operations.get(key, 0) + 1
+
+    def count_cache(self, cache: str, hit: bool):
+        with self._lock:
+            key = (cache, "hit" if hit else "miss")
+            self.cache[key] = self.cache.get(key, 0) + 1
+
+    def set_cache(self, cache: str, hits: int, misses: int):
+        """Sets the hits and misses of a cache that counts them itself"""
+        with self._lock:
+            self.cache[(cache, "hit")] = hits
+            self.cache[(cache, "miss")] = misses
+
+    def set_total(self, name: str, value: float):
+        with self._lock:
+            self.totals[name] = value
+
+    def timed(self, func: Callable) -> Callable:
+        """Decorator recording the latency and outcome (`ok` or the exception type) of every call of `func`"""
+        operation = func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            outcome = "ok"
+            try:
+                return func(*args, **kwargs)
+            except Exception as exception:
+                outcome = type(exception).__name__
+                raise
+            finally:
+                self.observe_operation(operation, perf_counter() - start, outcome)
+
+        return wrapper
+
+    def merge_dict(self, values: Dict):
+        """
+        Adds the metrics of another run written by `to_dict`, e.g. of another shard. Totals are summed, except
+        durations, of which the maximum is kept.
+        """
+        with self._lock:
+            for route, request in values["requests"].items():
+                self.request_latency.setdefault(route, Histogram()).merge(
+                    Histogram.from_dict(request["latency_seconds"]))
+                for status, count in request["status_codes"].items():
+                    self.responses[(route, status)] = self.responses.get((route, status), 0) + count
+                if request["retries"]:
+                    self.retries[route] = self.retries.get(route, 0) + request["retries"]
+            for operation, values_of_operation in values["operations"].items():
+                self.operation_latency.setdefault(operation, Histogram()).merge(
+                    Histogram.from_dict(values_of_operation["latency_seconds"]))
+                for outcome, count in values_of_operation["outcomes"].items():
+                    self.operations[(operation, outcome)] = self.operations.get((operation, outcome), 0) + count
+            for cache, counts in values["caches"].items():
+                for result, count in (("hit", counts["hits"]), ("miss", counts["misses"])):
+                    self.cache[(cache, result)] = self.cache.get((cache, result), 0) + count
+            for name, value in values["totals"].items():
+                merge = max if name.endswith("_seconds") else sum
+                self.totals[name] = merge((self.totals.get(name, 0), value))
+
+    def cache_hit_ratio(self, cache: str) -> float | None:
+        hits = self.cache.get((cache, "hit"), 0)
+        misses = self.cache.get((cache, "miss"), 0)
+        return hits / (hits + misses) if hits + misses else None
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            caches = sorted({cache for cache, _ in self.cache})
+            return {
+                "requests": {
+                    route: {
+                        "latency_seconds": histogram.to_dict(),
+                        "status_codes": {status: count for (r, status), count in sorted(self.responses.items())
+                                         if r == route},
+                        "retries": self.retries.get(route, 0),
+                    }
+                    for route, histogram in sorted(self.request_latency.items())
+                },
+                "operations": {
+                    operation: {
+                        "latency_seconds": histogram.to_dict(),
+                        "outcomes": {outcome: count for (o, outcome), count in sorted(self.operations.items())
+                                     if o == operation},
+                    }
+                    for operation, histogram in sorted(self.operation_latency.items())
+                },
+                "caches": {
+                    cache: {
+                        "hits": self.cache.get((cache, "hit"), 0),
+                        "misses": self.cache.get((cache, "miss"), 0),
+                        "hit_ratio": self.cache_hit_ratio(cache),
+                    }
+                    for cache in caches
+                },
+                "totals": dict(self.totals),
+            }
+
+    def to_openmetrics(self) -> str:
+        lines = []
+
+        def histogram(name: str, label: str, histograms: Dict[str, Histogram], help_text: str):
+            lines.append(f"# TYPE {name} histogram")
+            lines.append(f"# UNIT {name} seconds")
+            lines.append(f"# HELP {name} {help_text}")
+            for key, values in sorted(histograms.items()):
+                for bound, count in values.cumulative_counts():
+                    lines.append(f"{name}_bucket{{{format_labels(**{label: key}, le=bound)}}} {count}")
+                lines.append(f"{name}_count{{{format_labels(**{label: key})}}} {values.count}")
+                lines.append(f"{name}_sum{{{format_labels(**{label: key})}}} {values.sum}")
+
+        def counter(name: str, label_names: tuple[str, ...], values: Dict, help_text: str):
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"# HELP {name} {help_text}")
+            for key, value in sorted(values.items()):
+                key = key if isinstance(key, tuple) else (key,)
+                lines.append(f"{name}_total{{{format_labels(**dict(zip(label_names, key)))}}} {value}")
+
+        with self._lock:
+            histogram(f"{METRIC_PREFIX}_http_request_duration_seconds", "route", self.request_latency,
+                      "Duration of HTTP requests including retries")
+            counter(f"{METRIC_PREFIX}_http_responses", ("route", "status"), self.responses,
+                    "HTTP responses by status code, error if no response was received")
+            counter(f"{METRIC_PREFIX}_http_retries", ("route",), self.retries, "Retried HTTP requests")
+            histogram(f"{METRIC_PREFIX}_operation_duration_seconds", "operation", self.operation_latency,
+                      "Duration of outbound operations")
+            counter(f"{METRIC_PREFIX}_operations", ("operation", "outcome"), self.operations,
+                    "Outbound operations by outcome")
+            counter(f"{METRIC_PREFIX}_cache_requests", ("cache", "result"), self.cache, "Cache lookups")
+            for name, value in sorted(self.totals.items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+                lines.append(f"{METRIC_PREFIX}_{name} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str):
+        write_atomically(path, json.dumps(self.to_dict(), indent=2))
+
+    def write_openmetrics(self, path: str):
+        write_atomically(path, self.to_openmetrics())
+
+    def log_summary(self):
+        """Logs the number of calls, estimated p50/p99 latency and failures per route"""
+        with self._lock:
+            for route, histogram in sorted(self.request_latency.items()):
+                failed = sum(count for (r, status), count in self.responses.items()
+                             if r == route and not status.startswith("2"))
+                logging.info("%s: calls=%s, p50<=%ss, p99<=%ss, total=%.1fs, failed=%s, retries=%s", route,
+                             histogram.count, histogram.quantile(0.5), histogram.quantile(0.99), histogram.sum, failed,
+                             self.retries.get(route, 0))
+
+
+def write_atomically(path: str, content: str):
+    """Writes to a temporary file first, so readers such as the textfile collector never see partial files"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(content)
+    os.replace(temp_path, path)
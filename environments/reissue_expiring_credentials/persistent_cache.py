@@ -0,0 +1,166 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Optional on-disk cache that keeps SAP operation details and company DIDs across runs.
+
+Entries are stored in a SQLite database, grouped by namespace and keyed by operation ID. Entries expire after a TTL
+and the least recently used entries are evicted once the cache exceeds its maximum size. Entries can be stored with a
+shorter TTL, e.g. operations without company identity, which may get one any time.
+Values flagged as secret, e.g. the uaa client credentials of a customer wallet, are encrypted with a Fernet key
+supplied at runtime and are not persisted at all if no key is given. Encryption requires the optional
+`cryptography` package.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from time import time
+from typing import Any, Iterable
+
+NAMESPACE_CLIENT_INFO = "client_info"
+NAMESPACE_COMPANY_DID = "company_did"
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+# TTL of negative results, e.g. operations without company identity
+NEGATIVE_TTL = 60 * 60
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Default of `PersistentCache.get` to tell a cached `None` apart from a missing entry
+MISSING = object()
+
+
+class PersistentCache:
+    def __init__(self, path: str, encryption_key: str | None = None, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._fernet = None
+        if encryption_key:
+            try:
+                from cryptography.fernet import Fernet
+            except ImportError as e:
+                raise ImportError("Encrypting the persistent cache requires the `cryptography` package") from e
+            self._fernet = Fernet(encryption_key)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "namespace TEXT NOT NULL, "
+            "key TEXT NOT NULL, "
+            "value BLOB NOT NULL, "
+            "encrypted INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "last_access REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._connection.execute("DELETE FROM cache_entries WHERE created_at < ?", (time() - self.ttl,))
+        self._connection.commit()
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any | None:
+        """
+        Returns the cached value or `default` if there is no valid entry. Pass `MISSING` as `default` to tell a cached
+        `None` apart from a missing entry.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, encrypted, created_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None or row[2] < time() - self.ttl:
+                self.misses += 1
+                return default
+
+            value, encrypted, _ = row
+            if encrypted:
+                if self._fernet is None:
+                    self.misses += 1
+                    return default
+                try:
+                    value = self._fernet.decrypt(value)
+                except Exception:
+                    logging.warning("Could not decrypt cached %s entry for %s, was the key changed?", namespace, key)
+                    self.misses += 1
+                    return default
+
+            self._connection.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                (time(), namespace, key),
+            )
+            self._connection.commit()
+            self.hits += 1
+            return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, secret: bool = False, ttl: float | None = None):
+        """
+        Stores a JSON serializable value. Secret values are only stored if an encryption key is configured.
+        With a `ttl` shorter than the one of the cache, the entry expires after `ttl` seconds.
+        """
+        payload = json.dumps(value).encode()
+        if secret:
+            if self._fernet is None:
+                return
+            payload = self._fernet.encrypt(payload)
+
+        now = time()
+        # Entries expire by their creation time, so a shorter TTL is stored as an earlier creation time
+        created_at = now - max(0.0, self.ttl - ttl) if ttl is not None else now
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, int(secret), created_at, now),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE rowid IN "
+                "(SELECT rowid FROM cache_entries ORDER BY last_access LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def retain(self, namespace: str, keys: Iterable[str]):
+        """
+        Removes all entries of `namespace` whose key is not in `keys`, entries of other namespaces are kept.
+        Called with the current operation IDs of the customer wallets, so entries of operations that were replaced
+        by a new operation are invalidated.
+        """
+        with self._lock:
+            self._connection.execute("CREATE TEMP TABLE IF NOT EXISTS retained_keys (key TEXT PRIMARY KEY)")
+            self._connection.execute("DELETE FROM retained_keys")
+            self._connection.executemany("INSERT OR IGNORE INTO retained_keys VALUES (?)", ((k,) for k in keys))
+            deleted = self._connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key NOT IN (SELECT key FROM retained_keys)",
+                (namespace,)).rowcount
+            self._connection.commit()
+        if deleted:
+            logging.info("Invalidated %s %s cache entries of operations no longer referenced by a wallet", deleted,
+                         namespace)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
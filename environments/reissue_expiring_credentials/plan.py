@@ -0,0 +1,73 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Reissue plans, the output of the discovery phase of the reissue script.
+
+A plan is a JSON Lines file. The first line is a header with the plan version and the settings it was created
+with, e.g. the stage and the expiry date range. Every further line is a merged credential record with the BPN,
+credential type, holder DID, credential ID and operation ID, in discovery order. Records are written without
+whitespace and with sorted keys, so plans of different runs can be compared with `diff`.
+The plan is written to a temporary file that replaces `path` once all records were written, so a plan that
+exists is always complete.
+"""
+
+import json
+import logging
+import os
+from typing import Dict, Generator, Iterable
+
+PLAN_VERSION = 1
+KEY_VERSION = "plan_version"
+
+
+def dump_line(value: Dict) -> str:
+    return json.dumps(value, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def write_plan(path: str, records: Iterable[Dict], **header) -> int:
+    """Writes the header and the records to `path`, returns the number of records"""
+    temp_path = f"{path}.tmp"
+    num_records = 0
+    with open(temp_path, "w", encoding="utf-8") as plan_file:
+        plan_file.write(dump_line({KEY_VERSION: PLAN_VERSION, **header}))
+        for record in records:
+            plan_file.write(dump_line(record))
+            num_records += 1
+    os.replace(temp_path, path)
+    logging.info("Wrote plan with %s credentials to %s", num_records, path)
+    return num_records
+
+
+def read_plan_header(path: str) -> Dict:
+    with open(path, encoding="utf-8") as plan_file:
+        header = json.loads(plan_file.readline() or "{}")
+    if header.get(KEY_VERSION) != PLAN_VERSION:
+        raise ValueError(f"Unsupported plan {path}: expected {KEY_VERSION} {PLAN_VERSION}, got {header}")
+    return header
+
+
+def read_plan_records(path: str) -> Generator[Dict, None, None]:
+    """Lazily yields the records of a plan, the file is only held open while the generator is active"""
+    with open(path, encoding="utf-8") as plan_file:
+        plan_file.readline()
+        for line in plan_file:
+            if line.strip():
+                yield json.loads(line)
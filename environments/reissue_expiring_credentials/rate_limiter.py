@@ -0,0 +1,156 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Adaptive per-host concurrency limiter used by the shared HTTP client.
+
+Every upstream host gets its own limit on the number of requests in flight, adjusted with AIMD (additive increase,
+multiplicative decrease): each fast, successful response raises the limit by 1/limit, i.e. by one per round of
+requests, while 429/503 responses and connection errors halve it. Responses slower than `latency_tolerance` times the
+best observed latency of the same route shrink the limit slightly, so the limit settles where the host stays
+responsive. Routes are tracked separately because e.g. issuance is much slower than listing on the same host.
+A `Retry-After` header pauses all requests to the host for the given time.
+"""
+
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+from typing import Dict
+
+DEFAULT_INITIAL_LIMIT = 4.0
+DEFAULT_MIN_LIMIT = 1.0
+DEFAULT_MAX_LIMIT = 64.0
+DEFAULT_LATENCY_TOLERANCE = 3.0
+THROTTLE_DECREASE = 0.5
+LATENCY_DECREASE = 0.9
+LATENCY_SMOOTHING = 0.2
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Returns the number of seconds to wait for a `Retry-After` header given in seconds or as HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    def __init__(self, host: str, initial_limit: float = DEFAULT_INITIAL_LIMIT, min_limit: float = DEFAULT_MIN_LIMIT,
+                 max_limit: float = DEFAULT_MAX_LIMIT, latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE):
+        self.host = host
+        self.limit = min(max(initial_limit, min_limit), max_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.throttled = 0
+        self.best_latency: Dict[str, float] = {}
+        self.smoothed_latency: Dict[str, float] = {}
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Blocks until a request to the host may be sent"""
+        with self._condition:
+            while True:
+                pause = self._paused_until - monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self.in_flight >= int(self.limit):
+                    self._condition.wait()
+                else:
+                    break
+            self.in_flight += 1
+
+    def release(self, route: str, latency: float | None, throttled: bool = False, retry_after: float | None = None):
+        """
+        Records the outcome of a request and adjusts the limit accordingly.
+        `latency` is `None` if the request's latency is not representative, e.g. because it was retried.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self._throttle(retry_after)
+            elif latency is not None:
+                self._observe_latency(route, latency)
+            self._condition.notify_all()
+
+    def throttle(self, retry_after: float | None = None):
+        """Records a throttled attempt of a request that is still in flight, e.g. one that is being retried"""
+        with self._condition:
+            self._throttle(retry_after)
+            self._condition.notify_all()
+
+    def _throttle(self, retry_after: float | None):
+        self.throttled += 1
+        self._set_limit(self.limit * THROTTLE_DECREASE, "throttled")
+        if retry_after:
+            self._paused_until = max(self._paused_until, monotonic() + retry_after)
+            logging.info("Pausing requests to %s for %.1fs as requested by Retry-After", self.host, retry_after)
+
+    def _observe_latency(self, route: str, latency: float):
+        smoothed = self.smoothed_latency.get(route, latency)
+        smoothed += LATENCY_SMOOTHING * (latency - smoothed)
+        self.smoothed_latency[route] = smoothed
+        best = self.best_latency[route] = min(self.best_latency.get(route, smoothed), smoothed)
+
+        if smoothed > best * self.latency_tolerance:
+            self._set_limit(self.limit * LATENCY_DECREASE, f"{route} latency {smoothed:.3f}s")
+        else:
+            self._set_limit(self.limit + 1 / self.limit, None)
+
+    def _set_limit(self, limit: float, reason: str | None):
+        previous = int(self.limit)
+        self.limit = min(max(limit, self.min_limit), self.max_limit)
+        if int(self.limit) < previous:
+            logging.info("Reduced concurrency limit for %s from %d to %d (%s)", self.host, previous, int(self.limit),
+                         reason)
+        elif int(self.limit) > previous:
+            logging.debug("Raised concurrency limit for %s to %d", self.host, int(self.limit))
+
+    def __str__(self) -> str:
+        latencies = ", ".join(f"{route}={latency:.3f}s" for route, latency in self.smoothed_latency.items())
+        return f"{self.host}: limit={int(self.limit)}, throttled={self.throttled}, latency=[{latencies}]"
+
+
+class HostLimiters:
+    """Creates and holds one `AdaptiveLimiter` per host"""
+
+    def __init__(self, **limiter_kwargs):
+        self.limiter_kwargs = limiter_kwargs
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> AdaptiveLimiter:
+        with self._lock:
+            if host not in self._limiters:
+                self._limiters[host] = AdaptiveLimiter(host, **self.limiter_kwargs)
+            return self._limiters[host]
+
+    def log_limits(self):
+        for limiter in list(self._limiters.values()):
+            logging.info("Rate limit %s", limiter)
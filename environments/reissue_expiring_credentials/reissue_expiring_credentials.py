@@ -19,24 +19,84 @@
 ################################################################################
 
 import argparse
+import asyncio
+import dataclasses
 import logging
+import os
+import re
+import sys
+import threading
 from argparse import Namespace
-from datetime import date
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
 from enum import Enum
-from time import time
-from typing import Dict, List
+from functools import partial
+from itertools import chain, islice
+from time import perf_counter
+from typing import Callable, Container, Dict, Generator, Iterable, Iterator, List, NamedTuple, Set
 from urllib.parse import urljoin
 
 import requests
 from requests import JSONDecodeError, Response
 
+import endpoints
+import http_client
+import persistent_cache
+import rate_limiter
+from bulk import (DEFAULT_BULK_SIZE, DEFAULT_BULK_WAIT, MAX_BULK_SIZE, BulkOutcomeUnknown, BulkUnsupported,
+                  MicroBatcher, is_bulk_unsupported, submit_or_call)
+from completion import (DEFAULT_BATCH_SIZE, DEFAULT_TIMEOUT, UNSUPPORTED_STATUS_ROUTE_CODES, CompletionTracker,
+                        StatusUnsupported)
+from credential_page import (CompactPage, CredentialPage, CredentialStatus, ListedCredential, decode_compact_page,
+                             decode_credential_page, decode_credential_status, json_backend)
+from daemon import (DEFAULT_HEALTH_HOST, DEFAULT_HEALTH_PORT, DEFAULT_INTERVAL, DEFAULT_WINDOW_DAYS, Daemon,
+                    HealthServer)
+from delta_state import STATUS_FAILED, STATUS_REISSUED, STATUS_REVOKED, DeltaState, load_delta_state
+from duplicates import REASON_ACTIVE_REPLACEMENT, REASON_PENDING_REPLACEMENT, DuplicateIndex
+from endpoints import Endpoints
+from journal import (STEP_DISCOVERY_COMPLETE, STEP_FAILED, STEP_ISSUED, STEP_MERGED, STEP_REVOKED, Journal,
+                     JournalState, load_journal)
+from log_setup import DEFAULT_MAX_LENGTH, configure_logging, excerpt
+from metrics import Metrics
+from persistent_cache import NAMESPACE_CLIENT_INFO, NAMESPACE_COMPANY_DID, MISSING, NEGATIVE_TTL, PersistentCache
+from plan import read_plan_header, read_plan_records, write_plan
+from scheduler import DEFAULT_BUFFER_SIZE, DeadlineScheduler, expiry_key
+from sharding import Shard, fill_shard, validate_shard, write_summary
+from token_manager import TokenManager
+from wallet_index import DEFAULT_REFRESH_INTERVAL, WalletIndex
+
 ### CONSTANTS
-# URLs and paths
-DID_DOCUMENT_BASE_URL = "https://portal-backend.{}.catena-x.net/api/administration/staticdata/did/{}/did.json"
-ISSUER_SERVICE_BASE_URL = "https://ssi-credential-issuer.{}.catena-x.net"
-KEYCLOAK_BASE_URL = "https://centralidp.{}.catena-x.net"
-AUTH_TOKEN_PATH_KEYCLOAK = "/auth/realms/CX-Central/protocol/openid-connect/token"
-AUTH_TOKEN_PATH_SAP = "/oauth/token"
+# Pagination
+DEFAULT_PAGE_SIZE = 15
+# Page size of the keyset paginated listing, which only returns the fields used by the script
+DEFAULT_COMPACT_PAGE_SIZE = 500
+# Status codes of issuer services without the keyset paginated listing
+KEYSET_UNSUPPORTED_STATUS_CODES = (404, 405)
+EXPIRY_DATE_SORTING = "ExpiryDateAsc"
+STATUS_QUERY = "companySsiDetailStatusId"
+CREDENTIAL_STATUS_ACTIVE = "ACTIVE"
+CREDENTIAL_STATUS_PENDING = "PENDING"
+# Statuses of credentials that are revoked
+CREDENTIAL_STATUSES_REVOKED = ("REVOKED", "INACTIVE")
+DEFAULT_FETCH_WORKERS = 4
+
+# Merging
+DEFAULT_DID_WORKERS = 4
+
+# Reissuing
+DEFAULT_CONCURRENCY = 1
+
+# Commands
+COMMAND_RUN = "run"
+COMMAND_PLAN = "plan"
+COMMAND_EXECUTE = "execute"
+COMMAND_SERVE = "serve"
+COMMANDS = (COMMAND_RUN, COMMAND_PLAN, COMMAND_EXECUTE, COMMAND_SERVE)
+
+# Log formats
+LOG_FORMAT_TEXT = "text"
+LOG_FORMAT_JSON = "json"
 
 # JSON fields
 APPLICATION_JSON = "application/json"
@@ -56,6 +116,42 @@ KEY_OPERATION_ID = "operation_id"
 KEY_BPN = "bpn"
 KEY_HOLDER_DID = "holder_did"
 KEY_CUSTOMER_NAME = "customer_name"
+KEY_REVOKED = "revoked"
+KEY_EXPIRY_DATE = "expiry_date"
+KEY_DATE_CREATED = "date_created"
+
+# Issuance routes below `/api/issuer` and their lists in the body of `/api/issuer/bulk`
+ISSUANCE_ROUTE_BPN = "bpn"
+ISSUANCE_ROUTE_MEMBERSHIP = "membership"
+ISSUANCE_ROUTE_FRAMEWORK = "framework"
+BULK_ISSUANCE_FIELDS = {
+    ISSUANCE_ROUTE_BPN: "bpnCredentials",
+    ISSUANCE_ROUTE_MEMBERSHIP: "membershipCredentials",
+    ISSUANCE_ROUTE_FRAMEWORK: "frameworkCredentials",
+}
+
+# BPNLs are 16 characters long, e.g. BPNL00000003CRHK
+BPNL_PATTERN = re.compile(r"BPNL[0-9A-Z]{12}")
+
+
+class OperationIdIndex(NamedTuple):
+    """
+    Lookup structure for the operation IDs of the customer wallets.
+    `by_bpn` maps every BPNL found in a customer name to the positions and operation IDs of the matching wallets.
+    `unparsed` holds the position, customer name and operation ID of wallets whose name contains no BPNL.
+    `operations` holds the original operation data, used to look up BPNs that are not well-formed BPNLs.
+    """
+    by_bpn: Dict[str, List[tuple[int, str]]]
+    unparsed: List[tuple[int, str, str]]
+    operations: List[Dict]
+
+
+class ReissueResult(NamedTuple):
+    """Outcome of reissuing a single credential, `error` is `None` on success"""
+    credential_id: str
+    bpn: str
+    credential_type: str
+    error: Exception | None
 
 
 class CredentialType(Enum):
@@ -64,15 +160,49 @@ class CredentialType(Enum):
     DATA_EXCHANGE_GOVERNANCE_CREDENTIAL = "DATA_EXCHANGE_GOVERNANCE_CREDENTIAL"
 
 
-CLIENT_INFO_CACHE = {}
-TOKEN_CACHE = {}
-
-
-def setup_logger(log_level: int | str) -> logging.Logger:
+# Latency, status codes and cache hits of the run, written out in `main`
+METRICS = Metrics()
+# Base URLs and paths of the called services, resolved for the stage in `main`
+ENDPOINTS = Endpoints()
+# Client info per operation ID, fetched at most once per run even by concurrent workers
+CLIENT_INFO_CACHE: Dict[str, Future] = {}
+CLIENT_INFO_CACHE_LOCK = threading.Lock()
+# Company DIDs per operation ID, resolved at most once per run. The result is `None` if the operation has no
+# company identity.
+COMPANY_DIDS: Dict[str, Future] = {}
+# Unresolved company DIDs that were handed to a caller other than the one that submitted them, they are never cancelled
+SHARED_COMPANY_DIDS: Set[Future] = set()
+COMPANY_DIDS_LOCK = threading.Lock()
+# Optional pool resolving the company DIDs of several candidate operation IDs concurrently, configured in `main`
+DID_EXECUTOR: ThreadPoolExecutor | None = None
+# Optional cache persisted across runs, configured in `main`
+PERSISTENT_CACHE: PersistentCache | None = None
+# Optional progress journal, configured in `main`
+JOURNAL: Journal | None = None
+# Optional state of incremental runs, configured in `main`
+DELTA_STATE: DeltaState | None = None
+# Orders the credentials by expiry date and stops starting credentials before the deadline, configured in `main`
+SCHEDULER: DeadlineScheduler | None = None
+# Optional batchers combining the revocations and issuances of concurrent workers into bulk requests, configured in
+# `main`. They hold credential IDs and `(route, payload)` issuance requests.
+REVOCATION_BATCHER: MicroBatcher[str, None] | None = None
+ISSUANCE_BATCHER: MicroBatcher[tuple[str, Dict], str] | None = None
+# Optional tracker polling whether the issued credentials are completed, configured in `main`
+TRACKER: CompletionTracker | None = None
+# Optional index skipping credentials whose holder already has a replacement, configured in `main`
+DUPLICATES: DuplicateIndex | None = None
+# Customer wallets indexed by BPN and kept between the cycles of the daemon, configured in `main`
+WALLET_INDEX: WalletIndex[OperationIdIndex] | None = None
+
+
+def setup_logger(log_level: int | str, json_output: bool = False,
+                 max_length: int = DEFAULT_MAX_LENGTH) -> logging.Logger:
     """
     Setup logger with specified level.
     If `log_level` is an int, it must be one of 10, 20, 30, 40, 50.
     If `log_level` is a str, it must be one of "DEBUG", "INFO", "WARN", "WARNING", "ERROR", or "CRITICAL", "FATAL".
+    Records are written by a background thread, redacted and truncated to `max_length` characters, as JSON lines
+    with `json_output`.
     """
 
     if isinstance(log_level, str):
@@ -85,18 +215,114 @@ def setup_logger(log_level: int | str) -> logging.Logger:
     else:
         raise TypeError(f"`log_level` must be of type int | str, but was: {type(log_level)}")
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    configure_logging(level, json_output, max_length)
     return logging.getLogger(__name__)
 
 
-def fetch_active_credentials(auth_base_url: str, client_id: str, client_secret: str, issuer_url: str) -> List[Dict]:
+@METRICS.timed
+def fetch_credential_page(issuer_url: str, headers: Dict, page: int, page_size: int,
+                          query: Dict | None = None) -> CredentialPage:
+    """Fetch a single page of active credentials and decode it into compact credential records"""
+    # Execute request and ensure status 200
+    response: Response = http_client.get(
+        url=f"{issuer_url}/api/issuer",
+        params={"page": page, "size": page_size, STATUS_QUERY: CREDENTIAL_STATUS_ACTIVE, **(query or {})},
+        headers=headers
+    )
+    if response.status_code != 200:
+        raise requests.HTTPError(
+            f"Failed to fetch credentials on page {page}: {response.status_code} {excerpt(response.text)}",
+            response=response)
+
+    # Decode response body
+    try:
+        return decode_credential_page(response.content)
+    except KeyError as keyError:
+        logging.error("Failed to parse [meta][totalPages] or [content] from response for page=%s: %s", page,
+                      excerpt(response.text))
+        raise keyError
+    except ValueError as valueError:
+        logging.error("Issuer service returned 200, but the response contained invalid JSON for page=%s: %s", page,
+                      excerpt(response.text))
+        raise valueError
+
+
+@METRICS.timed
+def fetch_compact_page(issuer_url: str, headers: Dict, cursor: str | None, page_size: int,
+                       query: Dict | None = None) -> CompactPage:
+    """Fetch the page of active credentials after `cursor` from the keyset paginated listing"""
+    params = {"size": page_size, STATUS_QUERY: CREDENTIAL_STATUS_ACTIVE, **(query or {})}
+    if cursor is not None:
+        params["cursor"] = cursor
+    response: Response = http_client.get(url=f"{issuer_url}/api/issuer/compact", params=params, headers=headers)
+    if response.status_code != 200:
+        raise requests.HTTPError(
+            f"Failed to fetch credentials after cursor {cursor}: {response.status_code} {excerpt(response.text)}",
+            response=response)
+
+    try:
+        return decode_compact_page(response.content)
+    except KeyError as keyError:
+        logging.error("Failed to parse [content] from response for cursor=%s: %s", cursor, excerpt(response.text))
+        raise keyError
+    except ValueError as valueError:
+        logging.error("Issuer service returned 200, but the response contained invalid JSON for cursor=%s: %s",
+                      cursor, excerpt(response.text))
+        raise valueError
+
+
+def stream_compact_credentials(issuer_url: str, headers: Dict, first_page: CompactPage, page_size: int,
+                               query: Dict | None = None) -> Iterator[ListedCredential]:
+    """
+    Lazily yield the credentials of the keyset paginated listing, starting with `first_page`, until the cursor is
+    exhausted. Every page depends on the cursor of the previous one, so the next page is requested as soon as the
+    current one arrived and is fetched while the consumer processes the current one.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = first_page
+        while True:
+            next_page = None
+            if page.next_cursor is not None:
+                next_page = executor.submit(fetch_compact_page, issuer_url, headers, page.next_cursor, page_size, query)
+            yield from page.credentials
+            if next_page is None:
+                return
+            page = next_page.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_active_credentials(
+        auth_base_url: str,
+        client_id: str,
+        client_secret: str,
+        issuer_url: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        expiry_from: date | None = None,
+        expiry_to: date | None = None,
+        compact_page_size: int | None = DEFAULT_COMPACT_PAGE_SIZE,
+        status: str = CREDENTIAL_STATUS_ACTIVE,
+) -> Iterator[ListedCredential]:
+    """
+    Lazily yield all active credentials from the issuer service in page order, or the ones with another `status`.
+    With a `compact_page_size`, the keyset paginated listing is used: every page continues after the last credential
+    of the previous one, so the issuer service neither skips earlier rows nor counts the credentials, and revocations
+    during the run don't shift the pages. Issuer services without it answer with 404, then the offset paginated
+    listing is used.
+    For the offset paginated listing, page 0 is fetched first to determine the total number of pages. Afterwards at
+    most `max_workers` pages are fetched ahead of the consumer, so only a bounded number of pages is held in memory at
+    any time and the consumer can start processing as soon as the first page arrived. Closing the generator stops
+    fetching.
+    If `expiry_from` or `expiry_to` are given, the issuer service only returns credentials expiring within that
+    range (both inclusive), sorted by expiry date. Issuer services that don't support this reject the request with
+    400, then all active credentials are fetched instead.
+    """
     logging.debug("Fetching expiring credentials")
     issuer_service_auth_token = get_auth_token(
         auth_base_url,
-        AUTH_TOKEN_PATH_KEYCLOAK,
+        ENDPOINTS.keycloak_token_path,
         client_id,
         client_secret,
         True,
@@ -106,123 +332,131 @@ def fetch_active_credentials(auth_base_url: str, client_id: str, client_secret:
         AUTHORIZATION: BEARER_TOKEN.format(issuer_service_auth_token),
     }
 
-    current_page = 0
-    total_num_pages = 1
-    credential_list_acc: list = []
-
-    while current_page <= total_num_pages:
-        # Execute request and ensure status 200
-        response: Response = requests.get(
-            url=f"{issuer_url}/api/issuer?page={current_page}&size=15&companySsiDetailStatusId=ACTIVE",
-            headers=headers
-        )
-        if response.status_code != 200:
-            raise requests.HTTPError(
-                f"Failed to fetch credentials on page {current_page}: {response.status_code} {response.text}")
+    expiry_query = {}
+    if expiry_from is not None:
+        expiry_query["expiryDateFrom"] = f"{expiry_from.isoformat()}T00:00:00Z"
+    if expiry_to is not None:
+        expiry_query["expiryDateTo"] = f"{expiry_to.isoformat()}T23:59:59.999999Z"
+    status_query = {STATUS_QUERY: status}
 
-        # Extract response body
+    if compact_page_size is not None:
         try:
-            response_json = response.json()
-        except JSONDecodeError as jsonDecodeError:
-            logging.error(
-                f"Issuer service returned 200, but the response contained invalid JSON for page={current_page}: {response.text}")
-            raise jsonDecodeError
-        # Determine total number of pages
-        if current_page == 0:
-            try:
-                total_num_pages = response_json["meta"]["totalPages"]
-            except JSONDecodeError as jsonDecodeError:
-                logging.error(f"Failed to parse [meta][totalPages] from response for page=1: {response.text}")
-                raise jsonDecodeError
-
-        # Extract credentials from current page
-        try:
-            credentials_current_page = response_json["content"]
-        except JSONDecodeError as jsonDecodeError:
-            logging.error(f"Failed to extract credentials from response for page={current_page}: {response.text}")
-            raise jsonDecodeError
-
-        # Append credentials to accumulator list
-        credential_list_acc.extend(credentials_current_page)
-
-        current_page += 1
+            first_compact_page = fetch_compact_page(issuer_url, headers, None, compact_page_size,
+                                                    {**status_query, **expiry_query})
+        except requests.HTTPError as httpError:
+            if httpError.response is None or httpError.response.status_code not in KEYSET_UNSUPPORTED_STATUS_CODES:
+                raise httpError
+            logging.warning("Issuer service does not support the keyset paginated listing, fetching pages by offset")
+        else:
+            yield from stream_compact_credentials(issuer_url, headers, first_compact_page, compact_page_size,
+                                                  {**status_query, **expiry_query})
+            return
 
-    return credential_list_acc
+    query = {"sorting": EXPIRY_DATE_SORTING, **expiry_query} if expiry_query else {}
 
+    # Determine total number of pages
+    try:
+        first_page = fetch_credential_page(issuer_url, headers, 0, page_size, {**status_query, **query})
+    except requests.HTTPError as httpError:
+        if not query or httpError.response is None or httpError.response.status_code != 400:
+            raise httpError
+        logging.warning("Issuer service does not support filtering by expiry date, fetching all %s credentials", status)
+        query = {}
+        first_page = fetch_credential_page(issuer_url, headers, 0, page_size, status_query)
+    query.update(status_query)
+
+    remaining_pages = range(1, first_page.total_pages)
+    logging.debug("Fetching %d remaining pages with %d workers", len(remaining_pages), max_workers)
+
+    if max_workers <= 1:
+        yield from first_page.credentials
+        for page in remaining_pages:
+            yield from fetch_credential_page(issuer_url, headers, page, page_size, query).credentials
+        return
 
-def expires_in_range(credential: dict, expiry_on_or_after: date, expiry_on_or_before: date) -> bool:
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        # Keep `max_workers` pages in flight and hand them out in submission order to preserve the page order.
+        pages = iter(remaining_pages)
+        in_flight = deque(
+            (page, executor.submit(fetch_credential_page, issuer_url, headers, page, page_size, query))
+            for page in islice(pages, max_workers)
+        )
+        yield from first_page.credentials
+        while in_flight:
+            page, future = in_flight.popleft()
+            next_page = next(pages, None)
+            if next_page is not None:
+                in_flight.append((next_page, executor.submit(fetch_credential_page, issuer_url, headers, next_page,
+                                                             page_size, query)))
+            yield from future.result().credentials
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def filter_credentials(credentials: Iterable[ListedCredential], start: date, end: date,
+                       on_unsigned: Callable[[date], None] | None = None) -> Iterator[ListedCredential]:
     """
-    Returns `true` if the credential expiry date lies between `expiry_on_or_after` (inclusive) and `expiry_on_or_before` (inclusive).
-    False otherwise.
-    Also returns false if credential has no expiry date.
+    Lazily yield the credentials that expire between `start` (inclusive) and `end` (inclusive) and whose
+    CREATE_SIGNED_CREDENTIAL step is DONE. Credentials without expiry date are skipped. `on_unsigned` is called with
+    the expiry date of every skipped credential within the range that is not signed yet.
     """
-    expiry_date_str = credential.get("expiryDate")
-    if expiry_date_str is None:
-        logging.warning(
-            f"No expiry date found for credential ID: {credential.get("credentialDetailId")}. Treating it as expiring within given range.")
-        return False
-
-    try:
-        expiry_date = date.fromisoformat(expiry_date_str.split("T")[0])
-    except ValueError as valueError:
-        raise ValueError(f"Invalid 'expiryDate' value in credential:\n{credential}\n{valueError}")
-
-    return expiry_on_or_after <= expiry_date <= expiry_on_or_before
-
-
-def verify_create_signed_credential_step_done(credential: dict) -> bool:
-    process_steps = credential["processSteps"]
-    for step in process_steps:
-        process_step_type_id = step["processStepTypeId"]
-        process_step_status_id = step["processStepStatusId"]
-        if process_step_type_id == "CREATE_SIGNED_CREDENTIAL" and process_step_status_id == "DONE":
-            return True
-    return False
-
-
-def filter_credentials(credentials: list, start: date, end: date) -> List[Dict]:
-    filtered_credentials = []
+    num_without_expiry_date = 0
     for cred in credentials:
-        if expires_in_range(cred, start, end) and verify_create_signed_credential_step_done(cred):
-            filtered_credentials.append(cred)
-    return filtered_credentials
-
+        expiry_date_str = cred.expiry_date
+        if expiry_date_str is None:
+            num_without_expiry_date += 1
+            continue
 
-def transform_credential_data(cred: dict, stage: str) -> dict:
-    try:
-        bpn = cred["bpnl"]
-        credential_type = cred["credentialType"]
-        credential_detail_id = cred["credentialDetailId"]
-    except KeyError as keyError:
-        raise KeyError(f"Credential does not have required fields: {cred}\n{keyError}")
+        try:
+            # ISO 8601 timestamps start with the date
+            expiry_date = date.fromisoformat(expiry_date_str[:10])
+        except ValueError as valueError:
+            raise ValueError(f"Invalid 'expiryDate' value in credential:\n{cred}\n{valueError}")
+        if start <= expiry_date <= end:
+            if cred.signed:
+                yield cred
+            elif on_unsigned is not None:
+                on_unsigned(expiry_date)
+
+    if num_without_expiry_date > 0:
+        logging.warning("Skipped %s credentials without expiry date", num_without_expiry_date)
+
+
+def transform_credential_data(cred: ListedCredential) -> dict:
+    if cred.bpn is None or cred.credential_type is None or cred.credential_id is None:
+        raise KeyError(f"Credential does not have required fields: {cred}")
     return {
-        KEY_BPN: bpn,
-        KEY_TYPE: credential_type,
-        KEY_HOLDER_DID: DID_DOCUMENT_BASE_URL.format(stage, bpn),
-        KEY_CREDENTIAL_ID: credential_detail_id,
+        KEY_BPN: cred.bpn,
+        KEY_TYPE: cred.credential_type,
+        KEY_HOLDER_DID: ENDPOINTS.did_document(cred.bpn),
+        KEY_CREDENTIAL_ID: cred.credential_id,
+        KEY_EXPIRY_DATE: cred.expiry_date,
+        KEY_DATE_CREATED: cred.date_created,
     }
 
 
+@METRICS.timed
 def get_operation_ids(sap_auth_url: str, sap_client_id: str, sap_client_secret: str, sap_url: str) -> List[Dict]:
     """Fetch operation IDs"""
     sap_token = get_auth_token(
         sap_auth_url,
-        AUTH_TOKEN_PATH_SAP,
+        ENDPOINTS.sap_token_path,
         sap_client_id,
         sap_client_secret
     )
 
     headers = {AUTHORIZATION: BEARER_TOKEN.format(sap_token)}
 
-    response = requests.get(f"{sap_url}/api/v1.0.0/customerWallets", headers=headers)
+    response = http_client.get(f"{sap_url}/api/v1.0.0/customerWallets", headers=headers)
     if response.status_code != 200:
-        raise requests.HTTPError(f"Failed to get customer wallets: {response.status_code} {response.text}")
+        raise requests.HTTPError(f"Failed to get customer wallets: {response.status_code} {excerpt(response.text)}")
 
     response_json = response.json()
     try:
         response_data = response_json["data"]
     except KeyError as key_error:
-        logging.error(f"Could not access `data` field in response: {response_json}")
+        logging.error("Could not access `data` field in response: %s", excerpt(response.text))
         raise key_error
 
     operation_ids = []
@@ -231,8 +465,8 @@ def get_operation_ids(sap_auth_url: str, sap_client_id: str, sap_client_secret:
             customer_name = customer["customerName"]
             operation_id = customer["lastOperationId"]
         except KeyError as key_error:
-            logging.error(f"Could not access `customerName` or `lastOperationId` fields in response: {customer}.\n"
-                          f"Full response: {response_json}")
+            logging.error("Could not access `customerName` or `lastOperationId` fields of customer wallet: %s",
+                          excerpt(str(customer)))
             raise key_error
         operation_ids.append({
             KEY_CUSTOMER_NAME: customer_name,
@@ -242,24 +476,94 @@ def get_operation_ids(sap_auth_url: str, sap_client_id: str, sap_client_secret:
     return operation_ids
 
 
+def load_operation_index(sap_auth_url: str, sap_client_id: str, sap_client_secret: str,
+                         sap_url: str) -> OperationIdIndex | None:
+    """
+    Fetch and index the operation IDs of the customer wallets, `None` if there are none.
+    With a `WALLET_INDEX`, the wallets are only fetched once its refresh is due, and only the cached details of
+    operations no longer referenced by a wallet are dropped.
+    """
+    if WALLET_INDEX is None:
+        operation_ids = get_operation_ids(sap_auth_url, sap_client_id, sap_client_secret, sap_url)
+        if not operation_ids:
+            return None
+        logging.info("Found %s operation IDs.", len(operation_ids))
+        retain_cached_operations(operation_ids)
+        return build_operation_id_index(operation_ids)
+
+    operation_index, changes = WALLET_INDEX.get()
+    METRICS.count_cache("wallet_index", hit=changes is None)
+    if changes is not None and changes.changed:
+        forget_operations(changes.stale_operation_ids)
+        retain_cached_operations(WALLET_INDEX.operations)
+    return operation_index
+
+
+def retain_cached_operations(operations: List[Dict]):
+    """Drop the persisted client info and company DIDs of operations that are no longer referenced by a wallet"""
+    if PERSISTENT_CACHE is None:
+        return
+    operation_ids = [operation[KEY_OPERATION_ID] for operation in operations]
+    for namespace in (NAMESPACE_CLIENT_INFO, NAMESPACE_COMPANY_DID):
+        PERSISTENT_CACHE.retain(namespace, operation_ids)
+
+
+def forget_operations(operation_ids: Iterable[str]):
+    """Drop the cached client info and company DIDs of operations that are no longer referenced by a wallet"""
+    for operation_id in operation_ids:
+        with CLIENT_INFO_CACHE_LOCK:
+            CLIENT_INFO_CACHE.pop(operation_id, None)
+        with COMPANY_DIDS_LOCK:
+            COMPANY_DIDS.pop(operation_id, None)
+
+
+def build_operation_id_index(operation_data: List[Dict]) -> OperationIdIndex:
+    """Index the operation IDs returned by `get_operation_ids` by the BPNLs contained in the customer names"""
+    by_bpn: Dict[str, List[tuple[int, str]]] = {}
+    unparsed: List[tuple[int, str, str]] = []
+    for position, operation in enumerate(operation_data):
+        customer_name = operation[KEY_CUSTOMER_NAME]
+        operation_id = operation[KEY_OPERATION_ID]
+        bpns = set(BPNL_PATTERN.findall(customer_name))
+        if not bpns:
+            unparsed.append((position, customer_name, operation_id))
+        for bpn in bpns:
+            by_bpn.setdefault(bpn, []).append((position, operation_id))
+
+    logging.debug("Indexed %s BPNs, %s customer names contain no BPN", len(by_bpn), len(unparsed))
+    return OperationIdIndex(by_bpn, unparsed, operation_data)
+
+
+def find_operation_ids(operation_index: OperationIdIndex, bpn: str) -> List[str]:
+    """
+    Returns the operation IDs of all wallets whose customer name contains the given BPN, in the order of the
+    `customerWallets` response. Customer names without a parsable BPNL are matched by substring.
+    """
+    if not BPNL_PATTERN.fullmatch(bpn):
+        return [op[KEY_OPERATION_ID] for op in operation_index.operations if bpn in op[KEY_CUSTOMER_NAME]]
+
+    matches = list(operation_index.by_bpn.get(bpn, []))
+    fallback_matches = [(position, op_id) for position, name, op_id in operation_index.unparsed if bpn in name]
+    if fallback_matches:
+        matches = sorted(matches + fallback_matches)
+    return [op_id for _, op_id in matches]
+
+
 def add_operation_id_to_credential_data(
         stage: str,
         sap_auth_url: str,
         sap_client_id: str,
         sap_client_secret: str,
         sap_url: str,
-        credentials: List[Dict],
-        operation_data: List[Dict],
-) -> List[Dict]:
+        credentials: Iterable[Dict],
+        operation_index: OperationIdIndex,
+) -> Iterator[Dict]:
+    """Lazily yield the credentials enriched with their operation ID, credentials without one are skipped"""
     logging.debug("Merging credential data with operation IDs")
-    merged_data = []
     num_removed_credential = 0
     for cred in credentials:
         bpn = cred[KEY_BPN]
-        op_ids = []
-        for operation in operation_data:
-            if bpn in operation[KEY_CUSTOMER_NAME]:
-                op_ids.append(operation[KEY_OPERATION_ID])
+        op_ids = find_operation_ids(operation_index, bpn)
 
         if len(op_ids) == 1:
             op_id = op_ids[0]
@@ -270,17 +574,17 @@ def add_operation_id_to_credential_data(
 
         if op_id:
             cred.update({KEY_OPERATION_ID: op_id})
-            merged_data.append(cred)
+            yield cred
         else:
             num_removed_credential += 1
-            logging.warning(
-                f"Removed credential - No operation ID found for BPN: {bpn},"
-                f" Type: {cred["type"]}, Credential ID: {cred[KEY_CREDENTIAL_ID]}",
-            )
+            logging.warning("Removed credential - No operation ID found for BPN: %s, Type: %s, Credential ID: %s", bpn,
+                            cred[KEY_TYPE], cred[KEY_CREDENTIAL_ID])
 
     if num_removed_credential > 0:
-        logging.warning(f"Total {num_removed_credential} credentials removed due to missing operation IDs:")
-    return merged_data
+        logging.warning("Total %s credentials removed due to missing operation IDs:", num_removed_credential)
+        if WALLET_INDEX is not None:
+            # Their wallets may have been created since the wallets were fetched
+            WALLET_INDEX.invalidate()
 
 
 def get_first_op_id_by_stage(
@@ -294,36 +598,103 @@ def get_first_op_id_by_stage(
     """
     Returns the first operation ID valid for the given stage.
     If no valid operation ID is found, returns an empty string.
+    With a `DID_EXECUTOR`, the company DIDs of all candidates are resolved concurrently and the operation ID is
+    returned as soon as it and all candidates before it are resolved. Candidates this call submitted are cancelled
+    unless they already started or another caller is waiting for them as well.
     """
-    for operation_id in matching_op_ids:
-        company_did: str = get_company_did(
-            sap_auth_url,
-            sap_client_id,
-            sap_client_secret,
-            sap_url,
-            operation_id
-        )
-        if stage in company_did:
-            return operation_id
-    return ""
+    submitted: List[Future] = []
+    resolve = partial(resolve_company_did, sap_auth_url, sap_client_id, sap_client_secret, sap_url,
+                      submitted=submitted)
+    if DID_EXECUTOR is None:
+        # Resolved one after the other, so candidates after the first valid one are never resolved
+        company_dids = map(resolve, matching_op_ids)
+    else:
+        company_dids = [resolve(operation_id) for operation_id in matching_op_ids]
 
+    try:
+        for operation_id, company_did in zip(matching_op_ids, company_dids):
+            company_did = company_did.result()
+            if company_did is not None and stage in company_did:
+                return operation_id
+        return ""
+    finally:
+        if DID_EXECUTOR is not None:
+            cancel_unshared_company_dids(submitted)
 
-def get_auth_token(auth_base_url: str, auth_path: str, client_id: str, client_secret: str,
-                   is_user: bool = False) -> str:
-    """Get authentication token from Keycloak with caching"""
-    cache_key = f"{auth_base_url}:{client_id}"
-
-    # Check cache and token expiry
-    if cache_key in TOKEN_CACHE:
-        token_data = TOKEN_CACHE[cache_key]
-        # Check if token is still valid (with 15s buffer)
-        if token_data["expiry"] > time() + 15:
-            logging.debug(f"Using cached token for {cache_key}")
-            return token_data["token"]
+
+def resolve_company_did(
+        sap_auth_url: str,
+        sap_client_id: str,
+        sap_client_secret: str,
+        sap_url: str,
+        operation_id: str,
+        submitted: List[Future] | None = None,
+) -> Future:
+    """
+    Returns a future of the company DID of the operation, which is already resolved without a `DID_EXECUTOR`.
+    Every operation ID is resolved once per run and callers share the same future. A newly submitted future is
+    appended to `submitted`, one returned to another caller is marked as shared. Failed and cancelled resolutions
+    are forgotten, so they are resolved again on the next call.
+    """
+    with COMPANY_DIDS_LOCK:
+        company_did = COMPANY_DIDS.get(operation_id)
+        if company_did is not None:
+            if not company_did.done():
+                SHARED_COMPANY_DIDS.add(company_did)
+            return company_did
+        if DID_EXECUTOR is not None:
+            company_did = DID_EXECUTOR.submit(
+                get_company_did, sap_auth_url, sap_client_id, sap_client_secret, sap_url, operation_id)
+            if submitted is not None:
+                submitted.append(company_did)
         else:
-            logging.debug(f"Cached token expired for {cache_key}")
-            TOKEN_CACHE.pop(cache_key)
+            company_did = Future()
+        COMPANY_DIDS[operation_id] = company_did
+
+    if DID_EXECUTOR is None:
+        try:
+            company_did.set_result(
+                get_company_did(sap_auth_url, sap_client_id, sap_client_secret, sap_url, operation_id))
+        except Exception as exception:
+            company_did.set_exception(exception)
+    company_did.add_done_callback(partial(forget_unresolved_company_did, operation_id))
+    return company_did
+
+
+def forget_unresolved_company_did(operation_id: str, company_did: Future):
+    failed = company_did.cancelled() or company_did.exception() is not None
+    with COMPANY_DIDS_LOCK:
+        SHARED_COMPANY_DIDS.discard(company_did)
+        if failed and COMPANY_DIDS.get(operation_id) is company_did:
+            del COMPANY_DIDS[operation_id]
 
+
+def cancel_unshared_company_dids(submitted: List[Future]):
+    """
+    Cancels the `submitted` company DIDs that no other caller waits for. They are forgotten first, so no caller can
+    get them while they are cancelled, and kept if they started meanwhile. Cancelling runs the done callbacks, which
+    take the lock, so it is released before.
+    """
+    with COMPANY_DIDS_LOCK:
+        unshared = {company_did for company_did in submitted
+                    if not company_did.done() and company_did not in SHARED_COMPANY_DIDS}
+        forgotten = [(operation_id, company_did) for operation_id, company_did in COMPANY_DIDS.items()
+                     if company_did in unshared]
+        for operation_id, _ in forgotten:
+            del COMPANY_DIDS[operation_id]
+    started = [(operation_id, company_did) for operation_id, company_did in forgotten if not company_did.cancel()]
+    if started:
+        with COMPANY_DIDS_LOCK:
+            for operation_id, company_did in started:
+                # A failed resolution was already forgotten by its done callback
+                if not company_did.done() or company_did.exception() is None:
+                    COMPANY_DIDS.setdefault(operation_id, company_did)
+
+
+@METRICS.timed
+def request_auth_token(auth_base_url: str, auth_path: str, client_id: str, client_secret: str,
+                       is_user: bool = False) -> tuple[str, float]:
+    """Request a new authentication token, returns the token and its lifetime in seconds"""
     headers = {CONTENT_TYPE: APPLICATION_X_WWW_FORM_URLENCODED}
 
     if is_user:
@@ -331,22 +702,27 @@ def get_auth_token(auth_base_url: str, auth_path: str, client_id: str, client_se
     else:
         payload = f"client_id={client_id}&grant_type=client_credentials&client_secret={client_secret}"
 
-    response: Response = requests.post(urljoin(auth_base_url, auth_path), headers=headers, data=payload)
+    response: Response = http_client.post(urljoin(auth_base_url, auth_path), headers=headers, data=payload)
     if response.status_code != 200:
-        raise requests.HTTPError(f"Failed to get access token: {response.status_code} {response.text}")
+        raise requests.HTTPError(f"Failed to get access token: {response.status_code} {excerpt(response.text)}")
 
     body = response.json()
+    return body["access_token"], body.get("expires_in", 300)  # Default 5 min if expires_in not present
 
-    # Cache the token with expiry
-    TOKEN_CACHE[cache_key] = {
-        "token": body["access_token"],
-        "expiry": time() + body.get("expires_in", 300)  # Default 5 min if expires_in not present
-    }
 
-    logging.debug(f"Cached new token for {cache_key}")
-    return body["access_token"]
+TOKEN_MANAGER = TokenManager(request_auth_token)
+
+
+def get_auth_token(auth_base_url: str, auth_path: str, client_id: str, client_secret: str,
+                   is_user: bool = False) -> str:
+    """
+    Get authentication token from Keycloak or SAP UAA with caching.
+    Used for the issuer service, SAP and the per-tenant tokens of the customer wallets alike.
+    """
+    return TOKEN_MANAGER.get_token(auth_base_url, auth_path, client_id, client_secret, is_user)
 
 
+@METRICS.timed
 def get_customer_client_info(
         sap_auth_url: str,
         sap_client_id: str,
@@ -354,36 +730,73 @@ def get_customer_client_info(
         sap_base_url: str,
         operation_id: str,
 ) -> Dict:
-    """Get Customer client information for a specific operation with local caching"""
-    if operation_id in CLIENT_INFO_CACHE:
-        logging.debug(f"Using cached client info for operation ID: {operation_id}")
-        return CLIENT_INFO_CACHE[operation_id]
+    """
+    Get Customer client information for a specific operation with local caching.
+    Every operation ID is fetched once per run, concurrent callers wait for the same fetch. Failed fetches are
+    forgotten, so they are fetched again on the next call.
+    """
+    with CLIENT_INFO_CACHE_LOCK:
+        client_info = CLIENT_INFO_CACHE.get(operation_id)
+        is_cached = client_info is not None
+        if not is_cached:
+            client_info = Future()
+            CLIENT_INFO_CACHE[operation_id] = client_info
+    METRICS.count_cache("client_info", hit=is_cached)
+    if is_cached:
+        logging.debug("Using cached client info for operation ID: %s", operation_id)
+        return client_info.result()
+
+    try:
+        client_info.set_result(
+            fetch_customer_client_info(sap_auth_url, sap_client_id, sap_client_secret, sap_base_url, operation_id))
+    except Exception as exception:
+        with CLIENT_INFO_CACHE_LOCK:
+            if CLIENT_INFO_CACHE.get(operation_id) is client_info:
+                del CLIENT_INFO_CACHE[operation_id]
+        client_info.set_exception(exception)
+    return client_info.result()
+
+
+def fetch_customer_client_info(
+        sap_auth_url: str,
+        sap_client_id: str,
+        sap_client_secret: str,
+        sap_base_url: str,
+        operation_id: str,
+) -> Dict:
+    """Get Customer client information for a specific operation from the persistent cache or SAP"""
+    if PERSISTENT_CACHE is not None:
+        client_info = PERSISTENT_CACHE.get(NAMESPACE_CLIENT_INFO, operation_id)
+        if client_info is not None:
+            logging.debug("Using persisted client info for operation ID: %s", operation_id)
+            return client_info
 
     sap_auth_token = get_auth_token(
         sap_auth_url,
-        AUTH_TOKEN_PATH_SAP,
+        ENDPOINTS.sap_token_path,
         sap_client_id,
         sap_client_secret
     )
-    response = requests.get(
+    response = http_client.get(
         f"{sap_base_url}/api/v1.0.0/operations/{operation_id}",
         headers={AUTHORIZATION: BEARER_TOKEN.format(sap_auth_token)},
     )
     if response.status_code != 200:
         raise requests.HTTPError(
-            f"Failed to get operation details for operation ID {operation_id}: {response.status_code} {response.text}")
+            f"Failed to get operation details for operation ID {operation_id}: {response.status_code} "
+            f"{excerpt(response.text)}")
 
     try:
         response_json = response.json()
     except JSONDecodeError as e:
-        logging.error(f"Failed to parse JSON response. Full response text: {response.text}")
+        logging.error("Failed to parse JSON response. Response text: %s", excerpt(response.text))
         raise e
 
     try:
         uaa = response_json["data"]["serviceKey"]["uaa"]
     except KeyError as e:
-        logging.error(
-            f"Failed to parse [data][serviceKey][uaa] field from response. Is the operation status completed? Full response text: {response.text}")
+        logging.error("Failed to parse [data][serviceKey][uaa] field from response. Is the operation status completed? "
+                      "Response text: %s", excerpt(response.text))
         raise e
 
     try:
@@ -399,20 +812,28 @@ def get_customer_client_info(
         CLIENT_ID: client_id,
         CLIENT_SECRET: client_secret
     }
-    CLIENT_INFO_CACHE[operation_id] = client_info
-    logging.debug(f"Cached client info for operation ID: {operation_id}")
+    if PERSISTENT_CACHE is not None:
+        PERSISTENT_CACHE.set(NAMESPACE_CLIENT_INFO, operation_id, client_info, secret=True)
+    logging.debug("Fetched client info for operation ID: %s", operation_id)
 
     return client_info
 
 
+@METRICS.timed
 def get_company_did(
         sap_auth_url: str,
         sap_client_id: str,
         sap_client_secret: str,
         sap_url: str,
         operation_id: str
-) -> str:
-    """Get Company DID"""
+) -> str | None:
+    """Get Company DID, `None` if the operation has no company identity"""
+    if PERSISTENT_CACHE is not None:
+        company_did = PERSISTENT_CACHE.get(NAMESPACE_COMPANY_DID, operation_id, default=MISSING)
+        if company_did is not MISSING:
+            logging.debug("Using persisted company DID for operation ID: %s", operation_id)
+            return company_did
+
     customer_client_info: dict = get_customer_client_info(
         sap_auth_url,
         sap_client_id,
@@ -423,49 +844,52 @@ def get_company_did(
 
     auth_token = get_auth_token(
         customer_client_info[URL],
-        AUTH_TOKEN_PATH_SAP,
+        ENDPOINTS.sap_token_path,
         customer_client_info[CLIENT_ID],
         customer_client_info[CLIENT_SECRET]
     )
 
-    response = requests.get(
-        "https://dis-integration-service-prod.eu10.div.cloud.sap/api/v2.0.0/companyIdentities",
+    response = http_client.get(
+        f"{ENDPOINTS.dis_base_url}/api/v2.0.0/companyIdentities",
         headers={AUTHORIZATION: BEARER_TOKEN.format(auth_token)},
     )
 
     if response.status_code != 200:
         raise requests.HTTPError(
-            f"Failed to get company DID for operation ID {operation_id}: {response.status_code} {response.text}")
+            f"Failed to get company DID for operation ID {operation_id}: {response.status_code} "
+            f"{excerpt(response.text)}")
 
     try:
         response_json = response.json()
     except JSONDecodeError as e:
-        logging.error(f"Failed to parse JSON response. Full response text: {response.text}")
+        logging.error("Failed to parse JSON response. Response text: %s", excerpt(response.text))
         raise e
 
     try:
-        if not response_json["data"]:
-            logging.warning(f"No data found for the given BPN. Full response text: {response.text}")
-            return None
-        return response_json["data"][0]["issuerDID"]
+        company_did = response_json["data"][0]["issuerDID"] if response_json["data"] else None
     except KeyError as e:
-        logging.error(
-            f"Failed to parse [data][0][issuerDID] field from response. Full response text: {response.text}")
+        logging.error("Failed to parse [data][0][issuerDID] field from response. Response text: %s",
+                      excerpt(response.text))
         raise e
+    if company_did is None:
+        logging.warning("No data found for the given BPN. Response text: %s", excerpt(response.text))
 
+    if PERSISTENT_CACHE is not None:
+        # The company identity of an operation may be created any time, so its absence is only cached shortly
+        PERSISTENT_CACHE.set(NAMESPACE_COMPANY_DID, operation_id, company_did,
+                             ttl=NEGATIVE_TTL if company_did is None else None)
+    return company_did
 
-def issue_credential(
-        auth_url: str,
-        issuer_service_client_id: str,
-        issuer_service_client_secret: str,
-        issuer_url: str,
+
+def issuance_request(
         cred_type: str,
         holder_did: str,
         bpn: str,
         wallet_url: str,
         tech_user_client_id: str,
         tech_user_client_secret: str,
-):
+) -> tuple[str, Dict]:
+    """Route below `/api/issuer` and payload of the issuance request for the given credential type"""
     # Create base payload for issuance request
     base_payload = {
         "holder": holder_did,
@@ -478,206 +902,410 @@ def issue_credential(
         "callbackUrl": None,
     }
 
-    # Set URL and amend payload based on credential type
+    # Set route and amend payload based on credential type
     if cred_type == CredentialType.BUSINESS_PARTNER_NUMBER.value:
-        url = f"{issuer_url}/api/issuer/bpn"
+        route = ISSUANCE_ROUTE_BPN
     elif cred_type == CredentialType.MEMBERSHIP_CREDENTIAL.value:
-        url = f"{issuer_url}/api/issuer/membership"
+        route = ISSUANCE_ROUTE_MEMBERSHIP
         base_payload["memberOf"] = "catena-x"
     elif cred_type == CredentialType.DATA_EXCHANGE_GOVERNANCE_CREDENTIAL.value:
-        url = f"{issuer_url}/api/issuer/framework"
+        route = ISSUANCE_ROUTE_FRAMEWORK
         base_payload.update({
             "useCaseFrameworkId": "DATA_EXCHANGE_GOVERNANCE_CREDENTIAL",
             "useCaseFrameworkVersionId": "090efafd-9667-404f-85cc-d7d072b5ad46"
         })
     else:
         raise ValueError(f"Unsupported credential type: {cred_type}")
+    return route, base_payload
 
+
+def issuer_service_headers(auth_url: str, client_id: str, client_secret: str) -> Dict:
     # Get auth token for issuer service
     issuer_auth_token = get_auth_token(
         auth_url,
-        AUTH_TOKEN_PATH_KEYCLOAK,
-        issuer_service_client_id,
-        issuer_service_client_secret,
+        ENDPOINTS.keycloak_token_path,
+        client_id,
+        client_secret,
         True
     )
-
-    headers = {
+    return {
         ACCEPT: APPLICATION_JSON,
         CONTENT_TYPE: APPLICATION_JSON,
         AUTHORIZATION: BEARER_TOKEN.format(issuer_auth_token),
     }
-    response = requests.post(url, headers=headers, json=base_payload)
+
+
+def bulk_item_results(items: List[Dict], count: int, describe: Callable[[int], str]) -> List[str | Exception]:
+    """
+    Orders the item results of a bulk response by their index. Returns the ID of every succeeded item and a
+    `requests.HTTPError` for every failed or missing one.
+    """
+    results: List[str | Exception] = [requests.HTTPError(f"No result for {describe(index)}") for index in range(count)]
+    for item in items:
+        index = item["index"]
+        if item.get("error"):
+            results[index] = requests.HTTPError(
+                f"Failed to {describe(index)}: {item['error']['type']} {item['error']['message']}")
+        else:
+            results[index] = item["id"]
+    return results
+
+
+@METRICS.timed
+def issue_credential(
+        auth_url: str,
+        issuer_service_client_id: str,
+        issuer_service_client_secret: str,
+        issuer_url: str,
+        cred_type: str,
+        holder_did: str,
+        bpn: str,
+        wallet_url: str,
+        tech_user_client_id: str,
+        tech_user_client_secret: str,
+) -> str:
+    """Issues a new credential, returns its ID"""
+    route, payload = issuance_request(cred_type, holder_did, bpn, wallet_url, tech_user_client_id,
+                                      tech_user_client_secret)
+    headers = issuer_service_headers(auth_url, issuer_service_client_id, issuer_service_client_secret)
+    response = http_client.post(f"{issuer_url}/api/issuer/{route}", headers=headers, json=payload)
     if response.status_code != 200:
-        raise requests.HTTPError(f"Failed to issue credential: {response.status_code} {response.text}")
-    logging.info(f"Issued new {cred_type} credential with ID {response.text} to {holder_did}.")
+        raise requests.HTTPError(f"Failed to issue credential: {response.status_code} {excerpt(response.text)}")
+    # The ID is returned as JSON string
+    credential_id = response.text.strip().strip('"')
+    logging.info("Issued new %s credential with ID %s to %s.", cred_type, credential_id, holder_did)
+    return credential_id
 
 
+@METRICS.timed
+def issue_credentials_bulk(
+        auth_url: str,
+        issuer_service_client_id: str,
+        issuer_service_client_secret: str,
+        issuer_url: str,
+        requests_to_issue: List[tuple[str, Dict]],
+) -> List[str | Exception]:
+    """
+    Issues the credentials of several `issuance_request`s with one request to `/api/issuer/bulk`.
+    Returns the ID of every issued credential and the exception of every failed one.
+    """
+    # Position of every request in the list of its route
+    positions = {route: [] for route in BULK_ISSUANCE_FIELDS}
+    for number, (route, _) in enumerate(requests_to_issue):
+        positions[route].append(number)
+    body = {field: [requests_to_issue[number][1] for number in positions[route]]
+            for route, field in BULK_ISSUANCE_FIELDS.items()}
+
+    headers = issuer_service_headers(auth_url, issuer_service_client_id, issuer_service_client_secret)
+    try:
+        response = http_client.post(f"{issuer_url}/api/issuer/bulk", headers=headers, json=body)
+    except requests.RequestException as e:
+        if http_client.outcome_unknown(e):
+            # Issuing is not idempotent, the credentials are not issued again so that no holder gets two
+            raise BulkOutcomeUnknown(f"Failed to issue credentials, they may have been issued: {e}") from e
+        raise
+    if is_bulk_unsupported(response.status_code, response.text):
+        raise BulkUnsupported(f"Failed to issue credentials: {response.status_code} {excerpt(response.text)}")
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Failed to issue credentials: {response.status_code} {excerpt(response.text)}")
+
+    # Every request belongs to one route, so every result is set below
+    results: List[str | Exception | None] = [None] * len(requests_to_issue)
+    for route, field in BULK_ISSUANCE_FIELDS.items():
+        route_positions = positions[route]
+        route_results = bulk_item_results(
+            response.json().get(field) or [],
+            len(route_positions),
+            lambda index: f"issue {route} credential to {requests_to_issue[route_positions[index]][1]['holder']}",
+        )
+        for index, result in enumerate(route_results):
+            number = route_positions[index]
+            results[number] = result
+            if not isinstance(result, Exception):
+                logging.info("Issued new %s credential with ID %s to %s.", route, result,
+                             requests_to_issue[number][1]["holder"])
+    return results
+
+
+@METRICS.timed
 def revoke_credential(auth_url: str, client_id: str, client_secret: str, issuer_url: str, credential_id: str):
     """Revoke old credential"""
-    issuer_token = get_auth_token(
-        auth_url,
-        AUTH_TOKEN_PATH_KEYCLOAK,
-        client_id,
-        client_secret,
-        True
-    )
-    headers = {
-        ACCEPT: APPLICATION_JSON,
-        AUTHORIZATION: BEARER_TOKEN.format(issuer_token),
-    }
-
-    response = requests.post(
+    headers = issuer_service_headers(auth_url, client_id, client_secret)
+    response = http_client.post(
         f"{issuer_url}/api/revocation/issuer/credentials/{credential_id}",
         headers=headers
     )
     if response.status_code != 200:
-        raise requests.HTTPError(f"Failed to revoke credential: {credential_id} {response.status_code} {response.text}")
+        raise requests.HTTPError(
+            f"Failed to revoke credential: {credential_id} {response.status_code} {excerpt(response.text)}")
 
 
-def parse_cli_args() -> tuple[Namespace, list[str]]:
-    parser = argparse.ArgumentParser(description="Reissue expiring credentials")
-    parser.add_argument("--stage", required=True, choices=["int"], help="Environment stage")
-    parser.add_argument("--start_date", type=date.fromisoformat, required=True,
-                        help="yyyy-mm-dd - Credentials expiring on or after this date and on or before end_date will be reissued.")
-    parser.add_argument("--end_date", type=date.fromisoformat, required=True,
-                        help="yyyy-mm-dd - Credentials expiring on or before this date and on or after start_date will be reissued.")
-    parser.add_argument("--issuer-service-client-id", required=True, help="SSI Issuer client ID")
-    parser.add_argument("--issuer-service-client-secret", required=True, help="SSI Issuer client secret")
-    parser.add_argument("--sap-url", required=True, help="SAP base URL")
-    parser.add_argument("--sap-auth-url", required=True, help="SAP auth URL")
-    parser.add_argument("--sap-client-id", required=True, help="SAP client ID")
-    parser.add_argument("--sap-client-secret", required=True, help="SAP client secret")
-    parser.add_argument("--log-level", default="DEBUG", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-                        help="Logging level")
-    parser.add_argument("--limit", type=int, help="Maximum number of credentials to reissue")
-    return parser.parse_known_args()
+@METRICS.timed
+def revoke_credentials_bulk(auth_url: str, client_id: str, client_secret: str, issuer_url: str,
+                            credential_ids: List[str]) -> List[None | Exception]:
+    """
+    Revokes several old credentials with one request. Returns `None` for every revoked credential and the exception
+    of every failed one.
+    """
+    headers = issuer_service_headers(auth_url, client_id, client_secret)
+    try:
+        response = http_client.post(f"{issuer_url}/api/revocation/issuer/credentials/bulk", headers=headers,
+                                    json=credential_ids)
+    except requests.RequestException as e:
+        if http_client.outcome_unknown(e):
+            raise BulkOutcomeUnknown(f"Failed to revoke credentials, they may have been revoked: {e}") from e
+        raise
+    if is_bulk_unsupported(response.status_code, response.text):
+        raise BulkUnsupported(f"Failed to revoke credentials: {response.status_code} {excerpt(response.text)}")
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Failed to revoke credentials: {response.status_code} {excerpt(response.text)}")
+    results = bulk_item_results(response.json(), len(credential_ids),
+                                lambda index: f"revoke credential {credential_ids[index]}")
+    return [result if isinstance(result, Exception) else None for result in results]
 
 
-def main():
-    # Unpack args
-    args, unknown_args = parse_cli_args()
+def resolve_revocations(auth_url: str, client_id: str, client_secret: str, issuer_url: str, credential_ids: List[str],
+                        error: Exception) -> List[None | Exception]:
+    """
+    Find out which credentials of a bulk revocation with unknown outcome were revoked. Credentials whose status is
+    revoked are, the others are revoked with single requests, which skip credentials that are not active anymore.
+    Without the status route, every credential is revoked with a single request.
+    """
+    try:
+        statuses = {status.credential_id: status.status
+                    for status in fetch_credential_status(auth_url, client_id, client_secret, issuer_url,
+                                                          credential_ids)}
+    except StatusUnsupported:
+        statuses = {}
+    results: List[None | Exception] = []
+    for credential_id in credential_ids:
+        if statuses.get(credential_id) in CREDENTIAL_STATUSES_REVOKED:
+            results.append(None)
+            continue
+        try:
+            revoke_credential(auth_url, client_id, client_secret, issuer_url, credential_id)
+            results.append(None)
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+@METRICS.timed
+def fetch_credential_status(auth_url: str, client_id: str, client_secret: str, issuer_url: str,
+                            credential_ids: List[str]) -> List[CredentialStatus]:
+    """Fetch the status of several credentials with one request, unknown credentials are omitted"""
+    headers = issuer_service_headers(auth_url, client_id, client_secret)
+    response = http_client.post(f"{issuer_url}/api/issuer/status", headers=headers, json=credential_ids)
+    if response.status_code in UNSUPPORTED_STATUS_ROUTE_CODES:
+        raise StatusUnsupported(f"Failed to fetch credential status: {response.status_code} {excerpt(response.text)}")
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Failed to fetch credential status: {response.status_code} {excerpt(response.text)}")
+    return decode_credential_status(response.content)
 
-    stage = args.stage
-    start_date: date = args.start_date
-    end_date: date = args.end_date
-    issuer_service_client_id = args.issuer_service_client_id
-    issuer_service_client_secret = args.issuer_service_client_secret
-    sap_url = args.sap_url
-    sap_auth_url = args.sap_auth_url
-    sap_client_id = args.sap_client_id
-    sap_client_secret = args.sap_client_secret
-    log_level = args.log_level
-    iter_limit = args.limit
 
-    # Setup logging
-    logger = setup_logger(log_level)
-    logging.info(
-        f"Running with the following arguments:\n"
-        f"stage: {stage}\n"
-        f"start_date: {start_date}\n"
-        f"end_date: {end_date}\n"
-        f"issuer_service_client_id: {issuer_service_client_id}\n"
-        f"sap_url: {sap_url}\n"
-        f"sap_auth_url: {sap_auth_url}\n"
-        f"sap_client_id: {sap_client_id}\n"
-        f"log_level: {log_level}\n"
-        f"limit: {iter_limit}\n"
-    )
-    logging.info(
-        f"Reissuing credentials that are active and expire between {start_date} and {end_date} (both inclusive).",
-    )
-    if len(unknown_args) > 0:
-        logging.warning(f"Found {len(unknown_args)} unknown arguments, ignoring them")
-
-    # Setup base URLs
-    issuer_service_base_url = ISSUER_SERVICE_BASE_URL.format(stage)
-    keycloak_base_url = KEYCLOAK_BASE_URL.format(stage)
-
-    # Fetch all active credentials
-    active_credentials = fetch_active_credentials(
-        keycloak_base_url,
-        issuer_service_client_id,
-        issuer_service_client_secret,
-        issuer_service_base_url,
+def discover_credentials(
+        stage: str,
+        start_date: date,
+        end_date: date,
+        keycloak_base_url: str,
+        issuer_service_client_id: str,
+        issuer_service_client_secret: str,
+        issuer_service_base_url: str,
+        sap_auth_url: str,
+        sap_client_id: str,
+        sap_client_secret: str,
+        sap_url: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        skip_credential_ids: Container[str] = (),
+        shard: Shard | None = None,
+        compact_page_size: int | None = DEFAULT_COMPACT_PAGE_SIZE,
+) -> Iterator[Dict]:
+    """
+    Lazily yield the active, valid credentials expiring between `start_date` and `end_date`, merged with their
+    operation ID. Credentials in `skip_credential_ids` or outside of `shard` are skipped before merging.
+    With a `DELTA_STATE`, only credentials expiring after its watermark are listed, and the credentials of earlier
+    runs that were not reissued are yielded first. With a `SCHEDULER`, credentials are yielded by expiry date.
+    With `DUPLICATES`, credentials whose holder already has a replacement of the same type, or that share BPN and
+    type with a credential yielded before, are skipped before merging.
+    Closing the generator stops fetching.
+    """
+    listing_start = DELTA_STATE.listing_start(start_date) if DELTA_STATE is not None else start_date
+    if listing_start > end_date:
+        logging.info("Credentials expiring until %s were already listed by a previous run", end_date)
+        active_credentials = (cred for cred in [])
+    else:
+        if listing_start > start_date:
+            logging.info("Credentials expiring until %s were already listed by a previous run, listing credentials "
+                         "expiring from %s", DELTA_STATE.watermark, listing_start)
+        # Stream active credentials page by page
+        active_credentials = fetch_active_credentials(
+            keycloak_base_url,
+            issuer_service_client_id,
+            issuer_service_client_secret,
+            issuer_service_base_url,
+            page_size,
+            fetch_workers,
+            listing_start,
+            end_date,
+            compact_page_size,
+        )
+    try:
+        # The issuer service may not support filtering by expiry date, so the range is checked locally as well
+        # Unsigned credentials are reissued by a later run once they are signed, so they hold the watermark
+        expiring_credentials = filter_credentials(active_credentials, start_date, end_date,
+                                                  DELTA_STATE.hold if DELTA_STATE is not None else None)
+        expiring_credential_data = (
+            credential_data
+            for credential_data in (transform_credential_data(cred) for cred in expiring_credentials)
+            if shard is None or shard.contains(credential_data)
+        )
+        if DELTA_STATE is not None:
+            expiring_credential_data = DELTA_STATE.track(expiring_credential_data, start_date, end_date)
+        expiring_credential_data = (
+            credential_data for credential_data in expiring_credential_data
+            if credential_data[KEY_CREDENTIAL_ID] not in skip_credential_ids
+        )
+        if SCHEDULER is not None:
+            # Sorted before merging, so the lookahead of the buffer costs no SAP or DIS requests
+            expiring_credential_data = SCHEDULER.order(expiring_credential_data)
+
+        # Stop if there's nothing to reissue
+        first_expiring_credential = next(expiring_credential_data, None)
+        if first_expiring_credential is None:
+            logging.warning("No expiring credentials found.")
+            return
+        expiring_credential_data = chain([first_expiring_credential], expiring_credential_data)
+        if DUPLICATES is not None:
+            load_replacements(DUPLICATES, end_date, keycloak_base_url, issuer_service_client_id,
+                              issuer_service_client_secret, issuer_service_base_url, page_size, fetch_workers,
+                              compact_page_size)
+            expiring_credential_data = DUPLICATES.filter(expiring_credential_data)
+
+        # Get operation IDs
+        operation_index = load_operation_index(sap_auth_url, sap_client_id, sap_client_secret, sap_url)
+        if operation_index is None:
+            logging.error("No operation IDs found.")
+            return
+
+        # Merge data
+        for cred in add_operation_id_to_credential_data(stage, sap_auth_url, sap_client_id, sap_client_secret,
+                                                        sap_url, expiring_credential_data, operation_index):
+            if DELTA_STATE is not None and DELTA_STATE.status_of(cred[KEY_CREDENTIAL_ID]) == STATUS_REVOKED:
+                # Revoked by a previous run, but not issued again
+                cred[KEY_REVOKED] = True
+            yield cred
+    finally:
+        active_credentials.close()
+
+
+def load_replacements(
+        duplicates: DuplicateIndex,
+        end_date: date,
+        keycloak_base_url: str,
+        issuer_service_client_id: str,
+        issuer_service_client_secret: str,
+        issuer_service_base_url: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        compact_page_size: int | None = DEFAULT_COMPACT_PAGE_SIZE,
+):
+    """
+    Index the PENDING credentials and the ACTIVE credentials expiring after `end_date` as replacements of the
+    credentials of the same BPN and type expiring until `end_date`. ACTIVE credentials only replace the ones created
+    before them, see `DuplicateIndex`.
+    """
+    fetch = partial(fetch_active_credentials, keycloak_base_url, issuer_service_client_id,
+                    issuer_service_client_secret, issuer_service_base_url, page_size, fetch_workers,
+                    compact_page_size=compact_page_size)
+    num_pending = duplicates.add_replacements(fetch(status=CREDENTIAL_STATUS_PENDING), REASON_PENDING_REPLACEMENT)
+    # Issuer services without expiry date filter list every active credential, so the range is checked locally
+    num_active = duplicates.add_replacements(
+        (cred for cred in fetch(expiry_from=end_date + timedelta(days=1))
+         if cred.expiry_date is not None and cred.expiry_date[:10] > end_date.isoformat()),
+        REASON_ACTIVE_REPLACEMENT,
     )
+    logging.info("Found %s pending credentials and %s active credentials expiring after %s as replacements",
+                 num_pending, num_active, end_date)
 
-    # Filter credentials based on expiry date and validity
-    expiring_credentials = filter_credentials(active_credentials, start_date, end_date)
 
-    # Exit if there's nothing to reissue
-    if not expiring_credentials:
-        logging.warning("No expiring credentials found. Stopping execution.")
-        return
-    logging.info(
-        f"Found {len(expiring_credentials)} active, valid credentials that expire between {start_date} and {end_date}.",
-    )
+def journal_merged_credentials(credentials: Generator[Dict, None, None]) -> Generator[Dict, None, None]:
+    """Records every credential in the journal before it is handed out, and the end of the discovery"""
+    try:
+        for cred in credentials:
+            if JOURNAL is not None:
+                JOURNAL.record(cred[KEY_CREDENTIAL_ID], STEP_MERGED, record=cred)
+            yield cred
+        if JOURNAL is not None:
+            JOURNAL.record(None, STEP_DISCOVERY_COMPLETE)
+    finally:
+        credentials.close()
+
+
+def reissue_credential(
+        cred: Dict,
+        keycloak_base_url: str,
+        issuer_service_client_id: str,
+        issuer_service_client_secret: str,
+        issuer_service_base_url: str,
+        sap_auth_url: str,
+        sap_client_id: str,
+        sap_client_secret: str,
+        sap_url: str,
+):
+    """Revoke the given credential and request a new one for the same holder"""
+    # Extract keys from credential data
+    try:
+        bpn: str = cred[KEY_BPN]
+        cred_type: str = cred[KEY_TYPE]
+        holder_did: str = cred[KEY_HOLDER_DID]
+        credential_id: str = cred[KEY_CREDENTIAL_ID]
+        operation_id: str = cred[KEY_OPERATION_ID]
+    except KeyError as e:
+        logging.error("Missing key in credential data:\n%s", cred)
+        raise e
 
-    # Get operation IDs
-    operation_ids: list[dict] = get_operation_ids(sap_auth_url, sap_client_id, sap_client_secret, sap_url)
-    if not operation_ids:
-        logging.error("No operation IDs found. Stopping execution.")
-        return
-    logging.info(f"Found {len(operation_ids)} operation IDs.")
-
-    # Step 3: Merge data
-    expiring_credential_data: list[dict] = [transform_credential_data(cred, stage) for cred in expiring_credentials]
-    merged_credential_data = add_operation_id_to_credential_data(stage, sap_auth_url, sap_client_id, sap_client_secret,
-                                                                 sap_url, expiring_credential_data, operation_ids)
-    if not merged_credential_data:
-        logging.error("No credential with valid operation ID after merging. Stopping execution.")
-        return
-    logging.info(f"Successfully merged {len(merged_credential_data)} records.")
-
-    # Iterate over credentials
-    iter_count = 0
-    num_credentials_reissued = 0
-    for cred in merged_credential_data:
-        # Stop if at limit.
-        if iter_limit is not None and iter_count >= int(iter_limit):
-            logging.info(f"Reached processing limit of {iter_limit} credentials. Stopping execution.")
-            break
-
-        # Step 3: Merge data
-        # Extract keys from credential data
-        try:
-            bpn: str = cred[KEY_BPN]
-            cred_type: str = cred[KEY_TYPE]
-            holder_did: str = cred[KEY_HOLDER_DID]
-            credential_id: str = cred[KEY_CREDENTIAL_ID]
-            operation_id: str = cred[KEY_OPERATION_ID]
-        except KeyError as e:
-            logging.error(f"Missing key in credential data:\n{cred}")
-            raise e
-
-        allowed_credential_types = [ct.value for ct in CredentialType]
-        if cred_type not in allowed_credential_types:
-            raise ValueError(f"Invalid credential type: {cred_type}.\nFull credential data: {cred}")
-
-        # Get SAP client info
-        customer_client_info: dict = get_customer_client_info(
-            sap_auth_url,
-            sap_client_id,
-            sap_client_secret,
-            sap_url,
-            operation_id
-        )
-        wallet_url: str = customer_client_info[URL]
-        tech_user_client_id: str = customer_client_info[CLIENT_ID]
-        tech_user_client_secret: str = customer_client_info[CLIENT_SECRET]
+    allowed_credential_types = [ct.value for ct in CredentialType]
+    if cred_type not in allowed_credential_types:
+        raise ValueError(f"Invalid credential type: {cred_type}.\nFull credential data: {cred}")
 
-        # Revoke old credential
-        revoke_credential(
+    # Get SAP client info
+    customer_client_info: dict = get_customer_client_info(
+        sap_auth_url,
+        sap_client_id,
+        sap_client_secret,
+        sap_url,
+        operation_id
+    )
+    wallet_url: str = customer_client_info[URL]
+    tech_user_client_id: str = customer_client_info[CLIENT_ID]
+    tech_user_client_secret: str = customer_client_info[CLIENT_SECRET]
+
+    # Revoke old credential, unless a previous run already did
+    if cred.get(KEY_REVOKED):
+        logging.info("Credential %s was already revoked by a previous run", credential_id)
+    else:
+        submit_or_call(REVOCATION_BATCHER, credential_id, partial(
+            revoke_credential,
             keycloak_base_url,
             issuer_service_client_id,
             issuer_service_client_secret,
             issuer_service_base_url,
             credential_id
-        )
-        logger.info(f"Successfully revoked credential {credential_id}")
-
-        # Issue new credential
-        issue_credential(
+        ))
+        logging.info("Successfully revoked credential %s", credential_id)
+        if JOURNAL is not None:
+            # A revoked credential is not listed as ACTIVE anymore, resuming relies on this record to reissue it
+            JOURNAL.record(credential_id, STEP_REVOKED, durable=True)
+        if DELTA_STATE is not None:
+            DELTA_STATE.mark(credential_id, STATUS_REVOKED)
+
+    # Issue new credential
+    new_credential_id = submit_or_call(
+        ISSUANCE_BATCHER,
+        issuance_request(cred_type, holder_did, bpn, wallet_url, tech_user_client_id, tech_user_client_secret),
+        partial(
+            issue_credential,
             keycloak_base_url,
             issuer_service_client_id,
             issuer_service_client_secret,
@@ -688,16 +1316,859 @@ def main():
             wallet_url,
             tech_user_client_id,
             tech_user_client_secret,
-        )
+        ),
+    )
+    logging.info("Successfully requested reissued credential for BPN: %s %s", bpn, cred_type)
+    if TRACKER is not None:
+        TRACKER.track(new_credential_id, credential_id, bpn, cred_type)
+    if JOURNAL is not None:
+        JOURNAL.record(credential_id, STEP_ISSUED)
+    if DELTA_STATE is not None:
+        DELTA_STATE.mark(credential_id, STATUS_REISSUED)
+
+
+async def reissue_credentials(
+        credentials: Iterator[Dict],
+        reissue: Callable[[Dict], None],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limit: int | None = None,
+) -> List[ReissueResult]:
+    """
+    Reissue credentials with at most `concurrency` credentials in progress at any time.
+    Revocation and issuance of the same credential run sequentially inside `reissue`, independent credentials run in
+    parallel. The next credential is only pulled from `credentials` once a slot is free, so at most `limit`
+    credentials are pulled and no pages are fetched ahead of the workers. A failing credential is recorded in its
+    result and does not abort the run.
+    With a `SCHEDULER`, no further credential is pulled once it is not expected to complete before the deadline.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    # One extra thread pulls the next credential from the pipeline while the workers are busy
+    executor = ThreadPoolExecutor(max_workers=concurrency + 1)
+
+    async def run(cred: Dict) -> ReissueResult:
+        start = perf_counter()
+        try:
+            await loop.run_in_executor(executor, reissue, cred)
+            return ReissueResult(cred.get(KEY_CREDENTIAL_ID), cred.get(KEY_BPN), cred.get(KEY_TYPE), None)
+        except Exception as e:
+            logging.error("Failed to reissue credential %s: %s", cred.get(KEY_CREDENTIAL_ID), e)
+            if JOURNAL is not None:
+                JOURNAL.record(cred.get(KEY_CREDENTIAL_ID), STEP_FAILED, error=str(e))
+            if DELTA_STATE is not None:
+                DELTA_STATE.mark(cred.get(KEY_CREDENTIAL_ID), STATUS_FAILED)
+            return ReissueResult(cred.get(KEY_CREDENTIAL_ID), cred.get(KEY_BPN), cred.get(KEY_TYPE), e)
+        finally:
+            if SCHEDULER is not None:
+                SCHEDULER.record_duration(perf_counter() - start)
+            semaphore.release()
+
+    tasks = []
+    try:
+        while limit is None or len(tasks) < limit:
+            await semaphore.acquire()
+            if SCHEDULER is not None and not SCHEDULER.can_start():
+                semaphore.release()
+                logging.warning("Stopping after %.0f s, further credentials are not expected to complete within the "
+                                "maximum duration of %.0f s", SCHEDULER.elapsed(), SCHEDULER.max_duration)
+                break
+            cred = await loop.run_in_executor(executor, next, credentials, None)
+            if cred is None:
+                semaphore.release()
+                break
+            tasks.append(asyncio.create_task(run(cred)))
+    finally:
+        # Let credentials that are already in progress finish, even if the pipeline failed
+        results = await asyncio.gather(*tasks)
+        executor.shutdown(wait=False)
+    return results
+
+
+def read_planned_credentials(plan_file: str, skip_credential_ids: Container[str], shard: Shard,
+                             start_date: date | None = None, end_date: date | None = None) -> Iterator[Dict]:
+    """
+    Lazily yield the credentials of a plan by expiry date, except the ones in `skip_credential_ids` or outside of
+    `shard`. The window is the one the plan was written for, `start_date` and `end_date` are ignored.
+    """
+    return SCHEDULER.order(
+        cred for cred in read_plan_records(plan_file)
+        if cred[KEY_CREDENTIAL_ID] not in skip_credential_ids and shard.contains(cred)
+    )
+
+
+def reissue_window(
+        start_date: date,
+        end_date: date,
+        run_start: float,
+        discover: Callable[..., Iterator[Dict]] | None,
+        reissue: Callable[[Dict], None],
+        fetch_status: Callable[[List[str]], List[CredentialStatus]],
+        logger: logging.Logger,
+        stage: str,
+        shard: Shard,
+        pending_credentials: List[Dict] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limit: int | None = None,
+        max_duration: float | None = None,
+        schedule_buffer: int = DEFAULT_BUFFER_SIZE,
+        skip_duplicates: bool = False,
+        track_completion: bool = False,
+        track_timeout: float = DEFAULT_TIMEOUT,
+        track_batch_size: int = DEFAULT_BATCH_SIZE,
+        drain: bool = False,
+        metrics_json_file: str | None = None,
+        metrics_openmetrics_file: str | None = None,
+        summary_file: str | None = None,
+) -> Dict:
+    """
+    Reissue the `pending_credentials` of a resumed run, then the credentials `discover` yields for the window between
+    `start_date` and `end_date`. Logs the summary, exports the metrics and returns the summary, which is written to
+    `summary_file` as well. `run` and `execute` reissue one window, the daemon one window per cycle.
+    With `drain`, the credentials left are read from the rest of the input, which is only cheap for a plan.
+    """
+    pending_credentials = pending_credentials or []
+
+    # Setup scheduling by expiry date, the deadline counts from the start of the run
+    global SCHEDULER
+    SCHEDULER = DeadlineScheduler(max_duration, schedule_buffer, run_start)
+
+    # Setup duplicate detection, the replacements are listed once there are expiring credentials
+    global DUPLICATES
+    DUPLICATES = DuplicateIndex() if skip_duplicates else None
 
-        logger.info(f"Successfully requested reissued credential for BPN: {bpn} {cred_type}")
-        num_credentials_reissued += 1
-        iter_count += 1
+    # Setup completion tracking, the status of the issued credentials is polled while the run goes on
+    global TRACKER
+    TRACKER = CompletionTracker(fetch_status, track_batch_size) if track_completion else None
+
+    if discover is None:
+        discovered_credentials = (cred for cred in [])
+    else:
+        discovered_credentials = journal_merged_credentials(discover(start_date=start_date, end_date=end_date))
+    credentials_to_reissue = chain(pending_credentials, discovered_credentials)
+    try:
+        results = asyncio.run(reissue_credentials(credentials_to_reissue, reissue, concurrency, limit))
+        # Credentials that were not started: pending credentials of the journal and the ones buffered for scheduling.
+        # The rest of a plan is read as well, the rest of the listing is not fetched.
+        started_credential_ids = {result.credential_id for result in results}
+        remaining_credentials = sorted(
+            chain(
+                (record for record in pending_credentials if record[KEY_CREDENTIAL_ID] not in started_credential_ids),
+                SCHEDULER.remaining(drain=drain),
+            ),
+            key=expiry_key,
+        )
+    finally:
+        discovered_credentials.close()
+        if JOURNAL is not None:
+            JOURNAL.close()
+        if DELTA_STATE is not None:
+            DELTA_STATE.save(start_date, end_date)
+
+    # Wait for the issued credentials to complete, within the maximum duration of the run
+    completion = None
+    if TRACKER is not None:
+        if max_duration is not None:
+            track_timeout = max(0.0, min(track_timeout, max_duration - SCHEDULER.elapsed()))
+        if TRACKER.supported:
+            logging.info("Waiting up to %.0f s for %s issued credentials to complete", track_timeout,
+                         TRACKER.num_in_progress)
+        TRACKER.finish(track_timeout)
+        if TRACKER.supported:
+            completion = TRACKER.summary()
+
+    failed_results = [result for result in results if result.error is not None]
+    num_credentials_reissued = len(results) - len(failed_results)
+    if limit is not None and len(results) >= limit:
+        logging.info("Reached processing limit of %s credentials. Stopping execution.", limit)
+    elif not results:
+        logging.warning("No credentials to reissue. Stopping execution.")
 
     logger.info("=== Execution Summary ===")
-    logger.info(f"Credentials reissued: {num_credentials_reissued}")
+    logger.info("Credentials reissued: %s", num_credentials_reissued)
+    logger.info("Credentials failed: %s", len(failed_results))
+    for result in failed_results:
+        logger.info("  %s (BPN: %s, Type: %s): %s", result.credential_id, result.bpn, result.credential_type,
+                    result.error)
+    METRICS.set_total("credentials_reissued", num_credentials_reissued)
+    METRICS.set_total("credentials_failed", len(failed_results))
+    if remaining_credentials:
+        throughput = SCHEDULER.throughput()
+        logger.warning(
+            f"Credentials left: {len(remaining_credentials)}, expiring from "
+            f"{remaining_credentials[0].get(KEY_EXPIRY_DATE)}"
+            + (f", about {len(remaining_credentials) / throughput:.0f} s at {throughput:.2f} credentials/s"
+               if throughput > 0 else "")
+        )
+    if not SCHEDULER.input_complete:
+        logger.warning("The listing was not completed, credentials left that were not listed yet are not reported")
+    METRICS.set_total("credentials_remaining", len(remaining_credentials))
+    log_skipped_credentials(logger)
+    if completion is not None:
+        latency = completion["latency_seconds"]
+        logger.info("Issued credentials completed: %s of %s, latency p50=%s s, p90=%s s, p99=%s s, max=%s s, "
+                    "%s status requests", completion["completed"], completion["tracked"], latency["p50"],
+                    latency["p90"], latency["p99"], latency["max"], completion["status_requests"])
+        if completion["awaiting_approval"]:
+            logger.info("Issued credentials awaiting approval: %s", completion["awaiting_approval"])
+        if completion["stuck_credentials"]:
+            logger.warning("Issued credentials stuck: %s", len(completion["stuck_credentials"]))
+            for credential in completion["stuck_credentials"]:
+                logger.warning("  %s (BPN: %s, Type: %s, reissuing %s): %s after %.0f s", credential["credential_id"],
+                               credential["bpn"], credential["type"], credential["previous_credential_id"],
+                               credential["state"], credential["age_seconds"])
+        METRICS.set_total("credentials_completed", completion["completed"])
+        METRICS.set_total("credentials_awaiting_approval", completion["awaiting_approval"])
+        METRICS.set_total("credentials_stuck", len(completion["stuck_credentials"]))
+        METRICS.set_total("status_requests", completion["status_requests"])
+        for name, value in latency.items():
+            if value is not None:
+                METRICS.set_total(f"completion_latency_{name}_seconds", value)
+    for batcher in (REVOCATION_BATCHER, ISSUANCE_BATCHER):
+        if batcher is not None and batcher.num_batches > 0:
+            logger.info("Bulk %s requests: %s for %s credentials", batcher.name, batcher.num_batches, batcher.num_items)
+            METRICS.set_total(f"bulk_{batcher.name}_requests", batcher.num_batches)
+        if batcher is not None and batcher.num_unknown > 0:
+            logger.warning("Bulk %s requests with unknown outcome: %d", batcher.name, batcher.num_unknown)
+            METRICS.set_total(f"bulk_{batcher.name}_unknown_outcomes", batcher.num_unknown)
+    if DELTA_STATE is not None:
+        logger.info("Credentials retried from state: %s", DELTA_STATE.num_retried)
+        logger.info("Listed credentials skipped as known from state: %s", DELTA_STATE.num_skipped)
+        METRICS.set_total("credentials_retried_from_state", DELTA_STATE.num_retried)
+        METRICS.set_total("credentials_skipped_from_state", DELTA_STATE.num_skipped)
+    log_and_export_metrics(logger, run_start, metrics_json_file, metrics_openmetrics_file)
+    summary = {
+        "stage": stage,
+        "shard_index": shard.index,
+        "shard_count": shard.count,
+        "shard_key": shard.key,
+        "reissued": num_credentials_reissued,
+        "failed": len(failed_results),
+        "credentials": [
+            {
+                "credential_id": result.credential_id,
+                "bpn": result.bpn,
+                "type": result.credential_type,
+                "error": None if result.error is None else str(result.error),
+            }
+            for result in results
+        ],
+        "remaining": [
+            {
+                "credential_id": record.get(KEY_CREDENTIAL_ID),
+                "bpn": record.get(KEY_BPN),
+                "type": record.get(KEY_TYPE),
+                "expiry_date": record.get(KEY_EXPIRY_DATE),
+            }
+            for record in remaining_credentials
+        ],
+        "listing_complete": SCHEDULER.input_complete,
+        "skipped": [skipped.to_dict() for skipped in DUPLICATES.skipped] if DUPLICATES is not None else [],
+        "completion": completion,
+        "metrics": METRICS.to_dict(),
+    }
+    if summary_file:
+        write_summary(summary_file, summary)
+    return summary
+
+
+def parse_cli_args(argv: List[str] | None = None) -> tuple[Namespace, list[str]]:
+    """
+    Parse the command line. `plan` only discovers the expiring credentials and writes them to a plan file,
+    `execute` reissues the credentials of a plan file and `run` does both in one pass. `serve` keeps running and
+    reissues the credentials expiring within a rolling window once per interval.
+    Without a command, `run` is assumed.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help"):
+        argv = [COMMAND_RUN, *argv]
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--stage", required=True, help="Environment stage, e.g. int")
+    common.add_argument("--issuer-service-client-id", required=True, help="SSI Issuer client ID")
+    common.add_argument("--issuer-service-client-secret", required=True, help="SSI Issuer client secret")
+    common.add_argument("--sap-url", help="SAP base URL, required unless set in the config file or environment")
+    common.add_argument("--sap-auth-url",
+                        help="SAP auth URL, required unless set in the config file or environment")
+    common.add_argument("--sap-client-id", required=True, help="SAP client ID")
+    common.add_argument("--sap-client-secret", required=True, help="SAP client secret")
+    common.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Logging level")
+    common.add_argument("--log-format", default=LOG_FORMAT_TEXT, choices=[LOG_FORMAT_TEXT, LOG_FORMAT_JSON],
+                        help="Write log records as text lines or as one JSON object per line")
+    common.add_argument("--log-max-length", type=int, default=DEFAULT_MAX_LENGTH,
+                        help="Maximum number of characters of a log message, longer messages such as response bodies "
+                             "are truncated. 0 disables truncation")
+    common.add_argument("--limit", type=int, help="Maximum number of credentials to reissue or to plan")
+    common.add_argument("--cache-file",
+                        help="SQLite file that persists SAP operation details and company DIDs across runs (optional)")
+    common.add_argument("--cache-key", default=os.environ.get("REISSUE_CACHE_KEY"),
+                        help="Fernet key used to encrypt client secrets in the cache file, defaults to the "
+                             "REISSUE_CACHE_KEY environment variable. Without a key, client secrets are not persisted")
+    common.add_argument("--cache-ttl", type=float, default=persistent_cache.DEFAULT_TTL,
+                        help="Seconds after which persisted cache entries expire")
+    common.add_argument("--cache-max-entries", type=int, default=persistent_cache.DEFAULT_MAX_ENTRIES,
+                        help="Maximum number of persisted cache entries, least recently used entries are evicted")
+    common.add_argument("--connect-timeout", type=float, default=http_client.DEFAULT_CONNECT_TIMEOUT,
+                        help="Timeout in seconds for establishing a connection to an upstream host")
+    common.add_argument("--read-timeout", type=float, default=http_client.DEFAULT_READ_TIMEOUT,
+                        help="Timeout in seconds for waiting on a response from an upstream host")
+    common.add_argument("--http-retries", type=int, default=http_client.DEFAULT_RETRIES,
+                        help="Maximum number of retries for failed GET requests and for 429/503 responses")
+    common.add_argument("--adaptive-rate-limit", action=argparse.BooleanOptionalAction, default=True,
+                        help="Adapt the number of requests in flight per upstream host to throttling and latency")
+    common.add_argument("--initial-rate-limit", type=float, default=rate_limiter.DEFAULT_INITIAL_LIMIT,
+                        help="Number of requests in flight per upstream host before the limit adapts")
+    common.add_argument("--http-pool-size", type=int, default=http_client.DEFAULT_POOL_MAXSIZE,
+                        help="Maximum number of pooled keep-alive connections per upstream host")
+    common.add_argument("--schedule-buffer", type=int, default=DEFAULT_BUFFER_SIZE,
+                        help="Number of credentials buffered to process them by expiry date, earliest first")
+    common.add_argument("--metrics-json",
+                        help="File the latency histograms, status codes, retries and cache hits are written to as "
+                             "JSON at the end of the run (optional)")
+    common.add_argument("--metrics-openmetrics",
+                        help="File the metrics are written to in the OpenMetrics text format at the end of the run, "
+                             "e.g. for the node exporter textfile collector (optional)")
+    common.add_argument("--config-file", default=os.environ.get("REISSUE_CONFIG_FILE"),
+                        help="TOML file overriding the endpoints, per stage in [stages.<stage>] tables. Defaults to "
+                             "the REISSUE_CONFIG_FILE environment variable (optional)")
+    common.add_argument("--issuer-service-base-url", help="Base URL of the SSI credential issuer service")
+    common.add_argument("--keycloak-base-url", help="Base URL of the central Keycloak")
+    common.add_argument("--keycloak-token-path", help="Path of the Keycloak token endpoint")
+    common.add_argument("--sap-token-path", help="Path of the SAP token endpoints")
+    common.add_argument("--dis-base-url", help="Base URL of the SAP DIS company identities endpoint")
+    common.add_argument("--did-document-url", help="URL of the holder DID documents, must contain {bpn}")
+
+    window = argparse.ArgumentParser(add_help=False)
+    window.add_argument("--start_date", type=date.fromisoformat, required=True,
+                        help="yyyy-mm-dd - Credentials expiring on or after this date and on or before end_date will "
+                             "be reissued.")
+    window.add_argument("--end_date", type=date.fromisoformat, required=True,
+                        help="yyyy-mm-dd - Credentials expiring on or before this date and on or after start_date will "
+                             "be reissued.")
+
+    discovery = argparse.ArgumentParser(add_help=False)
+    discovery.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                           help="Number of credentials requested per page of the offset paginated listing")
+    discovery.add_argument("--keyset-listing", action=argparse.BooleanOptionalAction, default=True,
+                           help="List the credentials with the keyset paginated compact listing of the issuer service, "
+                                "which falls back to the offset paginated listing if the issuer service lacks it")
+    discovery.add_argument("--compact-page-size", type=int, default=DEFAULT_COMPACT_PAGE_SIZE,
+                           help="Number of credentials per page of the keyset paginated listing")
+    discovery.add_argument("--fetch-workers", type=int, default=DEFAULT_FETCH_WORKERS,
+                           help="Maximum number of pages of the offset paginated listing fetched concurrently, 1 "
+                                "fetches serially")
+    discovery.add_argument("--skip-duplicates", action=argparse.BooleanOptionalAction, default=False,
+                           help="Skip credentials whose holder already has a pending credential of the same type or "
+                                "an active one issued after it and expiring after the window, and all but the first "
+                                "credential of the same BPN and type in the window")
+    discovery.add_argument("--did-workers", type=int, default=DEFAULT_DID_WORKERS,
+                           help="Maximum number of company DIDs resolved concurrently for BPNs with several customer "
+                                "wallets, 1 resolves them serially")
+
+    reissuing = argparse.ArgumentParser(add_help=False)
+    reissuing.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                           help="Maximum number of credentials reissued in parallel")
+    reissuing.add_argument("--bulk-size", type=int, default=DEFAULT_BULK_SIZE,
+                           help=f"Maximum number of revocations and issuances of concurrent workers combined into one "
+                                f"bulk request, up to {MAX_BULK_SIZE} and at most --concurrency. 1 sends single "
+                                f"requests. Issuer services without bulk routes fall back to single requests")
+    reissuing.add_argument("--bulk-wait", type=float, default=DEFAULT_BULK_WAIT,
+                           help="Maximum number of seconds a revocation or issuance waits for others to join its "
+                                "bulk request")
+    reissuing.add_argument("--max-duration", type=float,
+                           help="Maximum duration of the run in seconds, e.g. shortly below the timeout of the CI job. "
+                                "No further credential is started once it is not expected to complete in time, the "
+                                "credentials left are reported (optional)")
+    reissuing.add_argument("--track-completion", action=argparse.BooleanOptionalAction, default=False,
+                           help="Poll the status of the issued credentials until they are signed and report the "
+                                "completion latency and the credentials that failed or are stuck")
+    reissuing.add_argument("--track-timeout", type=float, default=DEFAULT_TIMEOUT,
+                           help="Maximum number of seconds to wait for issued credentials to complete once every "
+                                "credential was issued, at most until --max-duration")
+    reissuing.add_argument("--track-batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                           help="Number of credentials whose status is polled with one request")
+    reissuing.add_argument("--journal",
+                           help="File that records the progress of every credential, required for --resume (optional)")
+    reissuing.add_argument("--resume", action="store_true",
+                           help="Continue the run recorded in --journal, skipping credentials it already processed")
+    reissuing.add_argument("--overwrite-journal", action="store_true",
+                           help="Start a new run even if --journal records a previous one, its records are lost")
+
+    reissuing.add_argument("--shard-index", type=int, default=0,
+                           help="Index of the shard of credentials processed by this run, starting at 0")
+    reissuing.add_argument("--shard-count", type=int, default=1,
+                           help="Number of shards the credentials are split into, e.g. one per CI job. --limit "
+                                "applies per shard")
+    reissuing.add_argument("--shard-key", default=KEY_BPN, choices=[KEY_BPN, KEY_CREDENTIAL_ID],
+                           help="Field the shard of a credential is determined by, sharding by BPN fetches the SAP "
+                                "details of a company in one shard only")
+    reissuing.add_argument("--summary-file",
+                           help="File the results and metrics of the run are written to as JSON, merged across shards "
+                                "with `python sharding.py merge` (optional)")
+
+    parser = argparse.ArgumentParser(description="Reissue expiring credentials")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser(COMMAND_RUN, parents=[common, window, discovery, reissuing],
+                                     help="Discover the expiring credentials and reissue them")
+    run_parser.add_argument("--state-file",
+                            help="JSON file with the state of incremental runs. Only credentials that expire after the "
+                                 "last listed expiry date or were not reissued by earlier runs are processed, {shard} "
+                                 "is replaced with the shard index (optional)")
+    run_parser.add_argument("--full-scan", action="store_true",
+                            help="List every credential in the window even if --state-file has a watermark, "
+                                 "credentials the state already knows are still skipped")
+    run_parser.set_defaults(plan_file=None, window_days=None, interval=None, max_cycles=None,
+                            wallet_refresh_interval=None, health_host=None, health_port=None)
+    plan_parser = commands.add_parser(COMMAND_PLAN, parents=[common, window, discovery],
+                                      help="Write the expiring credentials to a plan file without reissuing them")
+    plan_parser.add_argument("--plan-file", required=True, help="JSON Lines file the plan is written to")
+    plan_parser.set_defaults(concurrency=DEFAULT_CONCURRENCY, max_duration=None, bulk_size=DEFAULT_BULK_SIZE,
+                             bulk_wait=DEFAULT_BULK_WAIT, track_completion=False, track_timeout=DEFAULT_TIMEOUT,
+                             track_batch_size=DEFAULT_BATCH_SIZE, journal=None, resume=False, overwrite_journal=False,
+                             shard_index=0, shard_count=1, shard_key=KEY_BPN, summary_file=None, state_file=None,
+                             full_scan=False, window_days=None, interval=None, max_cycles=None,
+                             wallet_refresh_interval=None, health_host=None, health_port=None)
+    execute_parser = commands.add_parser(COMMAND_EXECUTE, parents=[common, reissuing],
+                                         help="Reissue the credentials of a plan file")
+    execute_parser.add_argument("--plan-file", required=True, help="JSON Lines file written by the plan command")
+    execute_parser.set_defaults(start_date=None, end_date=None, page_size=DEFAULT_PAGE_SIZE, keyset_listing=True,
+                                compact_page_size=DEFAULT_COMPACT_PAGE_SIZE,
+                                fetch_workers=DEFAULT_FETCH_WORKERS, did_workers=DEFAULT_DID_WORKERS,
+                                skip_duplicates=False, state_file=None,
+                                full_scan=False, window_days=None, interval=None, max_cycles=None,
+                                wallet_refresh_interval=None, health_host=None, health_port=None)
+    serve_parser = commands.add_parser(COMMAND_SERVE, parents=[common, discovery, reissuing],
+                                       help="Keep running and reissue the credentials expiring within a rolling window "
+                                            "once per interval")
+    serve_parser.add_argument("--window-days", type=int, default=DEFAULT_WINDOW_DAYS,
+                              help="Credentials expiring from today until this many days ahead are reissued")
+    serve_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                              help="Seconds from the start of one cycle to the start of the next")
+    serve_parser.add_argument("--max-cycles", type=int,
+                              help="Stop after this many cycles instead of running until SIGTERM or SIGINT (optional)")
+    serve_parser.add_argument("--wallet-refresh-interval", type=float, default=DEFAULT_REFRESH_INTERVAL,
+                              help="Seconds after which the customer wallets are fetched again. They are fetched on "
+                                   "the next cycle as well if a credential had no matching wallet")
+    serve_parser.add_argument("--health-host", default=DEFAULT_HEALTH_HOST,
+                              help="Address the /healthz, /metrics and /status endpoints are served on")
+    serve_parser.add_argument("--health-port", type=int, default=DEFAULT_HEALTH_PORT,
+                              help="Port the /healthz, /metrics and /status endpoints are served on, 0 picks a free "
+                                   "port")
+    serve_parser.add_argument("--state-file",
+                              help="JSON file the state of the daemon is persisted to, so a restarted daemon only "
+                                   "lists the credentials that newly entered the window. Without it, the state is kept "
+                                   "in memory, {shard} is replaced with the shard index (optional)")
+    serve_parser.set_defaults(start_date=None, end_date=None, plan_file=None, full_scan=False)
+    return parser.parse_known_args(argv)
+
+
+def main():
+    run_start = perf_counter()
+
+    # Unpack args
+    args, unknown_args = parse_cli_args()
+
+    command = args.command
+    stage = args.stage
+    plan_file = args.plan_file
+    start_date: date = args.start_date
+    end_date: date = args.end_date
+    issuer_service_client_id = args.issuer_service_client_id
+    issuer_service_client_secret = args.issuer_service_client_secret
+    sap_client_id = args.sap_client_id
+    sap_client_secret = args.sap_client_secret
+    log_level = args.log_level
+    log_format = args.log_format
+    log_max_length = args.log_max_length
+    iter_limit = args.limit
+    concurrency = args.concurrency
+    max_duration = args.max_duration
+    schedule_buffer = args.schedule_buffer
+    bulk_size = args.bulk_size
+    bulk_wait = args.bulk_wait
+    track_completion = args.track_completion
+    track_timeout = args.track_timeout
+    track_batch_size = args.track_batch_size
+    page_size = args.page_size
+    compact_page_size = args.compact_page_size if args.keyset_listing else None
+    fetch_workers = args.fetch_workers
+    did_workers = args.did_workers
+    skip_duplicates = args.skip_duplicates
+    connect_timeout = args.connect_timeout
+    read_timeout = args.read_timeout
+    http_retries = args.http_retries
+    adaptive_rate_limit = args.adaptive_rate_limit
+    initial_rate_limit = args.initial_rate_limit
+    cache_file = args.cache_file
+    cache_key = args.cache_key
+    cache_ttl = args.cache_ttl
+    cache_max_entries = args.cache_max_entries
+    shard = Shard(args.shard_index, args.shard_count, args.shard_key)
+    # Every shard gets its own files if their names contain {shard}
+    journal_file = fill_shard(args.journal, shard.index)
+    resume = args.resume
+    overwrite_journal = args.overwrite_journal
+    summary_file = fill_shard(args.summary_file, shard.index)
+    state_file = fill_shard(args.state_file, shard.index)
+    full_scan = args.full_scan
+    window_days = args.window_days
+    interval = args.interval
+    max_cycles = args.max_cycles
+    wallet_refresh_interval = args.wallet_refresh_interval
+    health_host = args.health_host
+    health_port = args.health_port
+    if command == COMMAND_SERVE and max_duration is None:
+        # A cycle stops starting credentials once the next one is due
+        max_duration = interval
+    metrics_json_file = fill_shard(args.metrics_json, shard.index)
+    metrics_openmetrics_file = fill_shard(args.metrics_openmetrics, shard.index)
+    http_pool_size = max(args.http_pool_size, fetch_workers, did_workers, concurrency)
+
+    # Setup logging
+    logger = setup_logger(log_level, log_format == LOG_FORMAT_JSON, log_max_length)
+
+    # Setup endpoints, invalid settings fail before any request is made
+    global ENDPOINTS
+    ENDPOINTS = endpoints.load_endpoints(
+        stage,
+        args.config_file,
+        {field.name: getattr(args, field.name) for field in dataclasses.fields(Endpoints)},
+    )
+    issuer_service_base_url = ENDPOINTS.issuer_service_base_url
+    keycloak_base_url = ENDPOINTS.keycloak_base_url
+    sap_url = ENDPOINTS.sap_url
+    sap_auth_url = ENDPOINTS.sap_auth_url
+
+    arguments = {
+        "stage": stage,
+        "plan_file": plan_file,
+        "start_date": start_date,
+        "end_date": end_date,
+        "issuer_service_client_id": issuer_service_client_id,
+        "sap_client_id": sap_client_id,
+        "log_level": log_level,
+        "log_format": log_format,
+        "log_max_length": log_max_length,
+        "limit": iter_limit,
+        "concurrency": concurrency,
+        "max_duration": max_duration,
+        "schedule_buffer": schedule_buffer,
+        "bulk_size": bulk_size,
+        "bulk_wait": bulk_wait,
+        "track_completion": track_completion,
+        "track_timeout": track_timeout,
+        "track_batch_size": track_batch_size,
+        "page_size": page_size,
+        "compact_page_size": compact_page_size,
+        "fetch_workers": fetch_workers,
+        "json_backend": json_backend(),
+        "did_workers": did_workers,
+        "skip_duplicates": skip_duplicates,
+        "connect_timeout": connect_timeout,
+        "read_timeout": read_timeout,
+        "http_retries": http_retries,
+        "http_pool_size": http_pool_size,
+        "adaptive_rate_limit": adaptive_rate_limit,
+        "initial_rate_limit": initial_rate_limit,
+        "cache_file": cache_file,
+        "cache_encrypted": cache_key is not None,
+        "cache_ttl": cache_ttl,
+        "cache_max_entries": cache_max_entries,
+        "journal": journal_file,
+        "resume": resume,
+        "overwrite_journal": overwrite_journal,
+        "shard": f"{shard.index + 1} of {shard.count} by {shard.key}",
+        "summary_file": summary_file,
+        "state_file": state_file,
+        "full_scan": full_scan,
+        "window_days": window_days,
+        "interval": interval,
+        "max_cycles": max_cycles,
+        "wallet_refresh_interval": wallet_refresh_interval,
+        "health": f"{health_host}:{health_port}",
+        "metrics_json": metrics_json_file,
+        "metrics_openmetrics": metrics_openmetrics_file,
+        "config_file": args.config_file,
+    }
+    logging.info("Running %s with the following arguments:\n%s\n%s\n", command,
+                 "\n".join(f"{name}: {value}" for name, value in arguments.items()), ENDPOINTS)
+    if command == COMMAND_EXECUTE:
+        plan_header = read_plan_header(plan_file)
+        if plan_header.get("stage") != stage:
+            raise ValueError(f"Plan {plan_file} was created for stage {plan_header.get('stage')}, not {stage}")
+        start_date = date.fromisoformat(plan_header["start_date"])
+        end_date = date.fromisoformat(plan_header["end_date"])
+        logging.info("Reissuing credentials of plan %s.", plan_file)
+    if command == COMMAND_SERVE:
+        logging.info("Reissuing credentials that are active and expire within the next %s days, every %.0f s.",
+                     window_days, interval)
+    else:
+        logging.info(
+            "%s credentials that are active and expire between %s and %s (both inclusive).",
+            "Planning" if command == COMMAND_PLAN else "Reissuing", start_date, end_date,
+        )
+    if len(unknown_args) > 0:
+        logging.warning("Found %s unknown arguments, ignoring them", len(unknown_args))
+    if resume and not journal_file:
+        raise ValueError("--resume requires --journal")
+    if resume and overwrite_journal:
+        raise ValueError("--resume and --overwrite-journal cannot be combined")
+    if journal_file and not resume and not overwrite_journal and os.path.isfile(journal_file) \
+            and os.path.getsize(journal_file) > 0:
+        raise ValueError(f"Journal {journal_file} records a previous run, pass --resume to continue it or "
+                         f"--overwrite-journal to start a new one")
+    if full_scan and not state_file:
+        raise ValueError("--full-scan requires --state-file")
+    validate_shard(shard.index, shard.count)
+    if schedule_buffer < 1:
+        raise ValueError(f"--schedule-buffer must be at least 1, got {schedule_buffer}")
+    if not 1 <= bulk_size <= MAX_BULK_SIZE:
+        raise ValueError(f"--bulk-size must be between 1 and {MAX_BULK_SIZE}, got {bulk_size}")
+    if track_batch_size < 1:
+        raise ValueError(f"--track-batch-size must be at least 1, got {track_batch_size}")
+    if command == COMMAND_SERVE:
+        if journal_file or resume:
+            raise ValueError("serve does not support --journal and --resume, its progress is kept by --state-file")
+        if window_days < 0:
+            raise ValueError(f"--window-days must not be negative, got {window_days}")
+        if interval <= 0:
+            raise ValueError(f"--interval must be positive, got {interval}")
+
+    # Setup shared HTTP session
+    http_client.configure_session(
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries=http_retries,
+        pool_maxsize=http_pool_size,
+        adaptive_rate_limit=adaptive_rate_limit,
+        initial_rate_limit=initial_rate_limit,
+        metrics=METRICS,
+    )
+
+    # Setup concurrent company DID resolution
+    global DID_EXECUTOR
+    if did_workers > 1 and command != COMMAND_EXECUTE:
+        DID_EXECUTOR = ThreadPoolExecutor(max_workers=did_workers, thread_name_prefix="did")
+
+    # Setup persistent cache
+    global PERSISTENT_CACHE
+    if cache_file:
+        PERSISTENT_CACHE = PersistentCache(cache_file, cache_key, cache_ttl, cache_max_entries)
+
+    try:
+        if command == COMMAND_PLAN:
+            # Setup scheduling by expiry date and duplicate detection, the replacements are listed once there are
+            # expiring credentials
+            global SCHEDULER, DUPLICATES
+            SCHEDULER = DeadlineScheduler(max_duration, schedule_buffer, run_start)
+            if skip_duplicates:
+                DUPLICATES = DuplicateIndex()
+
+            # Discover only, the plan is written as the credentials are discovered
+            discovered_credentials = discover_credentials(
+                stage,
+                start_date,
+                end_date,
+                keycloak_base_url,
+                issuer_service_client_id,
+                issuer_service_client_secret,
+                issuer_service_base_url,
+                sap_auth_url,
+                sap_client_id,
+                sap_client_secret,
+                sap_url,
+                page_size,
+                fetch_workers,
+                compact_page_size=compact_page_size,
+            )
+            try:
+                num_credentials_planned = write_plan(
+                    plan_file,
+                    islice(discovered_credentials, iter_limit),
+                    stage=stage,
+                    start_date=start_date.isoformat(),
+                    end_date=end_date.isoformat(),
+                )
+            finally:
+                discovered_credentials.close()
+
+            logger.info("=== Execution Summary ===")
+            logger.info("Credentials planned: %s", num_credentials_planned)
+            METRICS.set_total("credentials_planned", num_credentials_planned)
+            log_skipped_credentials(logger)
+            log_and_export_metrics(logger, run_start, metrics_json_file, metrics_openmetrics_file)
+            return 0
+
+        # Setup journal, resuming a previous run skips every credential it already processed
+        global JOURNAL
+        resume_state = load_journal(journal_file) if journal_file and resume else JournalState()
+        if journal_file:
+            JOURNAL = Journal(journal_file, append=resume)
+
+        # Credentials of a resumed run that were revoked but not reissued are not ACTIVE anymore and are only known
+        # from the journal, they are reissued without revoking them again.
+        # Credentials of other shards are skipped even if they are in the journal, so no credential is revoked by two
+        # shards
+        revoked_credentials = [{**record, KEY_REVOKED: True} for record in resume_state.pending(STEP_REVOKED)
+                               if shard.contains(record)]
+        merged_credentials = sorted((record for record in resume_state.pending(STEP_MERGED) if shard.contains(record)),
+                                    key=expiry_key)
+        if resume:
+            logging.info("Resuming run: %s revoked and %s merged credentials are pending, discovery complete: %s",
+                         len(revoked_credentials), len(merged_credentials), resume_state.discovery_complete)
+
+        # Setup the state of incremental runs, it is only valid for the shard it was written by.
+        # Without a state file, the daemon keeps the state in memory between its cycles
+        global DELTA_STATE
+        if state_file:
+            DELTA_STATE = load_delta_state(state_file, stage=stage, shard_count=shard.count, shard_index=shard.index,
+                                           shard_key=shard.key)
+            if full_scan:
+                DELTA_STATE.watermark = None
+            logging.info("Loaded state with watermark %s: %s", DELTA_STATE.watermark, DELTA_STATE.counts())
+        elif command == COMMAND_SERVE:
+            DELTA_STATE = DeltaState(None, {})
+
+        # Stream expiring credentials page by page, or read them from the plan
+        if resume_state.discovery_complete:
+            discover = None
+        elif command == COMMAND_EXECUTE:
+            discover = partial(read_planned_credentials, plan_file, resume_state.entries, shard)
+        else:
+            discover = partial(
+                discover_credentials,
+                stage,
+                keycloak_base_url=keycloak_base_url,
+                issuer_service_client_id=issuer_service_client_id,
+                issuer_service_client_secret=issuer_service_client_secret,
+                issuer_service_base_url=issuer_service_base_url,
+                sap_auth_url=sap_auth_url,
+                sap_client_id=sap_client_id,
+                sap_client_secret=sap_client_secret,
+                sap_url=sap_url,
+                page_size=page_size,
+                fetch_workers=fetch_workers,
+                skip_credential_ids=resume_state.entries.keys(),
+                shard=shard,
+                compact_page_size=compact_page_size,
+            )
+
+        # Setup bulk requests, a batch can only be filled by the concurrent workers
+        global REVOCATION_BATCHER, ISSUANCE_BATCHER
+        if min(bulk_size, concurrency) > 1:
+            REVOCATION_BATCHER = MicroBatcher(
+                "revocation",
+                partial(revoke_credentials_bulk, keycloak_base_url, issuer_service_client_id,
+                        issuer_service_client_secret, issuer_service_base_url),
+                min(bulk_size, concurrency),
+                bulk_wait,
+                partial(resolve_revocations, keycloak_base_url, issuer_service_client_id,
+                        issuer_service_client_secret, issuer_service_base_url),
+            )
+            ISSUANCE_BATCHER = MicroBatcher(
+                "issuance",
+                partial(issue_credentials_bulk, keycloak_base_url, issuer_service_client_id,
+                        issuer_service_client_secret, issuer_service_base_url),
+                min(bulk_size, concurrency),
+                bulk_wait,
+            )
+
+        # Setup the customer wallet index of the daemon, which is kept between its cycles
+        global WALLET_INDEX
+        if command == COMMAND_SERVE:
+            WALLET_INDEX = WalletIndex(
+                partial(get_operation_ids, sap_auth_url, sap_client_id, sap_client_secret, sap_url),
+                build_operation_id_index,
+                wallet_refresh_interval,
+            )
+
+        # Reissue credentials, each credential is reissued as soon as its page has been fetched.
+        # At most `limit` credentials are pulled from the pipeline, so no further pages are fetched afterwards.
+        reissue = partial(
+            reissue_credential,
+            keycloak_base_url=keycloak_base_url,
+            issuer_service_client_id=issuer_service_client_id,
+            issuer_service_client_secret=issuer_service_client_secret,
+            issuer_service_base_url=issuer_service_base_url,
+            sap_auth_url=sap_auth_url,
+            sap_client_id=sap_client_id,
+            sap_client_secret=sap_client_secret,
+            sap_url=sap_url,
+        )
+        reissue_window_of_run = partial(
+            reissue_window,
+            discover=discover,
+            reissue=reissue,
+            fetch_status=partial(fetch_credential_status, keycloak_base_url, issuer_service_client_id,
+                                 issuer_service_client_secret, issuer_service_base_url),
+            logger=logger,
+            stage=stage,
+            shard=shard,
+            pending_credentials=revoked_credentials + merged_credentials,
+            concurrency=concurrency,
+            limit=iter_limit,
+            max_duration=max_duration,
+            schedule_buffer=schedule_buffer,
+            skip_duplicates=skip_duplicates,
+            track_completion=track_completion,
+            track_timeout=track_timeout,
+            track_batch_size=track_batch_size,
+            drain=command == COMMAND_EXECUTE,
+            metrics_json_file=metrics_json_file,
+            metrics_openmetrics_file=metrics_openmetrics_file,
+            summary_file=summary_file,
+        )
+        if command == COMMAND_SERVE:
+            # Reissue the credentials of the rolling window once per interval, until the daemon is stopped
+            daemon = Daemon(reissue_window_of_run, METRICS, interval, window_days)
+            health_server = HealthServer(daemon, METRICS, health_host, health_port).start()
+            try:
+                return daemon.run(max_cycles)
+            finally:
+                health_server.stop()
+
+        summary = reissue_window_of_run(start_date, end_date, run_start)
+        return 1 if summary["failed"] else 0
+    finally:
+        if DID_EXECUTOR is not None:
+            DID_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        if PERSISTENT_CACHE is not None:
+            PERSISTENT_CACHE.close()
+
+
+def log_skipped_credentials(logger: logging.Logger):
+    """Logs the credentials that were skipped as redundant"""
+    if DUPLICATES is None:
+        return
+    counts = DUPLICATES.counts()
+    logger.info("Credentials skipped as redundant: %s %s", len(DUPLICATES.skipped), counts)
+    for skipped in DUPLICATES.skipped:
+        logger.info("  %s (BPN: %s, Type: %s): %s %s", skipped.record[KEY_CREDENTIAL_ID], skipped.record[KEY_BPN],
+                    skipped.record[KEY_TYPE], skipped.reason, skipped.other_credential_id)
+    for reason, count in counts.items():
+        METRICS.set_total(f"credentials_skipped_{reason}", count)
+
+
+def log_and_export_metrics(logger: logging.Logger, run_start: float, metrics_json_file: str | None,
+                           metrics_openmetrics_file: str | None):
+    """Logs the HTTP and cache metrics at the end of a run and writes the metrics"""
+    http_client.log_rate_limits()
+    METRICS.log_summary()
+    token_metrics = TOKEN_MANAGER.metrics
+    METRICS.set_cache("token", token_metrics.hits, token_metrics.misses)
+    logger.info("Token cache: %s, cached tokens=%s", token_metrics, len(TOKEN_MANAGER))
+    logger.info("Client info cache: hit ratio=%s", METRICS.cache_hit_ratio("client_info"))
+    if PERSISTENT_CACHE is not None:
+        METRICS.set_cache("persistent", PERSISTENT_CACHE.hits, PERSISTENT_CACHE.misses)
+        logger.info("Persistent cache: hits=%s, misses=%s", PERSISTENT_CACHE.hits, PERSISTENT_CACHE.misses)
     logger.info("=====================")
 
+    METRICS.set_total("run_duration_seconds", perf_counter() - run_start)
+    if metrics_json_file:
+        METRICS.write_json(metrics_json_file)
+    if metrics_openmetrics_file:
+        METRICS.write_openmetrics(metrics_openmetrics_file)
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,133 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Deadline-aware scheduling of a reissue run.
+
+Credentials are reissued in the order of their expiry date, earliest first, so `--limit`, `--max-duration` and rate
+limits cut off the credentials with the most time left. The listing of the issuer service is already sorted by expiry
+date, the credentials retried from the state, plans of older runs and listings of issuer services without expiry date
+sorting are not. `order` sorts them within a buffer of `buffer_size` credentials: a credential is only handed out once
+the buffer is full or the input is exhausted, so inputs of up to `buffer_size` credentials are sorted completely.
+
+With a `max_duration`, no further credential is started once the time left is shorter than the time a credential is
+expected to take, a high percentile of the durations observed so far. Every started credential therefore finishes
+before the deadline, e.g. the timeout of the CI job. The credentials that were not started are reported.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List
+
+DEFAULT_BUFFER_SIZE = 10000
+# Number of recent credential durations the expected duration is estimated from
+DURATION_WINDOW = 200
+DURATION_PERCENTILE = 0.9
+
+# Fields of the credential records of the reissue script
+KEY_EXPIRY_DATE = "expiry_date"
+# Records without expiry date, e.g. of plans written by older versions, are scheduled last
+UNKNOWN_EXPIRY_DATE = "9999-12-31"
+
+
+def expiry_key(record: Dict) -> str:
+    # ISO 8601 timestamps start with the date
+    return (record.get(KEY_EXPIRY_DATE) or UNKNOWN_EXPIRY_DATE)[:10]
+
+
+class DeadlineScheduler:
+    def __init__(self, max_duration: float | None = None, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 start: float | None = None, clock: Callable[[], float] = perf_counter):
+        self.max_duration = max_duration
+        self.buffer_size = buffer_size
+        self.clock = clock
+        self.start = start if start is not None else clock()
+        # Set once a credential was not started because of the deadline
+        self.deadline_reached = False
+        self.num_completed = 0
+        self._durations: deque[float] = deque(maxlen=DURATION_WINDOW)
+        # Heap of (expiry key, sequence number, record), the sequence number keeps the input order of equal dates
+        self._buffer: List[tuple[str, int, Dict]] = []
+        self._source: Iterator[Dict] | None = None
+        self.source_exhausted = False
+
+    @property
+    def input_complete(self) -> bool:
+        """Whether every record of the input was read, trivially without input"""
+        return self._source is None or self.source_exhausted
+
+    def order(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        """Lazily yields `records` sorted by expiry date within a buffer of `buffer_size` records"""
+        self._source = iter(records)
+        return self._order()
+
+    def _order(self) -> Iterator[Dict]:
+        sequence = count()
+        for record in self._source:
+            heapq.heappush(self._buffer, (expiry_key(record), next(sequence), record))
+            if len(self._buffer) >= self.buffer_size:
+                yield heapq.heappop(self._buffer)[2]
+        self.source_exhausted = True
+        while self._buffer:
+            yield heapq.heappop(self._buffer)[2]
+
+    def remaining(self, drain: bool = False) -> List[Dict]:
+        """
+        Records that were not handed out, sorted by expiry date. With `drain`, the records the buffer did not hold yet
+        are read from the input as well, which is only cheap for local inputs like a plan file.
+        """
+        records = [record for _, _, record in sorted(self._buffer)]
+        if drain and self._source is not None and not self.source_exhausted:
+            records.extend(sorted(self._source, key=expiry_key))
+            self.source_exhausted = True
+        return records
+
+    def elapsed(self) -> float:
+        return self.clock() - self.start
+
+    def expected_duration(self) -> float | None:
+        """High percentile of the recent credential durations, `None` before the first credential completed"""
+        if not self._durations:
+            return None
+        durations = sorted(self._durations)
+        return durations[min(len(durations) - 1, int(DURATION_PERCENTILE * len(durations)))]
+
+    def throughput(self) -> float:
+        """Completed credentials per second since the start of the run"""
+        elapsed = self.elapsed()
+        return self.num_completed / elapsed if elapsed > 0 else 0.0
+
+    def can_start(self) -> bool:
+        """Whether a credential started now is expected to complete before the deadline"""
+        if self.max_duration is None:
+            return True
+        time_left = self.max_duration - self.elapsed()
+        expected_duration = self.expected_duration()
+        if time_left <= 0 or (expected_duration is not None and time_left < expected_duration):
+            self.deadline_reached = True
+            return False
+        return True
+
+    def record_duration(self, duration: float):
+        self._durations.append(duration)
+        self.num_completed += 1
@@ -0,0 +1,221 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Deterministic sharding of a reissue run across processes or CI jobs.
+
+Every credential belongs to exactly one of `count` shards, determined by the CRC32 of its BPN or credential ID,
+so shards never process, and never revoke, the same credential. Sharding by BPN keeps all credentials of a company
+in one shard, so their SAP operation details and tokens are fetched once.
+
+Each shard can write a summary file. Run as a script, this module merges the summaries of all shards into one
+report and checks that every shard reported and that no credential was processed by more than one shard:
+
+    python sharding.py merge summaries/*.json --output report.json
+
+It can also run the shards as local worker processes. `{shard}` in the arguments is replaced with the shard index,
+e.g. to give every shard its own journal and summary file. The summaries are merged once all shards finished:
+
+    python sharding.py launch --shards 4 -- run --stage int ... --summary-file summary-{shard}.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import zlib
+from typing import Dict, List, NamedTuple
+
+from completion import STATES, latency_percentiles
+from metrics import Metrics, write_atomically
+
+SHARD_PLACEHOLDER = "{shard}"
+SUMMARY_FILE_OPTION = "--summary-file"
+
+
+class Shard(NamedTuple):
+    index: int
+    count: int
+    # Field of the merged credential record the shard is determined by
+    key: str
+
+    def contains(self, record: Dict) -> bool:
+        return self.count == 1 or shard_of(record[self.key], self.count) == self.index
+
+
+def shard_of(value: str, count: int) -> int:
+    # CRC32 is stable across processes and Python versions, unlike `hash`
+    return zlib.crc32(value.encode()) % count
+
+
+def validate_shard(index: int, count: int):
+    if count < 1:
+        raise ValueError(f"--shard-count must be at least 1, got {count}")
+    if not 0 <= index < count:
+        raise ValueError(f"--shard-index must be between 0 and {count - 1}, got {index}")
+
+
+def fill_shard(value: str | None, index: int) -> str | None:
+    """Replaces the `{shard}` placeholder in a file name"""
+    return value.replace(SHARD_PLACEHOLDER, str(index)) if value else value
+
+
+def write_summary(path: str, summary: Dict):
+    write_atomically(path, json.dumps(summary, indent=2))
+
+
+def merge_completions(completions: List[Dict]) -> Dict | None:
+    """Merges the completion tracking of several shards, `None` if no shard tracked the completion"""
+    if not completions:
+        return None
+    latencies = [latency for completion in completions for latency in completion["latencies"]]
+    return {
+        "tracked": sum(completion["tracked"] for completion in completions),
+        **{state: sum(completion[state] for completion in completions) for state in STATES},
+        "status_requests": sum(completion["status_requests"] for completion in completions),
+        "latency_seconds": latency_percentiles(latencies),
+        "latencies": latencies,
+        "stuck_credentials": [credential for completion in completions
+                              for credential in completion["stuck_credentials"]],
+    }
+
+
+def merge_summaries(summaries: List[Dict]) -> tuple[Dict, List[str]]:
+    """Merges the summaries of all shards of a run, returns the report and the problems found"""
+    problems = []
+    shard_counts = {summary["shard_count"] for summary in summaries}
+    if len(shard_counts) != 1:
+        problems.append(f"Summaries of different shard counts: {sorted(shard_counts)}")
+    for setting in ("stage", "shard_key"):
+        values = {summary[setting] for summary in summaries}
+        if len(values) != 1:
+            problems.append(f"Summaries of different {setting}s: {sorted(values)}")
+
+    shard_count = max(shard_counts, default=0)
+    reported_shards = [summary["shard_index"] for summary in summaries]
+    missing_shards = sorted(set(range(shard_count)) - set(reported_shards))
+    duplicate_shards = sorted({index for index in reported_shards if reported_shards.count(index) > 1})
+    if missing_shards:
+        problems.append(f"Missing summaries of shards {missing_shards}")
+    if duplicate_shards:
+        problems.append(f"Multiple summaries of shards {duplicate_shards}")
+
+    shards_by_credential: Dict[str, List[int]] = {}
+    for summary in summaries:
+        for credential in summary["credentials"]:
+            shards_by_credential.setdefault(credential["credential_id"], []).append(summary["shard_index"])
+    processed_repeatedly = {credential_id: shards for credential_id, shards in shards_by_credential.items()
+                            if len(shards) > 1}
+    for credential_id, shards in sorted(processed_repeatedly.items()):
+        problems.append(f"Credential {credential_id} was processed by shards {shards}")
+
+    metrics = Metrics()
+    for summary in summaries:
+        metrics.merge_dict(summary["metrics"])
+    failed = [credential for summary in summaries for credential in summary["credentials"]
+              if credential["error"] is not None]
+    # Summaries of older versions report no remaining credentials
+    remaining = sorted((credential for summary in summaries for credential in summary.get("remaining", [])),
+                       key=lambda credential: credential["expiry_date"] or "")
+    report = {
+        "shard_count": shard_count,
+        "shards": sorted(reported_shards),
+        "reissued": sum(summary["reissued"] for summary in summaries),
+        "failed": len(failed),
+        "failed_credentials": failed,
+        "remaining": len(remaining),
+        "remaining_credentials": remaining,
+        "listing_complete": all(summary.get("listing_complete", True) for summary in summaries),
+        "skipped": sum(len(summary.get("skipped", [])) for summary in summaries),
+        "skipped_credentials": [credential for summary in summaries for credential in summary.get("skipped", [])],
+        # Summaries of older versions and runs without --track-completion have no completion
+        "completion": merge_completions([summary["completion"] for summary in summaries if summary.get("completion")]),
+        "problems": problems,
+        "metrics": metrics.to_dict(),
+    }
+    return report, problems
+
+
+def merge_command(args: argparse.Namespace) -> int:
+    summaries = []
+    for path in args.summaries:
+        with open(path, encoding="utf-8") as summary_file:
+            summaries.append(json.load(summary_file))
+    report, problems = merge_summaries(summaries)
+    if args.output:
+        write_atomically(args.output, json.dumps(report, indent=2))
+
+    logging.info("Merged summaries of %s shards: reissued=%s, failed=%s, remaining=%s, skipped=%s", len(summaries),
+                 report["reissued"], report["failed"], report["remaining"], report["skipped"])
+    if report["completion"] is not None:
+        completion = report["completion"]
+        logging.info("Issued credentials completed: %s of %s, latency p50=%s s, p99=%s s, stuck=%s",
+                     completion["completed"], completion["tracked"], completion["latency_seconds"]["p50"],
+                     completion["latency_seconds"]["p99"], len(completion["stuck_credentials"]))
+    for credential in report["failed_credentials"]:
+        logging.info("  %s (BPN: %s, Type: %s): %s", credential["credential_id"], credential["bpn"], credential["type"],
+                     credential["error"])
+    for problem in problems:
+        logging.error(problem)
+    return 1 if problems or report["failed"] else 0
+
+
+def launch_command(args: argparse.Namespace) -> int:
+    validate_shard(0, args.shards)
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reissue_expiring_credentials.py")
+    script_args = args.script_args[1:] if args.script_args[:1] == ["--"] else args.script_args
+    processes = []
+    for index in range(args.shards):
+        command = [sys.executable, script, *(fill_shard(arg, index) for arg in script_args),
+                   "--shard-index", str(index), "--shard-count", str(args.shards)]
+        processes.append(subprocess.Popen(command))
+    exit_codes = [process.wait() for process in processes]
+    for index, exit_code in enumerate(exit_codes):
+        logging.info("Shard %s exited with %s", index, exit_code)
+
+    if SUMMARY_FILE_OPTION in script_args:
+        summary_file = script_args[script_args.index(SUMMARY_FILE_OPTION) + 1]
+        existing = [path for path in (fill_shard(summary_file, index) for index in range(args.shards))
+                    if os.path.exists(path)]
+        merge_exit_code = merge_command(argparse.Namespace(summaries=existing, output=args.output))
+        exit_codes.append(merge_exit_code)
+    return max(exit_codes)
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Merge shard summaries or run shards as local processes")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge_parser = commands.add_parser("merge", help="Merge the summary files of all shards of a run")
+    merge_parser.add_argument("summaries", nargs="+", help="Summary files written with --summary-file")
+    merge_parser.add_argument("--output", help="File the merged report is written to as JSON (optional)")
+    launch_parser = commands.add_parser("launch", help="Run every shard as a local worker process")
+    launch_parser.add_argument("--shards", type=int, required=True, help="Number of shards")
+    launch_parser.add_argument("--output", help="File the merged report is written to as JSON (optional)")
+    launch_parser.add_argument("script_args", nargs=argparse.REMAINDER,
+                               help="Arguments of reissue_expiring_credentials.py, {shard} is replaced per shard")
+    args = parser.parse_args()
+    return merge_command(args) if args.command == "merge" else launch_command(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import threading
+
+import pytest
+
+from bulk import BulkOutcomeUnknown, BulkUnsupported, MicroBatcher, is_bulk_unsupported, submit_or_call
+
+
+def submit_concurrently(batcher: MicroBatcher, items: list) -> dict:
+    """Submits every item from its own thread, returns the result or exception per item"""
+    results = {}
+
+    def submit(item):
+        try:
+            results[item] = batcher.submit(item)
+        except Exception as e:
+            results[item] = e
+
+    threads = [threading.Thread(target=submit, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_full_batches_are_sent_together():
+    batches = []
+
+    def send(items):
+        batches.append(items)
+        return [item * 10 for item in items]
+
+    batcher = MicroBatcher("test", send, max_size=3, max_wait=5)
+    results = submit_concurrently(batcher, [1, 2, 3, 4, 5, 6])
+
+    assert results == {item: item * 10 for item in range(1, 7)}
+    assert sorted(len(batch) for batch in batches) == [3, 3]
+    assert batcher.num_batches == 2
+    assert batcher.num_items == 6
+
+
+def test_partial_batch_is_sent_after_max_wait():
+    batcher = MicroBatcher("test", lambda items: list(items), max_size=10, max_wait=0.01)
+
+    assert batcher.submit("a") == "a"
+    assert batcher.num_batches == 1
+
+
+def test_item_errors_are_raised_in_their_worker():
+    error = ValueError("invalid item")
+    batcher = MicroBatcher("test", lambda items: [error if item == 2 else item for item in items], max_size=2)
+
+    results = submit_concurrently(batcher, [1, 2])
+
+    assert results == {1: 1, 2: error}
+
+
+def test_failed_request_fails_its_batch_and_keeps_bulk_enabled():
+    calls = []
+
+    def send(items):
+        calls.append(items)
+        if len(calls) == 1:
+            raise RuntimeError("400 Bad Request")
+        return items
+
+    batcher = MicroBatcher("test", send, max_size=1)
+
+    with pytest.raises(RuntimeError, match="400"):
+        batcher.submit("a")
+    assert batcher.submit("b") == "b"
+    assert batcher.enabled
+
+
+def test_unsupported_first_batch_falls_back_to_single_requests():
+    def send(_):
+        raise BulkUnsupported("404")
+
+    batcher = MicroBatcher("test", send, max_size=1)
+
+    assert submit_or_call(batcher, "a", lambda: "single a") == "single a"
+    assert not batcher.enabled
+    assert submit_or_call(batcher, "b", lambda: "single b") == "single b"
+
+
+def test_unsupported_after_successful_batch_fails_the_items():
+    calls = []
+
+    def send(items):
+        calls.append(items)
+        if len(calls) > 1:
+            raise BulkUnsupported("404")
+        return items
+
+    batcher = MicroBatcher("test", send, max_size=1)
+    assert batcher.submit("a") == "a"
+
+    with pytest.raises(RuntimeError, match="404"):
+        submit_or_call(batcher, "b", lambda: "single b")
+    assert batcher.enabled
+
+
+def test_unknown_outcome_is_resolved_per_item():
+    resolved = []
+
+    def send(_):
+        raise BulkOutcomeUnknown("read timeout")
+
+    def resolve(items, error):
+        resolved.append((items, error))
+        return [error if item == 2 else item for item in items]
+
+    batcher = MicroBatcher("test", send, max_size=2, max_wait=5, resolve=resolve)
+    results = submit_concurrently(batcher, [1, 2])
+
+    assert results[1] == 1
+    assert isinstance(results[2], BulkOutcomeUnknown)
+    assert [sorted(items) for items, _ in resolved] == [[1, 2]]
+    assert batcher.num_unknown == 1
+    assert batcher.enabled
+
+
+def test_unknown_outcome_without_resolve_fails_the_items():
+    def send(_):
+        raise BulkOutcomeUnknown("connection reset")
+
+    batcher = MicroBatcher("test", send, max_size=1)
+
+    with pytest.raises(BulkOutcomeUnknown, match="connection reset"):
+        batcher.submit("a")
+
+
+def test_failed_resolve_fails_the_items_with_the_unknown_outcome():
+    def send(_):
+        raise BulkOutcomeUnknown("read timeout")
+
+    def resolve(_, __):
+        raise RuntimeError("status route failed")
+
+    batcher = MicroBatcher("test", send, max_size=1, resolve=resolve)
+
+    with pytest.raises(BulkOutcomeUnknown, match="read timeout"):
+        batcher.submit("a")
+
+
+def test_known_failure_is_not_resolved():
+    resolved = []
+
+    def send(_):
+        raise RuntimeError("connection refused")
+
+    batcher = MicroBatcher("test", send, max_size=1, resolve=lambda items, error: resolved.append(items))
+
+    with pytest.raises(RuntimeError, match="connection refused"):
+        batcher.submit("a")
+    assert resolved == []
+
+
+def test_submit_or_call_without_batcher_sends_single_request():
+    assert submit_or_call(None, "a", lambda: "single a") == "single a"
+
+
+@pytest.mark.parametrize("status_code, text, expected", [
+    (404, "", True),
+    (405, "", True),
+    (400, '{"errors": {"credentialId": ["The value \'bulk\' is not valid."]}}', True),
+    (400, '{"errors": {"count": ["INVALID_BULK_SIZE"]}}', False),
+    (400, "", False),
+    (500, "", False),
+])
+def test_is_bulk_unsupported(status_code, text, expected):
+    assert is_bulk_unsupported(status_code, text) == expected
@@ -0,0 +1,203 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import threading
+import time
+
+import pytest
+
+from completion import (STATE_AWAITING_APPROVAL, STATE_COMPLETED, STATE_FAILED, STATE_IN_PROGRESS, STATES,
+                        CompletionTracker, StatusUnsupported, latency_percentiles)
+from credential_page import CredentialStatus
+
+INTERVAL = 2.0
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Issuer:
+    """Answers status requests with the given statuses, credentials without one are not listed yet"""
+
+    def __init__(self):
+        self.statuses = {}
+        self.requests = []
+        self.error: Exception | None = None
+        self._lock = threading.Lock()
+
+    def poll(self, credential_ids):
+        with self._lock:
+            self.requests.append(list(credential_ids))
+        if self.error is not None:
+            raise self.error
+        return [self.statuses[credential_id] for credential_id in credential_ids if credential_id in self.statuses]
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def issuer() -> Issuer:
+    return Issuer()
+
+
+@pytest.fixture
+def tracker(clock, issuer):
+    """Tracker polling `issuer` every 2 s of `clock`, up to every 10 s, stopped after the test"""
+    tracker = CompletionTracker(issuer.poll, batch_size=2, interval=INTERVAL, max_interval=10.0, clock=clock)
+    yield tracker
+    tracker.finish(0)
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def advance(tracker: CompletionTracker, clock: Clock, seconds: float, requests: int | None = None):
+    """Advances the clock and wakes the poller, then waits until it sent `requests` requests in total"""
+    clock.now += seconds
+    with tracker._condition:
+        tracker._condition.notify_all()
+    if requests is not None:
+        wait_until(lambda: tracker.num_requests == requests)
+
+
+def status(credential_id: str, value: str = "ACTIVE", signed: bool = False, failed: bool = False) -> CredentialStatus:
+    return CredentialStatus(credential_id, value, signed, failed)
+
+
+def states(tracker: CompletionTracker) -> dict:
+    return {credential_id: tracked.state for credential_id, tracked in tracker._credentials.items()}
+
+
+def test_poll_updates_the_states(tracker, clock, issuer):
+    issuer.statuses = {
+        "signed": status("signed", signed=True),
+        "failed": status("failed", failed=True),
+        "pending": status("pending", "PENDING"),
+        "unsigned": status("unsigned"),
+    }
+    for credential_id in ("signed", "failed", "pending", "unsigned", "unlisted"):
+        tracker.track(credential_id)
+
+    advance(tracker, clock, INTERVAL, requests=3)
+
+    assert states(tracker) == {"signed": STATE_COMPLETED, "failed": STATE_FAILED, "pending": STATE_AWAITING_APPROVAL,
+                               "unsigned": STATE_IN_PROGRESS, "unlisted": STATE_IN_PROGRESS}
+    assert tracker.num_in_progress == 2
+    summary = tracker.summary()
+    assert [summary[state] for state in STATES] == [1, 1, 1, 2]
+    assert summary["latencies"] == [INTERVAL]
+    assert [stuck["credential_id"] for stuck in summary["stuck_credentials"]] == ["failed", "unsigned", "unlisted"]
+
+
+def test_due_credentials_are_polled_in_batches(tracker, clock, issuer):
+    for credential_id in ("cred-1", "cred-2", "cred-3"):
+        tracker.track(credential_id)
+    clock.now += 1.5
+    tracker.track("cred-4")
+
+    # cred-4 is due within the next interval, so it is polled along with the due ones
+    advance(tracker, clock, 0.5, requests=2)
+    assert issuer.requests == [["cred-1", "cred-2"], ["cred-3", "cred-4"]]
+
+
+def test_credentials_in_progress_are_polled_with_backoff(tracker, clock, issuer):
+    tracker.track("cred-1")
+    tracked = tracker._credentials["cred-1"]
+    polled_at = []
+    for requests in range(1, 6):
+        advance(tracker, clock, tracked.next_poll - clock.now, requests=requests)
+        polled_at.append(clock.now - 1000)
+
+    assert polled_at == [2, 6, 14, 24, 34]
+
+
+def test_completed_credentials_are_not_polled_again(tracker, clock, issuer):
+    issuer.statuses = {"cred-1": status("cred-1", signed=True)}
+    tracker.track("cred-1")
+    tracker.track("cred-2")
+    advance(tracker, clock, INTERVAL, requests=1)
+
+    advance(tracker, clock, 4, requests=2)
+    assert issuer.requests == [["cred-1", "cred-2"], ["cred-2"]]
+
+
+def test_failed_poll_keeps_credentials_in_progress(tracker, clock, issuer):
+    issuer.error = ConnectionError("issuer down")
+    tracker.track("cred-1")
+    advance(tracker, clock, INTERVAL, requests=1)
+    assert states(tracker) == {"cred-1": STATE_IN_PROGRESS}
+
+    issuer.error = None
+    issuer.statuses = {"cred-1": status("cred-1", signed=True)}
+    advance(tracker, clock, 4, requests=2)
+    assert states(tracker) == {"cred-1": STATE_COMPLETED}
+    assert tracker.summary()["latencies"] == [6.0]
+
+
+def test_missing_status_route_stops_tracking(tracker, clock, issuer):
+    issuer.error = StatusUnsupported("404")
+    tracker.track("cred-1")
+    advance(tracker, clock, INTERVAL)
+    wait_until(lambda: not tracker.supported)
+
+    tracker.track("cred-2")
+    tracker.finish(600)
+    assert tracker.summary()["tracked"] == 1
+
+
+def test_finish_waits_for_credentials_in_progress(tracker, clock, issuer):
+    issuer.statuses = {"cred-1": status("cred-1", signed=True)}
+    tracker.track("cred-1")
+    finished = threading.Thread(target=tracker.finish, args=(600,))
+    finished.start()
+    advance(tracker, clock, INTERVAL)
+    finished.join(5)
+
+    assert not finished.is_alive()
+    assert states(tracker) == {"cred-1": STATE_COMPLETED}
+
+
+def test_finish_reports_credentials_still_in_progress_as_stuck(tracker, clock):
+    tracker.track("cred-1", "old-1", "BPNL000000000001", "MembershipCredential")
+    clock.now += 1
+    tracker.finish(0)
+
+    assert tracker.summary()["stuck_credentials"] == [
+        {"credential_id": "cred-1", "previous_credential_id": "old-1", "bpn": "BPNL000000000001",
+         "type": "MembershipCredential", "state": STATE_IN_PROGRESS, "age_seconds": 1.0},
+    ]
+
+
+def test_latency_percentiles():
+    assert latency_percentiles([]) == {"p50": None, "p90": None, "p99": None, "max": None}
+    assert latency_percentiles([float(value) for value in range(100, 0, -1)]) == {
+        "p50": 51.0, "p90": 91.0, "p99": 100.0, "max": 100.0}
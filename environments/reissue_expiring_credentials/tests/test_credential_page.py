@@ -0,0 +1,138 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import json
+
+import pytest
+
+from credential_page import (CredentialStatus, ListedCredential, decode_compact_page, decode_credential_page,
+                             decode_credential_status, loads)
+
+PAGE = {
+    "meta": {"totalPages": 3, "totalElements": 40, "pageSize": 15, "page": 0},
+    "content": [
+        {
+            "credentialDetailId": "cred-1",
+            "bpnl": "BPNL000000000001",
+            "credentialType": "BusinessPartnerCredential",
+            "expiryDate": "2025-01-10T00:00:00+00:00",
+            "documents": [{"documentId": "doc-1", "documentName": "credential.json"}],
+            "processSteps": [
+                {"processStepTypeId": "CREATE_SIGNED_CREDENTIAL", "processStepStatusId": "DONE"},
+                {"processStepTypeId": "SAVE_CREDENTIAL_DOCUMENT", "processStepStatusId": "DONE"},
+            ],
+        },
+        {
+            "credentialDetailId": "cred-2",
+            "bpnl": "BPNL000000000001",
+            "credentialType": "MembershipCredential",
+            "expiryDate": None,
+            "processSteps": [{"processStepTypeId": "CREATE_SIGNED_CREDENTIAL", "processStepStatusId": "TODO"}],
+        },
+        {"credentialDetailId": "cred-3", "bpnl": "BPNL000000000003"},
+    ],
+}
+COMPACT_PAGE = {
+    "nextCursor": "Y3JlZC0y",
+    "content": [
+        {"credentialDetailId": "cred-1", "bpnl": "BPNL000000000001", "credentialType": "BusinessPartnerCredential",
+         "expiryDate": "2025-01-10T00:00:00+00:00", "signed": True, "dateCreated": "2024-01-10T00:00:00+00:00"},
+        {"credentialDetailId": "cred-2"},
+    ],
+}
+STATUS = [
+    {"credentialDetailId": "cred-1", "status": "ACTIVE", "signed": True, "failed": False},
+    {"credentialDetailId": "cred-2", "status": "PENDING"},
+]
+
+
+def json_loads(body: bytes):
+    return json.loads(body)
+
+
+def orjson_loads(body: bytes):
+    return pytest.importorskip("orjson").loads(body)
+
+
+@pytest.fixture(params=[json_loads, orjson_loads], ids=["json", "orjson"])
+def decode(request):
+    """Decoder of either JSON backend"""
+    return request.param
+
+
+def encode(value) -> bytes:
+    return json.dumps(value).encode()
+
+
+def test_decode_credential_page(decode):
+    page = decode_credential_page(encode(PAGE), decode)
+
+    assert page.total_pages == 3
+    assert page.credentials == [
+        ListedCredential("cred-1", "BPNL000000000001", "BusinessPartnerCredential", "2025-01-10T00:00:00+00:00", True),
+        ListedCredential("cred-2", "BPNL000000000001", "MembershipCredential", None, False),
+        ListedCredential("cred-3", "BPNL000000000003", None, None, False),
+    ]
+
+
+def test_decode_compact_page(decode):
+    page = decode_compact_page(encode(COMPACT_PAGE), decode)
+
+    assert page.next_cursor == "Y3JlZC0y"
+    assert page.credentials == [
+        ListedCredential("cred-1", "BPNL000000000001", "BusinessPartnerCredential", "2025-01-10T00:00:00+00:00", True,
+                         "2024-01-10T00:00:00+00:00"),
+        ListedCredential("cred-2", None, None, None, False),
+    ]
+    assert decode_compact_page(b'{"content": []}', decode).next_cursor is None
+
+
+def test_decode_credential_status(decode):
+    assert decode_credential_status(encode(STATUS), decode) == [
+        CredentialStatus("cred-1", "ACTIVE", True, False),
+        CredentialStatus("cred-2", "PENDING", False, False),
+    ]
+
+
+def test_backends_decode_pages_alike():
+    orjson = pytest.importorskip("orjson")
+    for body in (encode(PAGE), json.dumps(PAGE, indent=2).encode()):
+        assert decode_credential_page(body, orjson.loads) == decode_credential_page(body, json.loads)
+    assert decode_compact_page(encode(COMPACT_PAGE), orjson.loads) == decode_compact_page(encode(COMPACT_PAGE),
+                                                                                         json.loads)
+
+
+def test_repeated_values_are_interned(decode):
+    page = decode_credential_page(encode(PAGE), decode)
+    assert page.credentials[0].bpn is page.credentials[1].bpn
+
+
+def test_page_without_content_raises_key_error(decode):
+    with pytest.raises(KeyError):
+        decode_credential_page(b'{"content": []}', decode)
+    with pytest.raises(KeyError):
+        decode_compact_page(b'{"nextCursor": null}', decode)
+
+
+def test_invalid_json_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_credential_page(b"<html>Bad Gateway</html>")
+    with pytest.raises(ValueError):
+        loads(b'{"content": [')
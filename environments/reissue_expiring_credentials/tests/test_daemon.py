@@ -0,0 +1,199 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import json
+import signal
+import urllib.error
+import urllib.request
+from datetime import date
+
+import pytest
+
+from daemon import (OPENMETRICS_CONTENT_TYPE, STATUS_FAILING, STATUS_OK, STATUS_STALE, STATUS_STARTING, Daemon,
+                    HealthServer, rolling_window)
+from metrics import Metrics
+
+TODAY = date(2025, 1, 1)
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def summary(reissued: int = 0, failed: int = 0) -> dict:
+    return {"reissued": reissued, "failed": failed, "remaining": [], "skipped": [], "listing_complete": True}
+
+
+class Cycles:
+    """Returns the given summaries in turn, an exception is raised instead of returned"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.windows = []
+
+    def __call__(self, start_date: date, end_date: date, run_start: float) -> dict:
+        self.windows.append((start_date, end_date))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def signal_handlers():
+    """Restores the SIGTERM and SIGINT handlers `Daemon.run` installs"""
+    handlers = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)}
+    yield
+    for signum, handler in handlers.items():
+        signal.signal(signum, handler)
+
+
+def make_daemon(cycle, clock: Clock = None, interval: float = 60.0) -> Daemon:
+    return Daemon(cycle, Metrics(), interval=interval, window_days=30, today=lambda: TODAY, clock=clock or Clock())
+
+
+def test_rolling_window_includes_window_days_ahead():
+    assert rolling_window(TODAY, 30) == (TODAY, date(2025, 1, 31))
+
+
+def test_health_is_starting_until_first_cycle_succeeds():
+    clock = Clock()
+    daemon = make_daemon(Cycles(summary(reissued=2)), clock)
+    assert daemon.health() == STATUS_STARTING
+
+    daemon.run_cycle()
+    assert daemon.health() == STATUS_OK
+
+
+def test_failed_cycle_makes_daemon_failing_until_next_success():
+    daemon = make_daemon(Cycles(summary(), RuntimeError("issuer down"), summary()))
+    daemon.run_cycle()
+    daemon.run_cycle()
+
+    assert daemon.health() == STATUS_FAILING
+    assert daemon.last_cycle["error"] == "issuer down"
+    assert (daemon.num_cycles, daemon.num_failed_cycles) == (2, 1)
+
+    daemon.run_cycle()
+    assert daemon.health() == STATUS_OK
+    assert "error" not in daemon.last_cycle
+
+
+def test_health_is_stale_without_success_for_two_intervals():
+    clock = Clock()
+    daemon = make_daemon(Cycles(summary()), clock, interval=60.0)
+    clock.now += 121
+    assert daemon.health() == STATUS_STALE
+
+    daemon.run_cycle()
+    assert daemon.health() == STATUS_OK
+    clock.now += 120
+    assert daemon.health() == STATUS_OK
+    clock.now += 1
+    assert daemon.health() == STATUS_STALE
+
+
+def test_cycles_accumulate_totals_and_metrics():
+    daemon = make_daemon(Cycles(summary(reissued=3, failed=1), summary(reissued=2)))
+    daemon.run_cycle()
+    daemon.run_cycle()
+
+    assert (daemon.num_reissued, daemon.num_failed) == (5, 1)
+    assert daemon.metrics.totals["daemon_cycles"] == 2
+    assert daemon.metrics.totals["daemon_credentials_reissued"] == 5
+    assert daemon.last_cycle["start_date"] == "2025-01-01"
+    assert daemon.last_cycle["end_date"] == "2025-01-31"
+    assert daemon.last_cycle["reissued"] == 2
+
+
+def test_run_stops_after_max_cycles_and_reports_last_cycle(signal_handlers):
+    cycles = Cycles(summary(), summary(), summary())
+    daemon = make_daemon(cycles, interval=0.0)
+    assert daemon.run(max_cycles=2) == 0
+    assert daemon.num_cycles == 2
+    assert cycles.windows == [(TODAY, date(2025, 1, 31))] * 2
+
+    daemon = make_daemon(Cycles(summary(), RuntimeError("issuer down")), interval=0.0)
+    assert daemon.run(max_cycles=2) == 1
+
+
+def test_stop_ends_run_after_current_cycle(signal_handlers):
+    daemon = make_daemon(None, interval=0.0)
+
+    def cycle(*args):
+        daemon.stop()
+        return summary()
+
+    daemon.cycle = cycle
+    assert daemon.run() == 0
+    assert daemon.num_cycles == 1
+
+
+@pytest.fixture
+def health_server():
+    """Health server of a daemon on a free local port"""
+    daemon = make_daemon(Cycles(summary(reissued=1), RuntimeError("issuer down")))
+    server = HealthServer(daemon, daemon.metrics, port=0).start()
+    yield server
+    server.stop()
+
+
+def fetch(url: str) -> tuple[int, str, str]:
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, response.headers["Content-Type"], response.read().decode()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers["Content-Type"], e.read().decode()
+
+
+def test_healthz_reflects_daemon_health(health_server):
+    assert fetch(f"{health_server.url}/healthz")[::2] == (200, "starting\n")
+    health_server.daemon.run_cycle()
+    assert fetch(f"{health_server.url}/healthz")[::2] == (200, "ok\n")
+    health_server.daemon.run_cycle()
+    assert fetch(f"{health_server.url}/healthz")[::2] == (503, "failing\n")
+
+
+def test_metrics_are_served_as_openmetrics(health_server):
+    health_server.daemon.run_cycle()
+    status, content_type, body = fetch(f"{health_server.url}/metrics")
+
+    assert (status, content_type) == (200, OPENMETRICS_CONTENT_TYPE)
+    assert "reissue_daemon_cycles 1" in body.splitlines()
+    assert body.endswith("# EOF\n")
+
+
+def test_status_returns_daemon_state(health_server):
+    health_server.daemon.run_cycle()
+    status, content_type, body = fetch(f"{health_server.url}/status?verbose")
+
+    assert (status, content_type) == (200, "application/json")
+    state = json.loads(body)
+    assert state["status"] == STATUS_OK
+    assert state["cycles"] == 1
+    assert state["last_cycle"]["reissued"] == 1
+
+
+def test_unknown_path_is_not_found(health_server):
+    assert fetch(f"{health_server.url}/other")[0] == 404
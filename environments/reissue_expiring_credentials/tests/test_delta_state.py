@@ -0,0 +1,148 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+from datetime import date
+
+import pytest
+
+from delta_state import (STATUS_FAILED, STATUS_PENDING, STATUS_REISSUED, STATUS_REVOKED, DeltaState,
+                         load_delta_state)
+
+START = date(2025, 1, 1)
+END = date(2025, 1, 31)
+
+
+def record(credential_id: str, expiry_date: str) -> dict:
+    return {"credential_id": credential_id, "expiry_date": f"{expiry_date}T00:00:00+00:00"}
+
+
+def test_listing_start_continues_after_watermark():
+    assert DeltaState(None, {}).listing_start(START) == START
+    assert DeltaState(None, {}, watermark=date(2025, 1, 10)).listing_start(START) == date(2025, 1, 11)
+    assert DeltaState(None, {}, watermark=date(2024, 12, 1)).listing_start(START) == START
+
+
+def test_track_retries_unfinished_credentials_and_skips_known_ones():
+    state = DeltaState(None, {})
+    list(state.track([record("reissued", "2025-01-05"), record("revoked", "2025-01-06"),
+                      record("failed", "2025-01-07"), record("outside", "2025-03-01")], START, END))
+    state.mark("reissued", STATUS_REISSUED)
+    state.mark("revoked", STATUS_REVOKED)
+    state.mark("failed", STATUS_FAILED)
+
+    tracked = list(state.track([record("reissued", "2025-01-05"), record("new", "2025-01-08")], START, END))
+
+    assert [cred["credential_id"] for cred in tracked] == ["revoked", "failed", "new"]
+    assert state.num_retried == 2
+    assert state.num_skipped == 1
+    assert state.status_of("new") == STATUS_PENDING
+    assert state.listing_complete
+
+
+def test_failure_does_not_overwrite_revoked():
+    state = DeltaState(None, {})
+    list(state.track([record("a", "2025-01-05")], START, END))
+    state.mark("a", STATUS_REVOKED)
+
+    state.mark("a", STATUS_FAILED)
+    state.mark("unknown", STATUS_FAILED)
+
+    assert state.status_of("a") == STATUS_REVOKED
+    assert state.status_of("unknown") is None
+
+
+def test_save_advances_watermark_only_after_complete_listing(tmp_path):
+    path = str(tmp_path / "state.json")
+    state = DeltaState(path, {"stage": "int"})
+    credentials = state.track([record("a", "2025-01-05")], START, END)
+    next(credentials)
+
+    state.save(START, END)
+    assert state.watermark is None
+
+    list(state.track([], START, END))
+    state.save(START, END)
+    assert state.watermark == END
+
+
+def test_unsigned_credentials_hold_the_watermark():
+    state = DeltaState(None, {})
+    state.listing_start(START)
+    list(state.track([record("a", "2025-01-05")], START, END))
+    state.hold(date(2025, 1, 20))
+    state.hold(date(2025, 1, 12))
+
+    state.save(START, END)
+
+    assert state.watermark == date(2025, 1, 11)
+    assert state.listing_start(START) == date(2025, 1, 12)
+
+
+def test_held_watermark_never_moves_back():
+    state = DeltaState(None, {}, watermark=date(2025, 1, 15))
+    state.listing_start(START)
+    list(state.track([], START, END))
+    state.hold(date(2025, 1, 10))
+
+    state.save(START, END)
+
+    assert state.watermark == date(2025, 1, 15)
+
+
+def test_hold_applies_to_one_listing_only():
+    state = DeltaState(None, {})
+    state.listing_start(START)
+    list(state.track([], START, END))
+    state.hold(date(2025, 1, 12))
+    state.save(START, END)
+
+    state.listing_start(START)
+    list(state.track([], START, END))
+    state.save(START, END)
+
+    assert state.watermark == END
+
+
+def test_save_drops_credentials_expiring_before_window_and_round_trips(tmp_path):
+    path = str(tmp_path / "state.json")
+    state = DeltaState(path, {"stage": "int"})
+    list(state.track([record("old", "2025-01-05"), record("new", "2025-02-05")], START, END))
+
+    state.save(date(2025, 2, 1), date(2025, 2, 28))
+    loaded = load_delta_state(path, stage="int")
+
+    assert loaded.watermark == date(2025, 2, 28)
+    assert set(loaded.credentials) == {"new"}
+    assert loaded.counts() == {STATUS_PENDING: 1}
+
+
+def test_load_rejects_state_of_other_settings(tmp_path):
+    path = str(tmp_path / "state.json")
+    DeltaState(path, {"stage": "int"}).save(START, END)
+
+    with pytest.raises(ValueError, match="stage=int"):
+        load_delta_state(path, stage="stable")
+
+
+def test_load_without_file_lists_every_credential(tmp_path):
+    state = load_delta_state(str(tmp_path / "missing.json"), stage="int")
+
+    assert state.watermark is None
+    assert state.credentials == {}
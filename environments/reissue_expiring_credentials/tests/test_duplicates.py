@@ -0,0 +1,135 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+from credential_page import ListedCredential
+from duplicates import (REASON_ACTIVE_REPLACEMENT, REASON_DUPLICATE, REASON_PENDING_REPLACEMENT, DuplicateIndex,
+                        parse_date_created)
+
+BPN = "BPNL000000000001"
+OTHER_BPN = "BPNL000000000002"
+MEMBERSHIP = "MembershipCredential"
+FRAMEWORK = "FrameworkCredential"
+
+
+def listed(credential_id: str, bpn: str = BPN, credential_type: str = MEMBERSHIP,
+           date_created: str | None = None) -> ListedCredential:
+    return ListedCredential(credential_id, bpn, credential_type, "2026-01-01T00:00:00Z", True, date_created)
+
+
+def record(credential_id: str, bpn: str = BPN, credential_type: str = MEMBERSHIP,
+           date_created: str | None = "2024-01-01T00:00:00Z") -> dict:
+    return {"credential_id": credential_id, "bpn": bpn, "type": credential_type, "expiry_date": "2025-01-10",
+            "date_created": date_created}
+
+
+def reissued(index: DuplicateIndex, *records: dict) -> list:
+    return [cred["credential_id"] for cred in index.filter(records)]
+
+
+def skipped(index: DuplicateIndex) -> list:
+    return [(cred.record["credential_id"], cred.reason, cred.other_credential_id) for cred in index.skipped]
+
+
+def test_only_first_credential_per_bpn_and_type_is_reissued():
+    index = DuplicateIndex()
+    assert reissued(index, record("cred-1"), record("cred-2"), record("cred-3", credential_type=FRAMEWORK),
+                    record("cred-4", bpn=OTHER_BPN), record("cred-5")) == ["cred-1", "cred-3", "cred-4"]
+    assert skipped(index) == [("cred-2", REASON_DUPLICATE, "cred-1"), ("cred-5", REASON_DUPLICATE, "cred-1")]
+
+
+def test_pending_replacement_skips_the_expiring_credentials():
+    index = DuplicateIndex()
+    assert index.add_replacements([listed("pending-1"), listed("pending-2", credential_type=FRAMEWORK)],
+                                  REASON_PENDING_REPLACEMENT) == 2
+
+    assert reissued(index, record("cred-1"), record("cred-2", date_created=None),
+                    record("cred-3", bpn=OTHER_BPN)) == ["cred-3"]
+    assert skipped(index) == [("cred-1", REASON_PENDING_REPLACEMENT, "pending-1"),
+                              ("cred-2", REASON_PENDING_REPLACEMENT, "pending-1")]
+
+
+def test_active_replacement_must_be_created_after_the_expiring_credential():
+    index = DuplicateIndex()
+    index.add_replacements([listed("active-1", date_created="2024-06-01T00:00:00Z")], REASON_ACTIVE_REPLACEMENT)
+
+    assert reissued(index, record("older", date_created="2024-01-01T00:00:00Z")) == []
+    assert skipped(index) == [("older", REASON_ACTIVE_REPLACEMENT, "active-1")]
+
+    index = DuplicateIndex()
+    index.add_replacements([listed("active-1", date_created="2024-06-01T00:00:00Z")], REASON_ACTIVE_REPLACEMENT)
+    assert reissued(index, record("newer", date_created="2024-07-01T00:00:00+00:00")) == ["newer"]
+
+    index = DuplicateIndex()
+    index.add_replacements([listed("active-1", date_created="2024-06-01T00:00:00Z")], REASON_ACTIVE_REPLACEMENT)
+    assert reissued(index, record("unknown", date_created=None)) == ["unknown"]
+
+
+def test_active_credentials_without_creation_date_are_no_replacements():
+    index = DuplicateIndex()
+    assert index.add_replacements([listed("active-1")], REASON_ACTIVE_REPLACEMENT) == 0
+    assert reissued(index, record("cred-1")) == ["cred-1"]
+
+
+def test_pending_replacement_takes_precedence_over_active_one():
+    index = DuplicateIndex()
+    index.add_replacements([listed("pending-1")], REASON_PENDING_REPLACEMENT)
+    index.add_replacements([listed("active-1", date_created="2024-06-01T00:00:00Z")], REASON_ACTIVE_REPLACEMENT)
+
+    assert reissued(index, record("cred-1")) == []
+    assert skipped(index) == [("cred-1", REASON_PENDING_REPLACEMENT, "pending-1")]
+
+
+def test_latest_created_active_replacement_is_kept():
+    index = DuplicateIndex()
+    index.add_replacements([listed("active-2", date_created="2024-08-01T00:00:00Z"),
+                            listed("active-1", date_created="2024-06-01T00:00:00Z")], REASON_ACTIVE_REPLACEMENT)
+
+    assert reissued(index, record("cred-1", date_created="2024-07-01T00:00:00Z")) == []
+    assert skipped(index) == [("cred-1", REASON_ACTIVE_REPLACEMENT, "active-2")]
+
+
+def test_listed_credentials_without_bpn_or_type_are_ignored():
+    index = DuplicateIndex()
+    assert index.add_replacements([listed("no-bpn", bpn=None), listed("no-type", credential_type=None)],
+                                  REASON_PENDING_REPLACEMENT) == 0
+    assert index.replacements == {}
+
+
+def test_counts_and_report_of_skipped_credentials():
+    index = DuplicateIndex()
+    index.add_replacements([listed("pending-1", bpn=OTHER_BPN)], REASON_PENDING_REPLACEMENT)
+    list(index.filter([record("cred-1"), record("cred-2"), record("cred-3", bpn=OTHER_BPN)]))
+
+    assert index.counts() == {REASON_PENDING_REPLACEMENT: 1, REASON_ACTIVE_REPLACEMENT: 0, REASON_DUPLICATE: 1}
+    assert index.skipped[0].to_dict() == {"credential_id": "cred-2", "bpn": BPN, "type": MEMBERSHIP,
+                                          "expiry_date": "2025-01-10", "reason": REASON_DUPLICATE,
+                                          "other_credential_id": "cred-1"}
+
+
+def test_active_replacement_with_date_without_offset():
+    index = DuplicateIndex()
+    index.add_replacements([listed("active-1", date_created="2024-06-01T00:00:00")], REASON_ACTIVE_REPLACEMENT)
+    assert reissued(index, record("older", date_created="2024-01-01T00:00:00Z")) == []
+
+
+def test_dates_without_offset_are_utc():
+    assert parse_date_created("2024-06-01T00:00:00") == parse_date_created("2024-06-01T00:00:00Z") == (
+        parse_date_created("2024-06-01T02:00:00+02:00"))
+    assert parse_date_created(None) is None
@@ -0,0 +1,103 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import pytest
+
+from endpoints import Endpoints, env_overrides, load_endpoints, read_config_file, resolve
+
+SAP = {"sap_url": "https://sap.example.org", "sap_auth_url": "https://sap-auth.example.org"}
+
+
+@pytest.fixture
+def config_file(tmp_path) -> str:
+    """Config file with a top level setting and one for the int stage"""
+    path = tmp_path / "endpoints.toml"
+    path.write_text('sap_url = "https://sap.example.org"\n'
+                    'sap_auth_url = "https://sap-auth.example.org/"\n'
+                    "\n"
+                    "[stages.int]\n"
+                    'issuer_service_base_url = "http://issuer.{stage}.svc.cluster.local:8080"\n')
+    return str(path)
+
+
+def test_defaults_are_resolved_for_the_stage():
+    endpoints = load_endpoints("int", cli_overrides=SAP, environ={})
+    assert endpoints.issuer_service_base_url == "https://ssi-credential-issuer.int.catena-x.net"
+    assert endpoints.keycloak_base_url == "https://centralidp.int.catena-x.net"
+    assert endpoints.did_document("BPNL000000000001") == (
+        "https://portal-backend.int.catena-x.net/api/administration/staticdata/did/BPNL000000000001/did.json")
+
+
+def test_later_sources_win(config_file):
+    environ = {"REISSUE_ISSUER_SERVICE_BASE_URL": "https://issuer.env.example.org",
+               "REISSUE_KEYCLOAK_BASE_URL": "https://keycloak.env.example.org"}
+    endpoints = load_endpoints("int", config_file, {"keycloak_base_url": "https://keycloak.cli.example.org",
+                                                    "issuer_service_base_url": None}, environ)
+
+    assert endpoints.sap_auth_url == "https://sap-auth.example.org"
+    assert endpoints.issuer_service_base_url == "https://issuer.env.example.org"
+    assert endpoints.keycloak_base_url == "https://keycloak.cli.example.org"
+
+
+def test_stage_table_overrides_top_level_keys(config_file):
+    assert read_config_file(config_file, "int")["issuer_service_base_url"] == (
+        "http://issuer.{stage}.svc.cluster.local:8080")
+    assert "issuer_service_base_url" not in read_config_file(config_file, "dev")
+    assert load_endpoints("int", config_file, environ={}).issuer_service_base_url == (
+        "http://issuer.int.svc.cluster.local:8080")
+
+
+def test_unknown_settings_are_rejected(tmp_path):
+    path = tmp_path / "endpoints.toml"
+    path.write_text('issuer_url = "https://issuer.example.org"\n')
+    with pytest.raises(ValueError, match="issuer_url"):
+        read_config_file(str(path), "int")
+
+
+def test_env_overrides_ignore_empty_values():
+    assert env_overrides({"REISSUE_SAP_URL": "https://sap.example.org", "REISSUE_SAP_AUTH_URL": "",
+                          "OTHER": "value"}) == {"sap_url": "https://sap.example.org"}
+
+
+def test_resolve_strips_trailing_slashes_and_keeps_bpn_placeholder():
+    endpoints = resolve(Endpoints(issuer_service_base_url="https://issuer.{stage}.example.org/", **SAP), "int")
+    assert endpoints.issuer_service_base_url == "https://issuer.int.example.org"
+    assert "{bpn}" in endpoints.did_document_url
+
+
+@pytest.mark.parametrize("stage, overrides, problem", [
+    ("INT", {}, "stage must be a lowercase DNS label"),
+    ("int", {"sap_url": None}, "sap_url is required"),
+    ("int", {"keycloak_base_url": "centralidp.example.org"}, "keycloak_base_url must be an absolute http(s) URL"),
+    ("int", {"sap_token_path": "oauth/token"}, "sap_token_path must start with '/'"),
+    ("int", {"issuer_service_base_url": "https://{env}.example.org"}, "unknown placeholders ['env']"),
+    ("int", {"did_document_url": "https://portal.example.org/did.json"}, "must contain the {bpn} placeholder"),
+])
+def test_invalid_settings_are_reported(stage, overrides, problem):
+    with pytest.raises(ValueError) as error:
+        load_endpoints(stage, cli_overrides={**SAP, **overrides}, environ={})
+    assert problem in str(error.value)
+
+
+def test_all_problems_are_reported_at_once():
+    with pytest.raises(ValueError) as error:
+        load_endpoints("int", environ={})
+    assert "sap_url is required" in str(error.value)
+    assert "sap_auth_url is required" in str(error.value)
@@ -0,0 +1,243 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic
+
+import pytest
+import requests
+
+import http_client
+from http_client import ReissueHTTPAdapter, ReissueRetry, create_session, host_key
+from metrics import Metrics
+from rate_limiter import HostLimiters
+
+
+@pytest.fixture
+def scripted_server():
+    """
+    A server answering every request with the next (status, headers) of the script, the last entry is repeated.
+    Yields the script, the base URL and the list of received request methods.
+    """
+    script = []
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def answer(self):
+            received.append(self.command)
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            status, headers = script.pop(0) if len(script) > 1 else script[0]
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = answer
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield script, f"http://127.0.0.1:{server.server_address[1]}", received
+    server.shutdown()
+    server.server_close()
+
+
+def limiter_of(session: requests.Session, url: str):
+    return session.get_adapter(url).limiters.get(host_key("http", "127.0.0.1", int(url.rsplit(":", 1)[1])))
+
+
+@pytest.fixture
+def silent_server():
+    """A server that reads one request and then closes the connection or keeps it open without answering"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    connections = []
+
+    def serve(close: bool):
+        connection, _ = server.accept()
+        connections.append(connection)
+        connection.recv(65536)
+        if close:
+            connection.close()
+
+    def start(close: bool) -> str:
+        threading.Thread(target=serve, args=(close,), daemon=True).start()
+        return f"http://127.0.0.1:{server.getsockname()[1]}/api/issuer/bulk"
+
+    yield start
+    for connection in connections:
+        connection.close()
+    server.close()
+
+
+def unused_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def raised_by(call) -> Exception:
+    with pytest.raises(requests.RequestException) as info:
+        call()
+    return info.value
+
+
+def test_outcome_is_known_when_the_connection_was_refused():
+    error = raised_by(lambda: requests.post(f"http://127.0.0.1:{unused_port()}/", timeout=1))
+
+    assert not http_client.outcome_unknown(error)
+
+
+def test_outcome_is_known_on_connect_timeout():
+    assert not http_client.outcome_unknown(requests.ConnectTimeout("connect timed out"))
+
+
+def test_outcome_is_unknown_when_the_connection_closed_after_sending(silent_server):
+    url = silent_server(close=True)
+
+    error = raised_by(lambda: requests.post(url, json=["a"], timeout=5))
+
+    assert isinstance(error, requests.ConnectionError)
+    assert http_client.outcome_unknown(error)
+
+
+def test_outcome_is_unknown_on_read_timeout(silent_server):
+    url = silent_server(close=False)
+
+    error = raised_by(lambda: requests.post(url, json=["a"], timeout=(5, 0.2)))
+
+    assert isinstance(error, requests.ReadTimeout)
+    assert http_client.outcome_unknown(error)
+
+
+def test_outcome_is_known_for_other_errors():
+    assert not http_client.outcome_unknown(requests.HTTPError("500 Internal Server Error"))
+
+
+def test_host_key_omits_default_ports():
+    assert host_key("https", "Issuer.Example.org", 443) == "issuer.example.org"
+    assert host_key("http", "issuer.example.org", None) == "issuer.example.org"
+    assert host_key("https", "issuer.example.org", 8443) == "issuer.example.org:8443"
+
+
+@pytest.mark.parametrize("method, status_code, expected", [
+    ("POST", 429, True),
+    ("POST", 503, True),
+    ("POST", 502, False),
+    ("POST", 504, False),
+    ("GET", 502, True),
+    ("GET", 429, True),
+])
+def test_retry_only_retries_unprocessed_posts(method, status_code, expected):
+    retry = ReissueRetry(total=3, status_forcelist=http_client.IDEMPOTENT_RETRY_STATUS_CODES,
+                         allowed_methods=http_client.IDEMPOTENT_METHODS)
+
+    assert retry.is_retry(method, status_code) == expected
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_post_is_retried_when_it_was_not_processed(scripted_server, status_code):
+    script, url, received = scripted_server
+    script.extend([(status_code, {"Retry-After": "0"}), (200, {})])
+    session = create_session(retries=2, backoff_factor=0)
+
+    response = session.post(f"{url}/api/issuer/bulk", json=[])
+
+    assert response.status_code == 200
+    assert received == ["POST", "POST"]
+    assert limiter_of(session, url).throttled == 1
+
+
+def test_post_is_not_retried_when_it_may_have_been_processed(scripted_server):
+    script, url, received = scripted_server
+    script.append((502, {}))
+    session = create_session(retries=2, backoff_factor=0)
+
+    response = session.post(f"{url}/api/issuer/bulk", json=[])
+
+    assert response.status_code == 502
+    assert received == ["POST"]
+    assert limiter_of(session, url).throttled == 0
+
+
+def test_every_throttled_attempt_is_reported_once(scripted_server):
+    script, url, received = scripted_server
+    script.append((429, {"Retry-After": "0"}))
+    session = create_session(retries=2, backoff_factor=0)
+
+    response = session.post(f"{url}/api/issuer/bulk", json=[])
+
+    assert response.status_code == 429
+    assert len(received) == 3
+    assert limiter_of(session, url).throttled == 3
+
+
+def test_response_exhausting_the_retries_is_reported_once(scripted_server):
+    script, url, received = scripted_server
+    script.append((503, {"Retry-After": "0"}))
+    limiters = HostLimiters()
+    retry = ReissueRetry(total=5, status=1, backoff_factor=0, allowed_methods=http_client.IDEMPOTENT_METHODS,
+                         raise_on_status=False)
+    retry.limiters = limiters
+    session = requests.Session()
+    session.mount("http://", ReissueHTTPAdapter((5, 5), limiters, max_retries=retry))
+
+    response = session.post(f"{url}/api/issuer/bulk", json=[])
+
+    assert response.status_code == 503
+    assert len(received) == 2
+    assert limiter_of(session, url).throttled == 2
+
+
+def test_retry_after_pauses_the_host(scripted_server):
+    script, url, _ = scripted_server
+    script.append((429, {"Retry-After": "30"}))
+    session = create_session(retries=0)
+
+    session.post(f"{url}/api/issuer/bulk", json=[])
+
+    limiter = limiter_of(session, url)
+    assert limiter.throttled == 1
+    assert limiter._paused_until - monotonic() > 25
+
+
+def test_adapter_applies_the_default_timeout(silent_server):
+    url = silent_server(close=False)
+    session = create_session(read_timeout=0.2, retries=0)
+
+    with pytest.raises(requests.ReadTimeout):
+        session.post(url, json=[])
+
+
+def test_adapter_records_metrics(scripted_server):
+    script, url, _ = scripted_server
+    script.append((200, {}))
+    metrics = Metrics()
+    session = create_session(metrics=metrics, adaptive_rate_limit=False)
+
+    session.get(f"{url}/api/issuer/status/page")
+
+    assert metrics.to_dict()["requests"]["GET /api/issuer/status"]["status_codes"] == {"200": 1}
@@ -0,0 +1,153 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import json
+import threading
+
+import pytest
+
+from journal import (STEP_DISCOVERY_COMPLETE, STEP_FAILED, STEP_ISSUED, STEP_MERGED, STEP_REVOKED, Journal,
+                     load_journal)
+
+
+def write_lines(path, *entries):
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+
+def merged(credential_id: str) -> dict:
+    return {"credential_id": credential_id, "step": STEP_MERGED, "record": {"credential_id": credential_id}}
+
+
+def test_load_journal_keeps_last_confirmed_step(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_lines(
+        path,
+        merged("merged"),
+        merged("revoked"),
+        merged("issued"),
+        merged("failed"),
+        {"credential_id": "revoked", "step": STEP_REVOKED},
+        {"credential_id": "issued", "step": STEP_REVOKED},
+        {"credential_id": "issued", "step": STEP_ISSUED},
+        {"credential_id": "failed", "step": STEP_FAILED, "error": "boom"},
+    )
+
+    state = load_journal(str(path))
+
+    assert {credential_id: entry.step for credential_id, entry in state.entries.items()} == {
+        "merged": STEP_MERGED,
+        "revoked": STEP_REVOKED,
+        "issued": STEP_ISSUED,
+        "failed": STEP_MERGED,
+    }
+    assert [record["credential_id"] for record in state.pending(STEP_MERGED)] == ["merged", "failed"]
+    assert [record["credential_id"] for record in state.pending(STEP_REVOKED)] == ["revoked"]
+    assert not state.discovery_complete
+
+
+def test_load_journal_ignores_steps_of_unmerged_credentials(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_lines(path, {"credential_id": "unknown", "step": STEP_REVOKED},
+                {"credential_id": None, "step": STEP_DISCOVERY_COMPLETE})
+
+    state = load_journal(str(path))
+
+    assert state.entries == {}
+    assert state.discovery_complete
+
+
+def test_load_journal_ignores_truncated_last_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_lines(path, merged("a"), {"credential_id": "a", "step": STEP_REVOKED})
+    with open(path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"credential_id": "a", "step": "iss')
+
+    state = load_journal(str(path))
+
+    assert state.entries["a"].step == STEP_REVOKED
+
+
+def test_load_journal_without_file_starts_from_scratch(tmp_path):
+    state = load_journal(str(tmp_path / "missing.jsonl"))
+
+    assert state.entries == {}
+    assert not state.discovery_complete
+
+
+def test_journal_round_trip(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(str(path), batch_size=2)
+    journal.record("a", STEP_MERGED, record={"credential_id": "a"})
+    journal.record("a", STEP_REVOKED, durable=True)
+    journal.record(None, STEP_DISCOVERY_COMPLETE)
+    journal.close()
+
+    state = load_journal(str(path))
+
+    assert state.entries["a"].step == STEP_REVOKED
+    assert state.discovery_complete
+
+
+class FailingFile:
+    """File whose writes fail, like a full disk"""
+
+    def write(self, _):
+        raise OSError("No space left on device")
+
+    def close(self):
+        pass
+
+
+def test_durable_record_raises_write_error(tmp_path):
+    journal = Journal(str(tmp_path / "journal.jsonl"))
+    journal._file.close()
+    journal._file = FailingFile()
+
+    with pytest.raises(OSError, match="No space left on device"):
+        journal.record("a", STEP_REVOKED, durable=True)
+    # Later durable records fail right away instead of waiting for the stopped writer
+    with pytest.raises(OSError):
+        journal.record("b", STEP_REVOKED, durable=True)
+    journal.close()
+
+
+def test_durable_record_raises_sync_error(tmp_path, monkeypatch):
+    def fail_sync():
+        raise OSError("fsync failed")
+
+    journal = Journal(str(tmp_path / "journal.jsonl"))
+    monkeypatch.setattr(journal, "_sync", fail_sync)
+    errors = []
+
+    def record(credential_id: str):
+        try:
+            journal.record(credential_id, STEP_REVOKED, durable=True)
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=record, args=(str(number),)) for number in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(errors) == 5
+    journal.close()
@@ -0,0 +1,117 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import atexit
+import io
+import json
+import logging
+
+import pytest
+
+from log_setup import REDACTED, configure_logging, excerpt, redact
+
+SECRET = "s3cr3t-Value.1"
+
+
+@pytest.mark.parametrize("text", [
+    f'{{"client_secret": "{SECRET}"}}',
+    f'{{"clientSecret":"{SECRET}", "clientId": "client"}}',
+    f'{{"clientsecret": "{SECRET}"}}',
+    f"{{'access_token': '{SECRET}'}}",
+    f"grant_type=client_credentials&client_secret={SECRET}&client_id=client",
+    f"access_token={SECRET}",
+    f"Authorization: Bearer {SECRET}",
+])
+def test_redact_replaces_secrets(text):
+    redacted = redact(text)
+    assert SECRET not in redacted
+    assert REDACTED in redacted
+
+
+def test_redact_keeps_other_values():
+    text = '{"client_id": "client", "secretary": "value"}'
+    assert redact(text) == text
+
+
+def test_excerpt_redacts_before_truncating():
+    text = f'{{"client_secret": "{SECRET}"}}' + "x" * 100
+    assert excerpt(text, 30) == f'{{"client_secret": "{REDACTED}"}}' + "x" * 6 + "... [94 characters truncated]"
+
+
+class LogOutput:
+    def __init__(self):
+        self.stream = io.StringIO()
+        self.listener = None
+
+    def configure(self, json_output: bool = False):
+        self.listener = configure_logging(logging.INFO, json_output, stream=self.stream)
+        # Stopped by the test, a listener cannot be stopped twice
+        atexit.unregister(self.listener.stop)
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def text(self) -> str:
+        """Waits until the queued records are written"""
+        self.stop()
+        return self.stream.getvalue()
+
+
+@pytest.fixture
+def log_output():
+    """Output of the configured logging, the handlers of the root logger are restored afterwards"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    output = LogOutput()
+    yield output
+    output.stop()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+@pytest.mark.parametrize("json_output", [False, True])
+def test_secrets_are_redacted_in_messages_and_args(log_output, json_output):
+    log_output.configure(json_output)
+    logging.info(f'Response: {{"clientSecret": "{SECRET}"}}')
+    logging.info("Response: %s", {"client_secret": SECRET, "client_id": "client"})
+    logging.info("Token request: %s", f"grant_type=client_credentials&access_token={SECRET}")
+
+    text = log_output.text()
+    assert SECRET not in text
+    assert text.count(REDACTED) == 3
+    messages = [json.loads(line)["message"] for line in text.splitlines()] if json_output else text.splitlines()
+    assert "'client_id': 'client'" in messages[1]
+
+
+def test_exceptions_are_redacted(log_output):
+    log_output.configure()
+    try:
+        raise ValueError(f'Failed: {{"client_secret": "{SECRET}"}}')
+    except ValueError:
+        logging.exception("Request failed")
+
+    text = log_output.text()
+    assert SECRET not in text
+    assert "Request failed" in text
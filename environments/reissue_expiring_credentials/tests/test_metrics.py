@@ -0,0 +1,139 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import re
+
+import pytest
+
+from metrics import Histogram, Metrics
+
+SAMPLE = re.compile(r"(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(\{(?P<labels>.*)\})? (?P<value>\S+)")
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    """Metrics with a request, an operation, cache lookups and a total"""
+    metrics = Metrics()
+    metrics.observe_request("GET /api/issuer", 200, 0.02)
+    metrics.observe_request("GET /api/issuer", 200, 0.3, retries=2)
+    metrics.observe_request('POST /api/"quoted"\\path', "error", 70.0)
+    metrics.observe_operation("get_company_did", 0.004, "ok")
+    metrics.observe_operation("get_company_did", 0.2, "HTTPError")
+    metrics.count_cache("client_info", hit=True)
+    metrics.count_cache("client_info", hit=False)
+    metrics.set_total("credentials_reissued", 2)
+    return metrics
+
+
+def families(text: str) -> dict:
+    """Samples by metric family of an OpenMetrics text, checking that every sample follows its TYPE line"""
+    result, current = {}, None
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, current, kind = line.split(" ")
+            assert current not in result, f"family {current} declared twice"
+            result[current] = {"type": kind, "samples": []}
+        elif line.startswith("# ") and line != "# EOF":
+            assert line.split(" ")[2] == current, line
+        elif line != "# EOF":
+            sample = SAMPLE.fullmatch(line)
+            assert sample is not None, line
+            assert sample["name"].startswith(current), line
+            result[current]["samples"].append((sample["name"], sample["labels"], float(sample["value"])))
+    return result
+
+
+def test_histogram_quantile_is_bucket_upper_bound():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == 1.0
+    assert histogram.cumulative_counts() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+
+
+def test_openmetrics_ends_with_eof(metrics):
+    text = metrics.to_openmetrics()
+    assert text.endswith("\n# EOF\n")
+    assert text.count("# EOF") == 1
+
+
+def test_openmetrics_families_are_typed(metrics):
+    result = families(metrics.to_openmetrics())
+    assert result["reissue_http_request_duration_seconds"]["type"] == "histogram"
+    assert result["reissue_http_responses"]["type"] == "counter"
+    assert result["reissue_credentials_reissued"]["type"] == "gauge"
+    for name, family in result.items():
+        if family["type"] == "counter":
+            assert all(sample_name == f"{name}_total" for sample_name, _, _ in family["samples"])
+
+
+def test_openmetrics_histogram_buckets_are_cumulative(metrics):
+    samples = families(metrics.to_openmetrics())["reissue_http_request_duration_seconds"]["samples"]
+    route = 'route="GET /api/issuer"'
+    buckets = [value for name, labels, value in samples if name.endswith("_bucket") and labels.startswith(route)]
+    count = [value for name, labels, value in samples if name.endswith("_count") and labels == route]
+
+    assert buckets == sorted(buckets)
+    assert buckets[-1] == count[0] == 2
+    assert f'{route},le="+Inf"' in [labels for _, labels, _ in samples]
+
+
+def test_openmetrics_label_values_are_escaped(metrics):
+    text = metrics.to_openmetrics()
+    assert 'reissue_http_responses_total{route="POST /api/\\"quoted\\"\\\\path",status="error"} 1' in text
+    assert 'reissue_http_retries_total{route="GET /api/issuer"} 2' in text
+    assert 'reissue_cache_requests_total{cache="client_info",result="hit"} 1' in text
+
+
+def test_openmetrics_is_parsed_by_prometheus_client(metrics):
+    parser = pytest.importorskip("prometheus_client.openmetrics.parser")
+    parsed = {family.name: family for family in parser.text_string_to_metric_families(metrics.to_openmetrics())}
+    assert parsed["reissue_http_responses"].type == "counter"
+
+
+def test_merge_dict_adds_the_metrics_of_another_run(metrics):
+    other = Metrics()
+    other.observe_request("GET /api/issuer", 500, 0.02)
+    other.set_total("credentials_reissued", 3)
+    other.set_total("run_duration_seconds", 10.0)
+    metrics.set_total("run_duration_seconds", 20.0)
+
+    metrics.merge_dict(other.to_dict())
+
+    merged = metrics.to_dict()
+    assert merged["requests"]["GET /api/issuer"]["status_codes"] == {"200": 2, "500": 1}
+    assert merged["requests"]["GET /api/issuer"]["latency_seconds"]["count"] == 3
+    assert merged["totals"] == {"credentials_reissued": 5, "run_duration_seconds": 20.0}
+
+
+def test_timed_records_the_outcome():
+    metrics = Metrics()
+
+    @metrics.timed
+    def fetch(fail: bool):
+        if fail:
+            raise KeyError("data")
+
+    fetch(False)
+    with pytest.raises(KeyError):
+        fetch(True)
+    assert metrics.to_dict()["operations"]["fetch"]["outcomes"] == {"KeyError": 1, "ok": 1}
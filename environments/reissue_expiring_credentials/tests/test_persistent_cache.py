@@ -0,0 +1,175 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import sqlite3
+
+import pytest
+
+import persistent_cache
+from persistent_cache import MISSING, NAMESPACE_CLIENT_INFO, NAMESPACE_COMPANY_DID, NEGATIVE_TTL, PersistentCache
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(persistent_cache, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    """Path of the cache database"""
+    return str(tmp_path / "cache.sqlite")
+
+
+def stored_keys(path: str) -> set:
+    connection = sqlite3.connect(path)
+    try:
+        return set(connection.execute("SELECT namespace, key FROM cache_entries"))
+    finally:
+        connection.close()
+
+
+def test_entries_survive_reopening(clock, path):
+    cache = PersistentCache(path)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", "did:web:one")
+    cache.close()
+
+    cache = PersistentCache(path)
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1") == "did:web:one"
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_entries_expire_after_ttl(clock, path):
+    cache = PersistentCache(path, ttl=100)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", "did:web:one")
+
+    clock.now += 100
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1") == "did:web:one"
+    clock.now += 1
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1") is None
+    assert cache.misses == 1
+
+
+def test_expired_entries_are_deleted_on_open(clock, path):
+    cache = PersistentCache(path, ttl=100)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", "did:web:one")
+    clock.now += 50
+    cache.set(NAMESPACE_COMPANY_DID, "op-2", "did:web:two")
+    cache.close()
+
+    clock.now += 60
+    PersistentCache(path, ttl=100).close()
+    assert stored_keys(path) == {(NAMESPACE_COMPANY_DID, "op-2")}
+
+
+def test_least_recently_used_entries_are_evicted(clock, path):
+    cache = PersistentCache(path, max_entries=2)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", "did:web:one")
+    clock.now += 1
+    cache.set(NAMESPACE_COMPANY_DID, "op-2", "did:web:two")
+    clock.now += 1
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1") == "did:web:one"
+    clock.now += 1
+    cache.set(NAMESPACE_COMPANY_DID, "op-3", "did:web:three")
+
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-2") is None
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1") == "did:web:one"
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-3") == "did:web:three"
+
+
+def test_retain_only_removes_entries_of_its_namespace(clock, path):
+    cache = PersistentCache(path)
+    for key in ("op-1", "op-2"):
+        cache.set(NAMESPACE_COMPANY_DID, key, f"did:web:{key}")
+        cache.set(NAMESPACE_CLIENT_INFO, key, {"client_id": key})
+
+    cache.retain(NAMESPACE_COMPANY_DID, iter(["op-2", "op-3"]))
+
+    assert stored_keys(path) == {(NAMESPACE_COMPANY_DID, "op-2"), (NAMESPACE_CLIENT_INFO, "op-1"),
+                                 (NAMESPACE_CLIENT_INFO, "op-2")}
+
+
+def test_retain_with_no_keys_clears_the_namespace(clock, path):
+    cache = PersistentCache(path)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", "did:web:one")
+    cache.retain(NAMESPACE_COMPANY_DID, [])
+    assert stored_keys(path) == set()
+
+
+def test_secrets_are_not_stored_without_encryption_key(clock, path):
+    cache = PersistentCache(path)
+    cache.set(NAMESPACE_CLIENT_INFO, "op-1", {"client_secret": "s3cr3t"}, secret=True)
+
+    assert cache.get(NAMESPACE_CLIENT_INFO, "op-1") is None
+    assert stored_keys(path) == set()
+    with open(path, "rb") as file:
+        assert b"s3cr3t" not in file.read()
+
+
+def test_secrets_are_stored_encrypted(clock, path):
+    fernet = pytest.importorskip("cryptography.fernet")
+    key = fernet.Fernet.generate_key().decode()
+    cache = PersistentCache(path, encryption_key=key)
+    cache.set(NAMESPACE_CLIENT_INFO, "op-1", {"client_secret": "s3cr3t"}, secret=True)
+    cache.close()
+
+    with open(path, "rb") as file:
+        assert b"s3cr3t" not in file.read()
+    assert PersistentCache(path, encryption_key=key).get(NAMESPACE_CLIENT_INFO, "op-1") == {"client_secret": "s3cr3t"}
+    assert PersistentCache(path).get(NAMESPACE_CLIENT_INFO, "op-1") is None
+    other_key = fernet.Fernet.generate_key().decode()
+    assert PersistentCache(path, encryption_key=other_key).get(NAMESPACE_CLIENT_INFO, "op-1") is None
+
+
+def test_cached_none_is_told_apart_from_missing_entry(clock, path):
+    cache = PersistentCache(path)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", None)
+
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1", default=MISSING) is None
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-2", default=MISSING) is MISSING
+
+
+def test_entries_with_shorter_ttl_expire_first(clock, path):
+    cache = PersistentCache(path)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", None, ttl=NEGATIVE_TTL)
+    cache.set(NAMESPACE_COMPANY_DID, "op-2", "did:web:two")
+
+    clock.now += NEGATIVE_TTL
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1", default=MISSING) is None
+    clock.now += 1
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1", default=MISSING) is MISSING
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-2") == "did:web:two"
+
+
+def test_ttl_longer_than_cache_ttl_is_capped(clock, path):
+    cache = PersistentCache(path, ttl=100)
+    cache.set(NAMESPACE_COMPANY_DID, "op-1", "did:web:one", ttl=1000)
+
+    clock.now += 101
+    assert cache.get(NAMESPACE_COMPANY_DID, "op-1") is None
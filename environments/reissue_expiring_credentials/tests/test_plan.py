@@ -0,0 +1,92 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import os
+
+import pytest
+
+from plan import KEY_VERSION, PLAN_VERSION, read_plan_header, read_plan_records, write_plan
+
+RECORDS = [
+    {"bpn": "BPNL000000000001", "credential_type": "BusinessPartnerCredential", "credential_id": "cred-1",
+     "holder_did": "did:web:example.org:BPNL000000000001", "operation_id": "op1"},
+    {"bpn": "BPNL000000000002", "credential_type": "MembershipCredential", "credential_id": "cred-2",
+     "holder_did": "did:web:example.org:BPNL000000000002", "operation_id": "op2", "expiry_date": "2025-01-10"},
+]
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    """Path of the plan file"""
+    return str(tmp_path / "plan.jsonl")
+
+
+def test_plan_round_trip(path):
+    assert write_plan(path, iter(RECORDS), stage="int", start_date="2025-01-01", end_date="2025-01-31") == 2
+
+    assert read_plan_header(path) == {KEY_VERSION: PLAN_VERSION, "stage": "int", "start_date": "2025-01-01",
+                                      "end_date": "2025-01-31"}
+    assert list(read_plan_records(path)) == RECORDS
+
+
+def test_empty_plan_round_trip(path):
+    assert write_plan(path, [], stage="int") == 0
+    assert read_plan_header(path)["stage"] == "int"
+    assert list(read_plan_records(path)) == []
+
+
+def test_plan_is_written_deterministically(tmp_path):
+    first, second = str(tmp_path / "first.jsonl"), str(tmp_path / "second.jsonl")
+    write_plan(first, RECORDS, stage="int")
+    write_plan(second, [dict(reversed(record.items())) for record in RECORDS], stage="int")
+
+    with open(first) as first_file, open(second) as second_file:
+        assert first_file.read() == second_file.read()
+
+
+def test_failed_write_keeps_the_previous_plan(path):
+    write_plan(path, RECORDS, stage="int")
+
+    def records():
+        yield RECORDS[0]
+        raise RuntimeError("discovery failed")
+
+    with pytest.raises(RuntimeError):
+        write_plan(path, records(), stage="prod")
+    assert read_plan_header(path)["stage"] == "int"
+    assert list(read_plan_records(path)) == RECORDS
+
+
+def test_unsupported_plan_version_is_rejected(path):
+    with open(path, "w") as plan_file:
+        plan_file.write('{"plan_version": 2}\n')
+    with pytest.raises(ValueError, match="Unsupported plan"):
+        read_plan_header(path)
+
+    os.truncate(path, 0)
+    with pytest.raises(ValueError, match="Unsupported plan"):
+        read_plan_header(path)
+
+
+def test_blank_lines_are_skipped(path):
+    write_plan(path, RECORDS, stage="int")
+    with open(path, "a") as plan_file:
+        plan_file.write("\n")
+    assert list(read_plan_records(path)) == RECORDS
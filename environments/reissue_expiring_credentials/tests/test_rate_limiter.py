@@ -0,0 +1,139 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from time import monotonic
+
+import pytest
+
+from rate_limiter import AdaptiveLimiter, HostLimiters, parse_retry_after
+
+ROUTE = "POST /api/issuer/bulk"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("3", 3.0),
+    ("1.5", 1.5),
+    ("-2", 0.0),
+    ("soon", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+
+    assert 55 < parse_retry_after(value) <= 60
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_fast_responses_increase_the_limit_additively():
+    limiter = AdaptiveLimiter("issuer", initial_limit=4)
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release(ROUTE, 0.1)
+
+    assert 4.9 < limiter.limit < 5.0
+
+
+def test_throttled_responses_halve_the_limit_down_to_the_minimum():
+    limiter = AdaptiveLimiter("issuer", initial_limit=8, min_limit=1)
+
+    limiter.acquire()
+    limiter.release(ROUTE, 0.1, throttled=True)
+    assert limiter.limit == 4
+    limiter.throttle()
+    limiter.throttle()
+    limiter.throttle()
+
+    assert limiter.limit == 1
+    assert limiter.throttled == 4
+
+
+def test_slow_responses_decrease_the_limit():
+    limiter = AdaptiveLimiter("issuer", initial_limit=10, latency_tolerance=2)
+    limiter.acquire()
+    limiter.release(ROUTE, 0.1)
+    limit = limiter.limit
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(ROUTE, 5.0)
+
+    assert limiter.limit < limit
+
+
+def test_routes_keep_their_own_latency():
+    limiter = AdaptiveLimiter("issuer", initial_limit=10, latency_tolerance=2)
+    limiter.acquire()
+    limiter.release("GET /api/issuer/status", 0.01)
+    limit = limiter.limit
+
+    limiter.acquire()
+    limiter.release(ROUTE, 5.0)
+
+    assert limiter.limit > limit
+
+
+def test_limit_is_capped_at_the_maximum():
+    limiter = AdaptiveLimiter("issuer", initial_limit=2, max_limit=2)
+
+    limiter.acquire()
+    limiter.release(ROUTE, 0.1)
+
+    assert limiter.limit == 2
+
+
+def test_acquire_blocks_until_a_request_is_released():
+    limiter = AdaptiveLimiter("issuer", initial_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+
+    assert not acquired.wait(0.1)
+    limiter.release(ROUTE, 0.1)
+    assert acquired.wait(5)
+    thread.join()
+
+
+def test_retry_after_pauses_every_request_to_the_host():
+    limiter = AdaptiveLimiter("issuer", initial_limit=4)
+    limiter.acquire()
+    limiter.release(ROUTE, None, throttled=True, retry_after=0.2)
+
+    start = monotonic()
+    limiter.acquire()
+
+    assert monotonic() - start >= 0.15
+
+
+def test_host_limiters_keep_one_limiter_per_host():
+    limiters = HostLimiters(initial_limit=2)
+
+    assert limiters.get("issuer") is limiters.get("issuer")
+    assert limiters.get("issuer") is not limiters.get("sap")
+    assert limiters.get("sap").limit == 2
@@ -0,0 +1,324 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from itertools import islice
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import persistent_cache
+import reissue_expiring_credentials
+from credential_page import CompactPage, CredentialPage, ListedCredential
+from persistent_cache import NEGATIVE_TTL, PersistentCache
+from reissue_expiring_credentials import (build_operation_id_index, cancel_unshared_company_dids,
+                                          fetch_active_credentials, filter_credentials, find_operation_ids,
+                                          get_company_did, get_first_op_id_by_stage, reissue_credentials,
+                                          resolve_company_did)
+
+START = date(2025, 1, 1)
+END = date(2025, 1, 31)
+
+
+def listed(credential_id: str, expiry_date: str | None, signed: bool = True) -> ListedCredential:
+    return ListedCredential(credential_id, "BPNL000000000001", "BusinessPartnerCredential",
+                            f"{expiry_date}T00:00:00+00:00" if expiry_date else None, signed)
+
+
+def test_filter_credentials_yields_signed_credentials_within_the_window():
+    unsigned = []
+    credentials = [
+        listed("before", "2024-12-31"),
+        listed("first", "2025-01-01"),
+        listed("unsigned", "2025-01-10", signed=False),
+        listed("no expiry", None),
+        listed("last", "2025-01-31"),
+        listed("unsigned after", "2025-02-01", signed=False),
+    ]
+
+    filtered = list(filter_credentials(credentials, START, END, unsigned.append))
+
+    assert [cred.credential_id for cred in filtered] == ["first", "last"]
+    assert unsigned == [date(2025, 1, 10)]
+
+
+@pytest.fixture
+def did_executor(monkeypatch):
+    """A single DID worker that is busy until the returned event is set, so submitted company DIDs stay pending"""
+    monkeypatch.setattr(reissue_expiring_credentials, "COMPANY_DIDS", {})
+    monkeypatch.setattr(reissue_expiring_credentials, "SHARED_COMPANY_DIDS", set())
+    monkeypatch.setattr(reissue_expiring_credentials, "get_company_did",
+                        lambda *args: f"did:web:int.example.org:{args[-1]}")
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(reissue_expiring_credentials, "DID_EXECUTOR", executor)
+    busy = threading.Event()
+    executor.submit(busy.wait, 5)
+    yield busy
+    busy.set()
+    executor.shutdown()
+
+
+def resolve(operation_id: str, submitted: list | None = None) -> Future:
+    return resolve_company_did("auth", "client", "secret", "sap", operation_id, submitted=submitted)
+
+
+def test_cancel_keeps_company_dids_other_callers_wait_for(did_executor):
+    submitted = []
+    own = resolve("op1", submitted)
+    shared = resolve("op2", submitted)
+    other = resolve("op2")
+
+    cancel_unshared_company_dids(submitted)
+    did_executor.set()
+
+    assert own.cancelled()
+    assert "op1" not in reissue_expiring_credentials.COMPANY_DIDS
+    assert other is shared
+    assert other.result(timeout=5) == "did:web:int.example.org:op2"
+    assert reissue_expiring_credentials.COMPANY_DIDS["op2"] is shared
+
+
+def test_first_op_id_does_not_cancel_company_dids_submitted_by_other_callers(did_executor):
+    resolved = Future()
+    resolved.set_result("did:web:int.example.org:op1")
+    reissue_expiring_credentials.COMPANY_DIDS["op1"] = resolved
+    other = resolve("op2")
+
+    operation_id = get_first_op_id_by_stage("int", "auth", "client", "secret", "sap", ["op1", "op2", "op3"])
+    did_executor.set()
+
+    assert operation_id == "op1"
+    assert other.result(timeout=5) == "did:web:int.example.org:op2"
+    assert "op3" not in reissue_expiring_credentials.COMPANY_DIDS
+
+
+def test_missing_company_did_is_persisted_shortly(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr(persistent_cache, "time", lambda: now[0])
+    monkeypatch.setattr(reissue_expiring_credentials, "PERSISTENT_CACHE", PersistentCache(str(tmp_path / "cache")))
+    client_info = {"url": "https://uaa.example.org", "client_id": "client", "client_secret": "secret"}
+    monkeypatch.setattr(reissue_expiring_credentials, "get_customer_client_info", lambda *args: client_info)
+    monkeypatch.setattr(reissue_expiring_credentials, "get_auth_token", lambda *args: "token")
+    responses = [{"data": []}, {"data": [{"issuerDID": "did:web:int.example.org:op1"}]}]
+    urls = []
+
+    def get(url, **kwargs):
+        urls.append(url)
+        return SimpleNamespace(status_code=200, text="", json=lambda: responses[len(urls) - 1])
+
+    monkeypatch.setattr(reissue_expiring_credentials.http_client, "get", get)
+
+    assert get_company_did("auth", "client", "secret", "sap", "op1") is None
+    assert get_company_did("auth", "client", "secret", "sap", "op1") is None
+    assert len(urls) == 1
+
+    now[0] += NEGATIVE_TTL + 1
+    assert get_company_did("auth", "client", "secret", "sap", "op1") == "did:web:int.example.org:op1"
+    assert len(urls) == 2
+
+
+def operation(customer_name: str, operation_id: str) -> dict:
+    return {"customer_name": customer_name, "operation_id": operation_id}
+
+
+def linear_scan(operations: list, bpn: str) -> list:
+    return [op["operation_id"] for op in operations if bpn in op["customer_name"]]
+
+
+def test_find_operation_ids_returns_all_wallets_of_a_bpn_in_order():
+    operations = [
+        operation("Company A BPNL000000000001", "op1"),
+        operation("Company B BPNL000000000002", "op2"),
+        operation("Company A (new) BPNL000000000001", "op3"),
+        operation("Group BPNL000000000001 / BPNL000000000002", "op4"),
+        operation("Legacy BPNL000000000001-old", "op5"),
+    ]
+    index = build_operation_id_index(operations)
+
+    assert find_operation_ids(index, "BPNL000000000001") == ["op1", "op3", "op4", "op5"]
+    assert find_operation_ids(index, "BPNL000000000002") == ["op2", "op4"]
+    assert find_operation_ids(index, "BPNL000000000003") == []
+
+
+def test_find_operation_ids_matches_keys_that_are_no_bpnl():
+    operations = [
+        operation("Company A BPNL000000000001", "op1"),
+        operation("Company without BPN", "op2"),
+        operation("Company C bpnl000000000003", "op3"),
+    ]
+    index = build_operation_id_index(operations)
+
+    assert index.unparsed == [(1, "Company without BPN", "op2"), (2, "Company C bpnl000000000003", "op3")]
+    assert find_operation_ids(index, "BPNL0000") == ["op1"]
+    assert find_operation_ids(index, "bpnl000000000003") == ["op3"]
+    assert find_operation_ids(index, "without") == ["op2"]
+    assert find_operation_ids(index, "") == ["op1", "op2", "op3"]
+
+
+def test_find_operation_ids_matches_linear_scan():
+    rng = random.Random(7)
+    bpns = [f"BPNL{i:012d}" for i in range(20)]
+
+    def customer_name() -> str:
+        parts = [rng.choice(["Company", "Group", "bpnl000000000001", "BPNS000000000001"])]
+        parts += rng.sample(bpns, rng.randint(0, 2))
+        return " ".join(parts)
+
+    operations = [operation(customer_name(), f"op{i}") for i in range(300)]
+    index = build_operation_id_index(operations)
+
+    for bpn in bpns + ["BPNL999999999999", "BPNS000000000001", "bpnl000000000001", "BPNL00000000000"]:
+        assert find_operation_ids(index, bpn) == linear_scan(operations, bpn), bpn
+
+
+def http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code}", response=response)
+
+
+class Issuer:
+    """
+    Serves `num_pages` pages of one credential each by offset and by cursor. Pages are answered after a random delay,
+    so concurrently fetched pages complete out of order.
+    """
+
+    def __init__(self, num_pages: int, compact_error: int | None = None, expiry_error: int | None = None):
+        self.num_pages = num_pages
+        self.compact_error = compact_error
+        self.expiry_error = expiry_error
+        self.pages = []
+        self.cursors = []
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def fetch_credential_page(self, issuer_url, headers, page, page_size, query=None) -> CredentialPage:
+        with self._lock:
+            self.pages.append(page)
+            self.queries.append(query)
+        if self.expiry_error is not None and "expiryDateFrom" in query:
+            raise http_error(self.expiry_error)
+        time.sleep(random.uniform(0, 0.01))
+        return CredentialPage(self.num_pages, [listed(f"page-{page}", "2025-01-10")])
+
+    def fetch_compact_page(self, issuer_url, headers, cursor, page_size, query=None) -> CompactPage:
+        with self._lock:
+            self.cursors.append(cursor)
+        if self.compact_error is not None:
+            raise http_error(self.compact_error)
+        page = 0 if cursor is None else int(cursor)
+        next_cursor = str(page + 1) if page + 1 < self.num_pages else None
+        return CompactPage(next_cursor, [listed(f"page-{page}", "2025-01-10")])
+
+
+@pytest.fixture
+def issuer(monkeypatch):
+    """Factory of fake issuers that replace the page fetches of the script"""
+
+    def create(num_pages: int = 10, **errors) -> Issuer:
+        issuer = Issuer(num_pages, **errors)
+        monkeypatch.setattr(reissue_expiring_credentials, "fetch_credential_page", issuer.fetch_credential_page)
+        monkeypatch.setattr(reissue_expiring_credentials, "fetch_compact_page", issuer.fetch_compact_page)
+        return issuer
+
+    monkeypatch.setattr(reissue_expiring_credentials, "get_auth_token", lambda *args: "token")
+    return create
+
+
+def fetch(**kwargs):
+    return fetch_active_credentials("auth", "client", "secret", "https://issuer.example.org", **kwargs)
+
+
+def credential_ids(credentials) -> list:
+    return [cred.credential_id for cred in credentials]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_offset_pages_are_yielded_in_page_order(issuer, max_workers):
+    issuer = issuer()
+    credentials = fetch(max_workers=max_workers, compact_page_size=None)
+    assert credential_ids(credentials) == [f"page-{page}" for page in range(10)]
+    assert sorted(issuer.pages) == list(range(10))
+
+
+def test_closing_the_generator_stops_fetching_pages(issuer):
+    issuer = issuer(num_pages=100)
+    credentials = fetch(max_workers=2, compact_page_size=None)
+    assert credential_ids(islice(credentials, 3)) == ["page-0", "page-1", "page-2"]
+    credentials.close()
+
+    # Page 0, the two pages in flight and one page submitted for each further credential
+    assert max(issuer.pages) <= 4
+
+
+def test_reissue_credentials_pulls_at_most_limit_credentials():
+    pulled = []
+
+    def credentials():
+        for i in range(100):
+            pulled.append(i)
+            yield {"credential_id": f"cred-{i}"}
+
+    results = asyncio.run(reissue_credentials(credentials(), lambda cred: None, concurrency=4, limit=3))
+    assert [result.credential_id for result in results] == ["cred-0", "cred-1", "cred-2"]
+    assert pulled == [0, 1, 2]
+
+
+def test_keyset_pages_follow_the_cursor(issuer):
+    issuer = issuer(num_pages=3)
+    assert credential_ids(fetch(compact_page_size=500)) == ["page-0", "page-1", "page-2"]
+    assert issuer.cursors == [None, "1", "2"]
+    assert issuer.pages == []
+
+
+@pytest.mark.parametrize("status_code", [404, 405])
+def test_keyset_listing_falls_back_to_offset_pages(issuer, status_code):
+    issuer = issuer(num_pages=3, compact_error=status_code)
+    assert credential_ids(fetch(compact_page_size=500)) == ["page-0", "page-1", "page-2"]
+    assert issuer.cursors == [None]
+
+
+def test_keyset_listing_raises_other_errors(issuer):
+    issuer(compact_error=500)
+    with pytest.raises(requests.HTTPError):
+        list(fetch(compact_page_size=500))
+
+
+def test_expiry_filter_falls_back_to_all_credentials_on_400(issuer):
+    issuer = issuer(num_pages=3, expiry_error=400)
+    credentials = fetch(compact_page_size=None, expiry_from=START, expiry_to=END)
+
+    assert credential_ids(credentials) == ["page-0", "page-1", "page-2"]
+    assert issuer.pages == [0, 0, 1, 2]
+    assert issuer.queries[0]["expiryDateFrom"] == "2025-01-01T00:00:00Z"
+    assert issuer.queries[0]["sorting"] == "ExpiryDateAsc"
+    assert all(query == {"companySsiDetailStatusId": "ACTIVE"} for query in issuer.queries[1:])
+
+
+def test_expiry_filter_raises_other_errors(issuer):
+    issuer(expiry_error=500)
+    with pytest.raises(requests.HTTPError):
+        list(fetch(compact_page_size=None, expiry_from=START, expiry_to=END))
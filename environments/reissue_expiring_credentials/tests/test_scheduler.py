@@ -0,0 +1,98 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+from scheduler import DeadlineScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def record(credential_id: str, expiry_date: str | None) -> dict:
+    return {"credential_id": credential_id, "expiry_date": expiry_date}
+
+
+def ids(records) -> list:
+    return [cred["credential_id"] for cred in records]
+
+
+def test_order_sorts_by_expiry_date_and_keeps_input_order_of_equal_dates():
+    scheduler = DeadlineScheduler()
+    records = [record("c", "2025-03-01"), record("unknown", None), record("a1", "2025-01-01T00:00:00+00:00"),
+               record("a2", "2025-01-01T12:00:00+00:00"), record("b", "2025-02-01")]
+
+    assert ids(scheduler.order(records)) == ["a1", "a2", "b", "c", "unknown"]
+    assert scheduler.input_complete
+
+
+def test_order_sorts_within_buffer_only():
+    scheduler = DeadlineScheduler(buffer_size=2)
+    records = [record("c", "2025-03-01"), record("b", "2025-02-01"), record("a", "2025-01-01")]
+
+    assert ids(scheduler.order(records)) == ["b", "a", "c"]
+
+
+def test_remaining_drains_unread_input():
+    scheduler = DeadlineScheduler(buffer_size=2)
+    ordered = scheduler.order([record("c", "2025-03-01"), record("b", "2025-02-01"), record("d", "2025-04-01"),
+                               record("a", "2025-01-01")])
+    assert ids([next(ordered)]) == ["b"]
+
+    assert ids(scheduler.remaining()) == ["c"]
+    assert ids(scheduler.remaining(drain=True)) == ["c", "a", "d"]
+    assert scheduler.input_complete
+
+
+def test_can_start_stops_before_expected_duration_exceeds_deadline():
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(max_duration=10, clock=clock)
+    assert scheduler.can_start()
+
+    scheduler.record_duration(3)
+    clock.now = 6
+    assert scheduler.can_start()
+
+    clock.now = 7.5
+    assert not scheduler.can_start()
+    assert scheduler.deadline_reached
+
+
+def test_can_start_without_max_duration():
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock=clock)
+    clock.now = 1e9
+
+    assert scheduler.can_start()
+    assert not scheduler.deadline_reached
+
+
+def test_throughput_counts_completed_credentials():
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock=clock)
+    for _ in range(4):
+        scheduler.record_duration(0.5)
+    clock.now = 2
+
+    assert scheduler.throughput() == 2
+    assert scheduler.expected_duration() == 0.5
@@ -0,0 +1,109 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import uuid
+
+import pytest
+
+from metrics import Metrics
+from sharding import Shard, merge_summaries, shard_of, validate_shard
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7])
+def test_every_credential_lands_in_exactly_one_shard(count):
+    records = [{"credential_id": str(uuid.UUID(int=number)), "bpn": f"BPNL{number // 3:012d}"}
+               for number in range(1000)]
+
+    for key in ("credential_id", "bpn"):
+        shards = [Shard(index, count, key) for index in range(count)]
+        for record in records:
+            assert [shard.index for shard in shards if shard.contains(record)] == [shard_of(record[key], count)]
+
+
+def test_shard_of_is_stable():
+    # Shards of one run may run different Python versions, so the assignment must never change
+    assert [shard_of(f"BPNL{number:012d}", 4) for number in range(8)] == [3, 1, 3, 1, 2, 0, 2, 0]
+
+
+def test_validate_shard():
+    validate_shard(0, 1)
+    with pytest.raises(ValueError):
+        validate_shard(0, 0)
+    with pytest.raises(ValueError):
+        validate_shard(2, 2)
+
+
+def summary(index: int, count: int, credentials: list, requests: int, **fields) -> dict:
+    metrics = Metrics()
+    for _ in range(requests):
+        metrics.observe_request("POST /api/revocation/issuer", "200", 0.01)
+    return {
+        "stage": "int",
+        "shard_index": index,
+        "shard_count": count,
+        "shard_key": "bpn",
+        "reissued": sum(1 for credential in credentials if credential["error"] is None),
+        "failed": sum(1 for credential in credentials if credential["error"] is not None),
+        "credentials": credentials,
+        "remaining": [],
+        "listing_complete": True,
+        "skipped": [],
+        "completion": None,
+        "metrics": metrics.to_dict(),
+        **fields,
+    }
+
+
+def credential(credential_id: str, error: str | None = None) -> dict:
+    return {"credential_id": credential_id, "bpn": "BPNL000000000000", "type": "MEMBERSHIP", "error": error}
+
+
+def test_merge_adds_up_shard_counts():
+    summaries = [
+        summary(0, 3, [credential("a"), credential("b")], requests=2,
+                skipped=[{"credential_id": "s"}], remaining=[{"credential_id": "r", "expiry_date": "2025-01-02"}]),
+        summary(1, 3, [credential("c"), credential("d", error="boom")], requests=2),
+        summary(2, 3, [credential("e")], requests=1,
+                remaining=[{"credential_id": "q", "expiry_date": "2025-01-01"}]),
+    ]
+
+    report, problems = merge_summaries(summaries)
+
+    assert problems == []
+    assert report["shards"] == [0, 1, 2]
+    assert report["reissued"] == 4
+    assert report["failed"] == 1
+    assert [failed["credential_id"] for failed in report["failed_credentials"]] == ["d"]
+    assert report["skipped"] == 1
+    assert [remaining["credential_id"] for remaining in report["remaining_credentials"]] == ["q", "r"]
+    assert report["remaining"] == 2
+    revocations = report["metrics"]["requests"]["POST /api/revocation/issuer"]
+    assert revocations["status_codes"] == {"200": 5}
+    assert revocations["latency_seconds"]["count"] == 5
+
+
+def test_merge_reports_missing_shards_and_credentials_processed_twice():
+    summaries = [summary(0, 3, [credential("a")], requests=0), summary(1, 3, [credential("a")], requests=0)]
+
+    report, problems = merge_summaries(summaries)
+
+    assert "Missing summaries of shards [2]" in problems
+    assert "Credential a was processed by shards [0, 1]" in problems
+    assert report["problems"] == problems
@@ -0,0 +1,173 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+import threading
+
+import pytest
+
+import token_manager
+from token_manager import TokenManager, TokenMetrics
+
+ARGS = ("https://keycloak.example.org", "/auth/token", "client", "secret")
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(token_manager, "time", clock)
+    return clock
+
+
+def wait_for_refreshes():
+    for thread in threading.enumerate():
+        if thread.name.startswith("token-refresh-"):
+            thread.join(timeout=5)
+
+
+def test_concurrent_callers_share_one_token_request(clock):
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch(*args):
+        calls.append(args)
+        started.set()
+        release.wait(5)
+        return f"token-{len(calls)}", 300
+
+    manager = TokenManager(fetch)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(manager.get_token(*ARGS))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert tokens == ["token-1"] * 8
+    assert manager.metrics.misses == 1
+    assert manager.metrics.hits == 7
+
+
+def test_tokens_are_cached_per_auth_url_and_client(clock):
+    manager = TokenManager(lambda url, path, client_id, secret, is_user: (f"{url}:{client_id}", 300))
+
+    assert manager.get_token(*ARGS) == "https://keycloak.example.org:client"
+    assert manager.get_token("https://sap.example.org", "/oauth/token", "client", "secret") == \
+        "https://sap.example.org:client"
+    assert manager.get_token(*ARGS) == "https://keycloak.example.org:client"
+    assert len(manager) == 2
+    assert manager.metrics == TokenMetrics(hits=1, misses=2)
+
+
+def test_expiring_token_is_requested_again(clock):
+    tokens = iter(["first", "second"])
+    manager = TokenManager(lambda *args: (next(tokens), 300), expiry_buffer=15)
+    manager.get_token(*ARGS)
+
+    clock.now += 290
+
+    assert manager.get_token(*ARGS) == "second"
+    assert manager.metrics.misses == 2
+
+
+def test_token_is_refreshed_in_the_background_before_it_expires(clock):
+    tokens = iter(["first", "second"])
+    manager = TokenManager(lambda *args: (next(tokens), 300), refresh_margin=60)
+    manager.get_token(*ARGS)
+
+    clock.now += 250
+    assert manager.get_token(*ARGS) == "first"
+    wait_for_refreshes()
+
+    assert manager.get_token(*ARGS) == "second"
+    assert manager.metrics.refreshes == 1
+    assert manager.metrics.misses == 1
+
+
+def test_failed_background_refresh_is_counted_and_retried(clock):
+    responses = iter([("first", 300), RuntimeError("keycloak unavailable"), ("second", 300)])
+
+    def fetch(*args):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    manager = TokenManager(fetch, refresh_margin=60)
+    manager.get_token(*ARGS)
+    clock.now += 250
+
+    assert manager.get_token(*ARGS) == "first"
+    wait_for_refreshes()
+    assert manager.metrics.refresh_failures == 1
+
+    assert manager.get_token(*ARGS) == "first"
+    wait_for_refreshes()
+    assert manager.get_token(*ARGS) == "second"
+    assert manager.metrics.refreshes == 1
+
+
+def test_short_lived_tokens_are_refreshed_after_half_their_lifetime(clock):
+    manager = TokenManager(lambda *args: ("token", 20), expiry_buffer=0, refresh_margin=60)
+    manager.get_token(*ARGS)
+
+    entry = next(iter(manager._entries.values()))
+
+    assert entry.refresh_at == clock.now + 10
+
+
+def test_failed_token_request_is_raised_and_not_cached(clock):
+    responses = iter([RuntimeError("401 Unauthorized"), ("token", 300)])
+
+    def fetch(*args):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    manager = TokenManager(fetch)
+
+    with pytest.raises(RuntimeError, match="401"):
+        manager.get_token(*ARGS)
+    assert manager.get_token(*ARGS) == "token"
+
+
+def test_clear_drops_every_token(clock):
+    manager = TokenManager(lambda *args: ("token", 300))
+    manager.get_token(*ARGS)
+
+    manager.clear()
+
+    assert len(manager) == 0
+
+
+def test_token_metrics_format():
+    assert str(TokenMetrics(1, 2, 3, 4)) == "hits=1, misses=2, refreshes=3, refresh_failures=4"
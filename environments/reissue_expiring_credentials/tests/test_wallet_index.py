@@ -0,0 +1,117 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+from wallet_index import WalletIndex
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wallet(customer_name: str, operation_id: str) -> dict:
+    return {"customer_name": customer_name, "operation_id": operation_id}
+
+
+class Wallets:
+    """Returns the current wallets and counts the downloads"""
+
+    def __init__(self, *wallets: dict):
+        self.wallets = list(wallets)
+        self.num_fetches = 0
+
+    def __call__(self) -> list:
+        self.num_fetches += 1
+        return list(self.wallets)
+
+
+def build(operations: list) -> dict:
+    return {operation["customer_name"]: operation["operation_id"] for operation in operations}
+
+
+def test_index_is_built_on_first_get_and_kept_until_refresh_interval():
+    clock = Clock()
+    wallets = Wallets(wallet("BPNL1", "op1"))
+    index = WalletIndex(wallets, build, refresh_interval=100, clock=clock)
+
+    built, changes = index.get()
+    assert built == {"BPNL1": "op1"}
+    assert (changes.added, changes.removed, changes.stale_operation_ids) == (1, 0, set())
+
+    clock.now += 99
+    assert index.get() == ({"BPNL1": "op1"}, None)
+    assert wallets.num_fetches == 1
+
+    clock.now += 1
+    assert index.get()[1] is not None
+    assert wallets.num_fetches == 2
+
+
+def test_unchanged_wallets_keep_the_index():
+    clock = Clock()
+    index = WalletIndex(Wallets(wallet("BPNL1", "op1")), build, refresh_interval=100, clock=clock)
+    built, _ = index.get()
+
+    clock.now += 100
+    refreshed, changes = index.get()
+    assert refreshed is built
+    assert not changes.changed
+    assert (index.num_refreshes, index.num_rebuilds) == (2, 1)
+
+
+def test_invalidate_refreshes_on_next_get():
+    clock = Clock()
+    wallets = Wallets(wallet("BPNL1", "op1"))
+    index = WalletIndex(wallets, build, refresh_interval=100, clock=clock)
+    index.get()
+
+    wallets.wallets.append(wallet("BPNL2", "op2"))
+    index.invalidate()
+    built, changes = index.get()
+    assert built == {"BPNL1": "op1", "BPNL2": "op2"}
+    assert (changes.added, changes.removed) == (1, 0)
+
+
+def test_replaced_operations_are_reported_stale():
+    wallets = Wallets(wallet("BPNL1", "op1"), wallet("BPNL2", "op2"), wallet("BPNL3", "op2"))
+    index = WalletIndex(wallets, build)
+    index.get()
+
+    wallets.wallets = [wallet("BPNL1", "op1-new"), wallet("BPNL3", "op2")]
+    index.invalidate()
+    built, changes = index.get()
+    assert built == {"BPNL1": "op1-new", "BPNL3": "op2"}
+    assert (changes.added, changes.removed) == (1, 2)
+    assert changes.stale_operation_ids == {"op1"}
+
+
+def test_index_is_none_without_wallets():
+    wallets = Wallets(wallet("BPNL1", "op1"))
+    index = WalletIndex(wallets, build)
+    index.get()
+
+    wallets.wallets = []
+    index.invalidate()
+    built, changes = index.get()
+    assert built is None
+    assert changes.stale_operation_ids == {"op1"}
@@ -0,0 +1,142 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+"""
+Thread-safe cache for OAuth access tokens.
+
+Tokens are cached per `auth_base_url:client_id`. Concurrent callers that miss the cache for the same key wait for a
+single token request instead of each requesting their own (single-flight). Tokens that are about to expire are
+refreshed in the background on access, so long runs don't stall on expired tokens.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from time import time
+from typing import Callable, Dict
+
+# Tokens are not handed out anymore if they expire within this many seconds
+DEFAULT_EXPIRY_BUFFER = 15
+# Tokens are refreshed in the background once they expire within this many seconds or half their lifetime
+DEFAULT_REFRESH_MARGIN = 60
+
+# Requests a token for (auth_base_url, auth_path, client_id, client_secret, is_user), returns (token, expires_in)
+TokenFetcher = Callable[[str, str, str, str, bool], tuple[str, float]]
+
+
+@dataclass
+class TokenEntry:
+    token: str
+    expiry: float
+    refresh_at: float
+    request_args: tuple[str, str, str, str, bool]
+
+
+@dataclass
+class TokenMetrics:
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+
+    def __str__(self) -> str:
+        return (f"hits={self.hits}, misses={self.misses}, refreshes={self.refreshes}, "
+                f"refresh_failures={self.refresh_failures}")
+
+
+class TokenManager:
+    def __init__(
+            self,
+            fetch_token: TokenFetcher,
+            expiry_buffer: float = DEFAULT_EXPIRY_BUFFER,
+            refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+    ):
+        self.fetch_token = fetch_token
+        self.expiry_buffer = expiry_buffer
+        self.refresh_margin = refresh_margin
+        self.metrics = TokenMetrics()
+        self._entries: Dict[str, TokenEntry] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key_lock(self, cache_key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(cache_key, threading.Lock())
+
+    def _count(self, metric: str):
+        with self._lock:
+            setattr(self.metrics, metric, getattr(self.metrics, metric) + 1)
+
+    def _request(self, cache_key: str, request_args: tuple[str, str, str, str, bool]) -> TokenEntry:
+        token, expires_in = self.fetch_token(*request_args)
+        now = time()
+        # Short-lived tokens are refreshed after half their lifetime at the latest
+        refresh_at = now + expires_in - min(self.refresh_margin, expires_in / 2)
+        entry = TokenEntry(token, now + expires_in, refresh_at, request_args)
+        self._entries[cache_key] = entry
+        logging.debug("Cached new token for %s", cache_key)
+        return entry
+
+    def _refresh_in_background(self, cache_key: str, entry: TokenEntry):
+        key_lock = self._key_lock(cache_key)
+        # Another thread is already requesting a token for this key
+        if not key_lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                if self._entries.get(cache_key) is entry:
+                    self._request(cache_key, entry.request_args)
+                    self._count("refreshes")
+            except Exception as e:
+                self._count("refresh_failures")
+                logging.warning("Failed to refresh token for %s in the background: %s", cache_key, e)
+            finally:
+                key_lock.release()
+
+        threading.Thread(target=refresh, name=f"token-refresh-{cache_key}", daemon=True).start()
+
+    def get_token(self, auth_base_url: str, auth_path: str, client_id: str, client_secret: str,
+                  is_user: bool = False) -> str:
+        cache_key = f"{auth_base_url}:{client_id}"
+
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry.expiry > time() + self.expiry_buffer:
+            self._count("hits")
+            if entry.refresh_at <= time():
+                self._refresh_in_background(cache_key, entry)
+            return entry.token
+
+        # Only one thread requests a new token, all others wait and use its result
+        with self._key_lock(cache_key):
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry.expiry > time() + self.expiry_buffer:
+                self._count("hits")
+                return entry.token
+            logging.debug("No valid cached token for %s", cache_key)
+            self._count("misses")
+            return self._request(cache_key, (auth_base_url, auth_path, client_id, client_secret, is_user)).token
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
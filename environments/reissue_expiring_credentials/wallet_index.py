@@ -0,0 +1,115 @@
+################################################################################
+# Copyright (c) 2025 Cofinity-X GmbH
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+################################################################################
+
+
+"""
+Customer wallet index kept between the cycles of the daemon.
+
+Every run downloads the customer wallets of SAP and indexes their operation IDs by the BPNs in the customer names.
+The daemon keeps the index and only downloads the wallets again once it is older than `refresh_interval` seconds,
+or on the next cycle after a credential had no matching wallet, e.g. of a company that was onboarded since.
+
+A refresh compares the wallets with the previous download. Unchanged wallets keep the index as it is. Otherwise the
+index is rebuilt and the operation IDs no longer referenced by any wallet are reported as stale, so only the cached
+client info and company DIDs of these operations are dropped while those of the other operations stay warm.
+"""
+
+import logging
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Generic, List, NamedTuple, Set, TypeVar
+
+DEFAULT_REFRESH_INTERVAL = 6 * 3600.0
+
+# Fields of the operation records of the reissue script
+KEY_CUSTOMER_NAME = "customer_name"
+KEY_OPERATION_ID = "operation_id"
+
+I = TypeVar("I")
+
+
+class WalletChanges(NamedTuple):
+    added: int
+    removed: int
+    # Operation IDs no longer referenced by any wallet
+    stale_operation_ids: Set[str]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class WalletIndex(Generic[I]):
+    def __init__(self, fetch: Callable[[], List[Dict]], build: Callable[[List[Dict]], I],
+                 refresh_interval: float = DEFAULT_REFRESH_INTERVAL, clock: Callable[[], float] = monotonic):
+        self.fetch = fetch
+        self.build = build
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self.operations: List[Dict] = []
+        self.index: I | None = None
+        self.refreshed_at: float | None = None
+        self.num_refreshes = 0
+        self.num_rebuilds = 0
+        self._stale = True
+        self._lock = Lock()
+
+    def invalidate(self):
+        """Downloads the wallets again on the next `get`, e.g. because a BPN had no wallet"""
+        self._stale = True
+
+    def is_due(self) -> bool:
+        return (self._stale or self.refreshed_at is None
+                or self.clock() - self.refreshed_at >= self.refresh_interval)
+
+    def get(self) -> tuple[I | None, WalletChanges | None]:
+        """
+        Returns the index, refreshed first if it is due, and the changes of the refresh, `None` without refresh.
+        The index is `None` while there are no wallets.
+        """
+        with self._lock:
+            if not self.is_due():
+                return self.index, None
+            changes = self._refresh()
+            return self.index, changes
+
+    def _refresh(self) -> WalletChanges:
+        operations = self.fetch()
+        self.refreshed_at = self.clock()
+        self._stale = False
+        self.num_refreshes += 1
+        if operations == self.operations and self.index is not None:
+            logging.info("Customer wallets are unchanged since the last refresh")
+            return WalletChanges(0, 0, set())
+
+        previous = {(operation[KEY_CUSTOMER_NAME], operation[KEY_OPERATION_ID]) for operation in self.operations}
+        current = {(operation[KEY_CUSTOMER_NAME], operation[KEY_OPERATION_ID]) for operation in operations}
+        current_operation_ids = {operation_id for _, operation_id in current}
+        changes = WalletChanges(
+            len(current - previous),
+            len(previous - current),
+            {operation_id for _, operation_id in previous if operation_id not in current_operation_ids},
+        )
+        self.operations = operations
+        self.index = self.build(operations) if operations else None
+        self.num_rebuilds += 1
+        logging.info("Refreshed the index of %s customer wallets: %s added, %s removed, %s stale operations",
+                     len(operations), changes.added, changes.removed, len(changes.stale_operation_ids))
+        return changes
@@ -0,0 +1,40 @@
+/********************************************************************************
+ * Copyright (c) 2024 Contributors to the Eclipse Foundation
+ *
+ * See the NOTICE file(s) distributed with this work for additional
+ * information regarding copyright ownership.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ ********************************************************************************/
+
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Entities.Enums;
+
+namespace Org.Eclipse.TractusX.SsiCredentialIssuer.DBAccess.Models;
+
+/// <summary>
+/// Projection of a credential for listings that only need its identity, creation, expiry and whether it was signed
+/// </summary>
+/// <param name="CredentialDetailId">Id of the credential</param>
+/// <param name="Bpnl">Bpnl of the holder</param>
+/// <param name="CredentialType">Type of the credential</param>
+/// <param name="ExpiryDate">Expiry date of the credential</param>
+/// <param name="DateCreated">Date the credential was requested</param>
+/// <param name="Signed"><c>true</c> if the process step CREATE_SIGNED_CREDENTIAL is done</param>
+public record CompactCredentialData(
+    Guid CredentialDetailId,
+    string Bpnl,
+    VerifiedCredentialTypeId CredentialType,
+    DateTimeOffset ExpiryDate,
+    DateTimeOffset DateCreated,
+    bool Signed
+);
@@ -35,4 +35,14 @@ public enum CompanySsiDetailSorting
     /// Descending by bpnl
     /// </summary>
     BpnlDesc = 2,
+
+    /// <summary>
+    /// Ascending by expiry date
+    /// </summary>
+    ExpiryDateAsc = 3,
+
+    /// <summary>
+    /// Descending by expiry date
+    /// </summary>
+    ExpiryDateDesc = 4,
 }
@@ -166,7 +166,7 @@ public class CompanySsiDetailsRepository(IssuerDbContext context)
             .SingleOrDefaultAsync();
 
     /// <inheritdoc />
-    public Func<int, int, Task<Pagination.Source<CredentialDetailData>?>> GetAllCredentialDetails(CompanySsiDetailSorting? sorting, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType) =>
+    public Func<int, int, Task<Pagination.Source<CredentialDetailData>?>> GetAllCredentialDetails(CompanySsiDetailSorting? sorting, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo) =>
         (skip, take) => Pagination.CreateSourceQueryAsync(
             skip,
             take,
@@ -176,11 +176,17 @@ public class CompanySsiDetailsRepository(IssuerDbContext context)
                     (!credentialTypeId.HasValue || c.VerifiedCredentialTypeId == credentialTypeId) &&
                     (!approvalType.HasValue ||
                      (approvalType.Value == CompanySsiDetailApprovalType.Automatic && c.VerifiedCredentialType!.VerifiedCredentialTypeAssignedKind!.VerifiedCredentialTypeKindId == VerifiedCredentialTypeKindId.FRAMEWORK) ||
-                     (approvalType.Value == CompanySsiDetailApprovalType.Manual && c.VerifiedCredentialType!.VerifiedCredentialTypeAssignedKind!.VerifiedCredentialTypeKindId != VerifiedCredentialTypeKindId.FRAMEWORK)))
+                     (approvalType.Value == CompanySsiDetailApprovalType.Manual && c.VerifiedCredentialType!.VerifiedCredentialTypeAssignedKind!.VerifiedCredentialTypeKindId != VerifiedCredentialTypeKindId.FRAMEWORK)) &&
+                    (!expiryDateFrom.HasValue || c.ExpiryDate >= expiryDateFrom.Value) &&
+                    (!expiryDateTo.HasValue || c.ExpiryDate <= expiryDateTo.Value))
                 .GroupBy(x => x.IssuerBpn),
-            credentials => sorting == null || sorting == CompanySsiDetailSorting.BpnlAsc ?
-                credentials.OrderBy(c => c.Bpnl) :
-                credentials.OrderByDescending(c => c.Bpnl),
+            credentials => sorting switch
+            {
+                CompanySsiDetailSorting.BpnlDesc => credentials.OrderByDescending(c => c.Bpnl),
+                CompanySsiDetailSorting.ExpiryDateAsc => credentials.OrderBy(c => c.ExpiryDate).ThenBy(c => c.Id),
+                CompanySsiDetailSorting.ExpiryDateDesc => credentials.OrderByDescending(c => c.ExpiryDate).ThenBy(c => c.Id),
+                _ => credentials.OrderBy(c => c.Bpnl)
+            },
             credential => new CredentialDetailData(
                 credential.Id,
                 credential.Bpnl,
@@ -207,6 +213,54 @@ public class CompanySsiDetailsRepository(IssuerDbContext context)
                             ps.ProcessStepTypeId)))
         ).SingleOrDefaultAsync();
 
+    /// <inheritdoc />
+    public IAsyncEnumerable<CompactCredentialData> GetCompactCredentialDetails(CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo, (DateTimeOffset ExpiryDate, Guid Id)? after, int take)
+    {
+        var afterExpiryDate = after?.ExpiryDate;
+        var afterId = after?.Id ?? Guid.Empty;
+        return context.CompanySsiDetails.AsNoTracking()
+            .Where(c =>
+                c.ExpiryDate != null &&
+                (!companySsiDetailStatusId.HasValue || c.CompanySsiDetailStatusId == companySsiDetailStatusId.Value) &&
+                (!credentialTypeId.HasValue || c.VerifiedCredentialTypeId == credentialTypeId) &&
+                (!expiryDateFrom.HasValue || c.ExpiryDate >= expiryDateFrom.Value) &&
+                (!expiryDateTo.HasValue || c.ExpiryDate <= expiryDateTo.Value) &&
+                (afterExpiryDate == null || c.ExpiryDate > afterExpiryDate || (c.ExpiryDate == afterExpiryDate && c.Id.CompareTo(afterId) > 0)))
+            .OrderBy(c => c.ExpiryDate)
+            .ThenBy(c => c.Id)
+            .Take(take)
+            .Select(c => new CompactCredentialData(
+                c.Id,
+                c.Bpnl,
+                c.VerifiedCredentialTypeId,
+                c.ExpiryDate!.Value,
+                c.DateCreated,
+                c.Process != null && c.Process.ProcessSteps.Any(ps =>
+                    ps.ProcessStepTypeId == ProcessStepTypeId.CREATE_SIGNED_CREDENTIAL &&
+                    ps.ProcessStepStatusId == ProcessStepStatusId.DONE)))
+            .ToAsyncEnumerable();
+    }
+
+    /// <inheritdoc />
+    public IAsyncEnumerable<CredentialStatusData> GetCredentialStatus(IEnumerable<Guid> credentialIds) =>
+        context.CompanySsiDetails.AsNoTracking()
+            .Where(c => credentialIds.Contains(c.Id))
+            .Select(c => new
+            {
+                c.Id,
+                c.CompanySsiDetailStatusId,
+                Signed = c.Process != null && c.Process.ProcessSteps.Any(ps =>
+                    ps.ProcessStepTypeId == ProcessStepTypeId.CREATE_SIGNED_CREDENTIAL &&
+                    ps.ProcessStepStatusId == ProcessStepStatusId.DONE),
+                Failed = c.Process != null && c.Process.ProcessSteps.Any(ps => ps.ProcessStepStatusId == ProcessStepStatusId.FAILED)
+            })
+            .Select(x => new CredentialStatusData(
+                x.Id,
+                x.CompanySsiDetailStatusId,
+                x.Signed,
+                x.Failed && !x.Signed))
+            .ToAsyncEnumerable();
+
     /// <inheritdoc />
     public IAsyncEnumerable<OwnedVerifiedCredentialData> GetOwnCredentialDetails(string bpnl) =>
         context.CompanySsiDetails.AsNoTracking()
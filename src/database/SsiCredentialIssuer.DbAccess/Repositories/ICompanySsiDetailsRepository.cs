@@ -89,8 +89,30 @@ public interface ICompanySsiDetailsRepository
     /// <param name="companySsiDetailStatusId">The status of the details</param>
     /// <param name="credentialTypeId">OPTIONAL: The type of the credential that should be returned</param>
     /// <param name="approvalType">OPTIONAL: The approval type of the credential</param>
+    /// <param name="expiryDateFrom">OPTIONAL: Only return credentials expiring on or after this date</param>
+    /// <param name="expiryDateTo">OPTIONAL: Only return credentials expiring on or before this date</param>
     /// <returns>Returns data to create the pagination</returns>
-    Func<int, int, Task<Pagination.Source<CredentialDetailData>?>> GetAllCredentialDetails(CompanySsiDetailSorting? sorting, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType);
+    Func<int, int, Task<Pagination.Source<CredentialDetailData>?>> GetAllCredentialDetails(CompanySsiDetailSorting? sorting, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo);
+
+    /// <summary>
+    /// Gets a page of the credentials with an expiry date, ordered by expiry date and id.
+    /// The page starts after the given position, so no earlier rows are scanned or counted.
+    /// </summary>
+    /// <param name="companySsiDetailStatusId">OPTIONAL: The status of the details</param>
+    /// <param name="credentialTypeId">OPTIONAL: The type of the credential that should be returned</param>
+    /// <param name="expiryDateFrom">OPTIONAL: Only return credentials expiring on or after this date</param>
+    /// <param name="expiryDateTo">OPTIONAL: Only return credentials expiring on or before this date</param>
+    /// <param name="after">OPTIONAL: Expiry date and id of the last credential of the previous page</param>
+    /// <param name="take">The maximum number of credentials returned</param>
+    /// <returns>Returns the compact data of the credentials</returns>
+    IAsyncEnumerable<CompactCredentialData> GetCompactCredentialDetails(CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo, (DateTimeOffset ExpiryDate, Guid Id)? after, int take);
+
+    /// <summary>
+    /// Gets the creation progress of the given credentials, unknown ids are omitted
+    /// </summary>
+    /// <param name="credentialIds">Ids of the credentials</param>
+    /// <returns>Returns the status data of the credentials</returns>
+    IAsyncEnumerable<CredentialStatusData> GetCredentialStatus(IEnumerable<Guid> credentialIds);
 
     /// <summary>
     /// Gets all credentials for a specific bpn
@@ -105,6 +105,9 @@ public class IssuerDbContext(DbContextOptions<IssuerDbContext> options, IAuditHa
                         j.HasKey(e => new { e.DocumentId, e.CompanySsiDetailId });
                     });
 
+            // Supports the keyset pagination of the credentials by status and expiry date
+            entity.HasIndex(e => new { e.CompanySsiDetailStatusId, e.ExpiryDate, e.Id });
+
             entity.HasAuditV2Triggers<CompanySsiDetail, AuditCompanySsiDetail20240419>();
         });
 
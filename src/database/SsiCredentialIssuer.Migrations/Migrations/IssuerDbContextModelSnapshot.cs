@@ -638,6 +638,9 @@ namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Migrations.Migrations
                     b.HasIndex("CompanySsiDetailStatusId")
                         .HasDatabaseName("ix_company_ssi_details_company_ssi_detail_status_id");
 
+                    b.HasIndex("CompanySsiDetailStatusId", "ExpiryDate", "Id")
+                        .HasDatabaseName("ix_company_ssi_details_company_ssi_detail_status_id_expiry_dat");
+
                     b.HasIndex("ExpiryCheckTypeId")
                         .HasDatabaseName("ix_company_ssi_details_expiry_check_type_id");
 
@@ -0,0 +1,63 @@
+/********************************************************************************
+ * Copyright (c) 2024 Contributors to the Eclipse Foundation
+ *
+ * See the NOTICE file(s) distributed with this work for additional
+ * information regarding copyright ownership.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ ********************************************************************************/
+
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+using System.Diagnostics;
+
+namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
+
+public static class BulkExecution
+{
+    public const string DurationExceededError = "BULK_DURATION_EXCEEDED";
+
+    /// <summary>
+    /// Executes the items of a bulk request one after another. A failing item is reported in its result
+    /// and does not stop the remaining items.
+    /// </summary>
+    /// <remarks>
+    /// The items share one scope, so <paramref name="execute"/> must not modify any entity before it can fail.
+    /// With a <paramref name="maxDuration"/>, items are only started until it has elapsed, the remaining items are
+    /// reported as failed without being executed, so the client can retry them.
+    /// </remarks>
+    public static async Task<IEnumerable<BulkItemResult>> ExecuteEach<T>(IEnumerable<T> items, Func<T, Task<Guid>> execute, CancellationToken cancellationToken, TimeSpan? maxDuration = null)
+    {
+        var results = new List<BulkItemResult>();
+        var stopwatch = Stopwatch.StartNew();
+        foreach (var (item, index) in items.Select((item, index) => (item, index)))
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+            if (maxDuration.HasValue && stopwatch.Elapsed >= maxDuration.Value)
+            {
+                results.Add(new BulkItemResult(index, null, new BulkItemError(DurationExceededError, $"The item was not started within the maximum duration of {maxDuration.Value.TotalSeconds} seconds of the bulk request")));
+                continue;
+            }
+
+            try
+            {
+                results.Add(new BulkItemResult(index, await execute(item).ConfigureAwait(ConfigureAwaitOptions.None), null));
+            }
+            catch (Exception ex) when (ex is not OperationCanceledException)
+            {
+                results.Add(new BulkItemResult(index, null, new BulkItemError(ex.GetType().Name, ex.Message)));
+            }
+        }
+
+        return results;
+    }
+}
@@ -0,0 +1,61 @@
+/********************************************************************************
+ * Copyright (c) 2024 Contributors to the Eclipse Foundation
+ *
+ * See the NOTICE file(s) distributed with this work for additional
+ * information regarding copyright ownership.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ ********************************************************************************/
+
+using Microsoft.AspNetCore.WebUtilities;
+using System.Globalization;
+using System.Text;
+
+namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
+
+/// <summary>
+/// Opaque cursor of the keyset paginated credential listing, holding the expiry date and id of the last credential of a page
+/// </summary>
+public static class CredentialCursor
+{
+    private const char Separator = '_';
+
+    public static string Encode(DateTimeOffset expiryDate, Guid id) =>
+        WebEncoders.Base64UrlEncode(Encoding.UTF8.GetBytes(string.Create(CultureInfo.InvariantCulture, $"{expiryDate.UtcTicks}{Separator}{id:N}")));
+
+    public static bool TryDecode(string cursor, out (DateTimeOffset ExpiryDate, Guid Id) position)
+    {
+        position = default;
+        string decoded;
+        try
+        {
+            decoded = Encoding.UTF8.GetString(WebEncoders.Base64UrlDecode(cursor));
+        }
+        catch (FormatException)
+        {
+            return false;
+        }
+
+        var parts = decoded.Split(Separator);
+        if (parts.Length != 2 ||
+            !long.TryParse(parts[0], NumberStyles.None, CultureInfo.InvariantCulture, out var ticks) ||
+            ticks < DateTimeOffset.MinValue.UtcTicks || ticks > DateTimeOffset.MaxValue.UtcTicks ||
+            !Guid.TryParseExact(parts[1], "N", out var id))
+        {
+            return false;
+        }
+
+        position = (new DateTimeOffset(ticks, TimeSpan.Zero), id);
+        return true;
+    }
+}
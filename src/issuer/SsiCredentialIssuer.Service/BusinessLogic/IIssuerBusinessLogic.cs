@@ -30,7 +30,10 @@ public interface IIssuerBusinessLogic
 
     IAsyncEnumerable<CertificateParticipationData> GetSsiCertificatesAsync();
 
-    Task<Pagination.Response<CredentialDetailData>> GetCredentials(int page, int size, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType, CompanySsiDetailSorting? sorting);
+    Task<Pagination.Response<CredentialDetailData>> GetCredentials(int page, int size, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType, CompanySsiDetailSorting? sorting, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo);
+
+    Task<CompactCredentialPage> GetCompactCredentials(string? cursor, int size, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo);
+    Task<IEnumerable<CredentialStatusData>> GetCredentialStatus(IEnumerable<Guid> credentialIds);
     IAsyncEnumerable<OwnedVerifiedCredentialData> GetCredentialsForBpn();
 
     Task ApproveCredential(Guid credentialId, CancellationToken cancellationToken);
@@ -41,5 +44,6 @@ public interface IIssuerBusinessLogic
     Task<Guid> CreateBpnCredential(CreateBpnCredentialRequest requestData, CancellationToken cancellationToken);
     Task<Guid> CreateMembershipCredential(CreateMembershipCredentialRequest requestData, CancellationToken cancellationToken);
     Task<Guid> CreateFrameworkCredential(CreateFrameworkCredentialRequest requestData, CancellationToken cancellationToken);
+    Task<BulkCredentialResponse> CreateCredentials(BulkCredentialRequest requestData, CancellationToken cancellationToken);
     Task RetriggerProcessStep(Guid processId, ProcessStepTypeId processStepTypeId, CancellationToken cancellationToken);
 }
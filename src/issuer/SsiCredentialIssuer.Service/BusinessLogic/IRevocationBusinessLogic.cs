@@ -17,9 +17,13 @@
  * SPDX-License-Identifier: Apache-2.0
  ********************************************************************************/
 
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+
 namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
 
 public interface IRevocationBusinessLogic
 {
     Task RevokeCredential(Guid credentialId, bool revokeForIssuer, CancellationToken cancellationToken);
+
+    Task<IEnumerable<BulkItemResult>> RevokeCredentials(IEnumerable<Guid> credentialIds, CancellationToken cancellationToken);
 }
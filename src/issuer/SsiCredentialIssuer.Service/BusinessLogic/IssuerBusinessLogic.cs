@@ -39,11 +39,13 @@ using Org.Eclipse.TractusX.SsiCredentialIssuer.Portal.Service.Services;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.ErrorHandling;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Identity;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+using System.Diagnostics;
 using System.Globalization;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
 using System.Text.RegularExpressions;
+using Constants = Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models.Constants;
 using ErrorParameter = Org.Eclipse.TractusX.Portal.Backend.Framework.ErrorHandling.ErrorParameter;
 
 namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
@@ -111,7 +113,7 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
             .GetSsiCertificates(_identity.Bpnl, _dateTimeProvider.OffsetNow);
 
     /// <inheritdoc />
-    public Task<Pagination.Response<CredentialDetailData>> GetCredentials(int page, int size, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType, CompanySsiDetailSorting? sorting) =>
+    public Task<Pagination.Response<CredentialDetailData>> GetCredentials(int page, int size, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, CompanySsiDetailApprovalType? approvalType, CompanySsiDetailSorting? sorting, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo) =>
         Pagination.CreateResponseAsync(
         page,
         size,
@@ -120,7 +122,56 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
             sorting,
             companySsiDetailStatusId,
             credentialTypeId,
-            approvalType));
+            approvalType,
+            expiryDateFrom?.ToUniversalTime(),
+            expiryDateTo?.ToUniversalTime()));
+
+    /// <inheritdoc />
+    public async Task<CompactCredentialPage> GetCompactCredentials(string? cursor, int size, CompanySsiDetailStatusId? companySsiDetailStatusId, VerifiedCredentialTypeId? credentialTypeId, DateTimeOffset? expiryDateFrom, DateTimeOffset? expiryDateTo)
+    {
+        if (size <= 0 || size > _settings.MaxCompactPageSize)
+        {
+            throw ControllerArgumentException.Create(IssuerErrors.INVALID_PAGE_SIZE, new ErrorParameter[] { new("maxPageSize", _settings.MaxCompactPageSize.ToString()), new("size", size.ToString()) });
+        }
+
+        (DateTimeOffset ExpiryDate, Guid Id)? after = null;
+        if (cursor != null)
+        {
+            if (!CredentialCursor.TryDecode(cursor, out var position))
+            {
+                throw ControllerArgumentException.Create(IssuerErrors.INVALID_CURSOR, new ErrorParameter[] { new("cursor", cursor) });
+            }
+
+            after = position;
+        }
+
+        // One more credential than requested tells whether there is a next page without counting them
+        var credentials = await _repositories.GetInstance<ICompanySsiDetailsRepository>()
+            .GetCompactCredentialDetails(companySsiDetailStatusId, credentialTypeId, expiryDateFrom?.ToUniversalTime(), expiryDateTo?.ToUniversalTime(), after, size + 1)
+            .ToListAsync()
+            .ConfigureAwait(false);
+        if (credentials.Count <= size)
+        {
+            return new CompactCredentialPage(credentials, null);
+        }
+
+        var last = credentials[size - 1];
+        return new CompactCredentialPage(credentials.Take(size), CredentialCursor.Encode(last.ExpiryDate, last.CredentialDetailId));
+    }
+
+    public async Task<IEnumerable<CredentialStatusData>> GetCredentialStatus(IEnumerable<Guid> credentialIds)
+    {
+        var ids = credentialIds.Distinct().ToList();
+        if (ids.Count == 0 || ids.Count > _settings.MaxCompactPageSize)
+        {
+            throw ControllerArgumentException.Create(IssuerErrors.INVALID_BULK_SIZE, new ErrorParameter[] { new("maxItems", _settings.MaxCompactPageSize.ToString()), new("count", ids.Count.ToString()) });
+        }
+
+        return await _repositories.GetInstance<ICompanySsiDetailsRepository>()
+            .GetCredentialStatus(ids)
+            .ToListAsync()
+            .ConfigureAwait(false);
+    }
 
     public IAsyncEnumerable<OwnedVerifiedCredentialData> GetCredentialsForBpn() =>
         _repositories
@@ -321,6 +372,62 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
         _repositories.GetInstance<ICompanySsiDetailsRepository>().GetCertificateTypes(_identity.Bpnl);
 
     public async Task<Guid> CreateBpnCredential(CreateBpnCredentialRequest requestData, CancellationToken cancellationToken)
+    {
+        var ssiDetailId = await PrepareBpnCredential(requestData, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None);
+        await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+        return ssiDetailId;
+    }
+
+    public async Task<Guid> CreateMembershipCredential(CreateMembershipCredentialRequest requestData, CancellationToken cancellationToken)
+    {
+        var ssiDetailId = await PrepareMembershipCredential(requestData, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None);
+        await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+        return ssiDetailId;
+    }
+
+    public async Task<Guid> CreateFrameworkCredential(CreateFrameworkCredentialRequest requestData, CancellationToken cancellationToken)
+    {
+        var ssiDetailId = await PrepareFrameworkCredential(requestData, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None);
+        await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+        return ssiDetailId;
+    }
+
+    public async Task<BulkCredentialResponse> CreateCredentials(BulkCredentialRequest requestData, CancellationToken cancellationToken)
+    {
+        var bpnCredentials = (requestData.BpnCredentials ?? Enumerable.Empty<CreateBpnCredentialRequest>()).ToList();
+        var membershipCredentials = (requestData.MembershipCredentials ?? Enumerable.Empty<CreateMembershipCredentialRequest>()).ToList();
+        var frameworkCredentials = (requestData.FrameworkCredentials ?? Enumerable.Empty<CreateFrameworkCredentialRequest>()).ToList();
+        var count = bpnCredentials.Count + membershipCredentials.Count + frameworkCredentials.Count;
+        if (count == 0 || count > Constants.MaxBulkItems)
+        {
+            throw ControllerArgumentException.Create(IssuerErrors.INVALID_BULK_SIZE, new ErrorParameter[] { new("maxItems", Constants.MaxBulkItems.ToString()), new("count", count.ToString()) });
+        }
+
+        // Every item is saved on its own, so an item is only reported as created once it is saved and a failing save
+        // does not fail the other items. The maximum bulk duration applies to the request as a whole.
+        var stopwatch = Stopwatch.StartNew();
+        return new BulkCredentialResponse(
+            await BulkExecution.ExecuteEach(bpnCredentials, request => CreateBulkItem(() => PrepareBpnCredential(request, cancellationToken)), cancellationToken, Constants.MaxBulkDuration - stopwatch.Elapsed).ConfigureAwait(ConfigureAwaitOptions.None),
+            await BulkExecution.ExecuteEach(membershipCredentials, request => CreateBulkItem(() => PrepareMembershipCredential(request, cancellationToken)), cancellationToken, Constants.MaxBulkDuration - stopwatch.Elapsed).ConfigureAwait(ConfigureAwaitOptions.None),
+            await BulkExecution.ExecuteEach(frameworkCredentials, request => CreateBulkItem(() => PrepareFrameworkCredential(request, cancellationToken)), cancellationToken, Constants.MaxBulkDuration - stopwatch.Elapsed).ConfigureAwait(ConfigureAwaitOptions.None));
+    }
+
+    private async Task<Guid> CreateBulkItem(Func<Task<Guid>> prepare)
+    {
+        try
+        {
+            var ssiDetailId = await prepare().ConfigureAwait(ConfigureAwaitOptions.None);
+            await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+            return ssiDetailId;
+        }
+        finally
+        {
+            // Changes of a failed item must not be saved with the next one
+            _repositories.Clear();
+        }
+    }
+
+    private async Task<Guid> PrepareBpnCredential(CreateBpnCredentialRequest requestData, CancellationToken cancellationToken)
     {
         var companyCredentialDetailsRepository = _repositories.GetInstance<ICompanySsiDetailsRepository>();
         var holderDid = await GetHolderInformation(requestData.Holder, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None);
@@ -344,10 +451,10 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
                 _settings.StatusListType)
         );
         var schema = JsonSerializer.Serialize(schemaData, Options);
-        return await HandleCredentialProcessCreation(requestData.BusinessPartnerNumber, VerifiedCredentialTypeKindId.BPN, VerifiedCredentialTypeId.BUSINESS_PARTNER_NUMBER, expiryDate, schema, requestData.TechnicalUserDetails, null, requestData.CallbackUrl, companyCredentialDetailsRepository);
+        return HandleCredentialProcessCreation(requestData.BusinessPartnerNumber, VerifiedCredentialTypeKindId.BPN, VerifiedCredentialTypeId.BUSINESS_PARTNER_NUMBER, expiryDate, schema, requestData.TechnicalUserDetails, null, requestData.CallbackUrl, companyCredentialDetailsRepository);
     }
 
-    public async Task<Guid> CreateMembershipCredential(CreateMembershipCredentialRequest requestData, CancellationToken cancellationToken)
+    private async Task<Guid> PrepareMembershipCredential(CreateMembershipCredentialRequest requestData, CancellationToken cancellationToken)
     {
         var companyCredentialDetailsRepository = _repositories.GetInstance<ICompanySsiDetailsRepository>();
 
@@ -372,10 +479,10 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
                 _settings.StatusListType)
         );
         var schema = JsonSerializer.Serialize(schemaData, Options);
-        return await HandleCredentialProcessCreation(requestData.HolderBpn, VerifiedCredentialTypeKindId.MEMBERSHIP, VerifiedCredentialTypeId.MEMBERSHIP, expiryDate, schema, requestData.TechnicalUserDetails, null, requestData.CallbackUrl, companyCredentialDetailsRepository);
+        return HandleCredentialProcessCreation(requestData.HolderBpn, VerifiedCredentialTypeKindId.MEMBERSHIP, VerifiedCredentialTypeId.MEMBERSHIP, expiryDate, schema, requestData.TechnicalUserDetails, null, requestData.CallbackUrl, companyCredentialDetailsRepository);
     }
 
-    public async Task<Guid> CreateFrameworkCredential(CreateFrameworkCredentialRequest requestData, CancellationToken cancellationToken)
+    private async Task<Guid> PrepareFrameworkCredential(CreateFrameworkCredentialRequest requestData, CancellationToken cancellationToken)
     {
         if (_identity.IsServiceAccount || _identity.CompanyUserId == null)
         {
@@ -441,7 +548,7 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
                 _settings.StatusListType)
         );
         var schema = JsonSerializer.Serialize(schemaData, Options);
-        return await HandleCredentialProcessCreation(requestData.HolderBpn, VerifiedCredentialTypeKindId.FRAMEWORK, requestData.UseCaseFrameworkId, result.Expiry, schema, requestData.TechnicalUserDetails, requestData.UseCaseFrameworkVersionId, requestData.CallbackUrl, companyCredentialDetailsRepository);
+        return HandleCredentialProcessCreation(requestData.HolderBpn, VerifiedCredentialTypeKindId.FRAMEWORK, requestData.UseCaseFrameworkId, result.Expiry, schema, requestData.TechnicalUserDetails, requestData.UseCaseFrameworkVersionId, requestData.CallbackUrl, companyCredentialDetailsRepository);
     }
 
     public Task RetriggerProcessStep(Guid processId, ProcessStepTypeId processStepTypeId, CancellationToken cancellationToken) =>
@@ -466,7 +573,7 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
         return did.Id;
     }
 
-    private async Task<Guid> HandleCredentialProcessCreation(
+    private Guid HandleCredentialProcessCreation(
         string bpnl,
         VerifiedCredentialTypeKindId kindId,
         VerifiedCredentialTypeId typeId,
@@ -477,6 +584,10 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
         string? callbackUrl,
         ICompanySsiDetailsRepository companyCredentialDetailsRepository)
     {
+        // Encrypt before any entity is created, so a failure leaves no partial credential behind in a bulk request
+        var encryptedSecret = technicalUserDetails == null
+            ? default
+            : _settings.EncryptionConfigs.GetCryptoHelper(_settings.EncryptionConfigIndex).Encrypt(technicalUserDetails.ClientSecret);
         var documentContent = Encoding.UTF8.GetBytes(schema);
         var hash = SHA512.HashData(documentContent);
         var documentRepository = _repositories.GetInstance<IDocumentRepository>();
@@ -517,8 +628,7 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
                     return;
                 }
 
-                var cryptoHelper = _settings.EncryptionConfigs.GetCryptoHelper(_settings.EncryptionConfigIndex);
-                var (secret, initializationVector) = cryptoHelper.Encrypt(technicalUserDetails.ClientSecret);
+                var (secret, initializationVector) = encryptedSecret;
 
                 c.ClientId = technicalUserDetails.ClientId;
                 c.ClientSecret = secret;
@@ -528,7 +638,6 @@ public class IssuerBusinessLogic : IIssuerBusinessLogic
                 c.CallbackUrl = callbackUrl;
             });
 
-        await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
         return ssiDetailId;
     }
 }
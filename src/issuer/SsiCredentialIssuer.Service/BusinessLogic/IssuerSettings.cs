@@ -36,6 +36,11 @@ public class IssuerSettings
     /// </summary>
     public int MaxPageSize { get; set; }
 
+    /// <summary>
+    /// The maximum amount of elements for a page of the compact credential listing
+    /// </summary>
+    public int MaxCompactPageSize { get; set; }
+
     [Required]
     public IEnumerable<EncryptionModeConfig> EncryptionConfigs { get; set; } = null!;
 
@@ -24,6 +24,8 @@ using Org.Eclipse.TractusX.SsiCredentialIssuer.Entities.Entities;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Entities.Enums;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.ErrorHandling;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Identity;
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+using Constants = Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models.Constants;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Wallet.Service.Services;
 
 namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
@@ -42,6 +44,48 @@ public class RevocationBusinessLogic : IRevocationBusinessLogic
     }
 
     public async Task RevokeCredential(Guid credentialId, bool revokeForIssuer, CancellationToken cancellationToken)
+    {
+        if (await PrepareRevocation(credentialId, revokeForIssuer, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None))
+        {
+            await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+        }
+    }
+
+    public async Task<IEnumerable<BulkItemResult>> RevokeCredentials(IEnumerable<Guid> credentialIds, CancellationToken cancellationToken)
+    {
+        var ids = credentialIds.ToList();
+        if (ids.Count == 0 || ids.Count > Constants.MaxBulkItems)
+        {
+            throw ControllerArgumentException.Create(RevocationDataErrors.INVALID_BULK_SIZE, new ErrorParameter[] { new("maxItems", Constants.MaxBulkItems.ToString()), new("count", ids.Count.ToString()) });
+        }
+
+        // Every item is saved right after its revocation in the wallet, so an item is only reported as revoked once it
+        // is saved and a failing save does not leave revoked credentials of other items active. Items are only started
+        // within the maximum bulk duration, so the client does not time out while credentials are still being revoked.
+        return await BulkExecution.ExecuteEach(ids, async credentialId =>
+            {
+                try
+                {
+                    if (await PrepareRevocation(credentialId, true, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None))
+                    {
+                        await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+                    }
+                }
+                finally
+                {
+                    // Changes of a failed item must not be saved with the next one
+                    _repositories.Clear();
+                }
+
+                return credentialId;
+            }, cancellationToken, Constants.MaxBulkDuration).ConfigureAwait(ConfigureAwaitOptions.None);
+    }
+
+    /// <summary>
+    /// Revokes the credential in the wallet and marks it as revoked, without saving the changes
+    /// </summary>
+    /// <returns>false if the credential was not active, then nothing was changed</returns>
+    private async Task<bool> PrepareRevocation(Guid credentialId, bool revokeForIssuer, CancellationToken cancellationToken)
     {
         var credentialRepository = _repositories.GetInstance<ICredentialRepository>();
         var data = await credentialRepository.GetRevocationDataById(credentialId, _identityData.Bpnl)
@@ -63,7 +107,7 @@ public class RevocationBusinessLogic : IRevocationBusinessLogic
 
         if (data.StatusId != CompanySsiDetailStatusId.ACTIVE)
         {
-            return;
+            return false;
         }
 
         // call walletService
@@ -78,7 +122,6 @@ public class RevocationBusinessLogic : IRevocationBusinessLogic
         credentialRepository.AttachAndModifyCredential(credentialId,
             x => x.CompanySsiDetailStatusId = data.StatusId,
             x => x.CompanySsiDetailStatusId = CompanySsiDetailStatusId.REVOKED);
-
-        await _repositories.SaveAsync().ConfigureAwait(ConfigureAwaitOptions.None);
+        return true;
     }
 }
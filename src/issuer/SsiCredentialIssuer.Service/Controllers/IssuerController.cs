@@ -83,8 +83,10 @@ public static class IssuerController
                 [FromQuery] CompanySsiDetailStatusId? companySsiDetailStatusId,
                 [FromQuery] VerifiedCredentialTypeId? credentialTypeId,
                 [FromQuery] CompanySsiDetailApprovalType? approvalType,
-                [FromQuery] CompanySsiDetailSorting? sorting) => logic.GetCredentials(page ?? 0, size ?? 15,
-                companySsiDetailStatusId, credentialTypeId, approvalType, sorting))
+                [FromQuery] CompanySsiDetailSorting? sorting,
+                [FromQuery] DateTimeOffset? expiryDateFrom,
+                [FromQuery] DateTimeOffset? expiryDateTo) => logic.GetCredentials(page ?? 0, size ?? 15,
+                companySsiDetailStatusId, credentialTypeId, approvalType, sorting, expiryDateFrom, expiryDateTo))
             .WithSwaggerDescription("Gets all outstanding, existing and inactive credentials",
                 "Example: GET: /api/issuer",
                 "The page to get",
@@ -92,11 +94,42 @@ public static class IssuerController
                 "OPTIONAL: Filter for the status",
                 "OPTIONAL: The type of the credential that should be returned",
                 "OPTIONAL: Search string for the company name",
-                "Defines the sorting of the list")
+                "Defines the sorting of the list",
+                "OPTIONAL: Only return credentials expiring on or after this date",
+                "OPTIONAL: Only return credentials expiring on or before this date")
             .RequireAuthorization(r => r.RequireRole(DecisionSsiRole))
             .WithDefaultResponses()
             .Produces(StatusCodes.Status200OK, typeof(IEnumerable<CredentialDetailData>), Constants.JsonContentType);
 
+        issuer.MapGet("compact", (IIssuerBusinessLogic logic, [FromQuery] string? cursor,
+                [FromQuery] int? size,
+                [FromQuery] CompanySsiDetailStatusId? companySsiDetailStatusId,
+                [FromQuery] VerifiedCredentialTypeId? credentialTypeId,
+                [FromQuery] DateTimeOffset? expiryDateFrom,
+                [FromQuery] DateTimeOffset? expiryDateTo) => logic.GetCompactCredentials(cursor, size ?? 500,
+                companySsiDetailStatusId, credentialTypeId, expiryDateFrom, expiryDateTo))
+            .WithSwaggerDescription("Gets the id, bpnl, type, expiry date and signing state of the credentials with an expiry date, ordered by expiry date. The next page is requested with the cursor of the previous page",
+                "Example: GET: /api/issuer/compact",
+                "OPTIONAL: The nextCursor of the previous page, the first page is returned if it is not set",
+                "Amount of entries",
+                "OPTIONAL: Filter for the status",
+                "OPTIONAL: The type of the credential that should be returned",
+                "OPTIONAL: Only return credentials expiring on or after this date",
+                "OPTIONAL: Only return credentials expiring on or before this date")
+            .RequireAuthorization(r => r.RequireRole(DecisionSsiRole))
+            .WithDefaultResponses()
+            .Produces(StatusCodes.Status200OK, typeof(CompactCredentialPage), Constants.JsonContentType)
+            .Produces(StatusCodes.Status400BadRequest, typeof(ErrorResponse), Constants.JsonContentType);
+
+        issuer.MapPost("status", ([FromBody] IEnumerable<Guid> credentialIds, IIssuerBusinessLogic logic) => logic.GetCredentialStatus(credentialIds))
+            .WithSwaggerDescription("Gets the status of the given credentials and whether they were signed or a process step failed, unknown ids are omitted",
+                "Example: POST: /api/issuer/status",
+                "The ids of at most MaxCompactPageSize credentials")
+            .RequireAuthorization(r => r.RequireRole(DecisionSsiRole))
+            .WithDefaultResponses()
+            .Produces(StatusCodes.Status200OK, typeof(IEnumerable<CredentialStatusData>), Constants.JsonContentType)
+            .Produces(StatusCodes.Status400BadRequest, typeof(ErrorResponse), Constants.JsonContentType);
+
         issuer.MapGet("owned-credentials", (IIssuerBusinessLogic logic) => logic.GetCredentialsForBpn())
             .WithSwaggerDescription("Gets all outstanding, existing and inactive credentials for the company of the user",
                 "Example: GET: /api/issuer/owned-credentials")
@@ -145,6 +178,20 @@ public static class IssuerController
             .WithDefaultResponses()
             .Produces(StatusCodes.Status200OK, typeof(Guid), contentType: Constants.JsonContentType);
 
+        issuer.MapPost("bulk", ([FromBody] BulkCredentialRequest requestData, CancellationToken cancellationToken, IIssuerBusinessLogic logic) => logic.CreateCredentials(requestData, cancellationToken))
+            .WithSwaggerDescription("Creates bpn, membership and framework credentials for the given data, returns the result per credential",
+                "POST: api/issuer/bulk",
+                "The request data of at most 100 credentials that should be created")
+            .RequireAuthorization(r =>
+            {
+                r.RequireRole(RequestSsiRole);
+                r.AddRequirements(new MandatoryIdentityClaimRequirement(PolicyTypeId.ValidIdentity));
+                r.AddRequirements(new MandatoryIdentityClaimRequirement(PolicyTypeId.ValidBpn));
+            })
+            .WithDefaultResponses()
+            .Produces(StatusCodes.Status200OK, typeof(BulkCredentialResponse), Constants.JsonContentType)
+            .Produces(StatusCodes.Status400BadRequest, typeof(ErrorResponse), Constants.JsonContentType);
+
         issuer.MapPut("{credentialId}/approval", async ([FromRoute] Guid credentialId, CancellationToken cancellationToken, IIssuerBusinessLogic logic) =>
             {
                 await logic.ApproveCredential(credentialId, cancellationToken).ConfigureAwait(ConfigureAwaitOptions.None);
@@ -48,6 +48,19 @@ public static class RevocationController
             })
             .WithDefaultResponses()
             .Produces(StatusCodes.Status200OK, typeof(Guid));
+        revocation.MapPost("issuer/credentials/bulk", ([FromBody] IEnumerable<Guid> credentialIds, CancellationToken cancellationToken, [FromServices] IRevocationBusinessLogic logic) => logic.RevokeCredentials(credentialIds, cancellationToken))
+            .WithSwaggerDescription("Revokes several credentials which were issued by the given issuer, returns the result per credential",
+                "POST: api/revocation/issuer/credentials/bulk",
+                "Ids of the credentials that should be revoked, at most 100")
+            .RequireAuthorization(r =>
+            {
+                r.RequireRole("revoke_credentials_issuer");
+                r.AddRequirements(new MandatoryIdentityClaimRequirement(PolicyTypeId.ValidBpn));
+                r.AddRequirements(new MandatoryIdentityClaimRequirement(PolicyTypeId.ValidIdentity));
+            })
+            .WithDefaultResponses()
+            .Produces(StatusCodes.Status200OK, typeof(IEnumerable<BulkItemResult>), Constants.JsonContentType)
+            .Produces(StatusCodes.Status400BadRequest, typeof(ErrorResponse), Constants.JsonContentType);
         revocation.MapPost("credentials/{credentialId}", ([FromRoute] Guid credentialId, CancellationToken cancellationToken, [FromServices] IRevocationBusinessLogic logic) => logic.RevokeCredential(credentialId, false, cancellationToken))
             .WithSwaggerDescription("Credential Revocation by holder",
                 "POST: api/revocation/credentials/{credentialId}",
@@ -56,7 +56,10 @@ public class IssuerErrorMessageContainer : IErrorMessageContainer
         { IssuerErrors.EMPTY_EXTERNAL_TYPE_ID, "External Type ID must be set" },
         { IssuerErrors.SCHEMA_NOT_SET, "The json schema must be set when approving a credential" },
         { IssuerErrors.SCHEMA_NOT_FRAMEWORK, "The schema must be a framework credential" },
-        { IssuerErrors.PENDING_CREDENTIAL_ALREADY_EXISTS, "Pending Credential request for version {versionId} and framework {frameworkId} does already exist" }
+        { IssuerErrors.PENDING_CREDENTIAL_ALREADY_EXISTS, "Pending Credential request for version {versionId} and framework {frameworkId} does already exist" },
+        { IssuerErrors.INVALID_BULK_SIZE, "Between 1 and {maxItems} credentials can be requested at once, got {count}" },
+        { IssuerErrors.INVALID_PAGE_SIZE, "Page size must be between 1 and {maxPageSize}, got {size}" },
+        { IssuerErrors.INVALID_CURSOR, "Cursor {cursor} is not valid" }
     }.ToImmutableDictionary(x => (int)x.Key, x => x.Value);
 
     public Type Type { get => typeof(IssuerErrors); }
@@ -94,5 +97,8 @@ public enum IssuerErrors
     EMPTY_EXTERNAL_TYPE_ID,
     SCHEMA_NOT_SET,
     SCHEMA_NOT_FRAMEWORK,
-    PENDING_CREDENTIAL_ALREADY_EXISTS
+    PENDING_CREDENTIAL_ALREADY_EXISTS,
+    INVALID_BULK_SIZE,
+    INVALID_PAGE_SIZE,
+    INVALID_CURSOR
 }
@@ -29,7 +29,8 @@ public class RevocationErrorMessageContainer : IErrorMessageContainer
     private static readonly IReadOnlyDictionary<int, string> _messageContainer = new Dictionary<RevocationDataErrors, string> {
         { RevocationDataErrors.CREDENTIAL_NOT_FOUND, "Credential {credentialId} does not exist" },
         { RevocationDataErrors.EXTERNAL_CREDENTIAL_ID_NOT_SET, "External Credential Id must be set for {credentialId}" },
-        { RevocationDataErrors.NOT_ALLOWED_TO_REVOKE_CREDENTIAL, "Not allowed to revoke credential" }
+        { RevocationDataErrors.NOT_ALLOWED_TO_REVOKE_CREDENTIAL, "Not allowed to revoke credential" },
+        { RevocationDataErrors.INVALID_BULK_SIZE, "Between 1 and {maxItems} credentials can be revoked at once, got {count}" }
     }.ToImmutableDictionary(x => (int)x.Key, x => x.Value);
 
     public Type Type { get => typeof(RevocationDataErrors); }
@@ -40,5 +41,6 @@ public enum RevocationDataErrors
 {
     CREDENTIAL_NOT_FOUND,
     EXTERNAL_CREDENTIAL_ID_NOT_SET,
-    NOT_ALLOWED_TO_REVOKE_CREDENTIAL
+    NOT_ALLOWED_TO_REVOKE_CREDENTIAL,
+    INVALID_BULK_SIZE
 }
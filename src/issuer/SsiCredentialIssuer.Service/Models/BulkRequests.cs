@@ -0,0 +1,51 @@
+/********************************************************************************
+ * Copyright (c) 2024 Contributors to the Eclipse Foundation
+ *
+ * See the NOTICE file(s) distributed with this work for additional
+ * information regarding copyright ownership.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ ********************************************************************************/
+
+using System.Text.Json.Serialization;
+
+namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+
+public record BulkCredentialRequest(
+    [property: JsonPropertyName("bpnCredentials")] IEnumerable<CreateBpnCredentialRequest>? BpnCredentials,
+    [property: JsonPropertyName("membershipCredentials")] IEnumerable<CreateMembershipCredentialRequest>? MembershipCredentials,
+    [property: JsonPropertyName("frameworkCredentials")] IEnumerable<CreateFrameworkCredentialRequest>? FrameworkCredentials
+);
+
+public record BulkCredentialResponse(
+    [property: JsonPropertyName("bpnCredentials")] IEnumerable<BulkItemResult> BpnCredentials,
+    [property: JsonPropertyName("membershipCredentials")] IEnumerable<BulkItemResult> MembershipCredentials,
+    [property: JsonPropertyName("frameworkCredentials")] IEnumerable<BulkItemResult> FrameworkCredentials
+);
+
+/// <summary>
+/// Result of a single item of a bulk request
+/// </summary>
+/// <param name="Index">Position of the item in the request</param>
+/// <param name="Id">Id of the created or revoked credential, null if the item failed</param>
+/// <param name="Error">Reason the item failed, null if it succeeded</param>
+public record BulkItemResult(
+    [property: JsonPropertyName("index")] int Index,
+    [property: JsonPropertyName("id")] Guid? Id,
+    [property: JsonPropertyName("error")] BulkItemError? Error
+);
+
+public record BulkItemError(
+    [property: JsonPropertyName("type")] string Type,
+    [property: JsonPropertyName("message")] string Message
+);
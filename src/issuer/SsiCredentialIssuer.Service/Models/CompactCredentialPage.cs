@@ -0,0 +1,33 @@
+/********************************************************************************
+ * Copyright (c) 2024 Contributors to the Eclipse Foundation
+ *
+ * See the NOTICE file(s) distributed with this work for additional
+ * information regarding copyright ownership.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ ********************************************************************************/
+
+using Org.Eclipse.TractusX.SsiCredentialIssuer.DBAccess.Models;
+using System.Text.Json.Serialization;
+
+namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+
+/// <summary>
+/// A page of the keyset paginated credential listing
+/// </summary>
+/// <param name="Content">The credentials of the page</param>
+/// <param name="NextCursor">Cursor of the next page, null if this is the last page</param>
+public record CompactCredentialPage(
+    [property: JsonPropertyName("content")] IEnumerable<CompactCredentialData> Content,
+    [property: JsonPropertyName("nextCursor")] string? NextCursor
+);
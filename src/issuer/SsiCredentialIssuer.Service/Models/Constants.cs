@@ -22,4 +22,14 @@ namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
 public static class Constants
 {
     public const string JsonContentType = "application/json";
+
+    /// <summary>
+    /// Maximum number of items of a bulk request
+    /// </summary>
+    public const int MaxBulkItems = 100;
+
+    /// <summary>
+    /// Maximum duration in which items of a bulk request are started, well below the read timeout of the clients
+    /// </summary>
+    public static readonly TimeSpan MaxBulkDuration = TimeSpan.FromSeconds(30);
 }
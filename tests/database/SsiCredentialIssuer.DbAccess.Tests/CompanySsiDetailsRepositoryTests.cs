@@ -168,7 +168,7 @@ public class CompanySsiDetailsRepositoryTests
         var sut = await CreateSut();
 
         // Act
-        var result = await sut.GetAllCredentialDetails(null, null, null, null)(0, 15);
+        var result = await sut.GetAllCredentialDetails(null, null, null, null, null, null)(0, 15);
 
         // Assert
         result.Should().NotBeNull();
@@ -192,7 +192,7 @@ public class CompanySsiDetailsRepositoryTests
         var sut = await CreateSut();
 
         // Act
-        var result = await sut.GetAllCredentialDetails(null, CompanySsiDetailStatusId.PENDING, null, null)(0, 15);
+        var result = await sut.GetAllCredentialDetails(null, CompanySsiDetailStatusId.PENDING, null, null, null, null)(0, 15);
 
         // Assert
         result.Should().NotBeNull();
@@ -213,7 +213,7 @@ public class CompanySsiDetailsRepositoryTests
         var sut = await CreateSut();
 
         // Act
-        var result = await sut.GetAllCredentialDetails(null, null, VerifiedCredentialTypeId.PCF_FRAMEWORK, null)(0, 15);
+        var result = await sut.GetAllCredentialDetails(null, null, VerifiedCredentialTypeId.PCF_FRAMEWORK, null, null, null)(0, 15);
 
         // Assert
         result.Should().NotBeNull();
@@ -221,6 +221,131 @@ public class CompanySsiDetailsRepositoryTests
         result.Data.Should().ContainSingle().Which.Bpnl.Should().Be(ValidBpnl);
     }
 
+    [Fact]
+    public async Task GetAllCredentialDetails_WithExpiryDateInRange_ReturnsExpected()
+    {
+        // Arrange
+        var sut = await CreateSut();
+
+        // Act
+        var result = await sut.GetAllCredentialDetails(CompanySsiDetailSorting.ExpiryDateAsc, null, null, null, new DateTimeOffset(2023, 09, 30, 00, 00, 00, TimeSpan.Zero), new DateTimeOffset(2023, 09, 30, 23, 59, 59, TimeSpan.Zero))(0, 15);
+
+        // Assert
+        result.Should().NotBeNull();
+        result!.Count.Should().Be(7);
+        result.Data.Should().HaveCount(7).And.BeInAscendingOrder(x => x.CredentialDetailId);
+    }
+
+    [Fact]
+    public async Task GetAllCredentialDetails_WithExpiryDateOutOfRange_ReturnsEmpty()
+    {
+        // Arrange
+        var sut = await CreateSut();
+
+        // Act
+        var result = await sut.GetAllCredentialDetails(CompanySsiDetailSorting.ExpiryDateAsc, null, null, null, new DateTimeOffset(2023, 10, 01, 00, 00, 00, TimeSpan.Zero), null)(0, 15);
+
+        // Assert
+        result.Should().BeNull();
+    }
+
+    #endregion
+
+    #region GetCompactCredentialDetails
+
+    [Fact]
+    public async Task GetCompactCredentialDetails_ReturnsOrderedByExpiryDateAndId()
+    {
+        // Arrange
+        var sut = await CreateSut();
+
+        // Act
+        var result = await sut.GetCompactCredentialDetails(null, null, null, null, null, 15).ToListAsync();
+
+        // Assert
+        result.Should().HaveCount(7)
+            .And.BeInAscendingOrder(x => x.ExpiryDate)
+            .And.BeInAscendingOrder(x => x.CredentialDetailId)
+            .And.OnlyContain(x => x.DateCreated != default);
+    }
+
+    [Fact]
+    public async Task GetCompactCredentialDetails_WithPosition_ContinuesAfterPosition()
+    {
+        // Arrange
+        var sut = await CreateSut();
+        var firstPage = await sut.GetCompactCredentialDetails(null, null, null, null, null, 3).ToListAsync();
+        var last = firstPage.Last();
+
+        // Act
+        var result = await sut.GetCompactCredentialDetails(null, null, null, null, (last.ExpiryDate, last.CredentialDetailId), 15).ToListAsync();
+
+        // Assert
+        firstPage.Should().HaveCount(3);
+        result.Should().HaveCount(4)
+            .And.OnlyContain(x => x.ExpiryDate > last.ExpiryDate || (x.ExpiryDate == last.ExpiryDate && x.CredentialDetailId.CompareTo(last.CredentialDetailId) > 0));
+        firstPage.Select(x => x.CredentialDetailId).Should().NotIntersectWith(result.Select(x => x.CredentialDetailId));
+    }
+
+    [Fact]
+    public async Task GetCompactCredentialDetails_PagingAcrossEqualExpiryDates_ReturnsEveryCredentialOnce()
+    {
+        // Arrange
+        var sut = await CreateSut();
+        var all = await sut.GetCompactCredentialDetails(null, null, null, null, null, 15).ToListAsync();
+        var result = new List<CompactCredentialData>();
+        (DateTimeOffset ExpiryDate, Guid Id)? after = null;
+
+        // Act
+        while (true)
+        {
+            var page = await sut.GetCompactCredentialDetails(null, null, null, null, after, 2).ToListAsync();
+            result.AddRange(page);
+            if (page.Count < 2)
+            {
+                break;
+            }
+
+            after = (page[^1].ExpiryDate, page[^1].CredentialDetailId);
+        }
+
+        // Assert
+        all.Select(x => x.ExpiryDate).Distinct().Should().ContainSingle();
+        result.Select(x => x.CredentialDetailId).Should().Equal(all.Select(x => x.CredentialDetailId));
+    }
+
+    [Fact]
+    public async Task GetCompactCredentialDetails_WithStatusAndExpiryDateOutOfRange_ReturnsEmpty()
+    {
+        // Arrange
+        var sut = await CreateSut();
+
+        // Act
+        var result = await sut.GetCompactCredentialDetails(CompanySsiDetailStatusId.PENDING, null, new DateTimeOffset(2023, 10, 01, 00, 00, 00, TimeSpan.Zero), null, null, 15).ToListAsync();
+
+        // Assert
+        result.Should().BeEmpty();
+    }
+
+    #endregion
+
+    #region GetCredentialStatus
+
+    [Fact]
+    public async Task GetCredentialStatus_ReturnsStatusOfKnownCredentials()
+    {
+        // Arrange
+        var sut = await CreateSut();
+
+        // Act
+        var result = await sut.GetCredentialStatus(new[] { new Guid("9f5b9934-4014-4099-91e9-7b1aee696b03"), new Guid("9f5b9934-4014-4099-91e9-7b1aee696b07"), Guid.NewGuid() }).ToListAsync();
+
+        // Assert
+        result.Should().HaveCount(2).And.Satisfy(
+            x => x.CredentialDetailId == new Guid("9f5b9934-4014-4099-91e9-7b1aee696b03") && x.Status == CompanySsiDetailStatusId.PENDING && x.Signed && !x.Failed,
+            x => x.CredentialDetailId == new Guid("9f5b9934-4014-4099-91e9-7b1aee696b07") && x.Status == CompanySsiDetailStatusId.INACTIVE && !x.Signed && !x.Failed);
+    }
+
     #endregion
 
     #region GetSsiCertificates
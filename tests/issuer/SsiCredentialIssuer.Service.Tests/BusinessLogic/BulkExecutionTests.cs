@@ -0,0 +1,64 @@
+/********************************************************************************
+ * Copyright (c) 2024 Contributors to the Eclipse Foundation
+ *
+ * See the NOTICE file(s) distributed with this work for additional
+ * information regarding copyright ownership.
+ *
+ * This program and the accompanying materials are made available under the
+ * terms of the Apache License, Version 2.0 which is available at
+ * https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ ********************************************************************************/
+
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
+
+namespace Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Tests.BusinessLogic;
+
+public class BulkExecutionTests
+{
+    [Fact]
+    public async Task ExecuteEach_WithFailingItem_ReturnsResultPerItem()
+    {
+        // Arrange
+        var ids = new[] { Guid.NewGuid(), Guid.NewGuid() };
+
+        // Act
+        var result = await BulkExecution.ExecuteEach(ids, id => id == ids[0] ? throw new InvalidOperationException("failed") : Task.FromResult(id), CancellationToken.None);
+
+        // Assert
+        result.Should().HaveCount(2).And.SatisfyRespectively(
+            x => x.Should().Be(new BulkItemResult(0, null, new BulkItemError(nameof(InvalidOperationException), "failed"))),
+            x => x.Should().Be(new BulkItemResult(1, ids[1], null)));
+    }
+
+    [Fact]
+    public async Task ExecuteEach_WithElapsedMaxDuration_DoesNotStartRemainingItems()
+    {
+        // Arrange
+        var ids = new[] { Guid.NewGuid(), Guid.NewGuid() };
+        var executed = new List<Guid>();
+
+        // Act
+        var result = await BulkExecution.ExecuteEach(ids, id =>
+        {
+            executed.Add(id);
+            return Task.FromResult(id);
+        }, CancellationToken.None, TimeSpan.Zero);
+
+        // Assert
+        executed.Should().BeEmpty();
+        result.Should().HaveCount(2).And.AllSatisfy(x =>
+        {
+            x.Id.Should().BeNull();
+            x.Error!.Type.Should().Be(BulkExecution.DurationExceededError);
+        });
+    }
+}
@@ -107,6 +107,7 @@ public class IssuerBusinessLogicTests
                 EncryptionKey = "zlWxjv54PrNDbjYx7d3m4nz88qmCHG0AhYwu0UYSFGTo9psPbcVsNiqr14zhRgSd"
             }, 1),
             MaxPageSize = 15,
+            MaxCompactPageSize = 100,
             IssuerDid = "did:web:example:org:bpn:18273z682734rt",
             IssuerBpn = IssuerBpnl,
             EncryptionConfigIndex = 0,
@@ -1034,6 +1035,136 @@ public class IssuerBusinessLogicTests
 
     #endregion
 
+    #region CreateCredentials
+
+    [Theory]
+    [InlineData(0)]
+    [InlineData(101)]
+    public async Task CreateCredentials_WithInvalidNumberOfItems_ThrowsControllerArgumentException(int count)
+    {
+        // Arrange
+        var data = new BulkCredentialRequest(
+            Enumerable.Repeat(new CreateBpnCredentialRequest("https://example.org/holder/BPNL12343546/did.json", Bpnl, null, null), count),
+            null,
+            null);
+        Task Act() => _sut.CreateCredentials(data, CancellationToken.None);
+
+        // Act
+        var ex = await Assert.ThrowsAsync<ControllerArgumentException>(Act);
+
+        // Assert
+        ex.Message.Should().Be(IssuerErrors.INVALID_BULK_SIZE.ToString());
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustNotHaveHappened();
+    }
+
+    [Fact]
+    public async Task CreateCredentials_WithOneInvalidItem_ReturnsResultPerItemAndSavesEachValidItem()
+    {
+        // Arrange
+        var didDocument = new DidDocument(Guid.NewGuid().ToString());
+        var data = new BulkCredentialRequest(
+            new[]
+            {
+                new CreateBpnCredentialRequest("https://example.org/holder/BPNL12343546/did.json", Bpnl, null, null),
+                new CreateBpnCredentialRequest("test", Bpnl, null, null)
+            },
+            null,
+            null);
+        ConfigureHttpClientFactoryFixture(new HttpResponseMessage
+        {
+            StatusCode = HttpStatusCode.OK,
+            Content = new StringContent(JsonSerializer.Serialize(didDocument))
+        });
+
+        // Act
+        var result = await _sut.CreateCredentials(data, CancellationToken.None);
+
+        // Assert
+        result.BpnCredentials.Should().HaveCount(2).And.SatisfyRespectively(
+            x =>
+            {
+                x.Index.Should().Be(0);
+                x.Id.Should().NotBeNull();
+                x.Error.Should().BeNull();
+            },
+            x =>
+            {
+                x.Index.Should().Be(1);
+                x.Id.Should().BeNull();
+                x.Error.Should().NotBeNull();
+                x.Error!.Type.Should().Be(nameof(ControllerArgumentException));
+            });
+        result.MembershipCredentials.Should().BeEmpty();
+        result.FrameworkCredentials.Should().BeEmpty();
+        A.CallTo(() => _companySsiDetailsRepository.CreateSsiDetails(A<string>._, VerifiedCredentialTypeId.BUSINESS_PARTNER_NUMBER, CompanySsiDetailStatusId.ACTIVE, IssuerBpnl, _identity.IdentityId, A<Action<CompanySsiDetail>>._))
+            .MustHaveHappenedOnceExactly();
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustHaveHappenedOnceExactly();
+        A.CallTo(() => _issuerRepositories.Clear()).MustHaveHappenedTwiceExactly();
+    }
+
+    [Fact]
+    public async Task CreateCredentials_WithFailingSave_ReportsOnlyThatItemAsFailed()
+    {
+        // Arrange
+        var didDocument = new DidDocument(Guid.NewGuid().ToString());
+        var data = new BulkCredentialRequest(
+            new[]
+            {
+                new CreateBpnCredentialRequest("https://example.org/holder/BPNL12343546/did.json", Bpnl, null, null),
+                new CreateBpnCredentialRequest("https://example.org/holder/BPNL12343546/did.json", Bpnl, null, null)
+            },
+            null,
+            null);
+        ConfigureHttpClientFactoryFixture(new HttpResponseMessage
+        {
+            StatusCode = HttpStatusCode.OK,
+            Content = new StringContent(JsonSerializer.Serialize(didDocument))
+        });
+        A.CallTo(() => _issuerRepositories.SaveAsync())
+            .Throws(new InvalidOperationException("save failed")).Once()
+            .Then.Returns(1);
+
+        // Act
+        var result = await _sut.CreateCredentials(data, CancellationToken.None);
+
+        // Assert
+        result.BpnCredentials.Should().HaveCount(2).And.SatisfyRespectively(
+            x =>
+            {
+                x.Index.Should().Be(0);
+                x.Id.Should().BeNull();
+                x.Error.Should().Be(new BulkItemError(nameof(InvalidOperationException), "save failed"));
+            },
+            x =>
+            {
+                x.Index.Should().Be(1);
+                x.Id.Should().NotBeNull();
+                x.Error.Should().BeNull();
+            });
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustHaveHappenedTwiceExactly();
+        A.CallTo(() => _issuerRepositories.Clear()).MustHaveHappenedTwiceExactly();
+    }
+
+    [Fact]
+    public async Task CreateCredentials_WithOnlyInvalidItems_DoesNotSave()
+    {
+        // Arrange
+        var data = new BulkCredentialRequest(
+            null,
+            new[] { new CreateMembershipCredentialRequest("test", Bpnl, "Test", null, null) },
+            null);
+
+        // Act
+        var result = await _sut.CreateCredentials(data, CancellationToken.None);
+
+        // Assert
+        result.MembershipCredentials.Should().ContainSingle().Which.Error.Should().NotBeNull();
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustNotHaveHappened();
+        A.CallTo(() => _issuerRepositories.Clear()).MustHaveHappenedOnceExactly();
+    }
+
+    #endregion
+
     #region RetriggerProcessStep
 
     [Theory]
@@ -1144,11 +1275,11 @@ public class IssuerBusinessLogicTests
         var data = _fixture.CreateMany<CredentialDetailData>(numberOfElements);
         Task<Pagination.Source<CredentialDetailData>?> PaginationResult(int skip, int take) => Task.FromResult(new Pagination.Source<CredentialDetailData>(data.Count(), data.Skip(skip).Take(take)));
 
-        A.CallTo(() => _companySsiDetailsRepository.GetAllCredentialDetails(A<CompanySsiDetailSorting?>._, A<CompanySsiDetailStatusId?>._, A<VerifiedCredentialTypeId?>._, A<CompanySsiDetailApprovalType?>._))
+        A.CallTo(() => _companySsiDetailsRepository.GetAllCredentialDetails(A<CompanySsiDetailSorting?>._, A<CompanySsiDetailStatusId?>._, A<VerifiedCredentialTypeId?>._, A<CompanySsiDetailApprovalType?>._, A<DateTimeOffset?>._, A<DateTimeOffset?>._))
             .Returns(PaginationResult);
 
         // Act
-        var result = await _sut.GetCredentials(page, size, null, null, null, null);
+        var result = await _sut.GetCredentials(page, size, null, null, null, null, null, null);
 
         // Assert
         result.Should().NotBeNull();
@@ -1159,6 +1290,145 @@ public class IssuerBusinessLogicTests
         result.Content.Should().HaveCount(resultPageSize);
     }
 
+    [Fact]
+    public async Task GetCredentials_WithExpiryDateRange_PassesUtcRangeToRepository()
+    {
+        // Arrange
+        var expiryDateFrom = new DateTimeOffset(2025, 01, 01, 02, 00, 00, TimeSpan.FromHours(2));
+        var expiryDateTo = new DateTimeOffset(2025, 01, 31, 23, 59, 59, TimeSpan.Zero);
+        Task<Pagination.Source<CredentialDetailData>?> PaginationResult(int skip, int take) => Task.FromResult<Pagination.Source<CredentialDetailData>?>(new Pagination.Source<CredentialDetailData>(0, Enumerable.Empty<CredentialDetailData>()));
+        A.CallTo(() => _companySsiDetailsRepository.GetAllCredentialDetails(A<CompanySsiDetailSorting?>._, A<CompanySsiDetailStatusId?>._, A<VerifiedCredentialTypeId?>._, A<CompanySsiDetailApprovalType?>._, A<DateTimeOffset?>._, A<DateTimeOffset?>._))
+            .Returns(PaginationResult);
+
+        // Act
+        await _sut.GetCredentials(0, 15, CompanySsiDetailStatusId.ACTIVE, null, null, CompanySsiDetailSorting.ExpiryDateAsc, expiryDateFrom, expiryDateTo);
+
+        // Assert
+        A.CallTo(() => _companySsiDetailsRepository.GetAllCredentialDetails(
+                CompanySsiDetailSorting.ExpiryDateAsc,
+                CompanySsiDetailStatusId.ACTIVE,
+                null,
+                null,
+                A<DateTimeOffset?>.That.Matches(x => x == expiryDateFrom && x!.Value.Offset == TimeSpan.Zero),
+                A<DateTimeOffset?>.That.Matches(x => x == expiryDateTo && x!.Value.Offset == TimeSpan.Zero)))
+            .MustHaveHappenedOnceExactly();
+    }
+
+    #endregion
+
+    #region GetCompactCredentials
+
+    [Theory]
+    [InlineData(0)]
+    [InlineData(101)]
+    public async Task GetCompactCredentials_WithInvalidSize_ThrowsControllerArgumentException(int size)
+    {
+        // Act
+        async Task Act() => await _sut.GetCompactCredentials(null, size, null, null, null, null);
+
+        // Assert
+        var ex = await Assert.ThrowsAsync<ControllerArgumentException>(Act);
+        ex.Message.Should().Be(IssuerErrors.INVALID_PAGE_SIZE.ToString());
+    }
+
+    [Fact]
+    public async Task GetCompactCredentials_WithInvalidCursor_ThrowsControllerArgumentException()
+    {
+        // Act
+        async Task Act() => await _sut.GetCompactCredentials("not-a-cursor", 10, null, null, null, null);
+
+        // Assert
+        var ex = await Assert.ThrowsAsync<ControllerArgumentException>(Act);
+        ex.Message.Should().Be(IssuerErrors.INVALID_CURSOR.ToString());
+    }
+
+    [Fact]
+    public async Task GetCompactCredentials_WithMoreCredentials_ReturnsCursorOfLastCredential()
+    {
+        // Arrange
+        var credentials = _fixture.CreateMany<CompactCredentialData>(3).ToList();
+        A.CallTo(() => _companySsiDetailsRepository.GetCompactCredentialDetails(A<CompanySsiDetailStatusId?>._, A<VerifiedCredentialTypeId?>._, A<DateTimeOffset?>._, A<DateTimeOffset?>._, A<(DateTimeOffset, Guid)?>._, A<int>._))
+            .Returns(credentials.ToAsyncEnumerable());
+
+        // Act
+        var result = await _sut.GetCompactCredentials(null, 2, CompanySsiDetailStatusId.ACTIVE, null, null, null);
+
+        // Assert
+        result.Content.Should().HaveCount(2).And.ContainInOrder(credentials.Take(2));
+        result.NextCursor.Should().NotBeNull();
+        CredentialCursor.TryDecode(result.NextCursor!, out var position).Should().BeTrue();
+        position.Id.Should().Be(credentials[1].CredentialDetailId);
+        position.ExpiryDate.Should().Be(credentials[1].ExpiryDate);
+        A.CallTo(() => _companySsiDetailsRepository.GetCompactCredentialDetails(CompanySsiDetailStatusId.ACTIVE, null, null, null, null, 3))
+            .MustHaveHappenedOnceExactly();
+    }
+
+    [Fact]
+    public async Task GetCompactCredentials_WithCursor_ContinuesAfterPosition()
+    {
+        // Arrange
+        var expiryDate = new DateTimeOffset(2025, 01, 01, 0, 0, 0, TimeSpan.Zero);
+        var id = Guid.NewGuid();
+        var credentials = _fixture.CreateMany<CompactCredentialData>(2).ToList();
+        A.CallTo(() => _companySsiDetailsRepository.GetCompactCredentialDetails(A<CompanySsiDetailStatusId?>._, A<VerifiedCredentialTypeId?>._, A<DateTimeOffset?>._, A<DateTimeOffset?>._, A<(DateTimeOffset, Guid)?>._, A<int>._))
+            .Returns(credentials.ToAsyncEnumerable());
+
+        // Act
+        var result = await _sut.GetCompactCredentials(CredentialCursor.Encode(expiryDate, id), 2, null, null, null, null);
+
+        // Assert
+        result.Content.Should().HaveCount(2);
+        result.NextCursor.Should().BeNull();
+        A.CallTo(() => _companySsiDetailsRepository.GetCompactCredentialDetails(null, null, null, null, A<(DateTimeOffset, Guid)?>.That.Matches(x => x == (expiryDate, id)), 3))
+            .MustHaveHappenedOnceExactly();
+    }
+
+    #endregion
+
+    #region GetCredentialStatus
+
+    [Fact]
+    public async Task GetCredentialStatus_WithoutIds_ThrowsControllerArgumentException()
+    {
+        // Act
+        async Task Act() => await _sut.GetCredentialStatus(Enumerable.Empty<Guid>());
+
+        // Assert
+        var ex = await Assert.ThrowsAsync<ControllerArgumentException>(Act);
+        ex.Message.Should().Be(IssuerErrors.INVALID_BULK_SIZE.ToString());
+    }
+
+    [Fact]
+    public async Task GetCredentialStatus_WithTooManyIds_ThrowsControllerArgumentException()
+    {
+        // Act
+        async Task Act() => await _sut.GetCredentialStatus(_fixture.CreateMany<Guid>(101));
+
+        // Assert
+        var ex = await Assert.ThrowsAsync<ControllerArgumentException>(Act);
+        ex.Message.Should().Be(IssuerErrors.INVALID_BULK_SIZE.ToString());
+        A.CallTo(() => _companySsiDetailsRepository.GetCredentialStatus(A<IEnumerable<Guid>>._))
+            .MustNotHaveHappened();
+    }
+
+    [Fact]
+    public async Task GetCredentialStatus_WithDuplicateIds_QueriesDistinctIds()
+    {
+        // Arrange
+        var id = Guid.NewGuid();
+        var status = new CredentialStatusData(id, CompanySsiDetailStatusId.ACTIVE, true, false);
+        A.CallTo(() => _companySsiDetailsRepository.GetCredentialStatus(A<IEnumerable<Guid>>._))
+            .Returns(Enumerable.Repeat(status, 1).ToAsyncEnumerable());
+
+        // Act
+        var result = await _sut.GetCredentialStatus(new[] { id, id });
+
+        // Assert
+        result.Should().ContainSingle().Which.Should().Be(status);
+        A.CallTo(() => _companySsiDetailsRepository.GetCredentialStatus(A<IEnumerable<Guid>>.That.IsSameSequenceAs(new[] { id })))
+            .MustHaveHappenedOnceExactly();
+    }
+
     #endregion
 
     #region Setup
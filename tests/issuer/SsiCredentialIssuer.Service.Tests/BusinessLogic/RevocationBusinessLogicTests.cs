@@ -6,6 +6,7 @@ using Org.Eclipse.TractusX.SsiCredentialIssuer.Entities.Enums;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.BusinessLogic;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.ErrorHandling;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Identity;
+using Org.Eclipse.TractusX.SsiCredentialIssuer.Service.Models;
 using Org.Eclipse.TractusX.SsiCredentialIssuer.Wallet.Service.Services;
 using System.Collections.Immutable;
 
@@ -159,4 +160,101 @@ public class RevocationBusinessLogicTests
     }
 
     #endregion
+
+    #region RevokeCredentials
+
+    [Theory]
+    [InlineData(0)]
+    [InlineData(101)]
+    public async Task RevokeCredentials_WithInvalidNumberOfItems_ThrowsControllerArgumentException(int count)
+    {
+        // Arrange
+        Task Act() => _sut.RevokeCredentials(Enumerable.Range(0, count).Select(_ => Guid.NewGuid()), CancellationToken.None);
+
+        // Act
+        var ex = await Assert.ThrowsAsync<ControllerArgumentException>(Act);
+
+        // Assert
+        ex.Message.Should().Be(RevocationDataErrors.INVALID_BULK_SIZE.ToString());
+        A.CallTo(() => _walletService.RevokeCredentialForIssuer(A<Guid>._, A<CancellationToken>._)).MustNotHaveHappened();
+    }
+
+    [Fact]
+    public async Task RevokeCredentials_WithOneNotExisting_ReturnsResultPerItemAndSavesEachRevokedItem()
+    {
+        // Arrange
+        var notExistingId = Guid.NewGuid();
+        var otherCredentialId = Guid.NewGuid();
+        A.CallTo(() => _credentialRepository.GetRevocationDataById(notExistingId, Bpnl))
+            .Returns(default((bool, bool, Guid?, CompanySsiDetailStatusId, IEnumerable<(Guid, DocumentStatusId)>)));
+        A.CallTo(() => _credentialRepository.GetRevocationDataById(CredentialId, Bpnl))
+            .Returns((true, true, Guid.NewGuid(), CompanySsiDetailStatusId.ACTIVE, Enumerable.Empty<(Guid, DocumentStatusId)>()));
+        A.CallTo(() => _credentialRepository.GetRevocationDataById(otherCredentialId, Bpnl))
+            .Returns((true, true, Guid.NewGuid(), CompanySsiDetailStatusId.ACTIVE, Enumerable.Empty<(Guid, DocumentStatusId)>()));
+
+        // Act
+        var result = await _sut.RevokeCredentials(new[] { CredentialId, notExistingId, otherCredentialId }, CancellationToken.None);
+
+        // Assert
+        result.Should().HaveCount(3).And.SatisfyRespectively(
+            x => x.Should().Be(new BulkItemResult(0, CredentialId, null)),
+            x =>
+            {
+                x.Index.Should().Be(1);
+                x.Id.Should().BeNull();
+                x.Error.Should().Be(new BulkItemError(nameof(NotFoundException), RevocationDataErrors.CREDENTIAL_NOT_FOUND.ToString()));
+            },
+            x => x.Should().Be(new BulkItemResult(2, otherCredentialId, null)));
+        A.CallTo(() => _walletService.RevokeCredentialForIssuer(A<Guid>._, A<CancellationToken>._)).MustHaveHappenedTwiceExactly();
+        A.CallTo(() => _credentialRepository.AttachAndModifyCredential(A<Guid>._, A<Action<CompanySsiDetail>>._, A<Action<CompanySsiDetail>>._)).MustHaveHappenedTwiceExactly();
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustHaveHappenedTwiceExactly();
+        A.CallTo(() => _issuerRepositories.Clear()).MustHaveHappened(3, Times.Exactly);
+    }
+
+    [Fact]
+    public async Task RevokeCredentials_WithFailingSave_ReportsOnlyThatItemAsFailed()
+    {
+        // Arrange
+        var otherCredentialId = Guid.NewGuid();
+        A.CallTo(() => _credentialRepository.GetRevocationDataById(CredentialId, Bpnl))
+            .Returns((true, true, Guid.NewGuid(), CompanySsiDetailStatusId.ACTIVE, Enumerable.Empty<(Guid, DocumentStatusId)>()));
+        A.CallTo(() => _credentialRepository.GetRevocationDataById(otherCredentialId, Bpnl))
+            .Returns((true, true, Guid.NewGuid(), CompanySsiDetailStatusId.ACTIVE, Enumerable.Empty<(Guid, DocumentStatusId)>()));
+        A.CallTo(() => _issuerRepositories.SaveAsync())
+            .Throws(new InvalidOperationException("save failed")).Once()
+            .Then.Returns(1);
+
+        // Act
+        var result = await _sut.RevokeCredentials(new[] { CredentialId, otherCredentialId }, CancellationToken.None);
+
+        // Assert
+        result.Should().HaveCount(2).And.SatisfyRespectively(
+            x =>
+            {
+                x.Index.Should().Be(0);
+                x.Id.Should().BeNull();
+                x.Error.Should().Be(new BulkItemError(nameof(InvalidOperationException), "save failed"));
+            },
+            x => x.Should().Be(new BulkItemResult(1, otherCredentialId, null)));
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustHaveHappenedTwiceExactly();
+        A.CallTo(() => _issuerRepositories.Clear()).MustHaveHappenedTwiceExactly();
+    }
+
+    [Fact]
+    public async Task RevokeCredentials_WithNoActiveCredential_DoesNotSave()
+    {
+        // Arrange
+        A.CallTo(() => _credentialRepository.GetRevocationDataById(CredentialId, Bpnl))
+            .Returns((true, true, Guid.NewGuid(), CompanySsiDetailStatusId.REVOKED, Enumerable.Empty<(Guid, DocumentStatusId)>()));
+
+        // Act
+        var result = await _sut.RevokeCredentials(new[] { CredentialId }, CancellationToken.None);
+
+        // Assert
+        result.Should().ContainSingle().Which.Should().Be(new BulkItemResult(0, CredentialId, null));
+        A.CallTo(() => _walletService.RevokeCredentialForIssuer(A<Guid>._, A<CancellationToken>._)).MustNotHaveHappened();
+        A.CallTo(() => _issuerRepositories.SaveAsync()).MustNotHaveHappened();
+    }
+
+    #endregion
 }